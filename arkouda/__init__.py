@@ -11,6 +11,7 @@ from arkouda.client_dtypes import *
 from arkouda.dtypes import *
 from arkouda.decorators import *
 from arkouda.pdarrayclass import *
+from arkouda.lazyexpr import *
 from arkouda.sorting import *
 from arkouda.pdarraysetops import *
 from arkouda.pdarraycreation import *
@@ -28,6 +29,9 @@ from arkouda.row import *
 from arkouda.index import *
 from arkouda.series import *
 from arkouda.alignment import *
+from arkouda.sorted_index import *
+from arkouda.hash_index import *
 from arkouda.plotting import *
 from arkouda.accessor import *
 from arkouda.io import *
+from arkouda.asyncclient import *
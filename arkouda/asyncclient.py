@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+from typing import Dict, List, Optional, Union, cast
+
+import numpy as np  # type: ignore
+import zmq  # type: ignore
+import zmq.asyncio  # type: ignore
+
+from arkouda import client
+from arkouda.client import _compact_args_to_str, _json_args_to_str, _parse_reply
+from arkouda.dtypes import bigint
+from arkouda.groupbyclass import GroupBy, _create_groupby_args, groupable
+from arkouda.io import _build_objects, _parse_errors, _prep_datasets, _read_parquet_args
+from arkouda.message import MessageFormat, RequestMessage
+from arkouda.pdarrayclass import pdarray
+
+__all__ = ["AsyncClient"]
+
+
+class AsyncClient:
+    """
+    A connection to the Arkouda server for asyncio programs. Commands sent
+    through an AsyncClient return awaitables instead of blocking, so a program
+    can keep several commands outstanding and do client-side work while the
+    server computes.
+
+    Parameters
+    ----------
+    url : str, optional
+        The address of the server, e.g. "tcp://localhost:5555". Defaults to
+        the server of the active :class:`arkouda.Session`, which is the one
+        :func:`arkouda.connect` connected to unless another Session's context
+        is active.
+
+    Raises
+    ------
+    RuntimeError
+        Raised if url is not given and the client is not connected to a server
+
+    Notes
+    -----
+    An AsyncClient uses a DEALER socket and tags every request with an id, so
+    replies are matched to their requests regardless of how many are in
+    flight. The server runs commands one at a time in the order it receives
+    them; the gain is that the client never waits idle between commands and
+    that one process can serve many concurrent callers. Requests sent through
+    the regular blocking client go over a separate connection and are not
+    ordered with respect to those of an AsyncClient.
+
+    Examples
+    --------
+    >>> async def summarize(a, b):
+    ...     async with ak.AsyncClient() as aclient:
+    ...         x, y = await asyncio.gather(aclient.to_ndarray(a), aclient.to_ndarray(b))
+    ...     return x.sum() + y.sum()
+    """
+
+    def __init__(self, url: Optional[str] = None) -> None:
+        if url is None:
+            session = client._current_session()
+            url, self._username, self._token = session.url, session.username, session.token
+            self._compact_args = session.compact_args
+        else:
+            self._username, self._token = client.username, client.token
+            # the argument formats of an arbitrary server are unknown, so use JSON
+            self._compact_args = False
+        self._context = zmq.asyncio.Context()
+        self._socket = self._context.socket(zmq.DEALER)
+        self._socket.connect(url)
+        self._ids = itertools.count()
+        self._pending: Dict[bytes, asyncio.Future] = {}
+        self._reader: Optional[asyncio.Future] = None
+
+    async def __aenter__(self) -> AsyncClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the connection, cancelling any requests still awaiting a reply.
+        """
+        if self._reader is not None:
+            self._reader.cancel()
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._socket.close(linger=0)
+        self._context.term()
+
+    async def generic_msg(
+        self,
+        cmd: str,
+        args: Dict = None,
+        payload: memoryview = None,
+        send_binary: bool = False,
+        recv_binary: bool = False,
+    ) -> Union[str, memoryview]:
+        """
+        Sends a binary or string message composed of a command and corresponding
+        arguments to the arkouda_server, returning the response sent by the server.
+        This is the awaitable counterpart of :func:`arkouda.client.generic_msg`.
+
+        Parameters
+        ----------
+        cmd : str
+            The server-side command to be executed
+        args : dict
+            The command arguments
+        payload : memoryview
+            Payload containing binary data e.g. a Numpy array
+        send_binary : bool
+            Indicates if the message to be sent is a string or binary
+        recv_binary : bool
+            Indicates if the return message will be a string or binary
+
+        Returns
+        -------
+        Union[str, memoryview]
+            The string or binary return message
+
+        Raises
+        ------
+        RuntimeError
+            Raised if there is a server-side error thrown
+        ValueError
+            Raised if the return message is malformed JSON or is missing 1..n
+            expected fields
+        """
+        size, msg_args = (_compact_args_to_str if self._compact_args else _json_args_to_str)(args)
+        message = RequestMessage(
+            user=self._username,
+            token=self._token,
+            cmd=cmd,
+            format=MessageFormat.BINARY if send_binary else MessageFormat.STRING,
+            args=msg_args,
+            size=size,
+        )
+        frames: List[Union[bytes, memoryview]]
+        if send_binary:
+            assert payload is not None
+            frames = [f"{json.dumps(message.asdict())}BINARY_PAYLOAD".encode(), payload]
+        else:
+            assert payload is None
+            frames = [json.dumps(message.asdict()).encode()]
+
+        # the server's REP socket sends the frames before the empty delimiter
+        # back with the reply, so the request id comes back with it
+        request_id = str(next(self._ids)).encode()
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            await self._socket.send_multipart([request_id, b""] + frames, copy=False)
+            if self._reader is None or self._reader.done():
+                self._reader = asyncio.ensure_future(self._read_replies())
+            frame = await future
+        finally:
+            self._pending.pop(request_id, None)
+
+        if recv_binary:
+            view = frame.buffer
+            # raise errors sent back from the server
+            if bytes(view[0 : len(b"Error:")]) == b"Error:":
+                raise RuntimeError(frame.bytes.decode())
+            return view
+        return _parse_reply(frame.bytes.decode())
+
+    async def _read_replies(self) -> None:
+        """
+        Receive replies while any request is outstanding, resolving the future
+        of the request each reply belongs to.
+        """
+        try:
+            while self._pending:
+                request_id, _, frame = await self._socket.recv_multipart(copy=False)
+                future = self._pending.get(request_id.bytes)
+                # the caller may have stopped waiting, e.g. if it was cancelled
+                if future is not None and not future.done():
+                    future.set_result(frame)
+        except Exception as e:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(e)
+
+    async def to_ndarray(self, pda: pdarray) -> np.ndarray:
+        """
+        Convert the array to a np.ndarray, transferring array data from the
+        Arkouda server to client-side Python. This is the awaitable counterpart
+        of :meth:`arkouda.pdarray.to_ndarray`.
+
+        Parameters
+        ----------
+        pda : pdarray
+            The array to transfer
+
+        Returns
+        -------
+        np.ndarray
+            A numpy ndarray with the same attributes and data as the pdarray
+
+        Raises
+        ------
+        RuntimeError
+            Raised if there is a server-side error thrown or if the pdarray size
+            exceeds the built-in client.maxTransferBytes size limit
+        TypeError
+            Raised if pda is a bigint pdarray
+        """
+        if pda.dtype == bigint:
+            raise TypeError("AsyncClient.to_ndarray does not support bigint pdarrays")
+        if pda.size * pda.dtype.itemsize > client.maxTransferBytes:
+            raise RuntimeError(
+                "Array exceeds allowed size for transfer. Increase client.maxTransferBytes to allow"
+            )
+        data = cast(
+            memoryview,
+            await self.generic_msg(cmd="tondarray", args={"array": pda}, recv_binary=True),
+        )
+        if len(data) != pda.size * pda.dtype.itemsize:
+            raise RuntimeError(
+                f"Expected {pda.size * pda.dtype.itemsize} bytes but received {len(data)}"
+            )
+        # the received frame is read-only, so copy to make the result writable
+        return np.frombuffer(data, pda._transfer_dtype()).copy()
+
+    async def read_parquet(
+        self,
+        filenames: Union[str, List[str]],
+        datasets: Optional[Union[str, List[str]]] = None,
+        strict_types: bool = True,
+        allow_errors: bool = False,
+    ):
+        """
+        Read Arkouda objects from Parquet files. This is the awaitable
+        counterpart of :func:`arkouda.read_parquet`.
+
+        Parameters
+        ----------
+        filenames : str or List[str]
+            Filename/s to read objects from
+        datasets : str or List[str], optional
+            Datasets to read from the provided files; all datasets if None
+        strict_types : bool
+            If True (default), require all dtypes of a given dataset to have the
+            same precision and sign
+        allow_errors : bool
+            Default False, if True will allow files with read errors to be skipped
+            instead of failing
+
+        Returns
+        -------
+        For a single dataset returns an Arkouda pdarray, Arkouda Strings, or Arkouda ArrayView
+        object and for multiple datasets returns a dictionary of Arkouda pdarrays, Arkouda
+        Strings or Arkouda ArrayView objects.
+
+        Raises
+        ------
+        RuntimeError
+            Raised if there is a server-side error thrown
+
+        Notes
+        -----
+        The names of the datasets in the files are checked with a short blocking
+        request before the files are read asynchronously.
+        """
+        if isinstance(filenames, str):
+            filenames = [filenames]
+        datasets = _prep_datasets(filenames, datasets)
+        rep_msg = await self.generic_msg(
+            cmd="readAllParquet",
+            args=_read_parquet_args(filenames, datasets, strict_types, allow_errors),
+        )
+        rep = json.loads(cast(str, rep_msg))  # See GenSymIO._buildReadAllMsgJson for json structure
+        _parse_errors(rep, allow_errors)
+        return _build_objects(rep)
+
+    async def groupby(
+        self, keys: groupable, assume_sorted: bool = False, method: str = "auto"
+    ) -> GroupBy:
+        """
+        Group an array or a list of arrays by value. This is the awaitable
+        counterpart of :class:`arkouda.GroupBy`.
+
+        Parameters
+        ----------
+        keys : (list of) pdarray, Strings, or Categorical
+            The array to group by value, or if list, the column arrays to group by row
+        assume_sorted : bool
+            If True, assume keys is already sorted (Default: False)
+        method : str
+            "sort", "hash" or "auto" (Default), see :class:`arkouda.GroupBy`
+
+        Returns
+        -------
+        GroupBy
+            The grouping of keys
+
+        Raises
+        ------
+        RuntimeError
+            Raised if there is a server-side error thrown
+
+        Notes
+        -----
+        Grouping, which sorts the keys, runs asynchronously. Gathering the
+        unique keys from the sorted keys is then a short blocking request.
+        """
+        args, _ = _create_groupby_args(keys, assume_sorted, method)
+        repmsg = await self.generic_msg(cmd="createGroupBy", args=args)
+        return GroupBy(keys, assume_sorted, method, create_reply=repmsg)
@@ -17,6 +17,7 @@ from typing import (
 import numpy as np  # type: ignore
 from typeguard import typechecked
 
+from arkouda.client import generic_msg
 from arkouda.decorators import objtypedec
 from arkouda.dtypes import bool as akbool
 from arkouda.dtypes import int64 as akint64
@@ -880,28 +881,44 @@ class Categorical:
         dataset: str = "categorical_array",
         mode: str = "truncate",
         compression: Optional[str] = None,
+        row_group_size: Optional[int] = None,
+        data_page_size: Optional[int] = None,
+        write_statistics: bool = True,
+        is_sorted: bool = False,
     ) -> str:
         """
-        This functionality is currently not supported and will also raise a RuntimeError.
-        Support is in development.
         Save the Categorical to Parquet. The result is a collection of files,
         one file per locale of the arkouda server, where each filename starts
         with prefix_path. Each locale saves its chunk of the array to its
-        corresponding file.
+        corresponding file as a dictionary-encoded string column, whose
+        dictionary is the categories and whose values are the codes, so the
+        strings of the values are never built.
 
         Parameters
         ----------
         prefix_path : str
             Directory and filename prefix that all output files share
         dataset : str
-            Name of the dataset to create in HDF5 files (must not already exist)
-        mode : str {'truncate' | 'append'}
-            By default, truncate (overwrite) output files, if they exist.
-            If 'append', create a new Categorical dataset within existing files.
+            Name of the column to create in the Parquet files
+        mode : str {'truncate'}
+            Truncate (overwrite) output files, if they exist. Appending a
+            Categorical to existing files is not supported.
         compression : str (Optional)
             Default None
             Provide the compression type to use when writing the file.
             Supported values: snappy, gzip, brotli, zstd, lz4
+        row_group_size : int (Optional)
+            The number of rows of each row group of each file. Default None
+            keeps the server default of 2**26 rows.
+        data_page_size : int (Optional)
+            The approximate size in bytes of each data page. Default None
+            keeps the Arrow default of 1MB.
+        write_statistics : bool
+            Whether to write the min/max statistics of each row group and
+            page, which readers use to skip them when filtering (Default: True)
+        is_sorted : bool
+            Whether to record in the metadata of the files that the values are
+            sorted in ascending order, which is not checked (Default: False)
 
         Returns
         -------
@@ -909,51 +926,53 @@ class Categorical:
 
         Raises
         ------
+        ValueError
+            Raised if mode is not 'truncate' or a size is not positive
         RuntimeError
-            On run due to compatability issues of Categorical with Parquet.
+            Raised if a server-side error is thrown saving the Categorical
+
         Notes
         -----
         - The prefix_path must be visible to the arkouda server and the user must
         have write permission.
         - Output files have names of the form ``<prefix_path>_LOCALE<i>``, where ``<i>``
         ranges from 0 to ``numLocales`` for `file_type='distribute'`.
-        - 'append' write mode is supported, but is not efficient.
-        - If any of the output files already exist and
-        the mode is 'truncate', they will be overwritten. If the mode is 'append'
-        and the number of output files is less than the number of locales or a
-        dataset with the same name already exists, a ``RuntimeError`` will result.
+        - If any of the output files already exist, they will be overwritten.
+        - Values equal to NAvalue are written as nulls.
         - Any file extension can be used.The file I/O does not rely on the extension to
         determine the file format.
+        - Use ``ak.read_parquet(..., read_dictionary=dataset)`` to read the
+        column back as a Categorical without building its strings.
+
         See Also
         --------
-        to_hdf
+        to_hdf, arkouda.read_parquet
         """
-        # due to the possibility that components will be different sizes,
-        # writing to Parquet is not supported at this time
-        raise RuntimeError("Categorical cannot be written to Parquet at this time due to its components "
-                           "potentially having different sizes.")
-        result = []
-        comp_dict = {k: v for k, v in self._get_components_dict().items() if v is not None}
-
-        if self.RequiredPieces.issubset(comp_dict.keys()):
-            # Honor the first mode but switch to append for all others
-            # since each following comp may wipe out the file
-            first = True
-            for k, v in comp_dict.items():
-                result.append(
-                    v.to_parquet(
-                        prefix_path,
-                        dataset=f"{dataset}.{k}",
-                        mode=(mode if first else "append"),
-                        compression=compression,
-                    )
-                )
-                first = False
-        else:
-            raise Exception(
-                "The required pieces of `categories` and `codes` were not populated on this Categorical"
-            )
-        return ";".join(result)
+        from arkouda.io import _parquet_write_args
+
+        if mode.lower() != "truncate":
+            raise ValueError("Categorical can only be written to Parquet in truncate mode")
+        return cast(
+            str,
+            generic_msg(
+                cmd="writeCategoricalParquet",
+                args={
+                    "codes": self.codes,
+                    "categories": self.categories,
+                    "nacode": self._NAcode,
+                    "dset": dataset,
+                    "prefix": prefix_path,
+                    "compression": compression,
+                    **_parquet_write_args(
+                        [dataset],
+                        row_group_size=row_group_size,
+                        data_page_size=data_page_size,
+                        write_statistics=write_statistics,
+                        sorted_by=[dataset] if is_sorted else None,
+                    ),
+                },
+            ),
+        )
 
     def save(
         self,
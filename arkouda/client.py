@@ -1,8 +1,13 @@
+import builtins
 import json
 import os
+import threading
 import warnings
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
 from enum import Enum
-from typing import Dict, List, Mapping, Optional, Tuple, Union, cast
+from typing import Deque, Dict, Iterator, List, Mapping, Optional, Tuple, Union, cast
 
 import pyfiglet  # type: ignore
 import zmq  # type: ignore
@@ -10,6 +15,7 @@ import zmq  # type: ignore
 from arkouda import __version__, io_util, security
 from arkouda.logger import getArkoudaLogger
 from arkouda.message import (
+    COMPACT_ARGS_MARKER,
     MessageFormat,
     MessageType,
     ParameterObject,
@@ -27,14 +33,20 @@ __all__ = [
     "get_server_commands",
     "print_server_commands",
     "ruok",
+    "Session",
 ]
 
 # stuff for zmq connection
 pspStr = ""
 context = zmq.Context()
-socket = context.socket(zmq.REQ)
 connected = False
-serverConfig = None
+# the Session used by the module-level functions, created by connect()
+_default_session: Optional["Session"] = None
+# the Session that generic_msg uses instead of the default one, within a Session's context
+_active_session: ContextVar[Optional["Session"]] = ContextVar("_active_session", default=None)
+# the tokens for restoring _active_session when the Sessions entered in this context exit
+_session_tokens: ContextVar[Tuple[Token, ...]] = ContextVar("_session_tokens", default=())
+serverConfig: Optional[Mapping[str, Union[str, int, float]]] = None
 # username and token for when basic authentication is enabled
 username = ""
 token = ""
@@ -46,8 +58,30 @@ pdarrayIterThreshDefVal = 100
 pdarrayIterThresh = pdarrayIterThreshDefVal
 maxTransferBytesDefVal = 2**30
 maxTransferBytes = maxTransferBytesDefVal
+# arrays larger than this are transferred in chunks of at most this many bytes
+transferChunkBytesDefVal = 2**27
+transferChunkBytes = transferChunkBytesDefVal
+# server memory, in bytes, that GroupBy may keep allocated to reuse the
+# groupings of keys that are grouped again, 0 to disable the reuse
+groupbyCacheBytesDefVal = 2**28
+groupbyCacheBytes = groupbyCacheBytesDefVal
 # maximum number of capture group for regex
 regexMaxCaptures: int = -1
+# commands the server runs outside of its command map, which cannot be sent in a batch
+_unbatchable_cmds = {"array", "batch", "connect", "disconnect", "noop", "ruok", "shutdown"}
+# in-place updates whose replies callers ignore, which generic_msg queues in an active batch
+_deferrable_cmds = {
+    "set",
+    "opeqvv",
+    "opeqvs",
+    "[int]=val",
+    "[pdarray]=val",
+    "[pdarray]=pdarray",
+    "[slice]=val",
+    "[slice]=pdarray",
+}
+# batch of queued requests when inside a batch() context, None otherwise
+_batch: ContextVar[Optional["MessageBatch"]] = ContextVar("_batch", default=None)
 # unit conversion for get_mem_used
 _memunit2normunit = {
     "bytes": "b",
@@ -119,17 +153,20 @@ if mode == ClientMode.UI:
 # reset settings to default values
 def set_defaults() -> None:
     """
-    Sets client variables including verbose, maxTransferBytes and
-    pdarrayIterThresh to default values.
+    Sets client variables including verbose, maxTransferBytes,
+    transferChunkBytes, groupbyCacheBytes and pdarrayIterThresh to default
+    values.
 
     Returns
     -------
     None
     """
-    global verbose, maxTransferBytes, pdarrayIterThresh
+    global verbose, maxTransferBytes, transferChunkBytes, groupbyCacheBytes, pdarrayIterThresh
     verbose = verboseDefVal
     pdarrayIterThresh = pdarrayIterThreshDefVal
     maxTransferBytes = maxTransferBytesDefVal
+    transferChunkBytes = transferChunkBytesDefVal
+    groupbyCacheBytes = groupbyCacheBytesDefVal
 
 
 # create context, request end of socket, and connect to it
@@ -176,69 +213,43 @@ def connect(
     Notes
     -----
     On success, prints the connected address, as seen by the server. If called
-    with an existing connection, the socket will be re-initialized.
+    with an existing connection, the sockets will be re-initialized. The
+    connection is a :class:`Session` that the module-level functions use by
+    default.
     """
-    global context, socket, pspStr, connected, serverConfig, verbose, username, token, regexMaxCaptures
+    global pspStr, connected, serverConfig, username, token, regexMaxCaptures, _default_session
 
     logger.debug(f"ZMQ version: {zmq.zmq_version()}")
 
-    if connect_url:
-        url_values = _parse_url(connect_url)
-        server = url_values[0]
-        port = url_values[1]
-        if len(url_values) == 3:
-            access_token = url_values[2]
-
-    # "protocol://server:port"
-    pspStr = f"tcp://{server}:{port}"
-
-    # check to see if tunnelled connection is desired. If so, start tunnel
-    tunnel_server = os.getenv("ARKOUDA_TUNNEL_SERVER")
-    if tunnel_server:
-        (pspStr, _) = _start_tunnel(addr=pspStr, tunnel_server=tunnel_server)
-
-    logger.debug(f"psp = {pspStr}")
-
-    # create and configure socket for connections to arkouda server
-    socket = context.socket(zmq.REQ)  # request end of the zmq connection
-
-    # if timeout is specified, set send and receive timeout params
-    if timeout > 0:
-        socket.setsockopt(zmq.SNDTIMEO, timeout * 1000)
-        socket.setsockopt(zmq.RCVTIMEO, timeout * 1000)
-
-    # set token and username global variables
-    username = security.get_username()
-    token = cast(str, _set_access_token(access_token=access_token, connect_string=pspStr))
-
-    # connect to arkouda server
-    try:
-        socket.connect(pspStr)
-    except Exception as e:
-        raise ConnectionError(e)
-
-    # send the connect message
-    cmd = "connect"
-    logger.debug(f"[Python] Sending request: {cmd}")
+    if _default_session is not None:
+        _default_session.close()
+        connected = False
 
-    # send connect request to server and get the response confirming if
-    # the connect request succeeded and, if not not, the error message
-    return_message = _send_string_message(cmd=cmd)
-    logger.debug(f"[Python] Received response: {str(return_message)}")
+    _default_session = Session(
+        server=server,
+        port=port,
+        timeout=timeout,
+        access_token=access_token,
+        connect_url=connect_url,
+        zmq_context=context,
+    )
+    pspStr = _default_session.url
+    username = _default_session.username
+    token = _default_session.token
     connected = True
 
-    serverConfig = _get_config_msg()
-    if serverConfig["arkoudaVersion"] != __version__:
+    config = _default_session.config
+    serverConfig = config
+    if config["arkoudaVersion"] != __version__:
         warnings.warn(
             (
                 "Version mismatch between client ({}) and server ({}); "
                 + "this may cause some commands to fail or behave "
                 + "incorrectly! Updating arkouda is strongly recommended."
-            ).format(__version__, serverConfig["arkoudaVersion"]),
+            ).format(__version__, config["arkoudaVersion"]),
             RuntimeWarning,
         )
-    regexMaxCaptures = serverConfig["regexMaxCaptures"]  # type:ignore
-    clientLogger.info(return_message)
+    regexMaxCaptures = config["regexMaxCaptures"]  # type:ignore
 
 
 def _parse_url(url: str) -> Tuple[str, int, Optional[str]]:
@@ -394,142 +405,99 @@ def _start_tunnel(addr: str, tunnel_server: str) -> Tuple[str, object]:
         raise ConnectionError(e)
 
 
-def _send_string_message(
-    cmd: str, recv_binary: bool = False, args: str = None, size: int = -1
-) -> Union[str, memoryview]:
+# Smallest binary reply, in bytes, that is received directly into a caller's buffer
+_recvIntoMinBytes = 2**16
+
+
+def _recv_binary(socket: zmq.Socket, out=None) -> memoryview:
     """
-    Generates a RequestMessage encapsulating command and requesting
-    user information, sends it to the Arkouda server, and returns
-    either a string or binary depending upon the message format.
+    Receives a binary reply from the Arkouda server. If out is provided the
+    reply is received directly into it, so the data is not copied again.
 
     Parameters
     ----------
-    cmd : str
-        The name of the command to be executed by the Arkouda server
-    recv_binary : bool, defaults to False
-        Indicates if the return message will be a string or binary data
-    args : str
-        A delimited string containing 1..n command arguments
-    size : int
-        Default -1
-        Number of parameters contained in args. Only set if args is json.
+    socket : zmq.Socket
+        The socket the request was sent on
+    out : buffer, optional
+        Writable, contiguous buffer, such as a numpy array, sized for the
+        expected reply
 
     Returns
     -------
-    Union[str,memoryview]
-        The response string or binary data sent back from the Arkouda server
+    memoryview
+        The binary data sent back from the Arkouda server; when out is
+        provided, a view of the part of out that was written
 
     Raises
     ------
     RuntimeError
-        Raised if the return message contains the word "Error", indicating
-        a server-side error was thrown
-    ValueError
-        Raised if the return message is malformed JSON or is missing 1..n
-        expected fields
-
-    Notes
-    -----
-    - Size is not yet utilized. It is being provided in preparation for further development.
+        Raised if the server sent back an error or, when out is provided, if
+        the reply does not fit in out
     """
-    message = RequestMessage(
-        user=username, token=token, cmd=cmd, format=MessageFormat.STRING, args=args, size=size
-    )
-
-    logger.debug(f"sending message {message}")
-
-    socket.send_string(json.dumps(message.asdict()))
-
-    if recv_binary:
+    if out is None:
         frame = socket.recv(copy=False)
         view = frame.buffer
         # raise errors sent back from the server
         if bytes(view[0 : len(b"Error:")]) == b"Error:":
             raise RuntimeError(frame.bytes.decode())
         return view
-    else:
-        raw_message = socket.recv_string()
-        try:
-            return_message = ReplyMessage.fromdict(json.loads(raw_message))
-
-            # raise errors or warnings sent back from the server
-            if return_message.msgType == MessageType.ERROR:
-                raise RuntimeError(return_message.msg)
-            elif return_message.msgType == MessageType.WARNING:
-                warnings.warn(return_message.msg)
-            return return_message.msg
-        except KeyError as ke:
-            raise ValueError(f"Return message is missing the {ke} field")
-        except json.decoder.JSONDecodeError:
-            raise ValueError(f"Return message is not valid JSON: {raw_message}")
-
 
-def _send_binary_message(
-    cmd: str, payload: memoryview, recv_binary: bool = False, args: str = None, size: int = -1
-) -> Union[str, memoryview]:
+    out = memoryview(out).cast("B")
+    # Error messages longer than out would be truncated by recv_into, so small
+    # replies, where the extra copy is cheap, are received into a new frame
+    if len(out) >= _recvIntoMinBytes and hasattr(socket, "recv_into"):
+        # recv_into returns the size of the full reply, truncating what does not fit
+        nbytes = socket.recv_into(out)
+        reply = out[: builtins.min(nbytes, len(out))]
+    else:
+        frame = socket.recv(copy=False)
+        nbytes = len(frame.buffer)
+        reply = frame.buffer
+    # an error reply has a different size than the data expected in out
+    if nbytes != len(out):
+        if bytes(reply[0 : len(b"Error:")]) == b"Error:":
+            raise RuntimeError(bytes(reply).decode(errors="replace"))
+        raise RuntimeError(f"Expected {len(out)} bytes but received {nbytes}")
+    if reply.obj is not out.obj:
+        out[:] = reply
+    return out
+
+
+def _parse_reply(raw_message: str) -> str:
     """
-    Generates a RequestMessage encapsulating command and requesting user information,
-    information prepends the binary payload, sends the binary request to the Arkouda
-    server, and returns either a string or binary depending upon the message format.
+    Parses a string reply from the Arkouda server, raising any error and
+    warning any warning sent back.
 
     Parameters
     ----------
-    cmd : str
-        The name of the command to be executed by the Arkouda server
-    payload : memoryview
-        The binary data to be converted to a pdarray, Strings, or Categorical
-        object on the Arkouda server
-    recv_binary : bool, defaults to False
-        Indicates if the return message will be a string or binary data
-    args : str
-        A delimited string containing 1..n command arguments
+    raw_message : str
+        The JSON-formatted ReplyMessage sent by the server
 
     Returns
     -------
-    Union[str,memoryview]
-        The response string or binary data sent back from the Arkouda server
+    str
+        The message of the reply
 
     Raises
     ------
     RuntimeError
-        Raised if the return message contains the word "Error", indicating
-        a server-side error was thrown
+        Raised if the reply is an error, indicating a server-side error was thrown
     ValueError
-        Raised if the return message is malformed JSON or is missing 1..n
-        expected fields
+        Raised if the reply is malformed JSON or is missing 1..n expected fields
     """
-    # Note - Size is a placeholder here because Binary msg not yet support json args
-    message = RequestMessage(
-        user=username, token=token, cmd=cmd, format=MessageFormat.BINARY, args=args, size=size
-    )
-
-    logger.debug(f"sending message {message}")
-
-    socket.send(f"{json.dumps(message.asdict())}BINARY_PAYLOAD".encode(), flags=zmq.SNDMORE)
-    socket.send(payload, copy=False)
+    try:
+        return_message = ReplyMessage.fromdict(json.loads(raw_message))
+    except KeyError as ke:
+        raise ValueError(f"Return message is missing the {ke} field")
+    except json.decoder.JSONDecodeError:
+        raise ValueError(f"Return message is not valid JSON, may be server-side error: {raw_message}")
 
-    if recv_binary:
-        frame = socket.recv(copy=False)
-        view = frame.buffer
-        # raise errors sent back from the server
-        if bytes(view[0 : len(b"Error:")]) == b"Error:":
-            raise RuntimeError(frame.bytes.decode())
-        return view
-    else:
-        raw_message = socket.recv_string()
-        try:
-            return_message = ReplyMessage.fromdict(json.loads(raw_message))
-
-            # raise errors or warnings sent back from the server
-            if return_message.msgType == MessageType.ERROR:
-                raise RuntimeError(return_message.msg)
-            elif return_message.msgType == MessageType.WARNING:
-                warnings.warn(return_message.msg)
-            return return_message.msg
-        except KeyError as ke:
-            raise ValueError(f"Return message is missing the {ke} field")
-        except json.decoder.JSONDecodeError:
-            raise ValueError(f"{raw_message} is not valid JSON, may be server-side error")
+    # raise errors or warnings sent back from the server
+    if return_message.msgType == MessageType.ERROR:
+        raise RuntimeError(return_message.msg)
+    elif return_message.msgType == MessageType.WARNING:
+        warnings.warn(return_message.msg)
+    return return_message.msg
 
 
 # message arkouda server the client is disconnecting from the server
@@ -546,18 +514,10 @@ def disconnect() -> None:
     ConnectionError
         Raised if there's an error disconnecting from the Arkouda server
     """
-    global socket, pspStr, connected, serverConfig, verbose, token
+    global connected, serverConfig
 
     if connected:
-        # send disconnect message to server
-        message = "disconnect"
-        logger.debug(f"[Python] Sending request: {message}")
-        return_message = cast(str, _send_string_message(message))
-        logger.debug(f"[Python] Received response: {return_message}")
-        try:
-            socket.disconnect(pspStr)
-        except Exception as e:
-            raise ConnectionError(e)
+        return_message = cast(Session, _default_session).disconnect()
         connected = False
         serverConfig = None
         clientLogger.info(return_message)
@@ -584,21 +544,11 @@ def shutdown() -> None:
         Raised if the client is not connected to the Arkouda server or
         there is an error in disconnecting from the server
     """
-    global socket, pspStr, connected, serverConfig, verbose
+    global connected, serverConfig
 
     if not connected:
         raise RuntimeError("not connected, cannot shutdown server")
-    # send shutdown message to server
-    message = "shutdown"
-
-    logger.debug(f"[Python] Sending request: {message}")
-    return_message = cast(str, _send_string_message(message))
-    logger.debug(f"[Python] Received response: {return_message}")
-
-    try:
-        socket.disconnect(pspStr)
-    except Exception as e:
-        raise RuntimeError(e)
+    cast(Session, _default_session).shutdown()
     connected = False
     serverConfig = None
 
@@ -642,12 +592,49 @@ def _json_args_to_str(json_obj: Dict = None) -> Tuple[int, str]:
     return len(j), json.dumps(j)
 
 
+def _compact_args_to_str(args: Dict = None) -> Tuple[int, str]:
+    """
+    Convert Python Dictionary into the compact argument format, which the
+    Arkouda Server parses in a single pass. Unlike the JSON format, list and
+    dict values are not JSON-encoded again inside each parameter, so long
+    lists of names cost time linear in their length to encode and parse.
+
+    Parameters
+    ----------
+    args : dict
+        Python dictionary of key:val representing command arguments
+
+    Return
+    ------
+    Tuple - the number of parameters found and the compact formatted string
+
+    Raises
+    ------
+    TypeError
+        - Keys are a type other than str
+        - A list contains values of multiple types.
+
+    See Also
+    --------
+    arkouda.message.ParameterObject.compact
+    """
+    if args is None:
+        return 0, ""
+    params = []
+    for key, val in args.items():
+        if not isinstance(key, str):
+            raise TypeError(f"Argument keys are required to be str. Found {type(key)}")
+        params.append(ParameterObject.factory(key, val, compact=True).compact)
+    return len(params), COMPACT_ARGS_MARKER + "".join(params)
+
+
 def generic_msg(
     cmd: str,
     args: Dict = None,
     payload: memoryview = None,
     send_binary: bool = False,
     recv_binary: bool = False,
+    out=None,
 ) -> Union[str, memoryview]:
     """
     Sends a binary or string message composed of a command and corresponding
@@ -665,6 +652,10 @@ def generic_msg(
         Indicates if the message to be sent is a string or binary
     recv_binary : bool
         Indicates if the return message will be a string or binary
+    out : buffer, optional
+        Writable, contiguous buffer, such as a numpy array, sized for the binary return
+        message. If provided, the binary return message is received directly
+        into it instead of into a new read-only buffer.
 
     Returns
     -------
@@ -684,30 +675,566 @@ def generic_msg(
     If the server response is a string, the string corresponds to a success
     confirmation, warn message, or error message. A memoryview response
     corresponds to an Arkouda array output as a numpy array.
+
+    Inside a :func:`batch` context, in-place updates such as ``a[i] = v`` and
+    ``a += b`` are queued and return a placeholder reply. Any other string
+    command is sent in the same request as the queued ones, so they cost no
+    extra round trip.
     """
-    global socket, pspStr, connected, verbose
+    session = _current_session()
+
+    batch = _batch.get()
+    if batch is not None:
+        if not (send_binary or recv_binary or cmd in _unbatchable_cmds):
+            reply = batch.generic_msg(cmd, args)
+            if cmd in _deferrable_cmds:
+                return f"{cmd} queued in batch"
+            batch.flush()
+            return reply.result()
+        # preserve program order by sending any queued requests first
+        if len(batch) > 0:
+            batch.flush()
+
+    return session.generic_msg(
+        cmd=cmd,
+        args=args,
+        payload=payload,
+        send_binary=send_binary,
+        recv_binary=recv_binary,
+        out=out,
+    )
 
-    if not connected:
+
+def _current_session() -> "Session":
+    """
+    The Session that generic_msg sends requests to: the one whose context is
+    active, if any, otherwise the one created by connect().
+    """
+    session = _active_session.get()
+    if session is not None:
+        return session
+    if not connected or _default_session is None:
         raise RuntimeError("client is not connected to a server")
+    return _default_session
 
-    size, msg_args = _json_args_to_str(args)
 
-    try:
-        if send_binary:
-            assert payload is not None
-            return _send_binary_message(
-                cmd=cmd, payload=payload, recv_binary=recv_binary, args=msg_args, size=size
+class Session:
+    """
+    A connection to an Arkouda server that can be shared between threads.
+    Each request checks out a socket from a pool, so threads send requests
+    concurrently instead of taking turns on one socket. The module-level
+    functions, such as :func:`generic_msg`, use the Session created by
+    :func:`connect` unless another Session's context is active.
+
+    Parameters
+    ----------
+    server : str, optional
+        The hostname of the server (must be visible to the current
+        machine). Defaults to `localhost`.
+    port : int, optional
+        The port of the server. Defaults to 5555.
+    timeout : int, optional
+        The timeout in seconds for send and receive operations. Defaults to
+        0 seconds, which is interpreted as no timeout.
+    access_token : str, optional
+        The token used to access an Arkouda server where authentication is
+        enabled. Defaults to None.
+    connect_url : str, optional
+        The complete url in the format of tcp://server:port?token=<token_value>
+        where the token is optional
+    pool_size : int, optional
+        The maximum number of sockets, and so of concurrent requests, of the
+        Session. Defaults to 8.
+    zmq_context : zmq.Context, optional
+        The context to create sockets in. Defaults to a new context.
+    compact_args : bool, optional
+        If True (default), send command arguments in the compact format when
+        the server accepts it, and in JSON otherwise.
+
+    Attributes
+    ----------
+    url : str
+        The address of the server, e.g. "tcp://localhost:5555"
+    username : str
+        The user the requests are sent as
+    token : str
+        The access token the requests are sent with
+    config : Mapping
+        The server's config, as returned by :func:`get_config`
+    compact_args : bool
+        Whether the command arguments are sent in the compact format
+
+    Raises
+    ------
+    ConnectionError
+        Raised if there's an error in connecting to the Arkouda server
+    ValueError
+        Raised if there's an error in parsing the connect_url parameter
+    RuntimeError
+        Raised if there is a server-side error
+
+    Notes
+    -----
+    The server runs commands one at a time, so concurrent requests wait for
+    each other on the server. Arkouda objects belong to the server they were
+    created on and must only be used with a Session connected to it.
+
+    Examples
+    --------
+    >>> other = ak.Session("other-host", 5555)
+    >>> with other:
+    ...     b = ak.arange(10)  # created on other-host
+    """
+
+    def __init__(
+        self,
+        server: str = "localhost",
+        port: int = 5555,
+        timeout: int = 0,
+        access_token: str = None,
+        connect_url: str = None,
+        pool_size: int = 8,
+        zmq_context: zmq.Context = None,
+        compact_args: bool = True,
+    ) -> None:
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be positive, got {pool_size}")
+        if connect_url:
+            url_values = _parse_url(connect_url)
+            server = url_values[0]
+            port = url_values[1]
+            if len(url_values) == 3:
+                access_token = url_values[2]
+
+        # "protocol://server:port"
+        url = f"tcp://{server}:{port}"
+
+        # check to see if tunnelled connection is desired. If so, start tunnel
+        tunnel_server = os.getenv("ARKOUDA_TUNNEL_SERVER")
+        if tunnel_server:
+            (url, _) = _start_tunnel(addr=url, tunnel_server=tunnel_server)
+        logger.debug(f"psp = {url}")
+
+        self.url = url
+        self.username = security.get_username()
+        self.token = cast(str, _set_access_token(access_token=access_token, connect_string=url))
+        self._timeout = timeout
+        self._context = zmq_context if zmq_context is not None else zmq.Context()
+        self._idle: List[zmq.Socket] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        # names of objects to delete with the next request, see delete()
+        self._deletes: Deque[str] = deque()
+        self.compact_args = False
+
+        # send connect request to server and get the response confirming if
+        # the connect request succeeded and, if not not, the error message
+        return_message = self.generic_msg(cmd="connect")
+        logger.debug(f"[Python] Received response: {str(return_message)}")
+        clientLogger.info(return_message)
+
+        # negotiate the argument format from the formats the server accepts
+        raw_config = cast(str, self.generic_msg(cmd="getconfig"))
+        try:
+            self.config: Mapping[str, Union[str, int, float]] = json.loads(raw_config)
+        except json.decoder.JSONDecodeError:
+            raise ValueError(f"Returned config is not valid JSON: {raw_config}")
+        self.compact_args = compact_args and bool(self.config.get("compactArgs", False))
+
+    def __enter__(self) -> "Session":
+        _session_tokens.set(_session_tokens.get() + (_active_session.set(self),))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        tokens = _session_tokens.get()
+        _session_tokens.set(tokens[:-1])
+        _active_session.reset(tokens[-1])
+
+    def _new_socket(self) -> zmq.Socket:
+        # create and configure socket for connections to arkouda server
+        socket = self._context.socket(zmq.REQ)  # request end of the zmq connection
+
+        # if timeout is specified, set send and receive timeout params
+        if self._timeout > 0:
+            socket.setsockopt(zmq.SNDTIMEO, self._timeout * 1000)
+            socket.setsockopt(zmq.RCVTIMEO, self._timeout * 1000)
+        try:
+            socket.connect(self.url)
+        except Exception as e:
+            socket.close(linger=0)
+            raise ConnectionError(e)
+        return socket
+
+    @contextmanager
+    def _socket(self) -> Iterator[zmq.Socket]:
+        """
+        Check out a socket for one request and reply, waiting if all of the
+        pool's sockets are in use.
+        """
+        with self._slots:
+            with self._lock:
+                socket = self._idle.pop() if self._idle else None
+            if socket is None:
+                socket = self._new_socket()
+            try:
+                yield socket
+            except RuntimeError:
+                # errors sent back by the server arrive as a whole reply, which
+                # leaves the socket ready for the next request
+                with self._lock:
+                    self._idle.append(socket)
+                raise
+            except BaseException:
+                # e.g. if the connection fails or the user interrupts during command
+                # execution, the socket gets out of sync, so replace it instead of
+                # returning it to the pool
+                socket.close(linger=0)
+                raise
+            with self._lock:
+                self._idle.append(socket)
+
+    def generic_msg(
+        self,
+        cmd: str,
+        args: Dict = None,
+        payload: memoryview = None,
+        send_binary: bool = False,
+        recv_binary: bool = False,
+        out=None,
+    ) -> Union[str, memoryview]:
+        """
+        Sends a binary or string message composed of a command and corresponding
+        arguments to the server of this Session, returning the response sent by
+        the server. See :func:`arkouda.client.generic_msg` for the parameters.
+
+        Returns
+        -------
+        Union[str, memoryview]
+            The string or binary return message
+
+        Raises
+        ------
+        RuntimeError
+            Raised if there is a server-side error thrown
+        ValueError
+            Raised if the return message is malformed JSON or is missing 1..n
+            expected fields
+        """
+        deletes = self._take_deletes()
+        if deletes and cmd == "batch" and args is not None:
+            return self._batch_with_deletes(args, deletes)
+
+        message = self._request_message(cmd, args, send_binary)
+        if deletes:
+            delete_message = self._request_message(
+                "deleteMany", {"size": len(deletes), "names": deletes}
             )
+            if send_binary or recv_binary or cmd in _unbatchable_cmds:
+                # send the deletions ahead of the request
+                self._send(delete_message)
+            else:
+                # piggyback the deletions on the request, ahead of it so their memory is freed first
+                batch_message = self._request_message(
+                    "batch", {"size": 2, "requests": [delete_message, message]}
+                )
+                replies = json.loads(cast(str, self._send(batch_message)))
+                _parse_reply(replies[0])
+                return _parse_reply(replies[1])
+
+        return self._send(message, payload, recv_binary, out)
+
+    def _batch_with_deletes(self, args: Dict, deletes: List[str]) -> str:
+        """
+        Send a batch request with the deletions as its last request, since its
+        queued commands may still refer to the objects being deleted, and
+        return the replies of the queued commands.
+        """
+        delete_message = self._request_message("deleteMany", {"size": len(deletes), "names": deletes})
+        requests = list(args["requests"]) + [delete_message]
+        replies = json.loads(
+            cast(
+                str,
+                self._send(
+                    self._request_message("batch", {"size": len(requests), "requests": requests})
+                ),
+            )
+        )
+        delete_reply = replies.pop()
+        if any(
+            ReplyMessage.fromdict(json.loads(reply)).msgType == MessageType.ERROR for reply in replies
+        ):
+            # a queued command failed, so the deletions were skipped
+            self._deletes.extend(deletes)
         else:
-            assert payload is None
-            return _send_string_message(cmd=cmd, args=msg_args, size=size, recv_binary=recv_binary)
-
-    except KeyboardInterrupt as e:
-        # if the user interrupts during command execution, the socket gets out
-        # of sync reset the socket before raising the interrupt exception
-        socket = context.socket(zmq.REQ)
-        socket.connect(pspStr)
-        raise e
+            _parse_reply(delete_reply)
+        return json.dumps(replies)
+
+    def _request_message(self, cmd: str, args: Dict = None, send_binary: bool = False) -> str:
+        size, msg_args = (_compact_args_to_str if self.compact_args else _json_args_to_str)(args)
+        message = RequestMessage(
+            user=self.username,
+            token=self.token,
+            cmd=cmd,
+            format=MessageFormat.BINARY if send_binary else MessageFormat.STRING,
+            args=msg_args,
+            size=size,
+        )
+        logger.debug(f"sending message {message}")
+        return json.dumps(message.asdict())
+
+    def _send(
+        self, message: str, payload: memoryview = None, recv_binary: bool = False, out=None
+    ) -> Union[str, memoryview]:
+        """
+        Send a request on a socket from the pool and receive its reply.
+        """
+        with self._socket() as socket:
+            if payload is not None:
+                socket.send(f"{message}BINARY_PAYLOAD".encode(), flags=zmq.SNDMORE)
+                socket.send(payload, copy=False)
+            else:
+                socket.send_string(message)
+
+            if recv_binary:
+                return _recv_binary(socket, out)
+            raw_message = socket.recv_string()
+        return _parse_reply(raw_message)
+
+    def delete(self, name: str) -> None:
+        """
+        Queue the deletion of a server-side object. Queued deletions are sent
+        to the server together with the next request of the Session, so
+        deleting many objects costs at most one round trip.
+
+        Parameters
+        ----------
+        name : str
+            The name of the object in the server's symbol table
+
+        Notes
+        -----
+        Registered objects are not deleted. This is safe to call from
+        ``__del__`` methods, since it never communicates with the server.
+        """
+        self._deletes.append(name)
+
+    def _take_deletes(self) -> List[str]:
+        names = []
+        # popleft is atomic, so deletions queued meanwhile by other threads or by GC are kept
+        while self._deletes:
+            try:
+                names.append(self._deletes.popleft())
+            except IndexError:
+                break
+        return names
+
+    def close(self) -> None:
+        """
+        Close the idle sockets of the Session without notifying the server.
+        Sockets in use are closed when their requests complete.
+        """
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for socket in idle:
+            socket.close(linger=0)
+
+    def disconnect(self) -> str:
+        """
+        Disconnect from the server and close the sockets of the Session.
+
+        Returns
+        -------
+        str
+            The reply of the server
+
+        Raises
+        ------
+        RuntimeError
+            Raised if there is a server-side error thrown
+        """
+        # send disconnect message to server
+        logger.debug("[Python] Sending request: disconnect")
+        return_message = cast(str, self.generic_msg(cmd="disconnect"))
+        logger.debug(f"[Python] Received response: {return_message}")
+        self.close()
+        return return_message
+
+    def shutdown(self) -> None:
+        """
+        Send a shutdown message to the server, which deletes all objects in the
+        SymTable and stops the server, then close the sockets of the Session.
+
+        Raises
+        ------
+        RuntimeError
+            Raised if there is a server-side error thrown
+        """
+        logger.debug("[Python] Sending request: shutdown")
+        return_message = cast(str, self.generic_msg(cmd="shutdown"))
+        logger.debug(f"[Python] Received response: {return_message}")
+        self.close()
+
+
+class BatchReply:
+    """
+    Placeholder for the reply to a command queued in a MessageBatch. The
+    reply becomes available once the batch has been flushed to the server.
+    """
+
+    __slots__ = ("cmd", "_reply")
+
+    def __init__(self, cmd: str) -> None:
+        self.cmd = cmd
+        self._reply: Optional[ReplyMessage] = None
+
+    @property
+    def done(self) -> bool:
+        """
+        True if the server has replied to the queued command
+        """
+        return self._reply is not None
+
+    def result(self) -> str:
+        """
+        Return the reply message sent back by the server for the queued command.
+
+        Returns
+        -------
+        str
+            The response string sent back from the Arkouda server
+
+        Raises
+        ------
+        RuntimeError
+            Raised if the batch has not been flushed yet or if the command
+            resulted in a server-side error
+        """
+        if self._reply is None:
+            raise RuntimeError(f"{self.cmd} has not been sent; flush the batch first")
+        if self._reply.msgType == MessageType.ERROR:
+            raise RuntimeError(self._reply.msg)
+        return self._reply.msg
+
+    def __repr__(self) -> str:
+        return f"BatchReply(cmd={self.cmd!r}, reply={self._reply!r})"
+
+
+class MessageBatch:
+    """
+    Queue of string commands that are sent to the Arkouda server as a single
+    request. The server executes the queued commands in order and sends all of
+    the replies back together, so a batch of n commands costs one round trip
+    instead of n. Use via the :func:`batch` context manager.
+    """
+
+    def __init__(self) -> None:
+        self._requests: List[str] = []
+        self._replies: List[BatchReply] = []
+
+    def __len__(self) -> int:
+        return len(self._requests)
+
+    def generic_msg(self, cmd: str, args: Dict = None) -> BatchReply:
+        """
+        Queue a command to be sent with the next flush of the batch.
+
+        Parameters
+        ----------
+        cmd : str
+            The server-side command to be executed
+        args : dict
+            The command arguments
+
+        Returns
+        -------
+        BatchReply
+            Placeholder that holds the server reply once the batch is flushed
+        """
+        self._requests.append(_current_session()._request_message(cmd, args))
+        reply = BatchReply(cmd)
+        self._replies.append(reply)
+        return reply
+
+    def flush(self) -> None:
+        """
+        Send all queued commands to the server as a single request.
+
+        Raises
+        ------
+        RuntimeError
+            Raised if any of the queued commands resulted in a server-side error.
+            Commands queued after the failing one are not executed.
+        """
+        if not self._requests:
+            return
+        requests, replies = self._requests, self._replies
+        self._requests, self._replies = [], []
+        raw_replies = json.loads(
+            cast(
+                str,
+                generic_msg(cmd="batch", args={"size": len(requests), "requests": requests}),
+            )
+        )
+        for reply, raw_reply in zip(replies, raw_replies):
+            reply._reply = ReplyMessage.fromdict(json.loads(raw_reply))
+        for reply in replies:
+            if reply._reply is not None and reply._reply.msgType == MessageType.WARNING:
+                warnings.warn(reply._reply.msg)
+        for reply in replies:
+            if reply._reply is not None and reply._reply.msgType == MessageType.ERROR:
+                raise RuntimeError(reply._reply.msg)
+
+
+@contextmanager
+def batch() -> Iterator[MessageBatch]:
+    """
+    Context manager that queues commands client-side and sends them to the
+    server as a single request, either when the context exits or when
+    MessageBatch.flush is called.
+
+    Yields
+    ------
+    MessageBatch
+        The batch to which commands are queued via MessageBatch.generic_msg
+
+    Raises
+    ------
+    RuntimeError
+        Raised if batches are nested or if a queued command resulted in a
+        server-side error
+
+    Notes
+    -----
+    Only commands that send and receive strings can be batched. While the
+    batch is open, :func:`generic_msg`, and so every pdarray operation, goes
+    through it: in-place updates such as ``a[i] = v``, ``a += b`` and
+    ``a.fill(v)`` are queued, and any other string command is sent together
+    with the queued commands in one request. Binary transfers first flush the
+    queued commands, so the server sees every command in program order. An
+    error in a queued update is raised by the command that sends it.
+    If the body of the context raises, the queued commands are discarded.
+
+    Examples
+    --------
+    >>> with ak.client.batch() as b:
+    ...     for a in arrays:
+    ...         b.generic_msg(cmd="delete", args={"name": a.name})
+
+    >>> # 1000 updates and the sum are sent in one request
+    >>> with ak.client.batch():
+    ...     for i in range(1000):
+    ...         a[i] = i
+    ...     total = a.sum()
+    """
+    if _batch.get() is not None:
+        raise RuntimeError("batch contexts cannot be nested")
+    batch = MessageBatch()
+    reset_token = _batch.set(batch)
+    try:
+        yield batch
+        batch.flush()
+    finally:
+        _batch.reset(reset_token)
 
 
 def get_config() -> Mapping[str, Union[str, int, float]]:
@@ -1,28 +1,34 @@
 from __future__ import annotations
 
+import builtins
 import json
 import os
 import random
 from collections import UserDict
-from re import compile, match
-from typing import Callable, Dict, List, Optional, Union, cast
+from re import compile, escape, fullmatch, match
+from typing import Callable, Dict, List, Optional, Tuple, Union, cast
 from warnings import warn
 
 import numpy as np  # type: ignore
 import pandas as pd  # type: ignore
+import pyarrow as pa  # type: ignore
 from typeguard import typechecked
 
 from arkouda import list_registry
 from arkouda.categorical import Categorical
 from arkouda.client import generic_msg, maxTransferBytes
 from arkouda.client_dtypes import BitVector, Fields, IPv4
+from arkouda.dtypes import bigint
 from arkouda.dtypes import bool as akbool
+from arkouda.dtypes import dtype as akdtype
 from arkouda.dtypes import float64 as akfloat64
+from arkouda.dtypes import get_server_byteorder
 from arkouda.dtypes import int64 as akint64
 from arkouda.groupbyclass import GroupBy as akGroupBy
 from arkouda.groupbyclass import unique
 from arkouda.index import Index
 from arkouda.io import _dict_recombine_segarrays, get_filetype, load_all
+from arkouda.join import _merge_indices
 from arkouda.numeric import cast as akcast
 from arkouda.numeric import cumsum
 from arkouda.numeric import isnan as akisnan
@@ -45,10 +51,12 @@ pd.set_option("display.max_colwidth", 65)
 
 __all__ = [
     "DataFrame",
+    "ChunkedDataFrame",
     "sorted",
     "intersect",
     "invert_permutation",
     "intx",
+    "merge",
 ]
 
 
@@ -111,6 +119,41 @@ class GroupBy(AggregateOps):
     def count(self):
         return Series(self.gb.count())
 
+    def agg(self, ops: Dict[str, Union[str, List[str]]]) -> DataFrame:
+        """
+        Aggregate several columns, computing all of the reductions with a
+        single request to the server.
+
+        Parameters
+        ----------
+        ops : dict
+            Maps column names to the name of a reduction operator or to a list
+            of operator names
+
+        Returns
+        -------
+        DataFrame
+            Indexed by the unique keys, with one column per reduction. A
+            column with a single operator keeps its name; otherwise the
+            reductions are named "<column>_<operator>".
+
+        Examples
+        --------
+        >>> df = ak.DataFrame({'k': ak.array([0, 1, 0]), 'a': ak.array([1, 2, 3])})
+        >>> df.groupby('k').agg({'a': ['sum', 'max']})
+           a_sum  a_max
+        0      4      3
+        1      2      2
+        """
+        names, values, operators = [], [], []
+        for col, col_ops in ops.items():
+            for op in [col_ops] if isinstance(col_ops, str) else col_ops:
+                names.append(col if isinstance(col_ops, str) else f"{col}_{op}")
+                values.append(self.df.data[col])
+                operators.append(op)
+        keys, aggregates = self.gb.aggregate(values, operators)
+        return DataFrame(dict(zip(names, aggregates)), index=Index.factory(keys))
+
     def diff(self, colname):
         """Create a difference aggregate for the given column
 
@@ -1396,6 +1439,12 @@ class DataFrame(UserDict):
         -------
         pandas.DataFrame
             The result of converting this DataFrame to a pandas DataFrame.
+
+        Notes
+        -----
+        Numeric, Strings, Categorical and SegArray columns are transferred
+        together in a single request; columns of other types are transferred
+        one at a time.
         """
 
         self.update_size()
@@ -1433,7 +1482,12 @@ class DataFrame(UserDict):
 
         # Proceed with conversion if possible
         pandas_data = {}
+        # Transfer every column with an Arrow layout in a single request
+        bulk = self._bulk_transfer(self._columns)
         for key in self._columns:
+            if key in bulk:
+                pandas_data[key] = _bulk_to_pandas(bulk[key])
+                continue
             val = self[key]
             try:
                 # in order for proper pandas functionality, SegArrays must be seen as 1d
@@ -1449,6 +1503,144 @@ class DataFrame(UserDict):
         else:
             return pd.DataFrame(data=pandas_data)
 
+    def to_arrow(self) -> pa.Table:
+        """
+        Send this DataFrame to a pyarrow Table. Columns with an Arrow layout are
+        transferred together in a single request and wrapped without copying.
+
+        Returns
+        -------
+        pyarrow.Table
+            The result of converting this DataFrame to a pyarrow Table. Strings
+            columns become large_string columns, Categorical columns become
+            dictionary columns and SegArray columns become large_list columns.
+
+        Raises
+        ------
+        RuntimeError
+            Raised if there is a server-side error thrown or if the transfer
+            exceeds client.maxTransferBytes
+        TypeError
+            Raised if a column is a bigint pdarray
+
+        See Also
+        --------
+        to_pandas
+
+        Notes
+        -----
+        Columns of other types, such as Datetime, are transferred one at a time
+        and converted with pyarrow.array.
+
+        Examples
+        --------
+        >>> df = ak.DataFrame({"a": ak.arange(3), "b": ak.array(["x", "y", "z"])})
+        >>> df.to_arrow().to_pydict()
+        {'a': [0, 1, 2], 'b': ['x', 'y', 'z']}
+        """
+        self.update_size()
+        bulk = self._bulk_transfer(self._columns)
+        arrays = []
+        for key in self._columns:
+            if key in bulk:
+                col = bulk[key]
+                arrays.append(pa.array(col) if isinstance(col, np.ndarray) else col)
+            else:
+                val = self[key]
+                if isinstance(val, pdarray) and val.dtype == bigint:
+                    raise TypeError(f"Column {key} is a bigint pdarray, which has no Arrow type")
+                arrays.append(pa.array(val.to_list() if isinstance(val, SegArray) else val.to_ndarray()))
+        return pa.Table.from_arrays(arrays, names=[str(key) for key in self._columns])
+
+    def _bulk_transfer(self, columns: List[str]) -> Dict[str, Union[np.ndarray, pa.Array]]:
+        """
+        Transfer the columns that have an Arrow layout in a single request.
+        Numeric columns are returned as numpy arrays and Strings, Categorical and
+        SegArray columns as pyarrow arrays, all viewing one received buffer.
+        Columns of any other type are left out of the result.
+        """
+        from arkouda.client import maxTransferBytes
+
+        if get_server_byteorder() != "little":
+            # Arrow buffers are little-endian
+            return {}
+
+        def is_plain(pda) -> bool:
+            # subclasses such as Datetime convert their values in to_ndarray
+            return type(pda) is pdarray and pda.dtype.name in _bulk_dtypes
+
+        # the server components and, for each column, the dtype and size of its buffers
+        components: List[str] = []
+        layout = []
+        for key in columns:
+            val = self[key]
+            if is_plain(val):
+                components.append(f"pdarray {val.name}")
+                layout.append((key, "pdarray", [(val.dtype, val.size)]))
+            elif isinstance(val, Strings):
+                components.append(f"strings {val.entry.name}")
+                layout.append((key, "strings", _strings_buffers(val)))
+            elif isinstance(val, Categorical) and is_plain(val.codes):
+                if val.categories.size > val.codes.size:
+                    val = val.reset_categories()
+                components += [f"pdarray {val.codes.name}", f"strings {val.categories.entry.name}"]
+                layout.append(
+                    (
+                        key,
+                        "categorical",
+                        [(val.codes.dtype, val.size)] + _strings_buffers(val.categories),
+                    )
+                )
+            elif isinstance(val, SegArray) and is_plain(val.values):
+                components += [
+                    f"segments {val.segments.name} {val.values.name}",
+                    f"pdarray {val.values.name}",
+                ]
+                layout.append(
+                    (
+                        key,
+                        "segarray",
+                        [(akint64, val.size + 1), (val.values.dtype, val.values.size)],
+                    )
+                )
+        if not components:
+            return {}
+
+        total = sum(
+            _bulk_aligned(size * akdtype(dt).itemsize) for _, _, bufs in layout for dt, size in bufs
+        )
+        if total > maxTransferBytes:
+            raise RuntimeError(
+                "DataFrame exceeds allowed size for transfer. Increase client.maxTransferBytes to allow"
+            )
+        data = np.empty(total, dtype=np.uint8)
+        generic_msg(
+            cmd="tondarrayMulti",
+            args={"n": len(components), "components": components},
+            recv_binary=True,
+            out=data,
+        )
+
+        result: Dict[str, Union[np.ndarray, pa.Array]] = {}
+        pos = 0
+        for key, kind, bufs in layout:
+            views = []
+            for dt, size in bufs:
+                nbytes = size * akdtype(dt).itemsize
+                views.append(data[pos : pos + nbytes].view(akdtype(dt)))
+                pos += _bulk_aligned(nbytes)
+            if kind == "pdarray":
+                result[key] = views[0]
+            elif kind == "strings":
+                result[key] = _arrow_strings(*views)
+            elif kind == "categorical":
+                result[key] = pa.DictionaryArray.from_arrays(
+                    pa.array(views[0]), _arrow_strings(*views[1:])
+                )
+            else:
+                result[key] = pa.LargeListArray.from_arrays(pa.array(views[0]), pa.array(views[1]))
+        return result
+
     def _prep_data(self, index=False, columns=None):
         # if no columns are stored, we will save all columns
         if columns is None:
@@ -1496,7 +1688,18 @@ class DataFrame(UserDict):
         data = self._prep_data(index=index, columns=columns)
         to_hdf(data, prefix_path=path, file_type=file_type)
 
-    def to_parquet(self, path, index=False, columns=None, compression: Optional[str] = None):
+    def to_parquet(
+        self,
+        path,
+        index=False,
+        columns=None,
+        compression: Optional[str] = None,
+        row_group_size: Optional[int] = None,
+        data_page_size: Optional[int] = None,
+        use_dictionary: Union[bool, List[str]] = True,
+        write_statistics: Union[bool, List[str]] = True,
+        sorted_by: Optional[List[str]] = None,
+    ):
         """
         Save DataFrame to disk as parquet, preserving column names.
 
@@ -1512,11 +1715,30 @@ class DataFrame(UserDict):
             Default None
             Provide the compression type to use when writing the file.
             Supported values: snappy, gzip, brotli, zstd, lz4
+        row_group_size : int (Optional)
+            The number of rows of each row group of each file. Default None
+            keeps the server default of 2**26 rows.
+        data_page_size : int (Optional)
+            The approximate size in bytes of each data page. Default None
+            keeps the Arrow default of 1MB.
+        use_dictionary : bool or list of str
+            Whether to dictionary encode the columns, or the names of the
+            columns to dictionary encode (Default: True)
+        write_statistics : bool or list of str
+            Whether to write the min/max statistics of the columns, or the
+            names of the columns to write them for (Default: True)
+        sorted_by : list of str (Optional)
+            The names of the columns the rows are sorted by, in ascending
+            order, to record in the metadata of the files. The order is not
+            checked.
         Returns
         -------
         None
         Raises
         ------
+        ValueError
+            Raised if a size is not positive, or if use_dictionary,
+            write_statistics or sorted_by names a column that is not written
         RuntimeError
             Raised if a server-side error is thrown saving the pdarray
         Notes
@@ -1526,12 +1748,21 @@ class DataFrame(UserDict):
         locale number.
         See Also
         ---------
-        to_hdf, load
+        to_hdf, load, arkouda.to_parquet
         """
         from arkouda.io import to_parquet
 
         data = self._prep_data(index=index, columns=columns)
-        to_parquet(data, prefix_path=path, compression=compression)
+        to_parquet(
+            data,
+            prefix_path=path,
+            compression=compression,
+            row_group_size=row_group_size,
+            data_page_size=data_page_size,
+            use_dictionary=use_dictionary,
+            write_statistics=write_statistics,
+            sorted_by=sorted_by,
+        )
 
     @typechecked
     def to_csv(
@@ -1919,6 +2150,23 @@ class DataFrame(UserDict):
 
         return self.GroupBy(keys, use_series)
 
+    def merge(
+        self,
+        right: DataFrame,
+        on: Optional[Union[str, List[str]]] = None,
+        how: str = "inner",
+        left_on: Optional[Union[str, List[str]]] = None,
+        right_on: Optional[Union[str, List[str]]] = None,
+        suffixes: Tuple[str, str] = ("_x", "_y"),
+        method: str = "auto",
+    ) -> DataFrame:
+        """
+        Join the rows of this DataFrame with those of another that have equal
+        values in key columns. See :func:`arkouda.merge`, with this DataFrame
+        as left.
+        """
+        return merge(self, right, on, how, left_on, right_on, suffixes, method)
+
     @typechecked
     def isin(self, values: Union[pdarray, Dict, Series, DataFrame]) -> DataFrame:
         """
@@ -2214,8 +2462,18 @@ class DataFrame(UserDict):
         See Also
         --------
         register, is_registered, unregister, unregister_groupby_by_name
+
+        Notes
+        -----
+        If user_defined_name is the name of a :class:`ChunkedDataFrame`, its
+        concatenated rows are returned, see ChunkedDataFrame.to_dataframe.
         """
 
+        if f"df_columns_{user_defined_name}" not in list_registry() and (
+            ChunkedDataFrame._chunk_ids(user_defined_name)
+        ):
+            return ChunkedDataFrame.attach(user_defined_name).to_dataframe()
+
         col_resp = cast(
             str, generic_msg(cmd="stringsToJSON", args={"name": f"df_columns_{user_defined_name}"})
         )
@@ -2413,6 +2671,446 @@ class DataFrame(UserDict):
         return df
 
 
+class ChunkedDataFrame:
+    """
+    A registered DataFrame stored as a sequence of chunks, each a DataFrame
+    registered with the server under its own name, that together hold the
+    rows of the frame in order. Appending a batch of rows registers it as a
+    new chunk, where DataFrame.append copies every column.
+
+    Parameters
+    ----------
+    user_defined_name : str
+        The name to register the frame under, which must not be the name of
+        another ChunkedDataFrame or DataFrame
+    df : DataFrame, optional
+        The first rows of the frame, which also fix its columns. Without it,
+        the first append does.
+    max_chunks : int
+        The number of chunks above which append merges the last chunks, for
+        frames whose batches vary in size (Default: 64)
+
+    Attributes
+    ----------
+    name : str or None
+        The name the frame is registered under, None once unregistered
+    chunks : List[DataFrame]
+        The registered chunks, in order
+    max_chunks : int
+        The number of chunks above which append merges the last chunks
+
+    Raises
+    ------
+    RegistrationError
+        Raised if a frame is already registered under user_defined_name
+
+    See Also
+    --------
+    DataFrame.register, DataFrame.append
+
+    Notes
+    -----
+    Chunk k is registered as the DataFrame "{user_defined_name}_chunk_{k}",
+    with k zero-padded to 8 digits, so it can also be attached on its own.
+    A chunk merged from chunks j to k-1 is registered as
+    "{user_defined_name}_chunk_{k}_from_{j}" before they are unregistered,
+    and attach skips the chunks that a merged chunk replaces, so a merge that
+    is interrupted leaves the rows of the frame registered exactly once.
+    Each chunk holds a copy of the rows appended to it, so the DataFrames
+    passed to append can be modified or deleted afterwards.
+
+    After an append, the new chunk is merged with the chunks before it while
+    it holds more than half as many rows as the chunk before it. With
+    batches of similar size, a frame of n rows then has O(log n) chunks and
+    each row is copied O(log n) times over all appends, like in a
+    log-structured merge tree.
+
+    Operations over all rows use to_dataframe, which concatenates the chunks
+    into one DataFrame the first time it is called after the frame changes
+    and returns the same columns until the next change.
+    :meth:`DataFrame.attach` attaches to a ChunkedDataFrame in the same way.
+
+    Examples
+    --------
+    >>> trades = ak.ChunkedDataFrame("trades", ak.DataFrame({"id": ak.arange(3)}))
+    >>> trades.append(ak.DataFrame({"id": ak.arange(3, 5)}))
+    >>> len(trades), len(trades.chunks)
+    (5, 2)
+    >>> ak.ChunkedDataFrame.attach("trades").to_dataframe()["id"]
+    array([0 1 2 3 4])
+    """
+
+    objtype = "ChunkedDataFrame"
+
+    @typechecked
+    def __init__(
+        self, user_defined_name: str, df: Optional[DataFrame] = None, max_chunks: int = 64
+    ) -> None:
+        if ChunkedDataFrame._chunk_ids(user_defined_name):
+            raise RegistrationError(f"A ChunkedDataFrame named '{user_defined_name}' is registered")
+        if f"df_columns_{user_defined_name}" in list_registry():
+            raise RegistrationError(f"A DataFrame named '{user_defined_name}' is registered")
+        if max_chunks < 1:
+            raise ValueError(f"max_chunks must be positive, got {max_chunks}")
+        self.name: Optional[str] = user_defined_name
+        self.chunks: List[DataFrame] = []
+        self.max_chunks = max_chunks
+        self._ids: List[int] = []
+        # the concatenation of the chunks, until they change, see to_dataframe
+        self._concatenated: Optional[DataFrame] = None
+        if df is not None:
+            self.append(df)
+
+    def __len__(self):
+        return sum(chunk.size for chunk in self.chunks)
+
+    def __repr__(self):
+        return f"ChunkedDataFrame({self.columns} [{len(self)} rows in {len(self.chunks)} chunks])"
+
+    @property
+    def columns(self) -> List[str]:
+        """
+        The names of the columns, in order, or an empty list before the first
+        rows are appended
+        """
+        return self.chunks[0].columns if self.chunks else []
+
+    @staticmethod
+    def _chunk_name(user_defined_name: str, chunk_id: int, first: Optional[int] = None) -> str:
+        name = f"{user_defined_name}_chunk_{chunk_id:08d}"
+        return name if first is None else f"{name}_from_{first:08d}"
+
+    @staticmethod
+    def _registered_chunks(user_defined_name: str) -> List[Tuple[int, int, str]]:
+        """
+        The id, the id of the first chunk it was merged from, and the name of
+        every registered chunk of the frame named user_defined_name, in order.
+        """
+        pattern = f"df_columns_({escape(user_defined_name)}_chunk_(\\d{{8}})(?:_from_(\\d{{8}}))?)"
+        found = (fullmatch(pattern, name) for name in list_registry())
+        return builtins.sorted(
+            (int(m.group(2)), int(m.group(3) or m.group(2)), m.group(1)) for m in found if m is not None
+        )
+
+    @staticmethod
+    def _chunk_names(user_defined_name: str) -> Dict[int, str]:
+        """
+        The names of the chunks that hold the rows of the frame named
+        user_defined_name by id, in order, without the chunks replaced by a
+        merged chunk whose merge was interrupted before they were unregistered.
+        """
+        names: Dict[int, str] = {}
+        covered = np.inf
+        for chunk_id, first, name in reversed(ChunkedDataFrame._registered_chunks(user_defined_name)):
+            # the chunks from first on are held by a chunk merged from them
+            if chunk_id < covered:
+                names[chunk_id] = name
+            covered = builtins.min(covered, first)
+        return dict(reversed(names.items()))
+
+    @staticmethod
+    def _chunk_ids(user_defined_name: str) -> List[int]:
+        """
+        The ids of the chunks that hold the rows of the frame named
+        user_defined_name, in order.
+        """
+        return list(ChunkedDataFrame._chunk_names(user_defined_name))
+
+    def _check_registered(self) -> str:
+        if self.name is None:
+            raise RegistrationError("This ChunkedDataFrame is not registered.")
+        return self.name
+
+    def _check_columns(self, df: DataFrame) -> None:
+        if set(df.columns) != set(self.columns):
+            raise KeyError("Key mismatch; keys must be identical in both DataFrames.")
+        first = self.chunks[0]
+        for col in self.columns:
+            if type(df[col]) is not type(first[col]) or (
+                isinstance(first[col], pdarray) and df[col].dtype != first[col].dtype
+            ):
+                raise TypeError(
+                    f"Incompatible types for column {col}: {type(first[col])} vs {type(df[col])}"
+                )
+
+    def _add_chunk(self, df: DataFrame, first: Optional[int] = None) -> None:
+        name = self._check_registered()
+        chunk_id = self._ids[-1] + 1 if self._ids else 0
+        df.register(ChunkedDataFrame._chunk_name(name, chunk_id, first))
+        self.chunks.append(df)
+        self._ids.append(chunk_id)
+        self._concatenated = None
+
+    def _merge_chunks(self, start: int) -> None:
+        """
+        Replace the chunks from start on with a single chunk holding their rows.
+        """
+        # the merged chunk gets a new id, so that it is registered before the
+        # chunks it replaces are unregistered, see _chunk_names
+        replaced = self.chunks[start:]
+        self._add_chunk(DataFrame.concat(replaced), first=self._ids[start])
+        for chunk in replaced:
+            chunk.unregister()
+        del self.chunks[start:-1], self._ids[start:-1]
+
+    def _merge_small_chunks(self) -> None:
+        """
+        Merge the last chunks while the last one holds more than half as many
+        rows as the one before it, or while there are more than max_chunks.
+        """
+        while len(self.chunks) > 1 and (
+            2 * self.chunks[-1].size > self.chunks[-2].size or len(self.chunks) > self.max_chunks
+        ):
+            self._merge_chunks(len(self.chunks) - 2)
+
+    @typechecked
+    def append(self, df: DataFrame) -> ChunkedDataFrame:
+        """
+        Append the rows of a DataFrame to the end of this frame by
+        registering a copy of them as a new chunk.
+
+        Parameters
+        ----------
+        df : DataFrame
+            The rows to append, with the columns of this frame in any order
+
+        Returns
+        -------
+        ChunkedDataFrame
+            This frame, for chaining
+
+        Raises
+        ------
+        KeyError
+            Raised if df does not have the columns of this frame
+        TypeError
+            Raised if a column of df has a different type or dtype
+        RegistrationError
+            Raised if this frame is not registered
+        """
+        self._check_registered()
+        if df.empty:
+            return self
+        if self.chunks:
+            self._check_columns(df)
+        columns = self.columns if self.chunks else df.columns
+        self._add_chunk(DataFrame({col: df[col][:] for col in columns}))
+        self._merge_small_chunks()
+        return self
+
+    @typechecked
+    def upsert(self, df: DataFrame, on: Union[str, List[str]]) -> ChunkedDataFrame:
+        """
+        Replace the rows of this frame whose key columns equal those of a row
+        of a DataFrame by the rows of the DataFrame, and append its other rows.
+
+        The rows being replaced are removed from the chunks that hold them and
+        the rows of df are appended as a new chunk, so only the chunks that
+        contain a replaced key are copied.
+
+        Parameters
+        ----------
+        df : DataFrame
+            The rows to insert or replace existing rows with
+        on : str or List[str]
+            The key columns
+
+        Returns
+        -------
+        ChunkedDataFrame
+            This frame, for chaining
+
+        Raises
+        ------
+        KeyError
+            Raised if df does not have the columns of this frame, or if a key
+            column is missing
+        TypeError
+            Raised if a column of df has a different type or dtype
+        RegistrationError
+            Raised if this frame is not registered
+        """
+        name = self._check_registered()
+        on = [on] if isinstance(on, str) else on
+        for col in on:
+            if col not in df.columns:
+                raise KeyError(f"Key column {col} not in df")
+        if df.empty:
+            return self
+        if self.chunks:
+            self._check_columns(df)
+        new_keys = [df[col] for col in on]
+        chunks, chunk_ids = [], []
+        for chunk, chunk_id in zip(self.chunks, self._ids):
+            replaced = in1d([chunk[col] for col in on], new_keys)
+            if replaced.any():
+                kept = chunk[~replaced]
+                kept.reset_index(inplace=True)
+                chunk.unregister()
+                if kept.size == 0:
+                    continue
+                chunk = kept.register(ChunkedDataFrame._chunk_name(name, chunk_id))
+            chunks.append(chunk)
+            chunk_ids.append(chunk_id)
+        self.chunks, self._ids = chunks, chunk_ids
+        self._concatenated = None
+        return self.append(df)
+
+    def to_dataframe(self, columns: Optional[List[str]] = None) -> DataFrame:
+        """
+        Return the rows of all chunks as one DataFrame. The chunks are
+        concatenated the first time this is called after the frame changes,
+        and later calls return the same columns without copying them.
+
+        Parameters
+        ----------
+        columns : List[str], optional
+            The columns to include, all by default
+
+        Returns
+        -------
+        DataFrame
+            The rows of all chunks, in order
+
+        Notes
+        -----
+        The columns are shared with the chunk, if there is only one, or with
+        the other DataFrames returned until the next change, so they must not
+        be modified in place.
+        """
+        columns = self.columns if columns is None else columns
+        if self._concatenated is None:
+            self._concatenated = (
+                self.chunks[0] if len(self.chunks) == 1 else DataFrame.concat(self.chunks)
+            )
+        return DataFrame({col: self._concatenated[col] for col in columns})
+
+    def compact(self) -> ChunkedDataFrame:
+        """
+        Replace the chunks with a single chunk holding all their rows.
+
+        Returns
+        -------
+        ChunkedDataFrame
+            This frame, for chaining
+
+        Raises
+        ------
+        RegistrationError
+            Raised if this frame is not registered
+        """
+        self._check_registered()
+        if len(self.chunks) > 1:
+            self._merge_chunks(0)
+        return self
+
+    def unregister(self) -> None:
+        """
+        Unregister all chunks of this frame.
+
+        Raises
+        ------
+        RegistrationError
+            Raised if this frame is not registered
+        """
+        name = self._check_registered()
+        for chunk in self.chunks:
+            chunk.unregister()
+        # chunks left registered by an interrupted merge
+        for _, _, chunk_name in ChunkedDataFrame._registered_chunks(name):
+            DataFrame.unregister_dataframe_by_name(chunk_name)
+        self.name = None
+        self._concatenated = None
+
+    def is_registered(self) -> bool:
+        """
+        Return True if all chunks of this frame are registered.
+
+        Returns
+        -------
+        bool
+            Indicates if the frame is registered
+        """
+        if self.name is None:
+            return False
+        return ChunkedDataFrame._chunk_ids(self.name) == self._ids
+
+    @staticmethod
+    @typechecked
+    def attach(user_defined_name: str, max_chunks: int = 64) -> ChunkedDataFrame:
+        """
+        Attach to a ChunkedDataFrame registered with the Arkouda server.
+
+        Parameters
+        ----------
+        user_defined_name : str
+            The name the frame was registered under
+        max_chunks : int
+            The number of chunks above which append merges the last chunks
+            (Default: 64)
+
+        Returns
+        -------
+        ChunkedDataFrame
+            The registered frame, whose chunks are attached but not copied
+
+        Raises
+        ------
+        RegistrationError
+            Raised if no frame is registered under user_defined_name
+        """
+        chunk_names = ChunkedDataFrame._chunk_names(user_defined_name)
+        if not chunk_names:
+            raise RegistrationError(f"No registered elements with name '{user_defined_name}'")
+        frame = ChunkedDataFrame.__new__(ChunkedDataFrame)
+        frame.name = user_defined_name
+        frame.max_chunks = max_chunks
+        frame._ids = list(chunk_names)
+        frame._concatenated = None
+        frame.chunks = [DataFrame.attach(chunk_name) for chunk_name in chunk_names.values()]
+        return frame
+
+
+# dtypes of pdarrays whose data is already in the Arrow layout
+_bulk_dtypes = {"int64", "uint64", "float64", "bool"}
+# every buffer of a bulk transfer starts on a multiple of this many bytes
+_bulk_alignment = 64
+
+
+def _bulk_aligned(nbytes: int) -> int:
+    return -(-nbytes // _bulk_alignment) * _bulk_alignment
+
+
+def _strings_buffers(strings: Strings) -> List:
+    # the server drops the null terminators, so offsets and values are Arrow's
+    return [(akint64, strings.size + 1), (np.uint8, strings.nbytes - strings.size)]
+
+
+def _arrow_strings(offsets: np.ndarray, values: np.ndarray) -> pa.LargeStringArray:
+    return pa.LargeStringArray.from_buffers(
+        offsets.size - 1, pa.py_buffer(offsets), pa.py_buffer(values)
+    )
+
+
+def _bulk_to_pandas(col: Union[np.ndarray, pa.Array]):
+    """
+    Convert a column from DataFrame._bulk_transfer to the values that
+    DataFrame.to_pandas has always produced for the same column type.
+    """
+    if isinstance(col, np.ndarray):
+        return col
+    if isinstance(col, pa.DictionaryArray):
+        # like Categorical.to_ndarray, give the category of each code
+        return col.dictionary.to_numpy(zero_copy_only=False)[col.indices.to_numpy()]
+    if isinstance(col, pa.LargeListArray):
+        # like SegArray.to_list, give a list per row
+        flat = col.values.to_numpy(zero_copy_only=False).tolist()
+        offsets = col.offsets.to_numpy().tolist()
+        return [flat[start:end] for start, end in zip(offsets, offsets[1:])]
+    # pandas stores strings as objects, so they are not converted to unicode
+    return col.to_numpy(zero_copy_only=False)
+
+
 def sorted(df, column=False):
     """
     Analogous to other python 'sorted(obj)' functions in that it returns
@@ -2608,3 +3306,168 @@ def invert_permutation(perm):
     if (unique(perm).size != perm.size) and (perm.size != rng + 1):
         raise ValueError("The array is not a permutation.")
     return coargsort([perm, arange(perm.size)])
+
+
+def merge(
+    left: DataFrame,
+    right: DataFrame,
+    on: Optional[Union[str, List[str]]] = None,
+    how: str = "inner",
+    left_on: Optional[Union[str, List[str]]] = None,
+    right_on: Optional[Union[str, List[str]]] = None,
+    suffixes: Tuple[str, str] = ("_x", "_y"),
+    method: str = "auto",
+) -> DataFrame:
+    """
+    Join the rows of two DataFrames that have equal values in key columns,
+    like pandas.merge.
+
+    Parameters
+    ----------
+    left : DataFrame
+        The left DataFrame
+    right : DataFrame
+        The right DataFrame
+    on : str or List[str], optional
+        The key columns, which both DataFrames must have. Defaults to the
+        columns the DataFrames have in common, unless left_on and right_on
+        are given.
+    how : str
+        "inner" (Default) keeps the pairs of rows with equal keys, "left"
+        and "right" also keep the rows of the left, respectively right,
+        DataFrame without a match, and "outer" keeps the rows of both
+    left_on : str or List[str], optional
+        The key columns of the left DataFrame, if they are named differently
+        from those of the right one
+    right_on : str or List[str], optional
+        The key columns of the right DataFrame, one per left_on column
+    suffixes : Tuple[str, str]
+        Appended to the names of the non-key columns of the left and the right
+        DataFrame that have the same name (Default: ("_x", "_y"))
+    method : str
+        How the server matches the keys of both DataFrames: "broadcast" copies
+        the keys of the smaller DataFrame to every locale and looks up those of
+        the larger one there, while "sort" and "hash" group the keys of both,
+        sorting them or using hash tables, see :class:`arkouda.GroupBy`. "auto"
+        (Default) broadcasts if the smaller DataFrame has at most
+        broadcastJoinMaxRows rows (a server setting, 65536 by default) and
+        otherwise hashes while there are few distinct keys. "broadcast" falls
+        back to "auto" if both DataFrames have more than broadcastJoinLimitRows
+        rows (a server setting, 16777216 by default).
+
+    Returns
+    -------
+    DataFrame
+        One row per joined pair of rows, with the key columns followed by the
+        other columns of left and then of right
+
+    Raises
+    ------
+    KeyError
+        Raised if a key column is missing
+    ValueError
+        Raised if no key columns are given or in common, if left_on and
+        right_on have different lengths, or if how or method is unknown
+    TypeError
+        Raised if the key columns of a pair have different types, or if a
+        column that must hold missing values is not a pdarray, Strings or
+        Categorical
+
+    Notes
+    -----
+    The key columns may be pdarrays, Strings or Categoricals, and several key
+    columns are joined on as a whole. The keys of both DataFrames are hashed
+    and matched by one server command, so no dense index of the keys is
+    built. A broadcast join neither sorts nor moves the keys of the larger
+    DataFrame, which makes it the fastest way to join a large table with a
+    small dimension table. The rows of the result are in no particular
+    order.
+
+    In the rows that "left", "right" and "outer" joins add for unmatched
+    rows, the missing values of numeric columns are NaN (making the columns
+    float64), those of Strings columns are empty and those of Categorical
+    columns are the NA value.
+
+    Examples
+    --------
+    >>> left = ak.DataFrame({"key": ak.array([1, 2, 3]), "a": ak.array([10, 20, 30])})
+    >>> right = ak.DataFrame({"key": ak.array([3, 1, 1]), "b": ak.array(["x", "y", "z"])})
+    >>> ak.merge(left, right, on="key")
+       key   a  b
+    0    1  10  y
+    1    1  10  z
+    2    3  30  x (3 rows x 3 columns)
+    """
+    if on is not None:
+        if left_on is not None or right_on is not None:
+            raise ValueError("Give either on or left_on and right_on, not both")
+        left_on = right_on = on
+    elif left_on is None and right_on is None:
+        left_on = right_on = [c for c in left.columns if c in right.columns]
+    if left_on is None or right_on is None:
+        raise ValueError("left_on and right_on must be given together")
+    left_on = [left_on] if isinstance(left_on, str) else list(left_on)
+    right_on = [right_on] if isinstance(right_on, str) else list(right_on)
+    if len(left_on) == 0:
+        raise ValueError("No key columns given and none in common")
+    if len(left_on) != len(right_on):
+        raise ValueError("left_on and right_on must have the same length")
+    for c in left_on:
+        if c not in left.columns:
+            raise KeyError(f"Key column {c} not in left")
+    for c in right_on:
+        if c not in right.columns:
+            raise KeyError(f"Key column {c} not in right")
+
+    left_inds, right_inds = _merge_indices(
+        [left[c] for c in left_on], [right[c] for c in right_on], how, method
+    )
+
+    result = {}
+    # a key column the two sides share comes from whichever side has the row
+    shared = {c for c, r in zip(left_on, right_on) if c == r}
+    for c in left_on:
+        if c not in shared:
+            result[c] = _take_rows(left[c], left_inds)
+        elif how == "outer":
+            keys = concatenate([left[c], right[c]])
+            result[c] = keys[where(left_inds >= 0, left_inds, left[c].size + right_inds)]
+        elif how == "right":
+            result[c] = right[c][right_inds]
+        else:
+            result[c] = left[c][left_inds]
+    for c in right_on:
+        if c not in shared and c not in result:
+            result[c] = _take_rows(right[c], right_inds)
+    left_rest = [c for c in left.columns if c not in left_on]
+    right_rest = [c for c in right.columns if c not in right_on]
+    for c in left_rest:
+        name = c + suffixes[0] if c in right_rest or c in result else c
+        result[name] = _take_rows(left[c], left_inds)
+    for c in right_rest:
+        name = c + suffixes[1] if c in left_rest or c in result else c
+        result[name] = _take_rows(right[c], right_inds)
+    return DataFrame(result)
+
+
+def _take_rows(col, inds: pdarray):
+    """
+    Gather the rows inds of a column, with a missing value where an index
+    is -1.
+    """
+    missing = inds < 0
+    if not missing.any():
+        return col[inds]
+    if isinstance(col, Categorical):
+        codes = concatenate([col.codes, array([col._NAcode])])
+        return Categorical.from_codes(
+            codes[where(missing, col.size, inds)], col.categories, NAvalue=col.NAvalue
+        )
+    if isinstance(col, Strings):
+        filler = array([""])
+    elif isinstance(col, pdarray) and col.dtype != bigint:
+        col = akcast(col, akfloat64)
+        filler = array([np.nan])
+    else:
+        raise TypeError(f"Columns of type {type(col)} cannot hold missing values, use how='inner'")
+    return concatenate([col, filler])[where(missing, col.size, inds)]
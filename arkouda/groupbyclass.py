@@ -2,7 +2,22 @@ from __future__ import annotations
 
 import enum
 import json
-from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, Union, cast
+import threading
+import weakref
+from collections import OrderedDict, deque
+from typing import (
+    TYPE_CHECKING,
+    Deque,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 if TYPE_CHECKING:
     from arkouda.categorical import Categorical
@@ -10,7 +25,8 @@ if TYPE_CHECKING:
 import numpy as np  # type: ignore
 from typeguard import typechecked
 
-from arkouda.client import generic_msg
+from arkouda import client
+from arkouda.client import _current_session, generic_msg
 from arkouda.dtypes import bigint
 from arkouda.dtypes import float64 as akfloat64
 from arkouda.dtypes import int64 as akint64
@@ -25,11 +41,16 @@ from arkouda.pdarrayclass import (
     pdarray,
     unregister_pdarray_by_name,
 )
-from arkouda.pdarraycreation import arange
+from arkouda.pdarraycreation import arange, zeros
 from arkouda.sorting import argsort
 from arkouda.strings import Strings
 
-__all__ = ["unique", "GroupBy", "broadcast", "GROUPBY_REDUCTION_TYPES"]
+__all__ = ["unique", "approx_unique_count", "GroupBy", "broadcast", "GROUPBY_REDUCTION_TYPES"]
+
+# the ways the server can group keys, see GroupBy
+GROUPBY_METHODS: FrozenSet[str] = frozenset(["auto", "hash", "sort"])
+# the ways the server can compute quantiles, see GroupBy.quantile
+QUANTILE_METHODS = frozenset(["approx", "exact"])
 
 groupable_element_type = Union[pdarray, Strings, "Categorical"]
 groupable = Union[groupable_element_type, Sequence[groupable_element_type]]
@@ -56,6 +77,164 @@ def _get_grouping_keys(pda: groupable):
     return grouping_keys, nkeys
 
 
+def _create_groupby_args(keys: groupable, assume_sorted: bool, method: str = "auto") -> Tuple[Dict, int]:
+    """
+    The arguments of the createGroupBy command for keys, and the number of keys.
+    """
+    grouping_keys, nkeys = _get_grouping_keys(keys)
+    args = {
+        "assumeSortedStr": assume_sorted,
+        "nkeys": len(grouping_keys),
+        "keynames": [k.name for k in grouping_keys],
+        "keytypes": [k.objtype for k in grouping_keys],
+        "method": method,
+    }
+    return args, nkeys
+
+
+class _Grouping(NamedTuple):
+    """
+    The server-side result of grouping keys, kept for the GroupBy objects
+    created from the same keys.
+    """
+
+    name: Optional[str]
+    nkeys: int
+    length: int
+    ngroups: int
+    permutation: pdarray
+    segments: pdarray
+    unique_keys: groupable
+
+    @property
+    def nbytes(self) -> int:
+        keys = self.unique_keys if isinstance(self.unique_keys, tuple) else (self.unique_keys,)
+        nbytes = (self.permutation.size + self.segments.size) * 8
+        for k in keys:
+            # Categorical unique keys share their categories with the keys, so count their codes
+            nbytes += k.size * 8 + (k.nbytes if isinstance(k, Strings) else 0)
+        return int(nbytes)
+
+    @property
+    def version(self) -> Tuple[int, ...]:
+        # changes to the arrays through the GroupBy that created them invalidate the grouping
+        keys = self.unique_keys if isinstance(self.unique_keys, tuple) else (self.unique_keys,)
+        return (self.permutation._version, self.segments._version, *[_key_version(k) for k in keys])
+
+    def copy(self) -> _Grouping:
+        """
+        A grouping with copies of the arrays that can change in place, so
+        GroupBy objects do not see each other's changes.
+        """
+        keys = self.unique_keys if isinstance(self.unique_keys, tuple) else (self.unique_keys,)
+        # Strings do not change in place
+        copies = tuple(k if isinstance(k, Strings) else k[:] for k in keys)
+        return self._replace(
+            permutation=self.permutation[:],
+            segments=self.segments[:],
+            unique_keys=copies if isinstance(self.unique_keys, tuple) else copies[0],
+        )
+
+
+# groupings and their versions by the keys they group, least recently used first
+_groupings: OrderedDict[Tuple, Tuple[_Grouping, Tuple[int, ...]]] = OrderedDict()
+# the server memory held by _groupings
+_groupings_nbytes = 0
+# guards _groupings and _groupings_nbytes, which GroupBy objects in all threads share
+_groupings_lock = threading.Lock()
+# groupings to drop because one of their keys was garbage collected; finalizers
+# can run in any thread at any time, so they only queue the drop, see _drop_grouping
+_dropped_groupings: Deque[Tuple] = deque()
+
+
+def _grouping_cache_key(keys: groupable, assume_sorted: bool) -> Tuple:
+    """
+    The server, names and versions of keys. The versions are shared by all
+    objects with the same name, so changes through any of them are seen.
+    """
+    return (
+        _current_session(),
+        assume_sorted,
+        *[(k.name, _key_version(k)) for k in _key_list(keys)],
+    )
+
+
+def _key_list(keys: groupable) -> List[groupable_element_type]:
+    if hasattr(keys, "_get_grouping_keys"):
+        return [cast(groupable_element_type, keys)]
+    return list(cast(Sequence[groupable_element_type], keys))
+
+
+def _key_version(key: groupable_element_type) -> int:
+    # only pdarrays change in place, e.g. the codes of a Categorical
+    if isinstance(key, pdarray):
+        return key._version
+    if isinstance(key, Strings):
+        return 0
+    return sum(k._version for k in key._get_grouping_keys())
+
+
+def _drop_grouping(cache_key: Tuple) -> None:
+    _dropped_groupings.append(cache_key)
+
+
+def _pop_grouping(cache_key: Tuple) -> None:
+    # _groupings_lock must be held
+    global _groupings_nbytes
+    entry = _groupings.pop(cache_key, None)
+    if entry is not None:
+        _groupings_nbytes -= entry[0].nbytes
+
+
+def _pop_dropped_groupings() -> None:
+    # _groupings_lock must be held
+    while _dropped_groupings:
+        try:
+            _pop_grouping(_dropped_groupings.popleft())
+        except IndexError:
+            break
+
+
+def _cached_grouping(cache_key: Tuple) -> Optional[_Grouping]:
+    """
+    A copy of the grouping of the keys of cache_key, or None if they have not
+    been grouped since they last changed.
+    """
+    with _groupings_lock:
+        _pop_dropped_groupings()
+        entry = _groupings.get(cache_key)
+        if entry is None:
+            return None
+        grouping, version = entry
+        if grouping.version != version:
+            # changed in place through the GroupBy that created it
+            _pop_grouping(cache_key)
+            return None
+        _groupings.move_to_end(cache_key)
+    return grouping.copy()
+
+
+def _cache_grouping(cache_key: Tuple, keys: groupable, grouping: _Grouping) -> None:
+    """
+    Keep grouping for reuse, evicting the least recently used groupings while
+    the cached groupings hold more than client.groupbyCacheBytes of server
+    memory.
+    """
+    global _groupings_nbytes
+    nbytes = grouping.nbytes
+    if nbytes > client.groupbyCacheBytes:
+        return
+    with _groupings_lock:
+        _pop_dropped_groupings()
+        _pop_grouping(cache_key)
+        _groupings[cache_key] = (grouping, grouping.version)
+        _groupings_nbytes += nbytes
+        while _groupings_nbytes > client.groupbyCacheBytes:
+            _pop_grouping(next(iter(_groupings)))
+    for k in _key_list(keys):
+        weakref.finalize(k, _drop_grouping, cache_key)
+
+
 def unique(
     pda: groupable, return_groups: bool = False, assume_sorted: bool = False  # type: ignore
 ) -> Union[
@@ -143,6 +322,74 @@ def unique(
         return unique_keys
 
 
+def approx_unique_count(pda: groupable, precision: int = 14) -> int:
+    """
+    Estimate the number of unique elements of an array, or of unique rows of
+    a list of arrays, without sorting them.
+
+    Parameters
+    ----------
+    pda : (list of) pdarray, Strings, or Categorical
+        Input array or arrays
+    precision : int
+        The sketch uses 2**precision registers, between 4 and 16. The
+        relative standard error of the estimate is about
+        1.04 / sqrt(2**precision), 0.8% for the default of 14.
+
+    Returns
+    -------
+    int
+        The estimated number of unique elements
+
+    Raises
+    ------
+    ValueError
+        Raised if precision is not between 4 and 16 or if the arrays in a
+        list have different sizes
+    RuntimeError
+        Raised if the dtype of an array is unsupported
+
+    See Also
+    --------
+    unique, GroupBy.nunique
+
+    Notes
+    -----
+    The elements are hashed and counted with a HyperLogLog sketch in a
+    single pass. Arrays with at most 2**precision elements are counted
+    exactly, up to hash collisions.
+
+    Examples
+    --------
+    >>> ak.approx_unique_count(ak.array([1, 2, 2, 3, 1]))
+    3
+    """
+    return int(_approx_nunique(pda, zeros(1, dtype=akint64), None, precision)[0])
+
+
+def _approx_nunique(
+    values: groupable, segments: pdarray, permutation: Optional[pdarray], precision: int
+) -> pdarray:
+    """
+    Estimate the number of unique values in each segment of values, after
+    putting values in grouped order with permutation if it is not None.
+    """
+    if not 4 <= precision <= 16:
+        raise ValueError(f"precision must be between 4 and 16, got {precision}")
+    grouping_keys, _ = _get_grouping_keys(values)
+    args = {
+        "nkeys": len(grouping_keys),
+        "keynames": [k.name for k in grouping_keys],
+        "keytypes": [k.objtype for k in grouping_keys],
+        "permute": permutation is not None,
+        "segments": segments,
+        "precision": precision,
+    }
+    if permutation is not None:
+        args["permutation"] = permutation
+    return create_pdarray(generic_msg(cmd="approxNunique", args=args))
+
+
 class GroupByReductionType(enum.Enum):
     SUM = "sum"
     PROD = "prod"
@@ -195,6 +442,13 @@ class GroupBy:
         The array to group by value, or if list, the column arrays to group by row
     assume_sorted : bool
         If True, assume keys is already sorted (Default: False)
+    method : str
+        How the server groups the keys: "sort" sorts them, "hash" counts the
+        distinct keys in hash tables, which is faster and uses less memory
+        when there are few of them, and "auto" (Default) hashes while there
+        are very few distinct keys. Both "hash" and "auto" sort the keys
+        instead once the number of distinct keys passes a server limit. The
+        grouping is the same with every method.
 
     Attributes
     ----------
@@ -232,6 +486,12 @@ class GroupBy:
     If the input is a single array with a .group() method defined, method 2
     will be used; otherwise, method 1 will be used.
 
+    The grouping of keys is kept on the server while the keys are not
+    modified or deleted, so that grouping the same keys again reuses it.
+    ``ak.client.groupbyCacheBytes`` (Default: 2**28) limits the server
+    memory held by the groupings kept, and setting it to 0 disables the
+    reuse.
+
     """
 
     Reductions = GROUPBY_REDUCTION_TYPES
@@ -240,6 +500,7 @@ class GroupBy:
         self,
         keys: Optional[groupable],
         assume_sorted: bool = False,
+        method: str = "auto",
         **kwargs,
     ):
         # Type Checks required because @typechecked was removed for causing other issues
@@ -248,9 +509,12 @@ class GroupBy:
         # See Issue #1267
         if not isinstance(assume_sorted, bool):
             raise TypeError("assume_sorted must be of type bool.")
+        if method not in GROUPBY_METHODS:
+            raise ValueError(f"method must be one of {sorted(GROUPBY_METHODS)}, got {method}")
 
         self.logger = getArkoudaLogger(name=self.__class__.__name__)
         self.assume_sorted = assume_sorted
+        self.method = method
         if (
             "orig_keys" in kwargs
             and "permutation" in kwargs
@@ -269,30 +533,48 @@ class GroupBy:
             raise ValueError("No keys passed to GroupBy.")
         else:
             self.keys = cast(groupable, keys)
-            grouping_keys, self.nkeys = _get_grouping_keys(self.keys)
-            keynames = [k.name for k in grouping_keys]
-            keytypes = [k.objtype for k in grouping_keys]
-            repmsg = generic_msg(
-                cmd="createGroupBy",
-                args={
-                    "assumeSortedStr": assume_sorted,
-                    "nkeys": len(grouping_keys),
-                    "keynames": keynames,
-                    "keytypes": keytypes,
-                },
-            )
-            rep_json = json.loads(repmsg)
-            fields = rep_json["groupby"].split()
-            self.name = fields[1]
-            self.length = int(fields[2])
-            self.ngroups = int(fields[3])
-            self.permutation = create_pdarray(rep_json["permutation"])
-            self.segments = create_pdarray(rep_json["segments"])
-            uki = create_pdarray(rep_json["uniqueKeyIdx"])
-            if self.nkeys == 1:
-                self.unique_keys = self.keys[uki]
-            else:
-                self.unique_keys = tuple(a[uki] for a in self.keys)
+            # the reply may already have been received, e.g. by an AsyncClient
+            repmsg = kwargs.get("create_reply", None)
+            cache_key = _grouping_cache_key(self.keys, assume_sorted)
+            # the same keys may have been grouped before and not changed since
+            grouping = _cached_grouping(cache_key) if repmsg is None else None
+            if grouping is None:
+                grouping = self._create_grouping(repmsg)
+                _cache_grouping(cache_key, self.keys, grouping)
+            (
+                self.name,
+                self.nkeys,
+                self.length,
+                self.ngroups,
+                self.permutation,
+                self.segments,
+                self.unique_keys,
+            ) = grouping
+
+    def _create_grouping(self, repmsg: Optional[str] = None) -> _Grouping:
+        """
+        Group the keys on the server, unless repmsg is the reply of the
+        createGroupBy command that grouped them.
+        """
+        args, nkeys = _create_groupby_args(self.keys, self.assume_sorted, self.method)
+        if repmsg is None:
+            repmsg = cast(str, generic_msg(cmd="createGroupBy", args=args))
+        rep_json = json.loads(repmsg)
+        fields = rep_json["groupby"].split()
+        uki = create_pdarray(rep_json["uniqueKeyIdx"])
+        if nkeys == 1:
+            unique_keys = self.keys[uki]
+        else:
+            unique_keys = tuple(a[uki] for a in self.keys)
+        return _Grouping(
+            name=fields[1],
+            nkeys=nkeys,
+            length=int(fields[2]),
+            ngroups=int(fields[3]),
+            permutation=create_pdarray(rep_json["permutation"]),
+            segments=create_pdarray(rep_json["segments"]),
+            unique_keys=unique_keys,
+        )
 
     def size(self) -> Tuple[groupable, pdarray]:
         """
@@ -368,18 +650,25 @@ class GroupBy:
         return self.unique_keys, create_pdarray(repMsg)
 
     def aggregate(
-        self, values: groupable, operator: str, skipna: bool = True, ddof: int_scalars = 1
-    ) -> Tuple[groupable, groupable]:
+        self,
+        values: groupable,
+        operator: Union[str, List[str]],
+        skipna: bool = True,
+        ddof: int_scalars = 1,
+    ) -> Tuple[groupable, Union[groupable, List[groupable]]]:
         """
         Using the permutation stored in the GroupBy instance, group another
         array of values and apply a reduction to each group's values.
 
         Parameters
         ----------
-        values : pdarray
-            The values to group and reduce
-        operator: str
-            The name of the reduction operator to use
+        values : pdarray, or list of pdarray
+            The values to group and reduce. If operator is a list, either one
+            array to apply all of the operators to or a list of arrays, one
+            per operator.
+        operator: str or List[str]
+            The name of the reduction operator to use, or a list of names to
+            compute several reductions with a single request
         skipna: bool
             boolean which determines if NANs should be skipped
         ddof : int_scalars
@@ -389,8 +678,9 @@ class GroupBy:
         -------
         unique_keys : groupable
             The unique keys, in grouped order
-        aggregates : groupable
-            One aggregate value per unique key in the GroupBy instance
+        aggregates : groupable, or list of groupable
+            One aggregate value per unique key in the GroupBy instance, or if
+            operator is a list, one such array per operator
 
         Raises
         ------
@@ -417,7 +707,12 @@ class GroupBy:
         (array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9]), array([-1, -0.77777777777777779,
         -0.55555555555555558, -0.33333333333333337, -0.11111111111111116, 0.11111111111111116,
         0.33333333333333326, 0.55555555555555536, 0.77777777777777768, 1]))
+        >>> g = ak.GroupBy(ak.array([0, 1, 0, 1]))
+        >>> g.aggregate([ak.arange(4), ak.array([1.5, 2.0, 0.5, 1.0])], ['sum', 'mean'])
+        (array([0, 1]), [array([2, 4]), array([1, 1.5])])
         """
+        if not isinstance(operator, str):
+            return self._aggregate_many(values, operator, skipna, ddof)
         operator = operator.lower()
         if operator not in self.Reductions:
             raise ValueError(f"Unsupported reduction: {operator}\nMust be one of {self.Reductions}")
@@ -460,6 +755,63 @@ class GroupBy:
         else:
             return self.unique_keys, create_pdarray(repMsg)
 
+    def _aggregate_many(
+        self, values: groupable, operators: List[str], skipna: bool, ddof: int_scalars
+    ) -> Tuple[groupable, List[groupable]]:
+        """
+        Compute several reductions, gathering each values array into grouped
+        order once on the server and sending all of the reductions that
+        segmentedReduction supports in one request.
+        """
+        operators = [op.lower() for op in operators]
+        for op in operators:
+            if op not in self.Reductions:
+                raise ValueError(f"Unsupported reduction: {op}\nMust be one of {self.Reductions}")
+        if isinstance(values, (list, tuple)):
+            if len(values) != len(operators):
+                raise ValueError(
+                    f"Got {len(values)} values arrays for {len(operators)} operators, "
+                    "the numbers must be equal"
+                )
+            values_list = list(values)
+        else:
+            values_list = [values] * len(operators)
+
+        results: List[groupable] = [None] * len(operators)  # type: ignore
+        batched = []
+        for i, (vals, op) in enumerate(zip(values_list, operators)):
+            if op in ("nunique", "first", "mode", "unique"):
+                # not computed by segmentedReduction
+                results[i] = cast(groupable, self.aggregate(vals, op, skipna, ddof)[1])
+                continue
+            if not isinstance(vals, pdarray):
+                raise TypeError(f"The values of a {op} reduction must be a pdarray, got {type(vals)}")
+            if vals.size != self.length:
+                raise ValueError("Attempt to group array using key array of different length")
+            batched.append(i)
+
+        if batched:
+            repMsg = generic_msg(
+                cmd="multiSegmentedReduction",
+                args={
+                    "nreductions": len(batched),
+                    "values": [values_list[i] for i in batched],
+                    "ops": [operators[i] for i in batched],
+                    "permute": not self.assume_sorted,
+                    "permutation": self.permutation,
+                    "segments": self.segments,
+                    "skip_nan": skipna,
+                    "ddof": ddof,
+                },
+            )
+            self.logger.debug(repMsg)
+            for i, rep in zip(batched, json.loads(cast(str, repMsg))):
+                if operators[i].startswith("arg"):
+                    results[i] = cast(pdarray, self.permutation[create_pdarray(rep)])
+                else:
+                    results[i] = create_pdarray(rep)
+        return self.unique_keys, results
+
     def sum(self, values: pdarray, skipna: bool = True) -> Tuple[groupable, pdarray]:
         """
         Using the permutation stored in the GroupBy instance, group
@@ -786,6 +1138,224 @@ class GroupBy:
         k, v = self.aggregate(values, "median", skipna)
         return k, cast(pdarray, v)
 
+    def quantile(
+        self,
+        values: pdarray,
+        q: Union[float, Sequence[float], np.ndarray] = 0.5,
+        method: str = "exact",
+        compression: int = 200,
+        skipna: bool = True,
+    ) -> Tuple[groupable, Union[pdarray, List[pdarray]]]:
+        """
+        Using the permutation stored in the GroupBy instance, group
+        another array of values and compute quantiles of each group's
+        values.
+
+        Parameters
+        ----------
+        values : pdarray, int64, uint64 or float64
+            The values to group and find quantiles of
+        q : float or sequence or np.ndarray of float
+            The quantile or quantiles to compute, between 0 and 1 inclusive
+            (Default: 0.5)
+        method : str
+            "exact" (Default) sorts the values of each group, "approx" estimates
+            the quantiles of groups with more than compression values in a
+            single pass over them
+        compression : int
+            The number of values the "approx" method keeps per level of its
+            sketch of each group; larger values are more accurate but use more
+            memory (Default: 200)
+        skipna: bool
+            boolean which determines if NANs should be skipped
+
+        Returns
+        -------
+        unique_keys : (list of) pdarray or Strings
+            The unique keys, in grouped order
+        group_quantiles : pdarray or List[pdarray], float64
+            One quantile per unique key in the GroupBy instance, or a list
+            with such an array per quantile if q is a sequence or array
+
+        Raises
+        ------
+        TypeError
+            Raised if the values array is not a pdarray of int64, uint64 or
+            float64
+        ValueError
+            Raised if the key array size does not match the values size, if a
+            quantile is not between 0 and 1, if the method is not "exact" or
+            "approx" or if compression is less than 2
+
+        See Also
+        --------
+        median
+
+        Notes
+        -----
+        The return dtype is always float64. The exact quantiles are
+        interpolated linearly between values, like numpy.quantile. The
+        approximate ones are values of the group whose rank is within
+        O(log(n/compression)/compression) of the exact rank, where n is the
+        group size. Unlike median, neither method sorts the values of all
+        groups together.
+
+        Examples
+        --------
+        >>> g = ak.GroupBy(ak.array([0, 0, 0, 0, 1, 1]))
+        >>> g.quantile(ak.array([4, 1, 3, 2, 10, 20]), [0.25, 0.5])
+        (array([0 1]), [array([1.75 12.5]), array([2.5 15])])
+        """
+        multiple = np.ndim(q) > 0
+        qs = np.asarray(q, dtype=float).ravel().tolist() if multiple else [q]
+        if method not in QUANTILE_METHODS:
+            raise ValueError(f"method must be one of {sorted(QUANTILE_METHODS)}, got {method}")
+        if compression < 2:
+            raise ValueError(f"compression must be at least 2, got {compression}")
+        if any(not 0 <= qi <= 1 for qi in qs):
+            raise ValueError(f"Quantiles must be between 0 and 1, got {q}")
+        repMsg = generic_msg(
+            cmd="segmentedQuantile",
+            args={
+                "values": self._grouped_values(values),
+                "segments": self.segments,
+                "nquantiles": len(qs),
+                "quantiles": [float(qi) for qi in qs],
+                "method": method,
+                # the sketch promotes half of the values of a full level
+                "compression": compression + compression % 2,
+                "skip_nan": skipna,
+            },
+        )
+        self.logger.debug(repMsg)
+        results = [create_pdarray(rep) for rep in json.loads(cast(str, repMsg))]
+        return self.unique_keys, results if multiple else results[0]
+
+    def nlargest(self, values: pdarray, n: int = 5) -> Tuple[groupable, pdarray]:
+        """
+        Using the permutation stored in the GroupBy instance, group
+        another array of values and return the n largest values of each
+        group.
+
+        Parameters
+        ----------
+        values : pdarray, int64, uint64 or float64
+            The values to group and select from
+        n : int
+            The number of values to return per group (Default: 5)
+
+        Returns
+        -------
+        keys : (list of) pdarray or Strings
+            The key of each selected value
+        group_largest : pdarray
+            The n largest values of each group, or all of the values of a
+            group with fewer than n values, in grouped order and from largest
+            to smallest within each group
+
+        Raises
+        ------
+        TypeError
+            Raised if the values array is not a pdarray of int64, uint64 or
+            float64
+        ValueError
+            Raised if the key array size does not match the values size or
+            if n is negative
+
+        See Also
+        --------
+        nsmallest
+
+        Notes
+        -----
+        NaNs are never selected. Equal values are returned in the order they
+        appear in values. The values of a group are not sorted, so selecting
+        a few values per group takes a single pass over the values.
+
+        Examples
+        --------
+        >>> g = ak.GroupBy(ak.array([0, 1, 0, 1, 0]))
+        >>> g.nlargest(ak.array([3, 5, 9, 1, 7]), 2)
+        (array([0 0 1 1]), array([9 7 5 1]))
+        """
+        return self._top_k(values, n, largest=True)
+
+    def nsmallest(self, values: pdarray, n: int = 5) -> Tuple[groupable, pdarray]:
+        """
+        Using the permutation stored in the GroupBy instance, group
+        another array of values and return the n smallest values of each
+        group.
+
+        Parameters
+        ----------
+        values : pdarray, int64, uint64 or float64
+            The values to group and select from
+        n : int
+            The number of values to return per group (Default: 5)
+
+        Returns
+        -------
+        keys : (list of) pdarray or Strings
+            The key of each selected value
+        group_smallest : pdarray
+            The n smallest values of each group, or all of the values of a
+            group with fewer than n values, in grouped order and from smallest
+            to largest within each group
+
+        Raises
+        ------
+        TypeError
+            Raised if the values array is not a pdarray of int64, uint64 or
+            float64
+        ValueError
+            Raised if the key array size does not match the values size or
+            if n is negative
+
+        See Also
+        --------
+        nlargest
+
+        Notes
+        -----
+        NaNs are never selected. Equal values are returned in the order they
+        appear in values.
+
+        Examples
+        --------
+        >>> g = ak.GroupBy(ak.array([0, 1, 0, 1, 0]))
+        >>> g.nsmallest(ak.array([3, 5, 9, 1, 7]), 2)
+        (array([0 0 1 1]), array([3 7 1 5]))
+        """
+        return self._top_k(values, n, largest=False)
+
+    def _top_k(self, values: pdarray, n: int, largest: bool) -> Tuple[groupable, pdarray]:
+        if n < 0:
+            raise ValueError(f"n must be non-negative, got {n}")
+        grouped = self._grouped_values(values)
+        repMsg = generic_msg(
+            cmd="segmentedTopK",
+            args={"values": grouped, "segments": self.segments, "k": n, "largest": largest},
+        )
+        self.logger.debug(repMsg)
+        rows, groups = (create_pdarray(rep) for rep in json.loads(cast(str, repMsg)))
+        if isinstance(self.unique_keys, (list, tuple)):
+            keys: groupable = [k[groups] for k in self.unique_keys]
+        else:
+            keys = self.unique_keys[groups]
+        return keys, grouped[rows]
+
+    def _grouped_values(self, values: pdarray) -> pdarray:
+        """
+        Check that values is a numeric pdarray of the length of the keys and
+        return it in grouped order.
+        """
+        if not isinstance(values, pdarray) or values.dtype not in (akint64, akuint64, akfloat64):
+            got = values.dtype if isinstance(values, pdarray) else type(values)
+            raise TypeError(f"values must be an int64, uint64 or float64 pdarray, got {got}")
+        if values.size != self.length:
+            raise ValueError("Attempt to group array using key array of different length")
+        return values if self.assume_sorted else cast(pdarray, values[self.permutation])
+
     def min(self, values: pdarray, skipna: bool = True) -> Tuple[groupable, pdarray]:
         """
         Using the permutation stored in the GroupBy instance, group
@@ -1001,7 +1571,9 @@ class GroupBy:
             togroup = [unique_key_idx] + list(values)
         return togroup
 
-    def nunique(self, values: groupable) -> Tuple[groupable, pdarray]:
+    def nunique(
+        self, values: groupable, approx: bool = False, precision: int = 14
+    ) -> Tuple[groupable, pdarray]:
         """
         Using the permutation stored in the GroupBy instance, group another
         array of values and return the number of unique values in each group.
@@ -1010,6 +1582,13 @@ class GroupBy:
         ----------
         values : pdarray, int64
             The values to group and find unique values
+        approx : bool
+            If True, estimate the number of unique values of each group with
+            a HyperLogLog sketch instead of grouping the (key, value) pairs
+            (Default: False)
+        precision : int
+            The sketches of approx use 2**precision registers, between 4 and
+            16; see :func:`approx_unique_count` (Default: 14)
 
         Returns
         -------
@@ -1024,11 +1603,19 @@ class GroupBy:
             Raised if the dtype(s) of values array(s) does/do not support
             the nunique method
         ValueError
-            Raised if the key array size does not match the values size or
-            if the operator is not in the GroupBy.Reductions array
+            Raised if the key array size does not match the values size,
+            if the operator is not in the GroupBy.Reductions array or if
+            precision is not between 4 and 16
         RuntimeError
             Raised if nunique is not supported for the values dtype
 
+        Notes
+        -----
+        With approx, the values are hashed and each group is scanned once
+        instead of sorting all pairs. Groups of at most 2**precision values
+        are counted exactly, up to hash collisions, and larger ones have a
+        relative standard error of about 1.04 / sqrt(2**precision).
+
         Examples
         --------
         >>> data = ak.array([3, 4, 3, 1, 1, 4, 3, 4, 1, 4])
@@ -1047,6 +1634,11 @@ class GroupBy:
         #    Group (3,3,3) has values [3,4,1] -> 3 unique values
         #    Group (4) has values [4] -> 1 unique value
         """
+        if approx:
+            if _get_grouping_keys(values)[0][0].size != self.length:
+                raise ValueError("Attempt to group array using key array of different length")
+            permutation = None if self.assume_sorted else cast(pdarray, self.permutation)
+            return self.unique_keys, _approx_nunique(values, self.segments, permutation, precision)
         # TO DO: defer to self.aggregate once logic is ported over to Chapel
         # return self.aggregate(values, "nunique")
         togroup = self._nested_grouping_helper(values)
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import json
+from typing import Optional, Union, cast
+
+from typeguard import typechecked
+
+from arkouda.categorical import Categorical
+from arkouda.client import generic_msg
+from arkouda.pdarrayclass import create_pdarray, pdarray
+from arkouda.registered_index import RegisteredIndex
+from arkouda.strings import Strings
+
+__all__ = ["HashIndex"]
+
+
+class HashIndex(RegisteredIndex):
+    """
+    A persistent hash index of the values of an array or Strings, built once
+    on the server. Membership tests and lookups then hash each query and
+    probe a single bucket of the index, costing O(1) expected work per query
+    instead of sorting or regrouping the indexed values with every batch of
+    queries as :func:`arkouda.in1d` and :func:`arkouda.find` do.
+
+    Parameters
+    ----------
+    keys : pdarray or Strings
+        The values to index, which may repeat
+
+    Attributes
+    ----------
+    keys : pdarray or Strings
+        The indexed values
+    size : int
+        The number of values
+    name : str or None
+        The name the index is registered under, if any
+
+    Raises
+    ------
+    TypeError
+        Raised if keys is not a pdarray or Strings
+
+    Notes
+    -----
+    Values are compared by their 128-bit SipHash, like in
+    :class:`arkouda.GroupBy`, so two different values are treated as equal
+    only with negligible probability. The index stores the hashes bucketed
+    by their leading bits, with at least as many buckets as values, the
+    index of each value and the start of each bucket: 24 bytes per value and
+    8 bytes per bucket, at most 40 bytes per value in addition to the values.
+
+    Examples
+    --------
+    >>> blocklist = ak.HashIndex(ak.array(["b.com", "a.com", "b.com"]))
+    >>> blocklist.contains(ak.array(["a.com", "c.com", "b.com"]))
+    array([True False True])
+    >>> blocklist.get_loc(ak.array(["a.com", "c.com", "b.com"]))
+    array([1 -1 0])
+    """
+
+    objtype = "HashIndex"
+
+    @typechecked
+    def __init__(self, keys: Union[pdarray, Strings]) -> None:
+        self.keys = keys
+        repMsg = generic_msg(cmd="createHashIndex", args={"name": keys.name, "objtype": keys.objtype})
+        self.hash_hi, self.hash_lo, self.rows, self.starts = (
+            create_pdarray(rep) for rep in json.loads(cast(str, repMsg))
+        )
+        self.size = keys.size
+        self.name: Optional[str] = None
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return f"HashIndex({self.keys}, size={self.size})"
+
+    @typechecked
+    def get_loc(self, values: Union[pdarray, Strings, Categorical]) -> pdarray:
+        """
+        Find the index of each value in the indexed values, the first if a
+        value repeats, or -1 if it is missing.
+
+        Parameters
+        ----------
+        values : pdarray, Strings or Categorical
+            The values to find, a pdarray with the dtype of the indexed values
+            or, if they are Strings, Strings or a Categorical
+
+        Returns
+        -------
+        pdarray
+            The int64 index of each value, or -1
+
+        Raises
+        ------
+        TypeError
+            Raised if values does not have the type of the indexed values
+        """
+        if isinstance(values, Categorical):
+            return self.get_loc(values.categories)[values.codes]
+        if isinstance(self.keys, Strings) != isinstance(values, Strings) or (
+            isinstance(values, pdarray) and values.dtype != cast(pdarray, self.keys).dtype
+        ):
+            got = values.dtype if isinstance(values, pdarray) else values.objtype
+            raise TypeError(f"values must have the type of the indexed values, got {got}")
+        repMsg = generic_msg(
+            cmd="hashIndexLookup",
+            args={
+                "hashhi": self.hash_hi,
+                "hashlo": self.hash_lo,
+                "rows": self.rows,
+                "starts": self.starts,
+                "name": values.name,
+                "objtype": values.objtype,
+            },
+        )
+        return create_pdarray(cast(str, repMsg))
+
+    @typechecked
+    def contains(self, values: Union[pdarray, Strings, Categorical]) -> pdarray:
+        """
+        Test whether each value is one of the indexed values.
+
+        Parameters
+        ----------
+        values : pdarray, Strings or Categorical
+            The values to test, see get_loc
+
+        Returns
+        -------
+        pdarray
+            True where the value is indexed
+
+        Raises
+        ------
+        TypeError
+            Raised if values does not have the type of the indexed values
+        """
+        return self.get_loc(values) >= 0
+
+    @typechecked
+    def in1d(self, values: Union[pdarray, Strings, Categorical], invert: bool = False) -> pdarray:
+        """
+        Test whether each value is one of the indexed values, like
+        ak.in1d(values, keys).
+
+        Parameters
+        ----------
+        values : pdarray, Strings or Categorical
+            The values to test, see get_loc
+        invert : bool
+            If True, test whether each value is not one of the indexed values
+            instead (Default: False)
+
+        Returns
+        -------
+        pdarray
+            True where the value is indexed, or where it is not if invert
+
+        Raises
+        ------
+        TypeError
+            Raised if values does not have the type of the indexed values
+        """
+        loc = self.get_loc(values)
+        return loc < 0 if invert else loc >= 0
+
+    def _components(self):
+        return {
+            "keys": self.keys,
+            "hash_hi": self.hash_hi,
+            "hash_lo": self.hash_lo,
+            "rows": self.rows,
+            "starts": self.starts,
+        }
+
+    @classmethod
+    def _from_components(cls, components):
+        index = cls.__new__(cls)
+        index.keys = components["keys"]
+        index.hash_hi = components["hash_hi"]
+        index.hash_lo = components["hash_lo"]
+        index.rows = components["rows"]
+        index.starts = components["starts"]
+        index.size = index.keys.size
+        return index
@@ -1,16 +1,27 @@
 import glob
 import json
+import operator
 import os
-from typing import Dict, List, Mapping, Optional, Union, cast
+import uuid
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union, cast
+from urllib.parse import quote, unquote
 from warnings import warn
 
+import numpy as np  # type: ignore
 import pandas as pd  # type: ignore
 from typeguard import typechecked
 
 import arkouda.array_view
 from arkouda.categorical import Categorical
 from arkouda.client import generic_msg
+from arkouda.dtypes import float64 as akfloat64
+from arkouda.dtypes import int64 as akint64
+from arkouda.groupbyclass import GroupBy
+from arkouda.numeric import cast as akcast
+from arkouda.numeric import where
 from arkouda.pdarrayclass import create_pdarray, pdarray
+from arkouda.pdarraycreation import arange, array, full, zeros
+from arkouda.pdarraysetops import concatenate
 from arkouda.segarray import SegArray
 from arkouda.strings import Strings
 
@@ -25,11 +36,13 @@ __all__ = [
     "read_parquet",
     "read_csv",
     "read",
+    "read_partitioned",
     "import_data",
     "export",
     "to_hdf",
     "to_parquet",
     "to_csv",
+    "to_partitioned",
     "save_all",
     "load",
     "load_all",
@@ -383,7 +396,9 @@ def _parse_errors(rep_msg, allow_errors: bool = False):
         )
 
 
-def _parse_obj(obj: Dict) -> Union[Strings, pdarray, arkouda.array_view.ArrayView, SegArray]:
+def _parse_obj(
+    obj: Dict,
+) -> Union[Strings, pdarray, arkouda.array_view.ArrayView, SegArray, Categorical]:
     """
     Helper function to create an Arkouda object from read response
 
@@ -394,7 +409,7 @@ def _parse_obj(obj: Dict) -> Union[Strings, pdarray, arkouda.array_view.ArrayVie
 
     Returns
     -------
-    Strings, pdarray, or ArrayView Arkouda object
+    Strings, pdarray, ArrayView or Categorical Arkouda object
 
     Raises
     ------
@@ -403,6 +418,9 @@ def _parse_obj(obj: Dict) -> Union[Strings, pdarray, arkouda.array_view.ArrayVie
     """
     if "seg_string" == obj["arkouda_type"]:
         return Strings.from_return_msg(obj["created"])
+    elif "dictionary" == obj["arkouda_type"]:
+        codes, dictionary = obj["created"].split("+", 1)
+        return _categorical_from_dictionary(create_pdarray(codes), Strings.from_return_msg(dictionary))
     elif "seg_array" == obj["arkouda_type"]:
         return SegArray.from_return_msg(obj["created"])
     elif "pdarray" == obj["arkouda_type"]:
@@ -416,6 +434,28 @@ def _parse_obj(obj: Dict) -> Union[Strings, pdarray, arkouda.array_view.ArrayVie
         raise TypeError(f"Unknown arkouda type:{obj['arkouda_type']}")
 
 
+def _categorical_from_dictionary(codes: pdarray, dictionary: Strings) -> Categorical:
+    """
+    Build a Categorical from a string column read as the codes into its
+    dictionaries, in which nulls have code -1. The dictionaries of row groups
+    and files repeat values, so they are deduplicated, which only groups the
+    dictionary entries rather than the strings of every value.
+    """
+    if dictionary.size == 0:
+        return Categorical.from_codes(zeros(codes.size, akint64), cast(Strings, array(["N/A"])))
+    g = GroupBy(dictionary)
+    categories = cast(Strings, g.unique_keys)
+    remap = g.broadcast(arange(categories.size), permute=True)
+    is_na = cast(pdarray, categories == "N/A")
+    if is_na.any():
+        na_code = int(akcast(is_na, akint64).argmax())
+    else:
+        # Categorical.from_codes appends the N/A category
+        na_code = int(categories.size)
+    remap = concatenate([remap, array([na_code])])
+    return Categorical.from_codes(remap[where(codes < 0, dictionary.size, codes)], categories)
+
+
 def _dict_recombine_segarrays(df_dict):
     # this assumes segments will always have corresponding values.
     # This should happen due to save config
@@ -443,7 +483,8 @@ def _build_objects(
     pdarray,
     SegArray,
     arkouda.array_view.ArrayView,
-    Mapping[str, Union[Strings, pdarray, SegArray, arkouda.array_view.ArrayView]],
+    Categorical,
+    Mapping[str, Union[Strings, pdarray, SegArray, arkouda.array_view.ArrayView, Categorical]],
 ]:
     """
     Helper function to create the Arkouda objects from a read operation
@@ -489,7 +530,8 @@ def read_hdf(
     Strings,
     SegArray,
     arkouda.array_view.ArrayView,
-    Mapping[str, Union[pdarray, Strings, SegArray, arkouda.array_view.ArrayView]],
+    Categorical,
+    Mapping[str, Union[pdarray, Strings, SegArray, arkouda.array_view.ArrayView, Categorical]],
 ]:
     """
     Read Arkouda objects from HDF5 file/s
@@ -592,18 +634,127 @@ def read_hdf(
         return _build_objects(rep)
 
 
+_FILTER_OPS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def _parquet_filter_value(value) -> str:
+    """
+    The representation of a filter value sent to the server, which parses it
+    as the type of the filtered column.
+    """
+    if isinstance(value, (bool, np.bool_)):
+        return str(bool(value)).lower()
+    elif isinstance(value, (int, np.integer)):
+        return str(int(value))
+    elif isinstance(value, (float, np.floating)):
+        return repr(float(value))
+    elif isinstance(value, str):
+        return value
+    raise TypeError(f"Unsupported filter value {value!r} of type {type(value).__name__}")
+
+
+def _read_parquet_args(
+    filenames: List[str],
+    datasets: List[str],
+    strict_types: bool,
+    allow_errors: bool,
+    filters: Optional[List[Tuple[str, str, Any]]] = None,
+    read_dictionary: Optional[Union[str, List[str]]] = None,
+) -> Dict:
+    """
+    The arguments of the readAllParquet command.
+    """
+    args = {
+        "strict_types": strict_types,
+        "dset_size": len(datasets),
+        "filename_size": len(filenames),
+        "allow_errors": allow_errors,
+        "dsets": datasets,
+        "filenames": filenames,
+    }
+    if filters:
+        args.update(
+            {
+                "filter_size": len(filters),
+                "filter_columns": [column for column, _, _ in filters],
+                "filter_ops": [op for _, op, _ in filters],
+                "filter_values": [_parquet_filter_value(value) for _, _, value in filters],
+            }
+        )
+    if read_dictionary:
+        if isinstance(read_dictionary, str):
+            read_dictionary = [read_dictionary]
+        args.update({"dictionary_size": len(read_dictionary), "dictionaries": read_dictionary})
+    return args
+
+
+def _as_categoricals(objs, read_datasets: List[str], read_dictionary: Union[str, List[str]]):
+    """
+    Group the strings of the datasets to read as Categoricals that the server
+    could not read as dictionaries.
+    """
+    if isinstance(read_dictionary, str):
+        read_dictionary = [read_dictionary]
+    if not isinstance(objs, dict):
+        read = read_datasets[0] in read_dictionary and isinstance(objs, Strings)
+        return Categorical(objs) if read else objs
+    return {
+        dset: Categorical(obj) if dset in read_dictionary and isinstance(obj, Strings) else obj
+        for dset, obj in objs.items()
+    }
+
+
+def _apply_filters(
+    objs, read_datasets: List[str], datasets: List[str], filters: List[Tuple[str, str, Any]]
+) -> Union[
+    pdarray,
+    Strings,
+    SegArray,
+    arkouda.array_view.ArrayView,
+    Mapping[str, Union[pdarray, Strings, SegArray, arkouda.array_view.ArrayView]],
+]:
+    """
+    Drop the rows read from files that do not pass every filter, and the
+    filtered columns that were only read to evaluate the filters.
+
+    The filters are evaluated with pdarray comparisons after the read, so the
+    selected row groups are decoded in full and each column is briefly held
+    twice, before and after the rows are dropped.
+    """
+    if not isinstance(objs, dict):
+        objs = {read_datasets[0]: objs}
+    mask = None
+    for column, op, value in filters:
+        if isinstance(objs[column], SegArray):
+            raise TypeError(f"Cannot filter on the list column {column}")
+        passes = _FILTER_OPS[op](objs[column], value)
+        mask = passes if mask is None else mask & passes
+    filtered = {dset: objs[dset][mask] for dset in datasets}
+    return next(iter(filtered.values())) if len(filtered) == 1 else filtered
+
+
 def read_parquet(
     filenames: Union[str, List[str]],
     datasets: Optional[Union[str, List[str]]] = None,
     iterative: bool = False,
     strict_types: bool = True,
     allow_errors: bool = False,
+    filters: Optional[List[Tuple[str, str, Any]]] = None,
+    read_dictionary: Optional[Union[str, List[str]]] = None,
 ) -> Union[
     pdarray,
     Strings,
     SegArray,
     arkouda.array_view.ArrayView,
-    Mapping[str, Union[pdarray, Strings, SegArray, arkouda.array_view.ArrayView]],
+    Categorical,
+    Mapping[str, Union[pdarray, Strings, SegArray, arkouda.array_view.ArrayView, Categorical]],
 ]:
     """
     Read Arkouda objects from Parquet file/s
@@ -627,19 +778,34 @@ def read_parquet(
             Default False, if True will allow files with read errors to be skipped
             instead of failing.  A warning will be included in the return containing
             the total number of files skipped due to failure and up to 10 filenames.
+        filters: Optional List[Tuple[str, str, Any]]
+            Default None, if given only the rows that pass every filter are
+            returned. Each filter is a (column, op, value) tuple, where op is
+            one of "==", "!=", "<", "<=", ">" or ">=", and columns of strings
+            can only be compared with "==" and "!=". Row groups whose min/max
+            statistics show that none of their rows can pass are not read.
+            The filtered columns need not be among the datasets read.
+        read_dictionary: Optional str, List[str]
+            Default None, the string datasets to read as Categoricals. Where
+            every file stores such a dataset dictionary encoded, as is the
+            default for Parquet writers, its dictionaries and the codes of
+            its values are read, so the strings of the values are never
+            built. Otherwise the strings are read and grouped into a
+            Categorical. Null values become the N/A category.
 
         Returns
         -------
-        For a single dataset returns an Arkouda pdarray, Arkouda Strings, or Arkouda ArrayView object
-        and for multiple datasets returns a dictionary of Arkouda pdarrays,
-        Arkouda Strings or Arkouda ArrayView.
+        For a single dataset returns an Arkouda pdarray, Arkouda Strings, Arkouda ArrayView or
+        Arkouda Categorical object and for multiple datasets returns a dictionary of Arkouda pdarrays,
+        Arkouda Strings, Arkouda ArrayView or Arkouda Categoricals.
             Dictionary of {datasetName: pdarray or String}
 
         Raises
         ------
         ValueError
-            Raised if all datasets are not present in all parquet files or if one or
-            more of the specified files do not exist
+            Raised if all datasets are not present in all parquet files, if one or
+            more of the specified files do not exist or if a filter operator is
+            not supported
         RuntimeError
             Raised if one or more of the specified files cannot be opened.
             If `allow_errors` is true this may be raised if no values are returned
@@ -665,16 +831,41 @@ def read_parquet(
         Parquet always recomputes offsets at this time
         This will need to be updated once parquets workflow is updated
 
+        Filters are pushed down to the row groups of integer, float and
+        string columns, so they save the most when the files are sorted or
+        partitioned by the filtered columns. Integer columns compared with a
+        float are pruned by comparing their statistics as floats, as the
+        rows are compared. Row groups are only skipped individually if no
+        strings or lists are read: the server reads those by whole file, so
+        a file is then read whole if any of its row groups may match, and
+        skipped otherwise.
+
+        Filters are not evaluated while the row groups are decoded. Every row
+        of the row groups that are read is decoded, and the rows that fail a
+        filter are then dropped with pdarray comparisons, which copies each
+        column read once more.
+
         Examples
         --------
         Read without file Extension
         >>> x = ak.read_parquet('path/name_prefix.parquet') # load Parquet
         Read Glob Expression
         >>> x = ak.read_parquet('path/name_prefix*') # Reads Parquet
+        Read Filtered Rows
+        >>> x = ak.read_parquet('path/name_prefix*', filters=[('ts', '>=', t0), ('proto', '==', 6)])
+        Read a String Column as a Categorical
+        >>> x = ak.read_parquet('path/name_prefix*', datasets='country', read_dictionary='country')
     """
     if isinstance(filenames, str):
         filenames = [filenames]
     datasets = _prep_datasets(filenames, datasets)
+    read_datasets = datasets
+    if filters:
+        for _, op, _ in filters:
+            if op not in _FILTER_OPS:
+                raise ValueError(f"Unsupported filter operator {op}")
+        filter_columns = _prep_datasets(filenames, list({column for column, _, _ in filters}))
+        read_datasets = datasets + [column for column in filter_columns if column not in datasets]
 
     if iterative:
         return {
@@ -683,24 +874,26 @@ def read_parquet(
                 datasets=dset,
                 strict_types=strict_types,
                 allow_errors=allow_errors,
+                filters=filters,
+                read_dictionary=read_dictionary,
             )[dset]
             for dset in datasets
         }
     else:
         rep_msg = generic_msg(
             cmd="readAllParquet",
-            args={
-                "strict_types": strict_types,
-                "dset_size": len(datasets),
-                "filename_size": len(filenames),
-                "allow_errors": allow_errors,
-                "dsets": datasets,
-                "filenames": filenames,
-            },
+            args=_read_parquet_args(
+                filenames, read_datasets, strict_types, allow_errors, filters, read_dictionary
+            ),
         )
         rep = json.loads(rep_msg)  # See GenSymIO._buildReadAllMsgJson for json structure
         _parse_errors(rep, allow_errors)
-        return _build_objects(rep)
+        objs = _build_objects(rep)
+        if read_dictionary:
+            objs = _as_categoricals(objs, read_datasets, read_dictionary)
+        if filters:
+            return _apply_filters(objs, read_datasets, datasets, filters)
+        return objs
 
 
 def read_csv(
@@ -708,12 +901,14 @@ def read_csv(
     datasets: Optional[Union[str, List[str]]] = None,
     column_delim: str = ",",
     allow_errors: bool = False,
+    infer_dtypes: bool = False,
 ) -> Union[
     pdarray,
     Strings,
     SegArray,
     arkouda.array_view.ArrayView,
-    Mapping[str, Union[pdarray, Strings, SegArray, arkouda.array_view.ArrayView]],
+    Categorical,
+    Mapping[str, Union[pdarray, Strings, SegArray, arkouda.array_view.ArrayView, Categorical]],
 ]:
     """
     Read CSV file(s) into Arkouda objects. If more than one dataset is found, the objects
@@ -733,6 +928,12 @@ def read_csv(
         Default False, if True will allow files with read errors to be skipped
         instead of failing.  A warning will be included in the return containing
         the total number of files skipped due to failure and up to 10 filenames.
+    infer_dtypes: bool
+        Default False, if True the dtypes of the columns of files without an
+        Arkouda header are inferred from their first 1000 rows: bool if every
+        value is true or false, int64 if every value is an integer, float64 if
+        every value is a number or empty (read as NaN) and str otherwise. If
+        False, such columns are read as Strings.
 
     Returns
     --------
@@ -758,8 +959,16 @@ def read_csv(
     ------
     - CSV format is not currently supported by load/load_all operations
     - The column delimiter is expected to be the same for column names and data
-    - Be sure that column delimiters are not found within your data.
-    - All CSV files must delimit rows using newline (`\n`) at this time.
+    - Fields may be quoted with double quotes to contain column delimiters and newlines,
+    and a doubled double quote within a quoted field is a literal double quote.
+    - All CSV files must delimit rows using newline (`\n`) at this time. A carriage return
+    before the newline is dropped.
+    - Each file is split into chunks of bytes that are parsed in parallel by the tasks of
+    all locales, so a single large file need not be split before it is read. The files
+    are read three times: once to find the rows of each chunk, once to parse all the
+    columns, and once more to copy the bytes of all Strings columns, if there are any.
+    - If dtypes are inferred, a value later in the files that does not parse as the
+    inferred dtype raises a RuntimeError.
     - Unlike other file formats, CSV files store Strings as their UTF-8 format instead of storing
     bytes as uint(8).
     """
@@ -780,6 +989,7 @@ def read_csv(
             "num_dsets": len(datasets),
             "col_delim": column_delim,
             "allow_errors": allow_errors,
+            "infer_dtypes": infer_dtypes,
         },
     )
     rep = json.loads(rep_msg)  # See GenSymIO._buildReadAllMsgJson for json structure
@@ -961,12 +1171,73 @@ def _bulk_write_prep(columns: Union[Mapping[str, pdarray], List[pdarray]], names
     return datasetNames, pdarrays
 
 
+def _parquet_write_args(
+    names: List[str],
+    mode: str = "truncate",
+    row_group_size: Optional[int] = None,
+    data_page_size: Optional[int] = None,
+    use_dictionary: Union[bool, List[str]] = True,
+    write_statistics: Union[bool, List[str]] = True,
+    sorted_by: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Build the arguments of a Parquet write of the columns named names that
+    set the layout options of to_parquet. Options left at their defaults are
+    not sent, so the server keeps its own defaults.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The arguments to add to the write message
+
+    Raises
+    ------
+    ValueError
+        Raised if a size is not positive, if use_dictionary, write_statistics
+        or sorted_by names a column that is not written, if sorted_by repeats
+        a column, or if an option is set when appending
+    """
+    args: Dict[str, Any] = {}
+    for key, size in [("row_group_size", row_group_size), ("data_page_size", data_page_size)]:
+        if size is not None:
+            if size <= 0:
+                raise ValueError(f"{key} must be positive, got {size}")
+            args[key] = size
+    for key, flags in [("dictionary", use_dictionary), ("statistics", write_statistics)]:
+        if isinstance(flags, bool):
+            if not flags:
+                args[key] = [False] * len(names)
+        else:
+            unknown = set(flags) - set(names)
+            if unknown:
+                raise ValueError(f"Columns {sorted(unknown)} are not written")
+            args[key] = [name in flags for name in names]
+    if sorted_by:
+        unknown = set(sorted_by) - set(names)
+        if unknown:
+            raise ValueError(f"Columns {sorted(unknown)} are not written")
+        if len(set(sorted_by)) != len(sorted_by):
+            raise ValueError("sorted_by must not repeat a column")
+        args["sorted_by"] = sorted_by
+        args["num_sorted"] = len(sorted_by)
+    if args and mode.lower() == "append":
+        raise ValueError(
+            "Row group, page, dictionary, statistics and sort options cannot be set when appending"
+        )
+    return args
+
+
 def to_parquet(
     columns: Union[Mapping[str, pdarray], List[pdarray]],
     prefix_path: str,
     names: List[str] = None,
     mode: str = "truncate",
     compression: Optional[str] = None,
+    row_group_size: Optional[int] = None,
+    data_page_size: Optional[int] = None,
+    use_dictionary: Union[bool, List[str]] = True,
+    write_statistics: Union[bool, List[str]] = True,
+    sorted_by: Optional[List[str]] = None,
 ) -> None:
     """
     Save multiple named pdarrays to Parquet files.
@@ -987,6 +1258,23 @@ def to_parquet(
             Default None
             Provide the compression type to use when writing the file.
             Supported values: snappy, gzip, brotli, zstd, lz4
+    row_group_size : int (Optional)
+        The number of rows of each row group of each file. Default None keeps
+        the server default of 2**26 rows.
+    data_page_size : int (Optional)
+        The approximate size in bytes of each data page. Default None keeps
+        the Arrow default of 1MB.
+    use_dictionary : bool or list of str
+        Whether to dictionary encode the columns, or the names of the columns
+        to dictionary encode. A column falls back to plain encoding if its
+        dictionary grows too large. (Default: True)
+    write_statistics : bool or list of str
+        Whether to write the min/max statistics of each row group and page of
+        the columns, or the names of the columns to write them for. Readers use
+        them to skip row groups and pages when filtering. (Default: True)
+    sorted_by : list of str (Optional)
+        The names of the columns the rows are sorted by, in ascending order,
+        to record in the metadata of the files. The order is not checked.
 
 
     Returns
@@ -996,8 +1284,10 @@ def to_parquet(
     Raises
     ------
     ValueError
-        Raised if (1) the lengths of columns and values differ or (2) the mode
-        is not 'truncate' or 'append'
+        Raised if (1) the lengths of columns and values differ, (2) the mode
+        is not 'truncate' or 'append', (3) a size is not positive, (4)
+        use_dictionary, write_statistics or sorted_by names a column that is
+        not written, or (5) a layout option is set in 'append' mode
     RuntimeError
             Raised if a server-side error is thrown saving the pdarray
 
@@ -1015,6 +1305,14 @@ def to_parquet(
     <columns> as new datasets to existing files. If the wrong number of files
     is present or dataset names already exist, a RuntimeError is raised.
 
+    Each file holds its rows in row groups of row_group_size rows, split in
+    data pages of about data_page_size bytes. Smaller row groups with
+    statistics let readers such as Spark and Trino skip more of the data
+    when filtering, at the cost of more metadata. The sort order is written
+    to the key-value metadata of each file under ``sorted_by``, as the
+    comma-separated column names, and to the sorting columns of each row
+    group if the server is built with Arrow 13 or later.
+
     Examples
     --------
     >>> a = ak.arange(25)
@@ -1025,6 +1323,9 @@ def to_parquet(
 
     >>> # Save using names instead of mapping
     >>> ak.to_parquet([a, b], 'path/name_prefix', names=['a', 'b'])
+
+    >>> # Save in row groups of 1M rows, recording that the rows are sorted by 'a'
+    >>> ak.to_parquet({'a': a, 'b': b}, 'path/name_prefix', row_group_size=2**20, sorted_by=['a'])
     """
     if mode.lower() not in ["append", "truncate"]:
         raise ValueError("Allowed modes are 'truncate' and 'append'")
@@ -1037,10 +1338,28 @@ def to_parquet(
         )
 
     datasetNames, pdarrays = _bulk_write_prep(columns, names)
+    write_args = _parquet_write_args(
+        datasetNames, mode, row_group_size, data_page_size, use_dictionary, write_statistics, sorted_by
+    )
     # append or single column use the old logic
     if mode.lower() == "append" or len(pdarrays) == 1:
         for arr, name in zip(pdarrays, cast(List[str], datasetNames)):
-            arr.to_parquet(prefix_path=prefix_path, dataset=name, mode=mode, compression=compression)
+            options: Dict[str, Any] = {
+                "row_group_size": row_group_size,
+                "data_page_size": data_page_size,
+                "write_statistics": (
+                    write_statistics if isinstance(write_statistics, bool) else name in write_statistics
+                ),
+                "is_sorted": sorted_by == [name],
+            }
+            # a Categorical is always written with its categories as the dictionary
+            if not isinstance(arr, Categorical):
+                options["use_dictionary"] = (
+                    use_dictionary if isinstance(use_dictionary, bool) else name in use_dictionary
+                )
+            arr.to_parquet(
+                prefix_path=prefix_path, dataset=name, mode=mode, compression=compression, **options
+            )
     else:
         print(
             cast(
@@ -1053,6 +1372,7 @@ def to_parquet(
                         "filename": prefix_path,
                         "num_cols": len(pdarrays),
                         "compression": compression,
+                        **write_args,
                     },
                 ),
             )
@@ -1301,7 +1621,8 @@ def load(
     Strings,
     SegArray,
     arkouda.array_view.ArrayView,
-    Mapping[str, Union[pdarray, Strings, SegArray, arkouda.array_view.ArrayView]],
+    Categorical,
+    Mapping[str, Union[pdarray, Strings, SegArray, arkouda.array_view.ArrayView, Categorical]],
 ]:
     """
     Load a pdarray previously saved with ``pdarray.save()``.
@@ -1475,7 +1796,8 @@ def read(
     Strings,
     SegArray,
     arkouda.array_view.ArrayView,
-    Mapping[str, Union[pdarray, Strings, SegArray, arkouda.array_view.ArrayView]],
+    Categorical,
+    Mapping[str, Union[pdarray, Strings, SegArray, arkouda.array_view.ArrayView, Categorical]],
 ]:
     """
     Read datasets from files.
@@ -1568,3 +1890,340 @@ def read(
         )
     else:
         raise RuntimeError(f"Invalid File Type detected, {ftype}")
+
+
+def _list_files(path: str) -> List[str]:
+    """
+    The files in a directory on the server and all its subdirectories.
+    """
+    return json.loads(cast(str, generic_msg(cmd="listfiles", args={"path": path})))
+
+
+def _partition_value(values: List[str]) -> Tuple[List, type]:
+    """
+    The values of a partition key parsed as ints, or else floats, or else
+    left as strings, as the type of the key is not recorded.
+    """
+    for kind in (int, float):
+        try:
+            return [kind(value) for value in values], kind
+        except ValueError:
+            pass
+    return values, str
+
+
+def read_partitioned(
+    path: str,
+    datasets: Optional[Union[str, List[str]]] = None,
+    filters: Optional[List[Tuple[str, str, Any]]] = None,
+    file_format: str = "parquet",
+    strict_types: bool = True,
+    allow_errors: bool = False,
+) -> Mapping[str, Union[pdarray, Strings, SegArray, Categorical]]:
+    """
+    Read a dataset partitioned into key=value directories, as written by
+    ``to_partitioned``, Spark or pyarrow.
+
+    Parameters
+    ----------
+    path : str
+        The root directory of the dataset
+    datasets : Optional str, List[str]
+        The datasets to read from the files (Default: all of them). The
+        partition keys are always returned.
+    filters: Optional List[Tuple[str, str, Any]]
+        Default None, if given only the rows that pass every filter are
+        returned, see read_parquet. Filters on partition keys select the
+        partitions to read before any file is opened, and the others are
+        applied to the files of those partitions.
+    file_format : str ("parquet" | "hdf5")
+        The format of the files (Default: "parquet")
+    strict_types: bool
+        See read_parquet
+    allow_errors: bool
+        See read_parquet
+
+    Returns
+    -------
+    Mapping[str, Union[pdarray, Strings, SegArray, Categorical]]
+        Dictionary of {datasetName: values}, with a column for each partition
+        key; keys with integer or float values are returned as pdarrays and
+        others as Categoricals
+
+    Raises
+    ------
+    ValueError
+        Raised if the file format or a filter operator is not supported, if
+        no partitions are found, or if the partitions do not all have the
+        same keys in the same order
+    RuntimeError
+        Raised if path is not a directory accessible to the server
+
+    See Also
+    --------
+    to_partitioned, read_parquet, read_hdf
+
+    Notes
+    -----
+    Files and directories whose names start with "_" or "." are ignored, as
+    are files that are not inside a key=value directory. Keys and values are
+    percent-decoded. Partitions are read in sorted order of their paths, and
+    the rows of a partition in the order of its files.
+
+    Parquet datasets are read with a single request for the files of all the
+    selected partitions, and if no partition is selected only the types of
+    the datasets are read. HDF5 datasets are read one partition at a time
+    and then concatenated, and the first partition is read for the types if
+    none is selected.
+
+    Examples
+    --------
+    >>> data = ak.read_partitioned('path/flows', filters=[('day', '==', 20230102), ('proto', '==', 6)])
+    """
+    if file_format.lower() not in ("parquet", "hdf5"):
+        raise ValueError(f"Unsupported file format {file_format}")
+    filters = filters if filters is not None else []
+    for _, op, _ in filters:
+        if op not in _FILTER_OPS:
+            raise ValueError(f"Unsupported filter operator {op}")
+
+    partitions: Dict[Tuple[Tuple[str, str], ...], List[str]] = {}
+    for filename in _list_files(path):
+        parts = os.path.relpath(filename, path).split("/")
+        if any(part.startswith(("_", ".")) for part in parts) or not all("=" in d for d in parts[:-1]):
+            continue
+        key = tuple(cast(Tuple[str, str], tuple(map(unquote, d.split("=", 1)))) for d in parts[:-1])
+        if key:
+            partitions.setdefault(key, []).append(filename)
+    if not partitions:
+        raise ValueError(f"No partitions found in {path}")
+    keys = list(partitions)
+    names = [name for name, _ in keys[0]]
+    if any([name for name, _ in key] != names for key in keys):
+        raise ValueError(f"The partitions in {path} do not all have the keys {names}")
+
+    # select the partitions before reading any file
+    values, kinds = zip(*(_partition_value([key[i][1] for key in keys]) for i in range(len(names))))
+    selected = [
+        p
+        for p in range(len(keys))
+        if all(
+            _FILTER_OPS[op](values[names.index(column)][p], value)
+            for column, op, value in filters
+            if column in names
+        )
+    ]
+    file_filters = [f for f in filters if f[0] not in names]
+    filter_columns = list({column for column, _, _ in file_filters})
+
+    first_files = partitions[keys[0]]
+    if datasets is None:
+        datasets = _prep_datasets(first_files, allow_errors=allow_errors)
+    elif isinstance(datasets, str):
+        datasets = [datasets]
+    datasets = [dset for dset in datasets if dset not in names]
+    if not datasets:
+        raise ValueError("At least one dataset that is not a partition key must be read")
+    read_datasets = datasets + [column for column in filter_columns if column not in datasets]
+
+    objs: Dict[str, Any] = {}
+    if file_format.lower() == "parquet":
+        # all selected partitions are read at once, and the server reports the
+        # rows read from each file, which tell the partition each row is from
+        files = [f for p in selected for f in partitions[keys[p]]]
+        args = _read_parquet_args(
+            files if files else first_files[:1], read_datasets, strict_types, allow_errors, file_filters
+        )
+        if not files:
+            # only the types of the datasets are read
+            args["schema_only"] = True
+        rep = json.loads(cast(str, generic_msg(cmd="readAllParquet", args=args)))
+        _parse_errors(rep, allow_errors)
+        read = _build_objects(rep)
+        objs = dict(read) if isinstance(read, dict) else {read_datasets[0]: read}
+        file_rows = iter(rep["file_rows"])
+        sizes = [sum(next(file_rows) for _ in partitions[keys[p]]) for p in selected]
+    else:
+        # the HDF5 reader does not report the rows read from each file, so each
+        # partition is read on its own, which also holds the pieces and their
+        # concatenation at once
+        pieces = []
+        for p in selected if selected else [0]:
+            read = read_hdf(
+                partitions[keys[p]], read_datasets, strict_types=strict_types, allow_errors=allow_errors
+            )
+            piece: Dict[str, Any] = dict(read) if isinstance(read, dict) else {read_datasets[0]: read}
+            pieces.append(piece if selected else {dset: obj[0:0] for dset, obj in piece.items()})
+        sizes = [piece[read_datasets[0]].size for piece in pieces]
+        for dset in read_datasets:
+            column = [piece[dset] for piece in pieces]
+            objs[dset] = (
+                SegArray.concat(column) if isinstance(column[0], SegArray) else concatenate(column)
+            )
+
+    for name, vals, kind in zip(names, values, kinds):
+        picked = [vals[p] for p in selected]
+        if kind is str:
+            categories = sorted(set(vals))
+            code_of = {category: code for code, category in enumerate(categories)}
+            objs[name] = Categorical.from_codes(
+                _repeat_values([code_of[v] for v in picked], sizes, akint64),
+                cast(Strings, array(categories)),
+            )
+        else:
+            objs[name] = _repeat_values(picked, sizes, akint64 if kind is int else akfloat64)
+    if file_filters:
+        return cast(
+            Mapping[str, Union[pdarray, Strings, SegArray, Categorical]],
+            _apply_filters(objs, read_datasets, datasets + names, file_filters),
+        )
+    return {dset: objs[dset] for dset in datasets + names}
+
+
+def _repeat_values(values: List, sizes: List[int], dtype) -> pdarray:
+    """
+    Each value repeated the number of times given by the matching size.
+    """
+    if not values:
+        return zeros(0, dtype=dtype)
+    return cast(
+        pdarray, concatenate([full(size, value, dtype=dtype) for value, size in zip(values, sizes)])
+    )
+
+
+def to_partitioned(
+    columns: Mapping[str, Union[pdarray, Strings]],
+    path: str,
+    partition_by: Union[str, List[str]],
+    file_format: str = "parquet",
+    mode: str = "truncate",
+    compression: Optional[str] = None,
+) -> None:
+    """
+    Write columns to a dataset partitioned into key=value directories, one
+    per distinct value of the partition_by columns, under path.
+
+    Parameters
+    ----------
+    columns : dict or DataFrame of pdarrays and Strings
+        The columns to write, including the partition_by columns
+    path : str
+        The root directory of the dataset, which is created if needed
+    partition_by : str or List[str]
+        The columns to partition by, outermost first. They are not written
+        to the files, and are recovered from the directory names by
+        read_partitioned.
+    file_format : str ("parquet" | "hdf5")
+        The format of the files (Default: "parquet")
+    mode : {'truncate' | 'append'}
+        By default, truncate (delete) the existing files of the partitions
+        that are written, once all the new files have been written. If
+        'append', add files to them instead. Partitions that have no rows in
+        columns are left untouched in either mode.
+    compression : str (Optional)
+        The compression of Parquet files, see to_parquet
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ValueError
+        Raised if the file format or mode is not supported, if a partition_by
+        column is missing, or if no other columns are given
+    RuntimeError
+        Raised if a server-side error is thrown writing the files
+
+    See Also
+    --------
+    read_partitioned, to_parquet, to_hdf
+
+    Notes
+    -----
+    Parquet datasets are written by a single request to the server, in
+    which each locale writes its part of every partition's rows to its own
+    file in the partition's directory. The locales write in parallel, but
+    each one writes its parts of the partitions one at a time. HDF5 datasets
+    are written one partition at a time with to_hdf, each locale also
+    writing its part of the partition's rows to its own file. Either way,
+    refreshing one partition rewrites only its files. Partition values are
+    percent-encoded in directory names.
+
+    Every write names its files with a new unique prefix. When truncating,
+    the other files of the partitions written are removed only after all the
+    new files have been written, so a failed write leaves the old files in
+    place. Files whose names start with "_" or "." are never removed.
+
+    Examples
+    --------
+    >>> ak.to_partitioned({'day': day, 'proto': proto, 'bytes': nbytes}, 'path/flows', 'day')
+    """
+    if file_format.lower() not in ("parquet", "hdf5"):
+        raise ValueError(f"Unsupported file format {file_format}")
+    if mode.lower() not in ("truncate", "append"):
+        raise ValueError("Allowed modes are 'truncate' and 'append'")
+    if isinstance(partition_by, str):
+        partition_by = [partition_by]
+    columns = {name: columns[name] for name in columns.keys()}
+    missing = set(partition_by) - set(columns)
+    if missing:
+        raise ValueError(f"Partition columns not found: {missing}")
+    data = {name: col for name, col in columns.items() if name not in partition_by}
+    if not data:
+        raise ValueError("There must be a column that is not partitioned by")
+
+    by = [columns[name] for name in partition_by]
+    g = GroupBy(by if len(by) > 1 else by[0])
+    if g.permutation.size == 0:
+        return
+    unique_keys = g.unique_keys if len(by) > 1 else [g.unique_keys]
+    key_lists = [key.to_list() for key in unique_keys]
+    directories = [
+        "/".join(
+            f"{quote(name, safe='')}={quote(str(value), safe='')}"
+            for name, value in zip(partition_by, key)
+        )
+        for key in zip(*key_lists)
+    ]
+    root = path.rstrip("/")
+    # every write gets new file names, so that the old files of a partition
+    # are only removed once the new ones have been written
+    prefix = f"part-{uuid.uuid4().hex}"
+
+    if file_format.lower() == "parquet":
+        names = list(data)
+        generic_msg(
+            cmd="toParquetPartitioned",
+            args={
+                "path": root,
+                "columns": [data[name][g.permutation] for name in names],
+                "col_names": names,
+                "num_cols": len(names),
+                "partitions": directories,
+                "num_partitions": len(directories),
+                "segments": g.segments,
+                "num_rows": g.permutation.size,
+                "prefix": prefix,
+                "mode": mode,
+                "compression": compression,
+            },
+        )
+        return
+
+    starts = g.segments.to_list()
+    ends = starts[1:] + [g.permutation.size]
+    for directory, start, end in zip(directories, starts, ends):
+        generic_msg(cmd="makedirs", args={"path": f"{root}/{directory}"})
+        rows = g.permutation[start:end]
+        to_hdf({name: col[rows] for name, col in data.items()}, f"{root}/{directory}/{prefix}")
+    if mode.lower() == "truncate":
+        generic_msg(
+            cmd="removepartitionfiles",
+            args={
+                "path": root,
+                "partitions": directories,
+                "partition_size": len(directories),
+                "keep_prefix": prefix,
+            },
+        )
@@ -1,23 +1,36 @@
-from typing import Callable, Tuple, Union, cast
+import json
+from typing import Callable, List, Sequence, Tuple, Union, cast
 
 import numpy as np  # type: ignore
 from typeguard import typechecked
 
 from arkouda.alignment import right_align
+from arkouda.categorical import Categorical
 from arkouda.client import generic_msg
 from arkouda.dtypes import NUMBER_FORMAT_STRINGS
 from arkouda.dtypes import int64 as akint64
 from arkouda.dtypes import resolve_scalar_dtype
-from arkouda.groupbyclass import GroupBy, broadcast
+from arkouda.groupbyclass import (
+    GROUPBY_METHODS,
+    GroupBy,
+    _get_grouping_keys,
+    broadcast,
+    groupable_element_type,
+)
 from arkouda.numeric import cumsum
 from arkouda.pdarrayclass import create_pdarray, pdarray
 from arkouda.pdarraycreation import arange, array, ones, zeros
 from arkouda.pdarraysetops import concatenate, in1d
+from arkouda.strings import Strings
 
 __all__ = ["join_on_eq_with_dt"]
 
 predicates = {"true_dt": 0, "abs_dt": 1, "pos_dt": 2}
 
+# the rows each kind of join keeps, see arkouda.merge
+JOIN_TYPES = frozenset(["inner", "left", "right", "outer"])
+MERGE_METHODS = GROUPBY_METHODS | {"broadcast"}
+
 
 @typechecked
 def join_on_eq_with_dt(
@@ -261,3 +274,56 @@ def inner_join(
     rightInds = byRight.permutation[filtRanges]
     leftInds = broadcast(filtSegs, arange(left.size)[keep12], filtRanges.size)
     return leftInds, rightInds
+
+
+def _merge_indices(
+    left: Sequence[groupable_element_type],
+    right: Sequence[groupable_element_type],
+    how: str = "inner",
+    method: str = "auto",
+) -> Tuple[pdarray, pdarray]:
+    """
+    Join the rows of the left and right key arrays that have equal keys in a
+    single server command, returning the left and right index of each joined
+    pair, or -1 for a row without a match that the join keeps. The pairs are
+    in no particular order.
+    """
+    if how not in JOIN_TYPES:
+        raise ValueError(f"how must be one of {sorted(JOIN_TYPES)}, got {how}")
+    if method not in MERGE_METHODS:
+        raise ValueError(f"method must be one of {sorted(MERGE_METHODS)}, got {method}")
+    if len(left) != len(right) or len(left) == 0:
+        raise ValueError("left and right must have the same, non-zero number of key arrays")
+    left_keys: List[groupable_element_type] = []
+    right_keys: List[groupable_element_type] = []
+    for lk, rk in zip(left, right):
+        if isinstance(lk, Categorical) or isinstance(rk, Categorical):
+            # codes are only comparable between Categoricals with the same categories
+            lk, rk = Categorical.standardize_categories(
+                [k if isinstance(k, Categorical) else Categorical(k) for k in (lk, rk)]
+            )
+        elif isinstance(lk, Strings) != isinstance(rk, Strings):
+            raise TypeError(f"Cannot join keys of types {type(lk)} and {type(rk)}")
+        elif isinstance(lk, pdarray) and lk.dtype != cast(pdarray, rk).dtype:
+            raise TypeError(
+                f"Cannot join keys of dtypes {lk.dtype} and {cast(pdarray, rk).dtype}, cast them first"
+            )
+        left_keys.append(lk)
+        right_keys.append(rk)
+    left_grouping, _ = _get_grouping_keys(left_keys)
+    right_grouping, _ = _get_grouping_keys(right_keys)
+    repMsg = generic_msg(
+        cmd="merge",
+        args={
+            "nleft": len(left_grouping),
+            "leftnames": [k.name for k in left_grouping],
+            "lefttypes": [k.objtype for k in left_grouping],
+            "nright": len(right_grouping),
+            "rightnames": [k.name for k in right_grouping],
+            "righttypes": [k.objtype for k in right_grouping],
+            "how": how,
+            "method": method,
+        },
+    )
+    left_inds, right_inds = (create_pdarray(rep) for rep in json.loads(cast(str, repMsg)))
+    return left_inds, right_inds
@@ -0,0 +1,359 @@
+from __future__ import annotations
+
+import operator
+from typing import Dict, List, Optional, Union, cast
+
+import numpy as np  # type: ignore
+from typeguard import typechecked
+
+from arkouda.client import generic_msg
+from arkouda.dtypes import dtype, float64, int64, int_scalars
+from arkouda.pdarrayclass import create_pdarray, pdarray
+
+__all__ = ["LazyExpr", "lazy"]
+
+# operators the server can evaluate inside a single fused kernel
+FusedOps = frozenset(["+", "-", "*", "/", "//", "%", "**"])
+# operators whose result is an int64 when both operands are int64
+IntOps = frozenset(["+", "-", "*", "//", "%"])
+fused_dtypes = {int64, float64}
+# the Python operator for each op, used to evaluate ops that are not fused
+eager_ops = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "//": operator.floordiv,
+    "%": operator.mod,
+    "**": operator.pow,
+    "<<": operator.lshift,
+    ">>": operator.rshift,
+    "&": operator.and_,
+    "|": operator.or_,
+    "^": operator.xor,
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+Operand = Union["LazyExpr", pdarray, int, float, np.integer, np.floating]
+
+
+class LazyExpr:
+    """
+    An arithmetic expression over pdarrays that is not evaluated until its
+    value is needed. Applying operators to a LazyExpr builds an expression
+    tree instead of sending one message per operator, and evaluate() runs the
+    whole tree as one fused kernel on the server. This avoids creating a
+    server-side temporary array for every intermediate result. Use
+    :func:`lazy` to create a LazyExpr from a pdarray.
+
+    Attributes
+    ----------
+    size : int
+        The number of elements in the result
+    dtype : dtype
+        The element type of the result, either int64 or float64
+
+    Notes
+    -----
+    The operators +, -, *, /, //, % and ** over int64 and float64 operands are
+    fused. Any other operator, such as a comparison or bitwise operator, or
+    operand dtype evaluates its operands and falls back to the eager pdarray
+    operator, so the result is the same as if the expression had been
+    computed with pdarrays. Intermediate values of a
+    float64 expression are held as float64, so int64 subexpressions mixed with
+    floats lose precision above 2**53.
+    """
+
+    objtype = "LazyExpr"
+
+    def __init__(
+        self,
+        op: Optional[str],
+        left: Operand,
+        right: Optional[Operand],
+        size: int_scalars,
+        mydtype,
+    ) -> None:
+        self.op = op
+        self.left = left
+        self.right = right
+        self.size = size
+        self.dtype = dtype(mydtype)
+        self._value: Optional[pdarray] = None
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return f"LazyExpr({self._to_str()}, size={self.size}, dtype={self.dtype.name})"
+
+    def _to_str(self) -> str:
+        if self.op is None:
+            return cast(pdarray, self.left).name
+        return f"({_operand_str(self.left)} {self.op} {_operand_str(self.right)})"
+
+    def _binop(self, other: Operand, op: str, reverse: bool = False) -> Union[LazyExpr, pdarray]:
+        if isinstance(other, pdarray):
+            if other.size != self.size:
+                raise ValueError(f"size mismatch {self.size} {other.size}")
+            other_dtype = other.dtype
+        elif isinstance(other, LazyExpr):
+            if other.size != self.size:
+                raise ValueError(f"size mismatch {self.size} {other.size}")
+            other_dtype = other.dtype
+        elif _is_fusable_scalar(other):
+            other_dtype = float64 if isinstance(other, (float, np.floating)) else int64
+        elif op in ("==", "!="):
+            # returning NotImplemented would make Python compare identities
+            raise TypeError(
+                f"unsupported operand type(s) for {op}: 'LazyExpr' and '{type(other).__name__}'"
+            )
+        else:
+            return NotImplemented
+        left, right = (other, self) if reverse else (self, other)
+        left_dtype, right_dtype = (other_dtype, self.dtype) if reverse else (self.dtype, other_dtype)
+        if (
+            op not in FusedOps
+            or self.dtype not in fused_dtypes
+            or other_dtype not in fused_dtypes
+            or (op == "**" and left_dtype == int64 and right_dtype == int64)
+        ):
+            # not supported by the fused kernel, so evaluate eagerly
+            return _eager(left, op, right)
+        if op in IntOps and left_dtype == int64 and right_dtype == int64:
+            return LazyExpr(op, left, right, self.size, int64)
+        return LazyExpr(op, left, right, self.size, float64)
+
+    def __add__(self, other):
+        return self._binop(other, "+")
+
+    def __radd__(self, other):
+        return self._binop(other, "+", reverse=True)
+
+    def __sub__(self, other):
+        return self._binop(other, "-")
+
+    def __rsub__(self, other):
+        return self._binop(other, "-", reverse=True)
+
+    def __mul__(self, other):
+        return self._binop(other, "*")
+
+    def __rmul__(self, other):
+        return self._binop(other, "*", reverse=True)
+
+    def __truediv__(self, other):
+        return self._binop(other, "/")
+
+    def __rtruediv__(self, other):
+        return self._binop(other, "/", reverse=True)
+
+    def __floordiv__(self, other):
+        return self._binop(other, "//")
+
+    def __rfloordiv__(self, other):
+        return self._binop(other, "//", reverse=True)
+
+    def __mod__(self, other):
+        return self._binop(other, "%")
+
+    def __rmod__(self, other):
+        return self._binop(other, "%", reverse=True)
+
+    def __pow__(self, other):
+        return self._binop(other, "**")
+
+    def __rpow__(self, other):
+        return self._binop(other, "**", reverse=True)
+
+    def __lshift__(self, other):
+        return self._binop(other, "<<")
+
+    def __rlshift__(self, other):
+        return self._binop(other, "<<", reverse=True)
+
+    def __rshift__(self, other):
+        return self._binop(other, ">>")
+
+    def __rrshift__(self, other):
+        return self._binop(other, ">>", reverse=True)
+
+    def __and__(self, other):
+        return self._binop(other, "&")
+
+    def __rand__(self, other):
+        return self._binop(other, "&", reverse=True)
+
+    def __or__(self, other):
+        return self._binop(other, "|")
+
+    def __ror__(self, other):
+        return self._binop(other, "|", reverse=True)
+
+    def __xor__(self, other):
+        return self._binop(other, "^")
+
+    def __rxor__(self, other):
+        return self._binop(other, "^", reverse=True)
+
+    def __lt__(self, other):
+        return self._binop(other, "<")
+
+    def __gt__(self, other):
+        return self._binop(other, ">")
+
+    def __le__(self, other):
+        return self._binop(other, "<=")
+
+    def __ge__(self, other):
+        return self._binop(other, ">=")
+
+    def __eq__(self, other):
+        return self._binop(other, "==")
+
+    def __ne__(self, other):
+        return self._binop(other, "!=")
+
+    def __neg__(self):
+        return self._binop(-1, "*")
+
+    def __invert__(self):
+        return ~self.evaluate()
+
+    def evaluate(self) -> pdarray:
+        """
+        Evaluate the expression on the server with a single fused kernel.
+        The result is cached, so evaluating the same expression again does
+        not send another message.
+
+        Returns
+        -------
+        pdarray
+            The value of the expression
+
+        Raises
+        ------
+        RuntimeError
+            Raised if there is a server-side error in evaluating the expression
+        """
+        if self._value is not None:
+            return self._value
+        if self.op is None:
+            self._value = cast(pdarray, self.left)
+            return self._value
+        arrays: List[pdarray] = []
+        index: Dict[str, int] = {}
+        program: List[str] = []
+        self._emit(program, arrays, index)
+        repMsg = generic_msg(
+            cmd="fusedEval",
+            args={
+                "narrays": len(arrays),
+                "arrays": arrays,
+                "nprog": len(program),
+                "program": program,
+            },
+        )
+        self._value = create_pdarray(cast(str, repMsg))
+        return self._value
+
+    def _emit(self, program: List[str], arrays: List[pdarray], index: Dict[str, int]) -> None:
+        """
+        Append the expression to program in reverse polish notation,
+        adding each distinct pdarray operand to arrays exactly once.
+        """
+        if self._value is not None:
+            _emit_operand(self._value, program, arrays, index)
+        elif self.op is None:
+            _emit_operand(self.left, program, arrays, index)
+        else:
+            _emit_operand(self.left, program, arrays, index)
+            _emit_operand(cast(Operand, self.right), program, arrays, index)
+            program.append(f"op:{self.op}")
+
+
+def _is_fusable_scalar(val) -> bool:
+    if isinstance(val, (bool, np.bool_)):
+        return True
+    if isinstance(val, (int, np.integer)):
+        return bool(-(2**63) <= val < 2**63)
+    return isinstance(val, (float, np.floating))
+
+
+def _operand_str(val) -> str:
+    if isinstance(val, LazyExpr):
+        return val._to_str()
+    if isinstance(val, pdarray):
+        return val.name
+    return str(val)
+
+
+def _emit_operand(
+    val: Operand, program: List[str], arrays: List[pdarray], index: Dict[str, int]
+) -> None:
+    if isinstance(val, LazyExpr):
+        val._emit(program, arrays, index)
+    elif isinstance(val, pdarray):
+        if val.name not in index:
+            index[val.name] = len(arrays)
+            arrays.append(val)
+        program.append(f"arr:{index[val.name]}")
+    elif isinstance(val, (float, np.floating)):
+        program.append(f"float:{float(val)!r}")
+    else:
+        program.append(f"int:{int(val)}")
+
+
+def _eager(left: Operand, op: str, right: Operand) -> pdarray:
+    """
+    Evaluate a single operator with the regular pdarray operators.
+    """
+    lval = left.evaluate() if isinstance(left, LazyExpr) else left
+    rval = right.evaluate() if isinstance(right, LazyExpr) else right
+    return eager_ops[op](lval, rval)
+
+
+@typechecked
+def lazy(pda: pdarray) -> LazyExpr:
+    """
+    Wrap a pdarray in a LazyExpr so that arithmetic on it is deferred and
+    evaluated on the server as a single fused kernel.
+
+    Parameters
+    ----------
+    pda : pdarray
+        The array to start the expression from
+
+    Returns
+    -------
+    LazyExpr
+        An expression whose value is pda
+
+    Raises
+    ------
+    TypeError
+        Raised if pda is not a pdarray
+
+    See Also
+    --------
+    LazyExpr.evaluate
+
+    Notes
+    -----
+    Operators applied to a LazyExpr (including ones where the other operand
+    is a pdarray) return a new LazyExpr. No server message is sent until
+    LazyExpr.evaluate is called.
+
+    Examples
+    --------
+    >>> a, b, c = ak.arange(1, 6), ak.arange(5), ak.ones(5, dtype=ak.int64)
+    >>> expr = (ak.lazy(a) * 2 + b) // c - 1
+    >>> expr.evaluate()
+    array([1, 4, 7, 10, 13])
+    """
+    return LazyExpr(None, pda, None, pda.size, pda.dtype)
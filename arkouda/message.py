@@ -9,6 +9,19 @@ from typeguard import typechecked
 
 from arkouda.dtypes import bigint
 
+"""
+Compact message arguments, and the LIST values within them, start with this
+marker, which JSON cannot start with. See ParameterObject.compact.
+"""
+COMPACT_ARGS_MARKER = "~"
+
+
+def _compact_field(val: str) -> str:
+    """
+    Prefix a field of compact message arguments with its length in bytes.
+    """
+    return f"{len(val) if val.isascii() else len(val.encode())}:{val}"
+
 
 class ObjectType(Enum):
     """
@@ -63,6 +76,19 @@ class ParameterObject:
             "val": self.val,
         }
 
+    @property
+    def compact(self) -> str:
+        """
+        The parameter in the compact format, four length-prefixed fields for
+        key, objType, dtype and val. A field is its length in bytes, a colon
+        and the field itself, so the server splits the fields without
+        unescaping or parsing them. Build the ParameterObject with
+        ``compact=True`` for the LIST and DICT values to be compact as well.
+        """
+        return "".join(
+            _compact_field(f) for f in (self.key, str(self.objType), self.dtype, self.val)
+        )
+
     @staticmethod
     @typechecked
     def _build_pdarray_param(key: str, val) -> ParameterObject:
@@ -84,7 +110,7 @@ class ParameterObject:
 
     @staticmethod
     @typechecked
-    def _build_strings_param(key: str, val) -> ParameterObject:
+    def _build_strings_param(key: str, val, compact: bool = False) -> ParameterObject:
         """
         Create a ParameterObject from a Strings value
 
@@ -94,6 +120,8 @@ class ParameterObject:
             key from the dictionary object
         val
             Strings object ot load from the symbol table
+        compact : bool
+            unused, the value of a Strings parameter is its name in either format
 
         Returns
         -------
@@ -105,7 +133,7 @@ class ParameterObject:
 
     @staticmethod
     @typechecked
-    def _build_list_param(key: str, val: list) -> ParameterObject:
+    def _build_list_param(key: str, val: list, compact: bool = False) -> ParameterObject:
         """
         Create a ParameterObject from a list
 
@@ -115,6 +143,8 @@ class ParameterObject:
             key from the dictionary object
         val : list
             list object to format as string
+        compact : bool
+            if True, format the list in the compact format instead of JSON
 
         Returns
         -------
@@ -136,21 +166,29 @@ class ParameterObject:
             # using pdarray for now. May change in future. This does not impact functionality
             t = pdarray.__name__
         if any(x == t for x in [pdarray.__name__, Strings.__name__]):
-            return ParameterObject(key, ObjectType.LIST, t, json.dumps([x.name for x in val]))
+            v = [x.name for x in val]
         else:
             # need all values to be str for chapel to read list properly
             v = val if t == str.__name__ else [str(x) for x in val]
-            return ParameterObject(key, ObjectType.LIST, t, json.dumps(v))
+        if compact:
+            return ParameterObject(
+                key, ObjectType.LIST, t, COMPACT_ARGS_MARKER + "".join(_compact_field(x) for x in v)
+            )
+        return ParameterObject(key, ObjectType.LIST, t, json.dumps(v))
 
     @staticmethod
     @typechecked
-    def _build_dict_param(key: str, val: Dict) -> ParameterObject:
+    def _build_dict_param(key: str, val: Dict, compact: bool = False) -> ParameterObject:
         j = []
         for k, v in val.items():
             if not isinstance(k, str):
                 raise TypeError(f"Argument keys are required to be str. Found {type(k)}")
-            param = ParameterObject.factory(k, v)
-            j.append(json.dumps(param.dict))
+            param = ParameterObject.factory(k, v, compact)
+            j.append(param.compact if compact else json.dumps(param.dict))
+        if compact:
+            return ParameterObject(
+                key, ObjectType.DICT, str(dict.__name__), COMPACT_ARGS_MARKER + "".join(j)
+            )
         return ParameterObject(key, ObjectType.DICT, str(dict.__name__), json.dumps(j))
 
     @staticmethod
@@ -182,7 +220,8 @@ class ParameterObject:
 
         Returns
         -------
-        Dictionary - mapping the parameter type to the build function
+        Dictionary - mapping the parameter type to the build function, which
+        takes the key, the value and whether to use the compact format
         """
         from arkouda.strings import Strings
 
@@ -193,7 +232,7 @@ class ParameterObject:
         }
 
     @classmethod
-    def factory(cls, key: str, val) -> ParameterObject:
+    def factory(cls, key: str, val, compact: bool = False) -> ParameterObject:
         """
         Factory method used to build ParameterObject given a key value pair
 
@@ -203,6 +242,8 @@ class ParameterObject:
             key from the dictionary object
         val
             the value corresponding to the provided key from the dictionary
+        compact : bool
+            if True, format list and dict values in the compact format instead of JSON
 
         Returns
         --------
@@ -216,7 +257,7 @@ class ParameterObject:
         ):  # this is done here to avoid multiple dispatch entries for the same type
             return cls._build_pdarray_param(key, val)
         elif (f := dispatch.get(type(val).__name__)) is not None:
-            return f(key, val)
+            return f(key, val, compact)
         else:
             return ParameterObject._build_gen_param(key, val)
 
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import builtins
 import json
-from typing import List, Optional, Sequence, Union, cast
+import weakref
+from typing import Iterator, List, Optional, Sequence, Tuple, Union, cast
 
 import numpy as np  # type: ignore
 from typeguard import typechecked
 
-from arkouda.client import generic_msg
+from arkouda.client import Session, _current_session, generic_msg
 from arkouda.dtypes import NUMBER_FORMAT_STRINGS, DTypes, bigint
 from arkouda.dtypes import bool as akbool
 from arkouda.dtypes import bool as npbool
@@ -114,6 +115,23 @@ def parse_single_value(msg: str) -> object:
         raise ValueError(f"unsupported value from server {mydtype.name} {value}")
 
 
+class _VersionCount:
+    """
+    The number of in-place changes made to a server array, see pdarray._version.
+    """
+
+    __slots__ = ("value", "__weakref__")
+
+    def __init__(self) -> None:
+        self.value = 0
+
+
+# by Session and name, as long as a pdarray refers to the server array
+_version_counts: weakref.WeakValueDictionary[
+    Tuple[Optional[Session], str], _VersionCount
+] = weakref.WeakValueDictionary()
+
+
 # class for the pdarray
 class pdarray:
     """
@@ -184,13 +202,32 @@ class pdarray:
         self.ndim = ndim
         self.shape = shape
         self.itemsize = itemsize
+        # the Session of the server holding the array, which may not be current when it is deleted
+        try:
+            self._session: Optional[Session] = _current_session()
+        except RuntimeError:
+            self._session = None
+        # shared by every pdarray with this name, e.g. one returned by attach, see _version
+        self._version_count = _version_counts.setdefault((self._session, name), _VersionCount())
+
+    @property
+    def _version(self) -> int:
+        """
+        The number of in-place changes made to the server array through any
+        pdarray object, so cached results derived from the data are not reused.
+        """
+        return self._version_count.value
+
+    @_version.setter
+    def _version(self, value: int) -> None:
+        self._version_count.value = value
 
     def __del__(self):
-        try:
+        session = getattr(self, "_session", None)
+        if session is not None:
             logger.debug(f"deleting pdarray with name {self.name}")
-            generic_msg(cmd="delete", args={"name": self.name})
-        except RuntimeError:
-            pass
+            # sent to the server with the next request, so __del__ never blocks
+            session.delete(self.name)
 
     def __bool__(self) -> builtins.bool:
         if self.size != 1:
@@ -274,9 +311,14 @@ class pdarray:
             a supported dtype
 
         """
+        from arkouda.lazyexpr import LazyExpr
+
         # For pdarray subclasses like ak.Datetime and ak.Timedelta, defer to child logic
         if type(other) != pdarray and issubclass(type(other), pdarray):
             return NotImplemented
+        # defer to LazyExpr so that the expression stays lazy
+        if isinstance(other, LazyExpr):
+            return NotImplemented
         if op not in self.BinOps:
             raise ValueError(f"bad operator {op}")
         # pdarray binop pdarray
@@ -479,6 +521,7 @@ class pdarray:
     def opeq(self, other, op):
         if op not in self.OpEqOps:
             raise ValueError(f"bad operator {op}")
+        self._version += 1
         # pdarray op= pdarray
         if isinstance(other, pdarray):
             if self.size != other.size:
@@ -602,6 +645,7 @@ class pdarray:
             raise TypeError(f"Unhandled key type: {key} ({type(key)})")
 
     def __setitem__(self, key, value):
+        self._version += 1
         if np.isscalar(key) and (resolve_scalar_dtype(key) in ["int64", "uint64"]):
             orig_key = key
             if key < 0:
@@ -675,6 +719,7 @@ class pdarray:
         TypeError
             Raised if value is not an int, int64, float, or float64
         """
+        self._version += 1
         generic_msg(
             cmd="set", args={"array": self, "dtype": self.dtype.name, "val": self.format_other(value)}
         )
@@ -1189,10 +1234,15 @@ class pdarray:
         may override this limit by setting client.maxTransferBytes to a larger
         value, but proceed with caution.
 
+        Arrays larger than ``client.transferChunkBytes`` are transferred in
+        chunks of at most that many bytes, each of which is copied directly
+        into the preallocated result.
+
         See Also
         --------
         array()
         to_list()
+        iter_chunks()
 
         Examples
         --------
@@ -1203,7 +1253,7 @@ class pdarray:
         >>> type(a.to_ndarray())
         numpy.ndarray
         """
-        from arkouda.client import maxTransferBytes
+        from arkouda.client import maxTransferBytes, transferChunkBytes
 
         dt = dtype(self.dtype)
 
@@ -1219,27 +1269,102 @@ class pdarray:
             raise RuntimeError(
                 "Array exceeds allowed size for transfer. Increase client.maxTransferBytes to allow"
             )
-        # The reply from the server will be binary data
-        data = cast(
-            memoryview,
-            generic_msg(cmd="tondarray", args={"array": self}, recv_binary=True),
-        )
-        # Make sure the received data has the expected length
-        if len(data) != self.size * self.dtype.itemsize:
+        dt = self._transfer_dtype()
+        # Receive the data directly into the result so it is writable without a copy
+        result = np.empty(self.size, dtype=dt)
+        if arraybytes > transferChunkBytes:
+            for start, stop in self._chunk_bounds(transferChunkBytes):
+                self._transfer_chunk(start, stop, out=result[start:stop])
+        else:
+            generic_msg(cmd="tondarray", args={"array": self}, recv_binary=True, out=result)
+        return result
+
+    def iter_chunks(self, nbytes: Optional[int_scalars] = None) -> Iterator[np.ndarray]:
+        """
+        Iterate over the array in chunks, transferring one chunk at a time from
+        the Arkouda server to client-side Python. Because the whole array is
+        never held by the client at once, the total size of the array is not
+        limited by client.maxTransferBytes.
+
+        Parameters
+        ----------
+        nbytes : int_scalars, optional
+            The maximum number of bytes in each chunk. Defaults to
+            client.transferChunkBytes.
+
+        Yields
+        ------
+        np.ndarray
+            Consecutive chunks of the array, each a new array that can be
+            modified without changing the pdarray
+
+        Raises
+        ------
+        TypeError
+            Raised if the pdarray is a bigint pdarray
+        ValueError
+            Raised if nbytes is not positive
+        RuntimeError
+            Raised if nbytes exceeds client.maxTransferBytes or if there is
+            a server-side error thrown
+
+        See Also
+        --------
+        to_ndarray()
+
+        Examples
+        --------
+        >>> a = ak.arange(0, 5, 1)
+        >>> [c.tolist() for c in a.iter_chunks(16)]
+        [[0, 1], [2, 3], [4]]
+        """
+        from arkouda.client import maxTransferBytes, transferChunkBytes
+
+        if self.dtype == bigint:
+            raise TypeError("iter_chunks is not supported for bigint pdarrays")
+        if nbytes is None:
+            nbytes = transferChunkBytes
+        if nbytes <= 0:
+            raise ValueError(f"nbytes must be positive, got {nbytes}")
+        if nbytes > maxTransferBytes:
             raise RuntimeError(
-                f"Expected {self.size * self.dtype.itemsize} bytes but received {len(data)}"
+                "Chunk exceeds allowed size for transfer. Increase client.maxTransferBytes to allow"
             )
-        # The server sends us native-endian data so we need to account for
-        # that. If the view is readonly, copy so the np array is mutable
+        dt = self._transfer_dtype()
+        for start, stop in self._chunk_bounds(nbytes):
+            chunk = np.empty(stop - start, dtype=dt)
+            self._transfer_chunk(start, stop, out=chunk)
+            yield chunk
+
+    def _transfer_dtype(self) -> np.dtype:
+        """
+        The server sends us native-endian data, so return the dtype of the
+        array with the byteorder of the server.
+        """
         if get_server_byteorder() == "big":
-            dt = dt.newbyteorder(">")
+            return dtype(self.dtype).newbyteorder(">")
         else:
-            dt = dt.newbyteorder("<")
+            return dtype(self.dtype).newbyteorder("<")
 
-        if data.readonly:
-            return np.frombuffer(data, dt).copy()
-        else:
-            return np.frombuffer(data, dt)
+    def _chunk_bounds(self, nbytes: int_scalars) -> Iterator[Tuple[int, int]]:
+        """
+        Yield the (start, stop) indices of consecutive chunks of at most nbytes.
+        """
+        step = builtins.max(1, int(nbytes) // self.dtype.itemsize)
+        for start in range(0, self.size, step):
+            yield start, builtins.min(start + step, self.size)
+
+    def _transfer_chunk(self, start: int, stop: int, out: np.ndarray) -> None:
+        """
+        Transfer the elements start..stop-1 of the array from the server
+        directly into out, which must hold exactly stop - start elements.
+        """
+        generic_msg(
+            cmd="tondarray",
+            args={"array": self, "start": start, "stop": stop},
+            recv_binary=True,
+            out=out,
+        )
 
     def to_list(self) -> List:
         """
@@ -1349,6 +1474,11 @@ class pdarray:
         dataset: str = "array",
         mode: str = "truncate",
         compression: Optional[str] = None,
+        row_group_size: Optional[int] = None,
+        data_page_size: Optional[int] = None,
+        use_dictionary: bool = True,
+        write_statistics: bool = True,
+        is_sorted: bool = False,
     ) -> str:
         """
         Save the pdarray to Parquet. The result is a collection of files,
@@ -1367,11 +1497,29 @@ class pdarray:
         compression : str (Optional)
             (None | "snappy" | "gzip" | "brotli" | "zstd" | "lz4")
             Sets the compression type used with Parquet files
+        row_group_size : int (Optional)
+            The number of rows of each row group of each file. Default None
+            keeps the server default of 2**26 rows.
+        data_page_size : int (Optional)
+            The approximate size in bytes of each data page. Default None
+            keeps the Arrow default of 1MB.
+        use_dictionary : bool
+            Whether to dictionary encode the values, falling back to plain
+            encoding if the dictionary grows too large (Default: True)
+        write_statistics : bool
+            Whether to write the min/max statistics of each row group and
+            page, which readers use to skip them when filtering (Default: True)
+        is_sorted : bool
+            Whether to record in the metadata of the files that the values are
+            sorted in ascending order, which is not checked (Default: False)
         Returns
         -------
         string message indicating result of save operation
         Raises
         ------
+        ValueError
+            Raised if a size is not positive, or if an option other than the
+            compression is set in 'append' mode
         RuntimeError
             Raised if a server-side error is thrown saving the pdarray
         Notes
@@ -1398,7 +1546,7 @@ class pdarray:
         Saves the array to numLocales HDF5 files with the name
         ``cwd/path/name_prefix_LOCALE####.parquet`` where #### is replaced by each locale number
         """
-        from arkouda.io import mode_str_to_int
+        from arkouda.io import _parquet_write_args, mode_str_to_int
 
         return cast(
             str,
@@ -1411,6 +1559,15 @@ class pdarray:
                     "prefix": prefix_path,
                     "dtype": self.dtype,
                     "compression": compression,
+                    **_parquet_write_args(
+                        [dataset],
+                        mode,
+                        row_group_size,
+                        data_page_size,
+                        use_dictionary,
+                        write_statistics,
+                        [dataset] if is_sorted else None,
+                    ),
                 },
             ),
         )
@@ -1720,6 +1877,8 @@ class pdarray:
             raise RegistrationError(f"Server was unable to register {user_defined_name}")
 
         self.name = user_defined_name
+        # objects attached by the new name see the changes made through this one
+        _version_counts[(self._session, self.name)] = self._version_count
         return self
 
     def unregister(self) -> None:
@@ -1,4 +1,3 @@
-import itertools
 from typing import Iterable, Optional, Union, cast
 
 import numpy as np  # type: ignore
@@ -186,6 +185,9 @@ def array(
     may override this limit by setting ak.maxTransferBytes to a larger value,
     but should proceed with caution.
 
+    Numeric arrays larger than ``ak.client.transferChunkBytes`` are sent in
+    chunks of at most that many bytes rather than as a single message.
+
     If the pdrray or ndarray is of type U, this method is called twice recursively
     to create the Strings object and the two corresponding pdarrays for string
     bytes and offsets, respectively.
@@ -209,7 +211,7 @@ def array(
     if isinstance(a, pdarray):
         # TODO update if max_bits is set
         return a if dtype is None else akcast(a, dtype)
-    from arkouda.client import maxTransferBytes
+    from arkouda.client import maxTransferBytes, transferChunkBytes
 
     # If a is not already a numpy.ndarray, convert it
     if not isinstance(a, np.ndarray):
@@ -240,14 +242,13 @@ def array(
     # Check if array of strings
     if "U" in a.dtype.kind:
         # encode each string and add a null byte terminator
-        encoded = [i for i in itertools.chain.from_iterable(map(lambda x: x.encode() + b"\x00", a))]
-        nbytes = len(encoded)
+        encoded_np = _encode_strings(a)
+        nbytes = encoded_np.size
         if nbytes > maxTransferBytes:
             raise RuntimeError(
                 f"Creating pdarray would require transferring {nbytes} bytes, which exceeds "
                 f"allowed transfer size. Increase ak.maxTransferBytes to force."
             )
-        encoded_np = np.array(encoded, dtype=np.uint8)
         rep_msg = generic_msg(
             cmd="array",
             args={"dtype": encoded_np.dtype.name, "size": encoded_np.size, "seg_string": True},
@@ -282,6 +283,9 @@ def array(
             raise RuntimeError(
                 "Array exceeds allowed transfer size. Increase ak.maxTransferBytes to allow"
             )
+        if size * a.itemsize > transferChunkBytes and a.dtype.name in _chunked_dtypes:
+            result = _array_chunked(a, transferChunkBytes)
+            return result if dtype is None else akcast(result, dtype)
         # Pack binary array data into a bytes object with a command header
         # including the dtype and size. If the server has a different byteorder
         # than our numpy array we need to swap to match since the server expects
@@ -296,6 +300,63 @@ def array(
         return create_pdarray(rep_msg) if dtype is None else akcast(create_pdarray(rep_msg), dtype)
 
 
+# dtypes that can be created empty on the server and then filled in chunks
+_chunked_dtypes = {"int64", "uint64", "float64", "bool"}
+
+
+def _array_chunked(a: np.ndarray, nbytes: int) -> pdarray:
+    """
+    Send a numpy array to the server in chunks of at most nbytes, writing
+    each chunk into a server array created beforehand, so no single message
+    holds the whole array.
+    """
+    result = create_pdarray(
+        cast(str, generic_msg(cmd="create", args={"dtype": a.dtype.name, "size": a.size}))
+    )
+    step = max(1, nbytes // a.itemsize)
+    for start in range(0, a.size, step):
+        chunk = a[start : start + step]
+        generic_msg(
+            cmd="array",
+            args={
+                "dtype": a.dtype.name,
+                "size": chunk.size,
+                "seg_string": False,
+                "target": result,
+                "start": start,
+            },
+            payload=_array_memview(chunk),
+            send_binary=True,
+        )
+    return result
+
+
+def _encode_strings(a: np.ndarray) -> np.ndarray:
+    """
+    Encode a numpy array of str as the null-terminated UTF-8 bytes of the
+    strings laid end to end, without creating a Python object per string.
+    """
+    a = np.ascontiguousarray(a, dtype=a.dtype.newbyteorder("="))
+    width = a.dtype.itemsize // 4
+    # numpy stores str as fixed-width UCS4 code points, padded with nulls
+    codepoints = a.view(np.uint32).reshape(a.size, width)
+    if a.size == 0 or width == 0 or codepoints.max() < 0x80:
+        # ASCII code points are their own UTF-8 encoding
+        fixed = codepoints.astype(np.uint8)
+    else:
+        encoded = np.char.encode(a, "utf-8")
+        width = encoded.dtype.itemsize
+        fixed = encoded.view(np.uint8).reshape(a.size, width)
+    # like numpy, treat trailing nulls as padding, so each string ends at its last nonzero byte
+    nonzero = fixed != 0
+    lengths = np.where(nonzero.any(axis=1), width - nonzero[:, ::-1].argmax(axis=1), 0)
+    # each row holds one string, plus room for its terminator
+    padded = np.zeros((a.size, width + 1), dtype=np.uint8)
+    padded[:, :width] = fixed
+    # keep each string's bytes and a single null terminator
+    return padded[np.arange(width + 1) <= lengths[:, np.newaxis]]
+
+
 def _array_memview(a) -> memoryview:
     if (get_byteorder(a.dtype) == "<" and get_server_byteorder() == "big") or (
         get_byteorder(a.dtype) == ">" and get_server_byteorder() == "little"
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Type, TypeVar, Union, cast
+
+from typeguard import typechecked
+
+from arkouda.client import generic_msg
+from arkouda.infoclass import list_registry
+from arkouda.pdarrayclass import RegistrationError, create_pdarray, pdarray
+from arkouda.strings import Strings
+
+__all__ = ["RegisteredIndex"]
+
+IndexType = TypeVar("IndexType", bound="RegisteredIndex")
+
+
+class RegisteredIndex(ABC):
+    """
+    Base class of the server-side indexes, such as :class:`arkouda.SortedIndex`
+    and :class:`arkouda.HashIndex`, whose components are registered with the
+    Arkouda server together, under one name.
+
+    Subclasses define _components, the components to register by the name of
+    each, and _from_components, which rebuilds an index from the attached
+    components without building it again.
+
+    Attributes
+    ----------
+    name : str or None
+        The name the index is registered under, if any
+    """
+
+    objtype = "RegisteredIndex"
+    name: Optional[str] = None
+
+    @abstractmethod
+    def _components(self) -> Dict[str, Union[pdarray, Strings]]:
+        ...
+
+    @classmethod
+    @abstractmethod
+    def _from_components(
+        cls: Type[IndexType], components: Dict[str, Union[pdarray, Strings]]
+    ) -> IndexType:
+        ...
+
+    @typechecked
+    def register(self: IndexType, user_defined_name: str) -> IndexType:
+        """
+        Register this index and its components with the Arkouda server, so
+        that it can be attached to later with attach.
+
+        Parameters
+        ----------
+        user_defined_name : str
+            The name to register the index under, which is the prefix of the
+            names of its components
+
+        Returns
+        -------
+        RegisteredIndex
+            The same index, now registered under user_defined_name
+
+        Raises
+        ------
+        RegistrationError
+            Raised if the server was unable to register a component
+
+        See Also
+        --------
+        attach, unregister, is_registered
+
+        Notes
+        -----
+        Objects registered with the server are immune to deletion until
+        they are unregistered.
+        """
+        for piece, component in self._components().items():
+            component.register(f"{user_defined_name}.{piece}")
+        self.name = user_defined_name
+        return self
+
+    def unregister(self) -> None:
+        """
+        Unregister this index and its components from the Arkouda server.
+
+        Raises
+        ------
+        RegistrationError
+            Raised if the index is not registered
+
+        See Also
+        --------
+        register, attach, is_registered
+        """
+        if not self.name:
+            raise RegistrationError(
+                "This item does not have a name and does not appear to be registered."
+            )
+        for component in self._components().values():
+            component.unregister()
+        self.name = None
+
+    def is_registered(self) -> bool:
+        """
+        Return True if this index and all its components are registered.
+
+        Returns
+        -------
+        bool
+            Indicates if the index is registered
+
+        See Also
+        --------
+        register, attach, unregister
+        """
+        if self.name is None:
+            return False
+        return all(component.is_registered() for component in self._components().values())
+
+    @classmethod
+    @typechecked
+    def attach(cls: Type[IndexType], user_defined_name: str) -> IndexType:
+        """
+        Attach to an index that was registered with the Arkouda server.
+
+        Parameters
+        ----------
+        user_defined_name : str
+            The name the index was registered under
+
+        Returns
+        -------
+        RegisteredIndex
+            The registered index, which is not built again
+
+        Raises
+        ------
+        RegistrationError
+            Raised if no index is registered under user_defined_name
+
+        See Also
+        --------
+        register, unregister, is_registered
+        """
+        prefix = f"{user_defined_name}."
+        names = [
+            name
+            for name in list_registry()
+            if name.startswith(prefix) and "." not in name[len(prefix) :]
+        ]
+        if f"{prefix}keys" not in names:
+            raise RegistrationError(f"No registered elements with name '{user_defined_name}'")
+        components: Dict[str, Union[pdarray, Strings]] = {}
+        for name in names:
+            resp = cast(str, generic_msg(cmd="attach", args={"name": name}))
+            components[name[len(prefix) :]] = (
+                Strings.from_return_msg(resp)
+                if resp.split()[2] == Strings.objtype
+                else create_pdarray(resp)
+            )
+        index = cls._from_components(components)
+        index.name = user_defined_name
+        return index
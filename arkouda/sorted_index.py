@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+from typing import Optional, Tuple, Union, cast
+
+from typeguard import typechecked
+
+from arkouda.categorical import Categorical
+from arkouda.client import generic_msg
+from arkouda.dtypes import float64 as akfloat64
+from arkouda.dtypes import int64 as akint64
+from arkouda.dtypes import numeric_scalars
+from arkouda.dtypes import uint64 as akuint64
+from arkouda.numeric import cumsum, isnan, where
+from arkouda.pdarrayclass import create_pdarray, is_sorted, pdarray
+from arkouda.pdarraycreation import arange, array, full
+from arkouda.registered_index import RegisteredIndex
+from arkouda.sorting import argsort
+
+__all__ = ["SortedIndex"]
+
+SEARCH_SIDES = frozenset(["left", "right"])
+
+
+class SortedIndex(RegisteredIndex):
+    """
+    A persistent index of the values of a numeric array, sorted once on the
+    server. Point lookups, searchsorted, range and interval queries then
+    binary search the sorted values, costing O(log n) per query instead of
+    concatenating and regrouping the values with every batch of queries as
+    :func:`arkouda.find`, :func:`arkouda.lookup` and
+    :func:`arkouda.search_intervals` do.
+
+    Parameters
+    ----------
+    keys : pdarray
+        The int64, uint64 or float64 values to index, which may repeat
+    ends : pdarray, optional
+        If given, keys and ends are the inclusive lower and upper bounds of
+        closed, non-overlapping intervals, which search_intervals finds
+        values in
+    assume_sorted : bool
+        If True, keys is already sorted in ascending order and is not sorted
+        again, which is checked in one pass over keys (Default: False)
+
+    Attributes
+    ----------
+    keys : pdarray
+        The values in ascending order
+    permutation : pdarray
+        The index in the original values of each sorted value, which for
+        equal values is in ascending order
+    ends : pdarray or None
+        The upper bounds of the intervals, in the order of keys
+    size : int
+        The number of values
+    dtype : dtype
+        The dtype of the values
+    name : str or None
+        The name the index is registered under, if any
+
+    Raises
+    ------
+    TypeError
+        Raised if keys is not an int64, uint64 or float64 pdarray, or if ends
+        does not have the same dtype
+    ValueError
+        Raised if keys contains NaN, if assume_sorted is True but keys is not
+        sorted, if ends has a different size, or if the intervals are empty or
+        overlap
+
+    Notes
+    -----
+    The sorted values stay distributed as they are. The server sends each
+    query to the locale holding the part of the values it falls in, where it
+    reads only the O(log n) values the query compares with, so an index can
+    be much larger than the memory of one locale.
+
+    Examples
+    --------
+    >>> index = ak.SortedIndex(ak.array([30, 10, 20, 10]))
+    >>> index.find(ak.array([10, 20, 25]))
+    array([1 2 -1])
+    >>> index.searchsorted(ak.array([5, 10, 25]), side="right")
+    array([0 2 3])
+    >>> index.range(10, 30)
+    array([1 3 2])
+    """
+
+    objtype = "SortedIndex"
+
+    @typechecked
+    def __init__(
+        self, keys: pdarray, ends: Optional[pdarray] = None, assume_sorted: bool = False
+    ) -> None:
+        if keys.dtype not in (akint64, akuint64, akfloat64):
+            raise TypeError(f"keys must be an int64, uint64 or float64 pdarray, got {keys.dtype}")
+        if keys.dtype == akfloat64 and isnan(keys).any():
+            raise ValueError("keys cannot contain NaN")
+        if assume_sorted:
+            if not is_sorted(keys):
+                raise ValueError("keys must be sorted in ascending order if assume_sorted is True")
+            self.permutation = arange(keys.size)
+            self.keys = keys
+        else:
+            self.permutation = argsort(keys)
+            self.keys = keys[self.permutation]
+        self.ends: Optional[pdarray] = None
+        if ends is not None:
+            if ends.dtype != keys.dtype:
+                raise TypeError(f"ends must have the dtype of keys, {keys.dtype}, got {ends.dtype}")
+            if ends.size != keys.size:
+                raise ValueError("ends must have the same size as keys")
+            self.ends = ends if assume_sorted else ends[self.permutation]
+            if not (self.ends >= self.keys).all():
+                raise ValueError("Upper bounds must be greater than lower bounds")
+            if not (self.keys[1:] > self.ends[:-1]).all():
+                raise ValueError("Intervals cannot overlap")
+        self.size = keys.size
+        self.dtype = keys.dtype
+        self.name: Optional[str] = None
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return f"SortedIndex({self.keys}, size={self.size}, dtype={self.dtype.name})"
+
+    def _as_queries(self, values: Union[pdarray, numeric_scalars]) -> pdarray:
+        if not isinstance(values, pdarray):
+            return cast(pdarray, array([values], dtype=self.dtype))
+        if values.dtype != self.dtype:
+            raise TypeError(f"values must have the dtype of the index, {self.dtype}, got {values.dtype}")
+        return values
+
+    @typechecked
+    def searchsorted(
+        self, values: Union[pdarray, numeric_scalars], side: str = "left"
+    ) -> Union[pdarray, int]:
+        """
+        Find the positions in the sorted values at which values would be
+        inserted to keep them sorted, like numpy.searchsorted.
+
+        Parameters
+        ----------
+        values : pdarray or scalar
+            The values to search for, with the dtype of the index
+        side : str
+            "left" (Default) gives the first suitable position, which is the
+            number of sorted values less than the value, and "right" the last,
+            which is the number not greater than the value
+
+        Returns
+        -------
+        pdarray or int
+            The int64 position of each value, or the position of a scalar value
+
+        Raises
+        ------
+        TypeError
+            Raised if values is a pdarray of another dtype
+        ValueError
+            Raised if side is not "left" or "right"
+        """
+        if side not in SEARCH_SIDES:
+            raise ValueError(f"side must be one of {sorted(SEARCH_SIDES)}, got {side}")
+        queries = self._as_queries(values)
+        repMsg = generic_msg(
+            cmd="searchSorted", args={"keys": self.keys, "queries": queries, "side": side}
+        )
+        positions = create_pdarray(cast(str, repMsg))
+        return positions if isinstance(values, pdarray) else int(positions[0])
+
+    @typechecked
+    def find(self, values: pdarray) -> pdarray:
+        """
+        Find the index of each value in the original values of the index, the
+        first if a value repeats, or -1 if it is missing, like
+        :func:`arkouda.find`.
+
+        Parameters
+        ----------
+        values : pdarray
+            The values to find, with the dtype of the index
+
+        Returns
+        -------
+        pdarray
+            The int64 index of each value, or -1
+
+        Raises
+        ------
+        TypeError
+            Raised if values has another dtype
+        """
+        positions = cast(pdarray, self.searchsorted(values))
+        found = positions < self.size
+        if self.size > 0:
+            inside = where(found, positions, 0)
+            found &= self.keys[inside] == values
+            return where(found, self.permutation[inside], -1)
+        return full(values.size, -1, dtype=akint64)
+
+    def lookup(self, values, arguments: pdarray, fillvalue=-1):
+        """
+        Apply the function defined by the mapping of the original values of the
+        index to values, like :func:`arkouda.lookup`.
+
+        Parameters
+        ----------
+        values : pdarray or Categorical
+            The value of the function for each original value of the index
+        arguments : pdarray
+            The arguments to evaluate the function at, with the dtype of the index
+        fillvalue : scalar
+            The value for arguments that are not in the index (Default: -1)
+
+        Returns
+        -------
+        pdarray or Categorical
+            The value of the function at each argument
+
+        Raises
+        ------
+        ValueError
+            Raised if values does not have the size of the index
+        TypeError
+            Raised if arguments has another dtype
+        """
+        if values.size != self.size:
+            raise ValueError("values must have the size of the index")
+        if isinstance(values, Categorical):
+            codes = self.lookup(values.codes, arguments, fillvalue=values._NAcode)
+            return Categorical.from_codes(codes, values.categories, NAvalue=values.NAvalue)
+        idx = self.find(arguments)
+        retvals = full(idx.size, fillvalue, dtype=values.dtype)
+        found = idx >= 0
+        retvals[found] = values[idx[found]]
+        return retvals
+
+    @typechecked
+    def range(self, low: numeric_scalars, high: numeric_scalars) -> pdarray:
+        """
+        Find the original values of the index in the half-open range
+        [low, high).
+
+        Parameters
+        ----------
+        low : scalar
+            The inclusive lower bound
+        high : scalar
+            The exclusive upper bound
+
+        Returns
+        -------
+        pdarray
+            The int64 indices of the values in the range, in ascending order
+            of the values
+        """
+        bounds = cast(pdarray, array([low, high], dtype=self.dtype))
+        start, stop = cast(pdarray, self.searchsorted(bounds)).to_list()
+        return self.permutation[start : max(start, stop)]
+
+    @typechecked
+    def ranges(self, low: pdarray, high: pdarray) -> Tuple[pdarray, pdarray]:
+        """
+        Find the original values of the index in each of a set of half-open
+        ranges [low, high).
+
+        Parameters
+        ----------
+        low : pdarray
+            The inclusive lower bound of each range, with the dtype of the index
+        high : pdarray
+            The exclusive upper bound of each range
+
+        Returns
+        -------
+        segments : pdarray
+            The int64 offset of the indices of each range in indices
+        indices : pdarray
+            The int64 indices of the values in each range, in ascending order
+            of the values, concatenated in the order of the ranges
+
+        Raises
+        ------
+        TypeError
+            Raised if low or high has another dtype
+        ValueError
+            Raised if low and high have different sizes
+        """
+        from arkouda.join import gen_ranges
+
+        if low.size != high.size:
+            raise ValueError("low and high must have the same size")
+        starts = cast(pdarray, self.searchsorted(low))
+        stops = cast(pdarray, self.searchsorted(high))
+        lengths = where(stops > starts, stops - starts, 0)
+        segments = cumsum(lengths) - lengths
+        nonempty = lengths > 0
+        _, positions = gen_ranges(starts[nonempty], stops[nonempty])
+        return segments, self.permutation[positions]
+
+    @typechecked
+    def search_intervals(self, values: pdarray) -> pdarray:
+        """
+        Find the interval of the index that contains each value, like
+        :func:`arkouda.search_intervals`.
+
+        Parameters
+        ----------
+        values : pdarray
+            The values to search for, with the dtype of the index
+
+        Returns
+        -------
+        pdarray
+            The int64 index in the original intervals of the interval
+            containing each value, or -1 if none does
+
+        Raises
+        ------
+        ValueError
+            Raised if the index was created without ends
+        TypeError
+            Raised if values has another dtype
+        """
+        if self.ends is None:
+            raise ValueError("search_intervals requires an index created with ends")
+        if self.size == 0:
+            return full(values.size, -1, dtype=akint64)
+        # the last interval whose lower bound is not greater than the value
+        candidates = cast(pdarray, self.searchsorted(values, side="right")) - 1
+        inside = where(candidates >= 0, candidates, 0)
+        found = (candidates >= 0) & (self.ends[inside] >= values)
+        return where(found, self.permutation[inside], -1)
+
+    def _components(self):
+        components = {"keys": self.keys, "permutation": self.permutation}
+        if self.ends is not None:
+            components["ends"] = self.ends
+        return components
+
+    @classmethod
+    def _from_components(cls, components):
+        index = cls.__new__(cls)
+        index.keys = components["keys"]
+        index.permutation = components["permutation"]
+        index.ends = components.get("ends", None)
+        index.size = index.keys.size
+        index.dtype = index.keys.dtype
+        return index
@@ -1754,17 +1754,20 @@ class Strings:
         numpy.ndarray
         """
         # Get offsets and append total bytes for length calculation
-        npoffsets = np.hstack((self._comp_to_ndarray("offsets"), np.array([self.nbytes])))
+        size = int(self.size)
+        npoffsets = np.empty(size + 1, dtype=self._comp_dtype("offsets"))
+        self._comp_to_ndarray("offsets", out=npoffsets[:size])
+        npoffsets[size] = self.nbytes
         # Get contents of strings (will error if too large)
-        npvalues = self._comp_to_ndarray("values")
+        npvalues = self._comp_to_ndarray("values").data
         # Compute lengths, discounting null terminators
         lengths = np.diff(npoffsets) - 1
         # Numpy dtype is based on max string length
         dt = f"<U{lengths.max() if len(lengths) > 0 else 1}"
         res = np.empty(self.size, dtype=dt)
-        # Form a string from each segment and store in numpy array
-        for i, (o, l) in enumerate(zip(npoffsets, lengths)):
-            res[i] = np.str_(codecs.decode(b"".join(npvalues[o : o + l])))
+        # Decode each segment straight from the received bytes and store in numpy array
+        for i, (o, l) in enumerate(zip(npoffsets.tolist(), lengths.tolist())):
+            res[i] = codecs.decode(npvalues[o : o + l])
         return res
 
     def to_list(self) -> list:
@@ -1802,7 +1805,7 @@ class Strings:
         """
         return self.to_ndarray().tolist()
 
-    def _comp_to_ndarray(self, comp: str) -> np.ndarray:
+    def _comp_to_ndarray(self, comp: str, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         This is an internal helper function to perform the to_ndarray for one
         of the string components.
@@ -1811,6 +1814,9 @@ class Strings:
         ----------
         comp : str
             The strings component to request
+        out : np.ndarray, optional
+            Array to receive the component into, which must have exactly as many
+            elements as the component and the dtype returned by _comp_dtype
 
         Returns
         -------
@@ -1847,27 +1853,25 @@ class Strings:
             raise RuntimeError(
                 "Array exceeds allowed size for transfer. Increase client.maxTransferBytes to allow"
             )
-        # The reply from the server will be a bytes object
-        rep_msg = generic_msg(
-            cmd=CMD_TO_NDARRAY, args={"obj": self.entry, "comp": comp}, recv_binary=True
+        # Receive the reply directly into a writable array, which also checks its length
+        if out is None:
+            dt = self._comp_dtype(comp)
+            out = np.empty(array_bytes // dt.itemsize, dtype=dt)
+        generic_msg(
+            cmd=CMD_TO_NDARRAY, args={"obj": self.entry, "comp": comp}, recv_binary=True, out=out
         )
+        return out
 
-        # Make sure the received data has the expected length
-        if len(rep_msg) != array_bytes:
-            raise RuntimeError(f"Expected {array_bytes} bytes but received {len(rep_msg)}")
-
+    def _comp_dtype(self, comp: str) -> np.dtype:
+        """
+        The dtype of one of the string components as sent by the server.
+        """
         # The server sends us native-endian bytes so we need to account for that.
-        # Since bytes are immutable, we need to copy the np array to be mutable
         dt: np.dtype = np.dtype(np.int64) if comp == "offsets" else np.dtype(np.uint8)
         if arkouda.dtypes.get_server_byteorder() == "big":
-            dt = dt.newbyteorder(">")
+            return dt.newbyteorder(">")
         else:
-            dt = dt.newbyteorder("<")
-        return (
-            np.frombuffer(rep_msg.encode("utf_8"), dt).copy()
-            if isinstance(rep_msg, str)
-            else np.frombuffer(rep_msg, dt).copy()
-        )
+            return dt.newbyteorder("<")
 
     def astype(self, dtype) -> pdarray:
         """
@@ -1897,6 +1901,11 @@ class Strings:
         dataset: str = "strings_array",
         mode: str = "truncate",
         compression: Optional[str] = None,
+        row_group_size: Optional[int] = None,
+        data_page_size: Optional[int] = None,
+        use_dictionary: bool = True,
+        write_statistics: bool = True,
+        is_sorted: bool = False,
     ) -> str:
         """
         Save the Strings object to Parquet. The result is a collection of files,
@@ -1915,11 +1924,29 @@ class Strings:
         compression : str (Optional)
             (None | "snappy" | "gzip" | "brotli" | "zstd" | "lz4")
             Sets the compression type used with Parquet files
+        row_group_size : int (Optional)
+            The number of rows of each row group of each file. Default None
+            keeps the server default of 2**26 rows.
+        data_page_size : int (Optional)
+            The approximate size in bytes of each data page. Default None
+            keeps the Arrow default of 1MB.
+        use_dictionary : bool
+            Whether to dictionary encode the values, falling back to plain
+            encoding if the dictionary grows too large (Default: True)
+        write_statistics : bool
+            Whether to write the min/max statistics of each row group and
+            page, which readers use to skip them when filtering (Default: True)
+        is_sorted : bool
+            Whether to record in the metadata of the files that the values are
+            sorted in ascending order, which is not checked (Default: False)
         Returns
         -------
         string message indicating result of save operation
         Raises
         ------
+        ValueError
+            Raised if a size is not positive, or if an option other than the
+            compression is set in 'append' mode
         RuntimeError
             Raised if a server-side error is thrown saving the pdarray
         Notes
@@ -1936,7 +1963,7 @@ class Strings:
         - Any file extension can be used.The file I/O does not rely on the extension to
         determine the file format.
         """
-        from arkouda.io import mode_str_to_int
+        from arkouda.io import _parquet_write_args, mode_str_to_int
 
         return cast(
             str,
@@ -1949,6 +1976,15 @@ class Strings:
                     "prefix": prefix_path,
                     "dtype": self.dtype,
                     "compression": compression,
+                    **_parquet_write_args(
+                        [dataset],
+                        mode,
+                        row_group_size,
+                        data_page_size,
+                        use_dictionary,
+                        write_statistics,
+                        [dataset] if is_sorted else None,
+                    ),
                 },
             ),
         )
@@ -65,6 +65,138 @@ int64_t cpp_getNumRows(const char* filename, char** errMsg) {
   }
 }
 
+int64_t cpp_getNumRowGroups(const char* filename, char** errMsg) {
+  try {
+    std::unique_ptr<parquet::ParquetFileReader> parquet_reader =
+      parquet::ParquetFileReader::OpenFile(filename, false);
+
+    return parquet_reader -> metadata() -> num_row_groups();
+  } catch (const std::exception& e) {
+    *errMsg = strdup(e.what());
+    return ARROWERROR;
+  }
+}
+
+int cpp_getRowGroupNumRows(const char* filename, void* chpl_rows, char** errMsg) {
+  try {
+    std::unique_ptr<parquet::ParquetFileReader> parquet_reader =
+      parquet::ParquetFileReader::OpenFile(filename, false);
+
+    std::shared_ptr<parquet::FileMetaData> file_metadata = parquet_reader->metadata();
+    auto rows = (int64_t*)chpl_rows;
+    for (int r = 0; r < file_metadata->num_row_groups(); r++)
+      rows[r] = file_metadata->RowGroup(r)->num_rows();
+    return 0;
+  } catch (const std::exception& e) {
+    *errMsg = strdup(e.what());
+    return ARROWERROR;
+  }
+}
+
+// Whether a column chunk whose values lie in [min, max] may hold a value
+// for which `x op value` is true. Only a chunk that holds no nulls or NaNs
+// (`exact`) can be ruled out for "!=", since those compare unequal to value.
+template<typename T>
+bool rangeMayMatch(const T& min, const T& max, const T& value, const std::string& op, bool exact) {
+  if(op == "==")
+    return !(value < min) && !(max < value);
+  else if(op == "!=")
+    return !exact || min < value || value < max;
+  else if(op == "<")
+    return min < value;
+  else if(op == "<=")
+    return !(value < min);
+  else if(op == ">")
+    return value < max;
+  else if(op == ">=")
+    return !(max < value);
+  return true;
+}
+
+int cpp_getRowGroupMatches(const char* filename, const char* colname, const char* op,
+                           const char* value, void* chpl_matches, char** errMsg) {
+  try {
+    std::unique_ptr<parquet::ParquetFileReader> parquet_reader =
+      parquet::ParquetFileReader::OpenFile(filename, false);
+
+    std::shared_ptr<parquet::FileMetaData> file_metadata = parquet_reader->metadata();
+    auto idx = file_metadata -> schema() -> ColumnIndex(colname);
+    if(idx < 0) {
+      std::string dname(colname);
+      std::string fname(filename);
+      std::string msg = "Dataset: " + dname + " does not exist in file: " + fname; 
+      *errMsg = strdup(msg.c_str());
+      return ARROWERROR;
+    }
+
+    const parquet::ColumnDescriptor* descr = file_metadata -> schema() -> Column(idx);
+    bool isUnsigned = descr->sort_order() == parquet::SortOrder::UNSIGNED;
+    std::string opStr(op);
+    std::string valStr(value);
+    // integer values are compared with integer columns exactly, and other
+    // values as doubles, as the client compares an int column with a float
+    bool isInteger = !valStr.empty() &&
+      valStr.find_first_not_of("0123456789", valStr[0] == '-' ? 1 : 0) == std::string::npos;
+    auto matches = (bool*)chpl_matches;
+
+    for (int r = 0; r < file_metadata->num_row_groups(); r++) {
+      if(!matches[r])
+        continue;
+      std::unique_ptr<parquet::ColumnChunkMetaData> chunk =
+        file_metadata->RowGroup(r)->ColumnChunk(idx);
+      std::shared_ptr<parquet::Statistics> stats = chunk->statistics();
+      // without statistics the row group has to be read
+      if(!chunk->is_stats_set() || !stats || !stats->HasMinMax())
+        continue;
+      bool exact = stats->HasNullCount() && stats->null_count() == 0;
+
+      // a value that does not parse as the column's type prunes nothing
+      try {
+        if(descr->physical_type() == parquet::Type::INT32 ||
+           descr->physical_type() == parquet::Type::INT64) {
+          int64_t min, max;
+          if(descr->physical_type() == parquet::Type::INT32) {
+            auto typed = std::static_pointer_cast<parquet::Int32Statistics>(stats);
+            min = isUnsigned ? (int64_t)(uint32_t)typed->min() : typed->min();
+            max = isUnsigned ? (int64_t)(uint32_t)typed->max() : typed->max();
+          } else {
+            auto typed = std::static_pointer_cast<parquet::Int64Statistics>(stats);
+            min = typed->min();
+            max = typed->max();
+          }
+          if(isInteger && isUnsigned && valStr[0] != '-')
+            matches[r] = rangeMayMatch<uint64_t>(min, max, std::stoull(valStr), opStr, exact);
+          else if(isInteger && !isUnsigned)
+            matches[r] = rangeMayMatch<int64_t>(min, max, std::stoll(valStr), opStr, exact);
+          else if(isUnsigned)
+            matches[r] = rangeMayMatch<double>((double)(uint64_t)min, (double)(uint64_t)max,
+                                               std::stod(valStr), opStr, exact);
+          else
+            matches[r] = rangeMayMatch<double>((double)min, (double)max, std::stod(valStr), opStr, exact);
+        } else if(descr->physical_type() == parquet::Type::FLOAT) {
+          auto typed = std::static_pointer_cast<parquet::FloatStatistics>(stats);
+          matches[r] = rangeMayMatch<double>(typed->min(), typed->max(), std::stod(valStr), opStr, false);
+        } else if(descr->physical_type() == parquet::Type::DOUBLE) {
+          auto typed = std::static_pointer_cast<parquet::DoubleStatistics>(stats);
+          matches[r] = rangeMayMatch<double>(typed->min(), typed->max(), std::stod(valStr), opStr, false);
+        } else if(descr->physical_type() == parquet::Type::BYTE_ARRAY && isUnsigned) {
+          // strings are ordered bytewise, as std::string compares them
+          auto typed = std::static_pointer_cast<parquet::ByteArrayStatistics>(stats);
+          std::string min((const char*)typed->min().ptr, typed->min().len);
+          std::string max((const char*)typed->max().ptr, typed->max().len);
+          matches[r] = rangeMayMatch<std::string>(min, max, valStr, opStr, exact);
+        }
+      } catch (const std::invalid_argument& e) {
+      } catch (const std::out_of_range& e) {
+      }
+    }
+    return 0;
+  } catch (const std::exception& e) {
+    *errMsg = strdup(e.what());
+    return ARROWERROR;
+  }
+}
+
 int cpp_getType(const char* filename, const char* colname, char** errMsg) {
   try {
     std::shared_ptr<arrow::io::ReadableFile> infile;
@@ -105,6 +237,10 @@ int cpp_getType(const char* filename, const char* colname, char** errMsg) {
     else if(myType->id() == arrow::Type::STRING ||
             myType->id() == arrow::Type::BINARY)
       return ARROWSTRING;
+    else if(myType->id() == arrow::Type::DICTIONARY &&
+            (std::static_pointer_cast<arrow::DictionaryType>(myType)->value_type()->id() == arrow::Type::STRING ||
+             std::static_pointer_cast<arrow::DictionaryType>(myType)->value_type()->id() == arrow::Type::BINARY))
+      return ARROWSTRING;
     else if(myType->id() == arrow::Type::FLOAT)
       return ARROWFLOAT;
     else if(myType->id() == arrow::Type::DOUBLE)
@@ -570,6 +706,131 @@ int cpp_readListColumnByName(const char* filename, void* chpl_arr, const char* c
   }
 }
 
+// Whether every data page of a column chunk is dictionary encoded, so
+// that its values can be read as indices into its dictionary
+bool isDictionaryEncoded(const parquet::ColumnChunkMetaData& chunk) {
+  if(!chunk.has_dictionary_page() || chunk.encoding_stats().empty())
+    return false;
+  for(auto& stats : chunk.encoding_stats()) {
+    if((stats.page_type == parquet::PageType::DATA_PAGE ||
+        stats.page_type == parquet::PageType::DATA_PAGE_V2) &&
+       stats.encoding != parquet::Encoding::PLAIN_DICTIONARY &&
+       stats.encoding != parquet::Encoding::RLE_DICTIONARY)
+      return false;
+  }
+  return true;
+}
+
+int cpp_getDictionaryColumnSize(const char* filename, const char* colname, void* chpl_sizes, char** errMsg) {
+  try {
+    std::unique_ptr<parquet::ParquetFileReader> parquet_reader =
+      parquet::ParquetFileReader::OpenFile(filename, false);
+
+    std::shared_ptr<parquet::FileMetaData> file_metadata = parquet_reader->metadata();
+    auto idx = file_metadata -> schema() -> ColumnIndex(colname);
+    if(idx < 0) {
+      std::string dname(colname);
+      std::string fname(filename);
+      std::string msg = "Dataset: " + dname + " does not exist in file: " + fname; 
+      *errMsg = strdup(msg.c_str());
+      return ARROWERROR;
+    }
+    if(file_metadata -> schema() -> Column(idx) -> physical_type() != parquet::Type::BYTE_ARRAY)
+      return 0;
+
+    // the number of dictionary entries and their bytes, null terminated
+    auto sizes = (int64_t*)chpl_sizes;
+    sizes[0] = 0;
+    sizes[1] = 0;
+    for (int r = 0; r < file_metadata->num_row_groups(); r++) {
+      if(!isDictionaryEncoded(*file_metadata->RowGroup(r)->ColumnChunk(idx)))
+        return 0;
+      std::shared_ptr<parquet::ColumnReader> column_reader = parquet_reader->RowGroup(r)->Column(idx);
+      parquet::ByteArrayReader* reader =
+        static_cast<parquet::ByteArrayReader*>(column_reader.get());
+
+      // a batch of 0 values only reads the dictionary
+      const parquet::ByteArray* dict = nullptr;
+      int32_t dict_len = 0;
+      int64_t indices_read = 0;
+      (void)reader->ReadBatchWithDictionary(0, nullptr, nullptr, nullptr, &indices_read, &dict, &dict_len);
+      sizes[0] += dict_len;
+      for(int32_t k = 0; k < dict_len; k++)
+        sizes[1] += dict[k].len + 1;
+    }
+    return 1;
+  } catch (const std::exception& e) {
+    *errMsg = strdup(e.what());
+    return ARROWERROR;
+  }
+}
+
+int cpp_readDictionaryColumnByName(const char* filename, const char* colname, void* chpl_codes,
+                                   int64_t codeBase, void* chpl_dict_sizes, void* chpl_dict_bytes,
+                                   int64_t batchSize, char** errMsg) {
+  try {
+    std::unique_ptr<parquet::ParquetFileReader> parquet_reader =
+      parquet::ParquetFileReader::OpenFile(filename, false);
+
+    std::shared_ptr<parquet::FileMetaData> file_metadata = parquet_reader->metadata();
+    auto idx = file_metadata -> schema() -> ColumnIndex(colname);
+    if(idx < 0) {
+      std::string dname(colname);
+      std::string fname(filename);
+      std::string msg = "Dataset: " + dname + " does not exist in file: " + fname; 
+      *errMsg = strdup(msg.c_str());
+      return ARROWERROR;
+    }
+    int16_t max_def_level = file_metadata -> schema() -> Column(idx) -> max_definition_level();
+
+    auto codes = (int64_t*)chpl_codes;
+    auto dict_sizes = (int64_t*)chpl_dict_sizes;
+    auto dict_bytes = (uint8_t*)chpl_dict_bytes;
+    std::vector<int16_t> def_levels(batchSize);
+    std::vector<int32_t> indices(batchSize);
+    int64_t i = 0;
+    int64_t entry = 0;
+    int64_t byteIdx = 0;
+
+    for (int r = 0; r < file_metadata->num_row_groups(); r++) {
+      std::shared_ptr<parquet::ColumnReader> column_reader = parquet_reader->RowGroup(r)->Column(idx);
+      parquet::ByteArrayReader* reader =
+        static_cast<parquet::ByteArrayReader*>(column_reader.get());
+
+      // each row group has its own dictionary, whose codes follow those of
+      // the dictionaries before it
+      const parquet::ByteArray* dict = nullptr;
+      int32_t dict_len = 0;
+      int64_t indices_read = 0;
+      (void)reader->ReadBatchWithDictionary(0, nullptr, nullptr, nullptr, &indices_read, &dict, &dict_len);
+      int64_t base = codeBase + entry;
+      for(int32_t k = 0; k < dict_len; k++) {
+        dict_sizes[entry++] = dict[k].len + 1;
+        memcpy(&dict_bytes[byteIdx], dict[k].ptr, dict[k].len);
+        byteIdx += dict[k].len;
+        dict_bytes[byteIdx++] = 0;
+      }
+
+      // nulls have code -1
+      while (reader->HasNext()) {
+        int64_t levels = reader->ReadBatchWithDictionary(batchSize, def_levels.data(), nullptr,
+                                                         indices.data(), &indices_read, nullptr, nullptr);
+        int64_t v = 0;
+        for(int64_t j = 0; j < levels; j++) {
+          if(max_def_level == 0 || def_levels[j] == max_def_level)
+            codes[i++] = base + indices[v++];
+          else
+            codes[i++] = -1;
+        }
+      }
+    }
+    return 0;
+  } catch (const std::exception& e) {
+    *errMsg = strdup(e.what());
+    return ARROWERROR;
+  }
+}
+
 int cpp_readColumnByName(const char* filename, void* chpl_arr, const char* colname, int64_t numElems, int64_t startIdx, int64_t batchSize, char** errMsg) {
   try {
     int64_t ty = cpp_getType(filename, colname, errMsg);
@@ -582,6 +843,17 @@ int cpp_readColumnByName(const char* filename, void* chpl_arr, const char* colna
 
     int64_t i = 0;
     for (int r = 0; r < num_row_groups; r++) {
+      // row groups before startIdx are skipped without being opened, and
+      // reading stops once numElems values have been read
+      if(ty != ARROWSTRING) {
+        if(i >= numElems)
+          break;
+        int64_t num_rows = file_metadata->RowGroup(r)->num_rows();
+        if(startIdx >= num_rows) {
+          startIdx -= num_rows;
+          continue;
+        }
+      }
       std::shared_ptr<parquet::RowGroupReader> row_group_reader =
         parquet_reader->RowGroup(r);
 
@@ -706,6 +978,76 @@ int cpp_readColumnByName(const char* filename, void* chpl_arr, const char* colna
   }
 }
 
+// Open a writer of a file with the given schema, whose columns are all
+// compressed with `compression`. Data pages hold about `dataPageSize` bytes,
+// or the Arrow default if it is 0. `dictionary` and `statistics` hold a flag
+// per column of whether to dictionary encode it and to write its min/max
+// statistics, and `sortedBy` the indices of the `numSorted` columns the rows
+// are sorted by in ascending order, which are recorded in the footer.
+// Compressed columns default to RLE encoding unless `dictionaryColumn`,
+// whose values fall back to plain encoding if the dictionary is too large.
+std::shared_ptr<parquet::ParquetFileWriter>
+openParquetWriter(const std::shared_ptr<arrow::io::FileOutputStream>& out_file,
+                  const std::shared_ptr<parquet::schema::GroupNode>& schema,
+                  parquet::WriterProperties::Builder& builder, int64_t compression,
+                  int64_t dataPageSize, const int64_t* dictionary, const int64_t* statistics,
+                  const int64_t* sortedBy, int64_t numSorted, bool dictionaryColumn = false) {
+  // assign the proper compression
+  bool compressed = true;
+  if(compression == SNAPPY_COMP) {
+    builder.compression(parquet::Compression::SNAPPY);
+  } else if (compression == GZIP_COMP) {
+    builder.compression(parquet::Compression::GZIP);
+  } else if (compression == BROTLI_COMP) {
+    builder.compression(parquet::Compression::BROTLI);
+  } else if (compression == ZSTD_COMP) {
+    builder.compression(parquet::Compression::ZSTD);
+  } else if (compression == LZ4_COMP) {
+    builder.compression(parquet::Compression::LZ4);
+  } else {
+    compressed = false;
+  }
+  if(compressed && !dictionaryColumn)
+    builder.encoding(parquet::Encoding::RLE);
+  if(dataPageSize > 0)
+    builder.data_pagesize(dataPageSize);
+
+  for(int i = 0; i < schema->field_count(); i++) {
+    const std::string path = schema->field(i)->name();
+    if(!dictionary[i]) {
+      builder.disable_dictionary(path);
+      // without a dictionary the values are encoded with the fallback
+      // encoding, and only booleans can be RLE encoded
+      if(schema->field(i)->is_primitive() &&
+         std::static_pointer_cast<parquet::schema::PrimitiveNode>(schema->field(i))->physical_type()
+           != parquet::Type::BOOLEAN)
+        builder.encoding(path, parquet::Encoding::PLAIN);
+    }
+    if(!statistics[i])
+      builder.disable_statistics(path);
+  }
+
+  // the sort order is written to the footer, and with Arrow 13 or later also
+  // to the sorting columns of each row group, where the format defines it
+  std::shared_ptr<arrow::KeyValueMetadata> metadata;
+  if(numSorted > 0) {
+    std::string names;
+    for(int64_t i = 0; i < numSorted; i++) {
+      if(i > 0)
+        names += ",";
+      names += schema->field(sortedBy[i])->name();
+    }
+    metadata = arrow::key_value_metadata({"sorted_by"}, {names});
+#if ARROW_VERSION_MAJOR >= 13
+    std::vector<parquet::SortingColumn> sortingColumns;
+    for(int64_t i = 0; i < numSorted; i++)
+      sortingColumns.push_back({static_cast<int32_t>(sortedBy[i]), false, false});
+    builder.set_sorting_columns(sortingColumns);
+#endif
+  }
+  return parquet::ParquetFileWriter::Open(out_file, schema, builder.build(), metadata);
+}
+
 // configure the schema for a multicolumn file
 std::shared_ptr<parquet::schema::GroupNode> SetupSchema(void* column_names, void* datatypes, int64_t colnum) {
   parquet::schema::NodeVector fields;
@@ -730,6 +1072,8 @@ std::shared_ptr<parquet::schema::GroupNode> SetupSchema(void* column_names, void
 int cpp_writeMultiColToParquet(const char* filename, void* column_names, 
                                 void** ptr_arr, void* datatypes,
                                 int64_t colnum, int64_t numelems, int64_t rowGroupSize,
+                                int64_t dataPageSize, void* dictionary, void* statistics,
+                                void* sortedBy, int64_t numSorted,
                                 int64_t compression, char** errMsg) {
   try {
     // initialize the file to write to
@@ -741,29 +1085,12 @@ int cpp_writeMultiColToParquet(const char* filename, void* column_names,
     std::shared_ptr<parquet::schema::GroupNode> schema = SetupSchema(column_names, datatypes, colnum);
 
     parquet::WriterProperties::Builder builder;
-    // assign the proper compression
-    if(compression == SNAPPY_COMP) {
-      builder.compression(parquet::Compression::SNAPPY);
-      builder.encoding(parquet::Encoding::RLE);
-    } else if (compression == GZIP_COMP) {
-      builder.compression(parquet::Compression::GZIP);
-      builder.encoding(parquet::Encoding::RLE);
-    } else if (compression == BROTLI_COMP) {
-      builder.compression(parquet::Compression::BROTLI);
-      builder.encoding(parquet::Encoding::RLE);
-    } else if (compression == ZSTD_COMP) {
-      builder.compression(parquet::Compression::ZSTD);
-      builder.encoding(parquet::Encoding::RLE);
-    } else if (compression == LZ4_COMP) {
-      builder.compression(parquet::Compression::LZ4);
-      builder.encoding(parquet::Encoding::RLE);
-    }
-    std::shared_ptr<parquet::WriterProperties> props = builder.build();
-
     std::shared_ptr<parquet::ParquetFileWriter> file_writer =
-      parquet::ParquetFileWriter::Open(out_file, schema, props);
+      openParquetWriter(out_file, schema, builder, compression, dataPageSize, (int64_t*)dictionary,
+                        (int64_t*)statistics, (int64_t*)sortedBy, numSorted);
 
     std::queue<int64_t> idxQueue; // queue used to track string byteIdx 
+    std::vector<parquet::ByteArray> values(8192); // batch of string values to write
 
     auto dtypes_ptr = (int64_t*) datatypes;
     int64_t numLeft = numelems; // number of elements remaining to write (rows)
@@ -807,18 +1134,19 @@ int cpp_writeMultiColToParquet(const char* filename, void* column_names,
           }
           
           while(count < batchSize) {
-            parquet::ByteArray value;
-            int16_t definition_level = 1;
-            value.ptr = reinterpret_cast<const uint8_t*>(&data_ptr[byteIdx]);
-            int64_t nextIdx = byteIdx;
-            while (data_ptr[nextIdx] != 0x00){
-              nextIdx++;
+            int64_t n = std::min<int64_t>(batchSize - count, values.size());
+            for(int64_t j = 0; j < n; j++) {
+              values[j].ptr = reinterpret_cast<const uint8_t*>(&data_ptr[byteIdx]);
+              int64_t nextIdx = byteIdx;
+              while (data_ptr[nextIdx] != 0x00){
+                nextIdx++;
+              }
+              // subtract 1 since we have the null terminator
+              values[j].len = nextIdx - byteIdx;
+              byteIdx = nextIdx + 1;
             }
-            // subtract 1 since we have the null terminator
-            value.len = nextIdx - byteIdx;
-            ba_writer->WriteBatch(1, &definition_level, nullptr, &value);
-            count++;
-            byteIdx = nextIdx + 1;
+            ba_writer->WriteBatch(n, nullptr, nullptr, values.data());
+            count += n;
           }
           if (numLeft - count > 0) {
             idxQueue.push(byteIdx);
@@ -843,7 +1171,8 @@ int cpp_writeMultiColToParquet(const char* filename, void* column_names,
 
 int cpp_writeColumnToParquet(const char* filename, void* chpl_arr,
                              int64_t colnum, const char* dsetname, int64_t numelems,
-                             int64_t rowGroupSize, int64_t dtype, int64_t compression,
+                             int64_t rowGroupSize, int64_t dataPageSize, int64_t dictionary,
+                             int64_t statistics, int64_t sorted, int64_t dtype, int64_t compression,
                              char** errMsg) {
   try {
     using FileClass = ::arrow::io::FileOutputStream;
@@ -863,27 +1192,10 @@ int cpp_writeColumnToParquet(const char* filename, void* chpl_arr,
       (parquet::schema::GroupNode::Make("schema", parquet::Repetition::REQUIRED, fields));
 
     parquet::WriterProperties::Builder builder;
-    // assign the proper compression
-    if(compression == SNAPPY_COMP) {
-      builder.compression(parquet::Compression::SNAPPY);
-      builder.encoding(parquet::Encoding::RLE);
-    } else if (compression == GZIP_COMP) {
-      builder.compression(parquet::Compression::GZIP);
-      builder.encoding(parquet::Encoding::RLE);
-    } else if (compression == BROTLI_COMP) {
-      builder.compression(parquet::Compression::BROTLI);
-      builder.encoding(parquet::Encoding::RLE);
-    } else if (compression == ZSTD_COMP) {
-      builder.compression(parquet::Compression::ZSTD);
-      builder.encoding(parquet::Encoding::RLE);
-    } else if (compression == LZ4_COMP) {
-      builder.compression(parquet::Compression::LZ4);
-      builder.encoding(parquet::Encoding::RLE);
-    }
-    std::shared_ptr<parquet::WriterProperties> props = builder.build();
-
+    const int64_t sortedBy = 0;
     std::shared_ptr<parquet::ParquetFileWriter> file_writer =
-      parquet::ParquetFileWriter::Open(out_file, schema, props);
+      openParquetWriter(out_file, schema, builder, compression, dataPageSize, &dictionary,
+                        &statistics, &sortedBy, sorted ? 1 : 0);
 
     int64_t i = 0;
     int64_t numLeft = numelems;
@@ -946,8 +1258,9 @@ int cpp_writeColumnToParquet(const char* filename, void* chpl_arr,
 
 int cpp_writeStrColumnToParquet(const char* filename, void* chpl_arr, void* chpl_offsets,
                                 const char* dsetname, int64_t numelems,
-                                int64_t rowGroupSize, int64_t dtype, int64_t compression,
-                                char** errMsg) {
+                                int64_t rowGroupSize, int64_t dataPageSize, int64_t dictionary,
+                                int64_t statistics, int64_t sorted, int64_t dtype,
+                                int64_t compression, char** errMsg) {
   try {
     using FileClass = ::arrow::io::FileOutputStream;
     std::shared_ptr<FileClass> out_file;
@@ -960,27 +1273,10 @@ int cpp_writeStrColumnToParquet(const char* filename, void* chpl_arr, void* chpl
       (parquet::schema::GroupNode::Make("schema", parquet::Repetition::REQUIRED, fields));
 
     parquet::WriterProperties::Builder builder;
-    // assign the proper compression
-    if(compression == SNAPPY_COMP) {
-      builder.compression(parquet::Compression::SNAPPY);
-      builder.encoding(parquet::Encoding::RLE);
-    } else if (compression == GZIP_COMP) {
-      builder.compression(parquet::Compression::GZIP);
-      builder.encoding(parquet::Encoding::RLE);
-    } else if (compression == BROTLI_COMP) {
-      builder.compression(parquet::Compression::BROTLI);
-      builder.encoding(parquet::Encoding::RLE);
-    } else if (compression == ZSTD_COMP) {
-      builder.compression(parquet::Compression::ZSTD);
-      builder.encoding(parquet::Encoding::RLE);
-    } else if (compression == LZ4_COMP) {
-      builder.compression(parquet::Compression::LZ4);
-      builder.encoding(parquet::Encoding::RLE);
-    }
-    std::shared_ptr<parquet::WriterProperties> props = builder.build();
-
+    const int64_t sortedBy = 0;
     std::shared_ptr<parquet::ParquetFileWriter> file_writer =
-      parquet::ParquetFileWriter::Open(out_file, schema, props);
+      openParquetWriter(out_file, schema, builder, compression, dataPageSize, &dictionary,
+                        &statistics, &sortedBy, sorted ? 1 : 0);
 
     int64_t i = 0;
     int64_t numLeft = numelems;
@@ -991,21 +1287,27 @@ int cpp_writeStrColumnToParquet(const char* filename, void* chpl_arr, void* chpl
       int64_t byteIdx = 0;
       int64_t offIdx = 0;
       
+      // the values are written in batches, so that data pages can be cut
+      // at the requested size without a call per value
+      const int64_t batchSize = 8192;
+      std::vector<int16_t> def_levels(batchSize, 1);
+      std::vector<parquet::ByteArray> values(batchSize);
       while(numLeft > 0) {
         parquet::RowGroupWriter* rg_writer = file_writer->AppendRowGroup();
         parquet::ByteArrayWriter* ba_writer =
           static_cast<parquet::ByteArrayWriter*>(rg_writer->NextColumn());
         int64_t count = 0;
         while(numLeft > 0 && count < rowGroupSize) {
-          parquet::ByteArray value;
-          int16_t definition_level = 1;
-          value.ptr = reinterpret_cast<const uint8_t*>(&chpl_ptr[byteIdx]);
-          // subtract 1 since we have the null terminator
-          value.len = offsets[offIdx+1] - offsets[offIdx] - 1;
-          ba_writer->WriteBatch(1, &definition_level, nullptr, &value);
-          numLeft--;count++;
-          offIdx++;
-          byteIdx+=offsets[offIdx] - offsets[offIdx-1];
+          int64_t n = std::min(std::min(numLeft, rowGroupSize - count), batchSize);
+          for(int64_t j = 0; j < n; j++) {
+            values[j].ptr = reinterpret_cast<const uint8_t*>(&chpl_ptr[byteIdx]);
+            // subtract 1 since we have the null terminator
+            values[j].len = offsets[offIdx+1] - offsets[offIdx] - 1;
+            offIdx++;
+            byteIdx+=offsets[offIdx] - offsets[offIdx-1];
+          }
+          ba_writer->WriteBatch(n, def_levels.data(), nullptr, values.data());
+          numLeft-=n;count+=n;
         }
       }
     } else {
@@ -1022,6 +1324,80 @@ int cpp_writeStrColumnToParquet(const char* filename, void* chpl_arr, void* chpl
   }
 }
 
+int cpp_writeDictionaryColumnToParquet(const char* filename, void* chpl_codes, int64_t numelems,
+                                       void* chpl_categories, void* chpl_offsets, int64_t numCategories,
+                                       int64_t numBytes, int64_t naCode, const char* dsetname,
+                                       int64_t rowGroupSize, int64_t dataPageSize, int64_t statistics,
+                                       int64_t sorted, int64_t compression, char** errMsg) {
+  try {
+    using FileClass = ::arrow::io::FileOutputStream;
+    std::shared_ptr<FileClass> out_file;
+    PARQUET_ASSIGN_OR_THROW(out_file, FileClass::Open(filename));
+
+    parquet::schema::NodeVector fields;
+
+    fields.push_back(parquet::schema::PrimitiveNode::Make(dsetname, parquet::Repetition::OPTIONAL, parquet::Type::BYTE_ARRAY, parquet::ConvertedType::UTF8));
+    std::shared_ptr<parquet::schema::GroupNode> schema = std::static_pointer_cast<parquet::schema::GroupNode>
+      (parquet::schema::GroupNode::Make("schema", parquet::Repetition::REQUIRED, fields));
+
+    parquet::WriterProperties::Builder builder;
+    // the categories are the dictionary, so it must not fall back to plain
+    // encoding unless it is larger than a dictionary page can be
+    builder.dictionary_pagesize_limit(std::max<int64_t>(numBytes + 4 * numCategories,
+                                                        parquet::DEFAULT_DICTIONARY_PAGE_SIZE_LIMIT));
+    const int64_t dictionary = 1;
+    const int64_t sortedBy = 0;
+    std::shared_ptr<parquet::ParquetFileWriter> file_writer =
+      openParquetWriter(out_file, schema, builder, compression, dataPageSize, &dictionary,
+                        &statistics, &sortedBy, sorted ? 1 : 0, true);
+
+    // each value refers to the bytes of its category, which are null terminated
+    auto codes = (int64_t*)chpl_codes;
+    auto categories = (uint8_t*)chpl_categories;
+    auto offsets = (int64_t*)chpl_offsets;
+    std::vector<parquet::ByteArray> dict(numCategories);
+    for(int64_t c = 0; c < numCategories; c++) {
+      int64_t end = (c + 1 < numCategories) ? offsets[c+1] : numBytes;
+      dict[c].ptr = &categories[offsets[c]];
+      dict[c].len = end - offsets[c] - 1;
+    }
+
+    const int64_t batchSize = 8192;
+    std::vector<int16_t> def_levels(batchSize);
+    std::vector<parquet::ByteArray> values(batchSize);
+    int64_t i = 0;
+    while(i < numelems) {
+      parquet::RowGroupWriter* rg_writer = file_writer->AppendRowGroup();
+      parquet::ByteArrayWriter* ba_writer =
+        static_cast<parquet::ByteArrayWriter*>(rg_writer->NextColumn());
+      int64_t rgEnd = std::min(numelems, i + rowGroupSize);
+      while(i < rgEnd) {
+        int64_t n = std::min(rgEnd - i, batchSize);
+        int64_t numValues = 0;
+        // the N/A category is written as null
+        for(int64_t j = 0; j < n; j++) {
+          if(codes[i+j] == naCode) {
+            def_levels[j] = 0;
+          } else {
+            def_levels[j] = 1;
+            values[numValues++] = dict[codes[i+j]];
+          }
+        }
+        ba_writer->WriteBatch(n, def_levels.data(), nullptr, values.data());
+        i += n;
+      }
+    }
+
+    file_writer->Close();
+    ARROWSTATUS_OK(out_file->Close());
+
+    return 0;
+  } catch (const std::exception& e) {
+    *errMsg = strdup(e.what());
+    return ARROWERROR;
+  }
+}
+
 int cpp_createEmptyParquetFile(const char* filename, const char* dsetname, int64_t dtype,
                                int64_t compression, char** errMsg) {
   try {
@@ -1203,7 +1579,8 @@ int cpp_getDatasetNames(const char* filename, char** dsetResult, char** errMsg)
          sc->field(i)->type()->id() == arrow::Type::BINARY ||
          sc->field(i)->type()->id() == arrow::Type::FLOAT ||
          sc->field(i)->type()->id() == arrow::Type::DOUBLE ||
-         sc->field(i)->type()->id() == arrow::Type::LIST
+         sc->field(i)->type()->id() == arrow::Type::LIST ||
+         sc->field(i)->type()->id() == arrow::Type::DICTIONARY
          ) {
         if(!first)
           fields += ("," + sc->field(i)->name());
@@ -1248,6 +1625,40 @@ extern "C" {
     return cpp_readColumnByName(filename, chpl_arr, colname, numElems, startIdx, batchSize, errMsg);
   }
 
+  int64_t c_getNumRowGroups(const char* filename, char** errMsg) {
+    return cpp_getNumRowGroups(filename, errMsg);
+  }
+
+  int c_getRowGroupNumRows(const char* filename, void* chpl_rows, char** errMsg) {
+    return cpp_getRowGroupNumRows(filename, chpl_rows, errMsg);
+  }
+
+  int c_getRowGroupMatches(const char* filename, const char* colname, const char* op,
+                           const char* value, void* chpl_matches, char** errMsg) {
+    return cpp_getRowGroupMatches(filename, colname, op, value, chpl_matches, errMsg);
+  }
+
+  int c_getDictionaryColumnSize(const char* filename, const char* colname, void* chpl_sizes, char** errMsg) {
+    return cpp_getDictionaryColumnSize(filename, colname, chpl_sizes, errMsg);
+  }
+
+  int c_readDictionaryColumnByName(const char* filename, const char* colname, void* chpl_codes,
+                                   int64_t codeBase, void* chpl_dict_sizes, void* chpl_dict_bytes,
+                                   int64_t batchSize, char** errMsg) {
+    return cpp_readDictionaryColumnByName(filename, colname, chpl_codes, codeBase, chpl_dict_sizes,
+                                          chpl_dict_bytes, batchSize, errMsg);
+  }
+
+  int c_writeDictionaryColumnToParquet(const char* filename, void* chpl_codes, int64_t numelems,
+                                       void* chpl_categories, void* chpl_offsets, int64_t numCategories,
+                                       int64_t numBytes, int64_t naCode, const char* dsetname,
+                                       int64_t rowGroupSize, int64_t dataPageSize, int64_t statistics,
+                                       int64_t sorted, int64_t compression, char** errMsg) {
+    return cpp_writeDictionaryColumnToParquet(filename, chpl_codes, numelems, chpl_categories, chpl_offsets,
+                                              numCategories, numBytes, naCode, dsetname, rowGroupSize,
+                                              dataPageSize, statistics, sorted, compression, errMsg);
+  }
+
   int c_getType(const char* filename, const char* colname, char** errMsg) {
     return cpp_getType(filename, colname, errMsg);
   }
@@ -1258,19 +1669,23 @@ extern "C" {
 
   int c_writeColumnToParquet(const char* filename, void* chpl_arr,
                              int64_t colnum, const char* dsetname, int64_t numelems,
-                             int64_t rowGroupSize, int64_t dtype, int64_t compression,
+                             int64_t rowGroupSize, int64_t dataPageSize, int64_t dictionary,
+                             int64_t statistics, int64_t sorted, int64_t dtype, int64_t compression,
                              char** errMsg) {
     return cpp_writeColumnToParquet(filename, chpl_arr, colnum, dsetname,
-                                    numelems, rowGroupSize, dtype, compression,
+                                    numelems, rowGroupSize, dataPageSize, dictionary,
+                                    statistics, sorted, dtype, compression,
                                     errMsg);
   }
   
   int c_writeStrColumnToParquet(const char* filename, void* chpl_arr, void* chpl_offsets,
                                 const char* dsetname, int64_t numelems,
-                                int64_t rowGroupSize, int64_t dtype, int64_t compression,
-                                char** errMsg) {
+                                int64_t rowGroupSize, int64_t dataPageSize, int64_t dictionary,
+                                int64_t statistics, int64_t sorted, int64_t dtype,
+                                int64_t compression, char** errMsg) {
     return cpp_writeStrColumnToParquet(filename, chpl_arr, chpl_offsets,
-                                       dsetname, numelems, rowGroupSize, dtype, compression, errMsg);
+                                       dsetname, numelems, rowGroupSize, dataPageSize, dictionary,
+                                       statistics, sorted, dtype, compression, errMsg);
   }
 
   int c_createEmptyParquetFile(const char* filename, const char* dsetname, int64_t dtype,
@@ -1315,7 +1730,10 @@ extern "C" {
   int c_writeMultiColToParquet(const char* filename, void* column_names, 
                                 void** ptr_arr, void* datatypes,
                                 int64_t colnum, int64_t numelems, int64_t rowGroupSize,
+                                int64_t dataPageSize, void* dictionary, void* statistics,
+                                void* sortedBy, int64_t numSorted,
                                 int64_t compression, char** errMsg){
-    return cpp_writeMultiColToParquet(filename, column_names, ptr_arr, datatypes, colnum, numelems, rowGroupSize, compression, errMsg);
+    return cpp_writeMultiColToParquet(filename, column_names, ptr_arr, datatypes, colnum, numelems, rowGroupSize,
+                                      dataPageSize, dictionary, statistics, sortedBy, numSorted, compression, errMsg);
   }
 }
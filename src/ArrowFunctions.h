@@ -41,6 +41,17 @@ extern "C" {
   int64_t c_getNumRows(const char*, char** errMsg);
   int64_t cpp_getNumRows(const char*, char** errMsg);
 
+  int64_t c_getNumRowGroups(const char* filename, char** errMsg);
+  int64_t cpp_getNumRowGroups(const char* filename, char** errMsg);
+
+  int c_getRowGroupNumRows(const char* filename, void* chpl_rows, char** errMsg);
+  int cpp_getRowGroupNumRows(const char* filename, void* chpl_rows, char** errMsg);
+
+  int c_getRowGroupMatches(const char* filename, const char* colname, const char* op,
+                           const char* value, void* chpl_matches, char** errMsg);
+  int cpp_getRowGroupMatches(const char* filename, const char* colname, const char* op,
+                             const char* value, void* chpl_matches, char** errMsg);
+
   int c_readColumnByName(const char* filename, void* chpl_arr,
                          const char* colname, int64_t numElems, int64_t startIdx,
                          int64_t batchSize, char** errMsg);
@@ -48,6 +59,16 @@ extern "C" {
                            const char* colname, int64_t numElems, int64_t startIdx,
                            int64_t batchSize, char** errMsg);
 
+  int c_getDictionaryColumnSize(const char* filename, const char* colname, void* chpl_sizes, char** errMsg);
+  int cpp_getDictionaryColumnSize(const char* filename, const char* colname, void* chpl_sizes, char** errMsg);
+
+  int c_readDictionaryColumnByName(const char* filename, const char* colname, void* chpl_codes,
+                                   int64_t codeBase, void* chpl_dict_sizes, void* chpl_dict_bytes,
+                                   int64_t batchSize, char** errMsg);
+  int cpp_readDictionaryColumnByName(const char* filename, const char* colname, void* chpl_codes,
+                                     int64_t codeBase, void* chpl_dict_sizes, void* chpl_dict_bytes,
+                                     int64_t batchSize, char** errMsg);
+
   int c_readListColumnByName(const char* filename, void* chpl_arr, 
                             const char* colname, int64_t numElems, 
                             int64_t startIdx, int64_t batchSize, char** errMsg);
@@ -76,21 +97,37 @@ extern "C" {
 
   int cpp_writeColumnToParquet(const char* filename, void* chpl_arr,
                                int64_t colnum, const char* dsetname, int64_t numelems,
-                               int64_t rowGroupSize, int64_t dtype, int64_t compression,
+                               int64_t rowGroupSize, int64_t dataPageSize, int64_t dictionary,
+                               int64_t statistics, int64_t sorted, int64_t dtype, int64_t compression,
                                char** errMsg);
   int c_writeColumnToParquet(const char* filename, void* chpl_arr,
                              int64_t colnum, const char* dsetname, int64_t numelems,
-                             int64_t rowGroupSize, int64_t dtype, int64_t compression, char** errMsg);
+                             int64_t rowGroupSize, int64_t dataPageSize, int64_t dictionary,
+                             int64_t statistics, int64_t sorted, int64_t dtype, int64_t compression,
+                             char** errMsg);
 
   int c_writeStrColumnToParquet(const char* filename, void* chpl_arr, void* chpl_offsets,
                                 const char* dsetname, int64_t numelems,
-                                int64_t rowGroupSize, int64_t dtype, int64_t compression,
-                                char** errMsg);
+                                int64_t rowGroupSize, int64_t dataPageSize, int64_t dictionary,
+                                int64_t statistics, int64_t sorted, int64_t dtype,
+                                int64_t compression, char** errMsg);
   int cpp_writeStrColumnToParquet(const char* filename, void* chpl_arr, void* chpl_offsets,
                                   const char* dsetname, int64_t numelems,
-                                  int64_t rowGroupSize, int64_t dtype, int64_t compression,
-                                  char** errMsg);
+                                  int64_t rowGroupSize, int64_t dataPageSize, int64_t dictionary,
+                                  int64_t statistics, int64_t sorted, int64_t dtype,
+                                  int64_t compression, char** errMsg);
   
+  int c_writeDictionaryColumnToParquet(const char* filename, void* chpl_codes, int64_t numelems,
+                                       void* chpl_categories, void* chpl_offsets, int64_t numCategories,
+                                       int64_t numBytes, int64_t naCode, const char* dsetname,
+                                       int64_t rowGroupSize, int64_t dataPageSize, int64_t statistics,
+                                       int64_t sorted, int64_t compression, char** errMsg);
+  int cpp_writeDictionaryColumnToParquet(const char* filename, void* chpl_codes, int64_t numelems,
+                                         void* chpl_categories, void* chpl_offsets, int64_t numCategories,
+                                         int64_t numBytes, int64_t naCode, const char* dsetname,
+                                         int64_t rowGroupSize, int64_t dataPageSize, int64_t statistics,
+                                         int64_t sorted, int64_t compression, char** errMsg);
+
   int c_createEmptyParquetFile(const char* filename, const char* dsetname, int64_t dtype,
                                int64_t compression, char** errMsg);
   int cpp_createEmptyParquetFile(const char* filename, const char* dsetname, int64_t dtype,
@@ -108,11 +145,15 @@ extern "C" {
   int c_writeMultiColToParquet(const char* filename, void* column_names, 
                                 void** ptr_arr, void* datatypes,
                                 int64_t colnum, int64_t numelems, int64_t rowGroupSize,
+                                int64_t dataPageSize, void* dictionary, void* statistics,
+                                void* sortedBy, int64_t numSorted,
                                 int64_t compression, char** errMsg);
 
   int cpp_writeMultiColToParquet(const char* filename, void* column_names, 
                                   void** ptr_arr, void* datatypes,
                                   int64_t colnum, int64_t numelems, int64_t rowGroupSize,
+                                  int64_t dataPageSize, void* dictionary, void* statistics,
+                                  void* sortedBy, int64_t numSorted,
                                   int64_t compression, char** errMsg);
     
   const char* c_getVersionInfo(void);
@@ -1673,4 +1673,186 @@ module BinOp
       }
     }
   }
+
+  /*
+  Token kinds used by the fused expression evaluator
+  */
+  param FUSED_ARR = 0;
+  param FUSED_VAL = 1;
+  param FUSED_OP = 2;
+
+  /*
+  Number of elements of each operand that are evaluated together by the
+  fused expression evaluator
+  */
+  config const fusedBlockSize = 4096;
+
+  /*
+  One token of a fused expression in reverse polish notation. `isReal` is the
+  static type of the value the token produces; for operators `lReal` and
+  `rReal` are the static types of the operands.
+  */
+  record FusedToken {
+    var kind: int;
+    var isReal: bool;
+    var lReal: bool;
+    var rReal: bool;
+    var idx: int;
+    var ival: int;
+    var rval: real;
+    var op: string;
+  }
+
+  /*
+  Apply a binary operator to two ints with the same semantics as doBinOpvv
+  */
+  inline proc fusedIntOp(op: string, l: int, r: int): int {
+    select op {
+      when "+" { return l + r; }
+      when "-" { return l - r; }
+      when "*" { return l * r; }
+      when "//" { return if r != 0 then l/r else 0; }
+      otherwise { return if r != 0 then l%r else 0; } // "%"
+    }
+  }
+
+  /*
+  Apply a binary operator to two reals with the same semantics as doBinOpvv
+  */
+  inline proc fusedRealOp(op: string, l: real, r: real): real {
+    select op {
+      when "+" { return l + r; }
+      when "-" { return l - r; }
+      when "*" { return l * r; }
+      when "/" { return l / r; }
+      when "//" { return floorDivisionHelper(l, r); }
+      when "**" { return l**r; }
+      otherwise { return AutoMath.mod(l, r); } // "%"
+    }
+  }
+
+  /*
+  Parse a fused expression in reverse polish notation and check that it is
+  well formed. Tokens are one of `arr:<idx>`, `int:<value>`, `float:<value>`
+  or `op:<operator>`, where `idx` indexes into `isRealArr`, the static types
+  of the array operands.
+
+  :returns: the parsed tokens and the maximum stack depth needed to evaluate them
+  */
+  proc parseFusedProgram(program: [] string, isRealArr: [] bool) throws {
+    var tokens: [0..#program.size] FusedToken;
+    var stack: [0..#program.size] bool;
+    var sp = -1;
+    var depth = 0;
+    for (tokStr, tok) in zip(program, tokens) {
+      const (kind, _, val) = tokStr.partition(":");
+      select kind {
+        when "arr" {
+          tok.kind = FUSED_ARR;
+          tok.idx = val:int;
+          tok.isReal = isRealArr[tok.idx];
+        }
+        when "int" {
+          tok.kind = FUSED_VAL;
+          tok.ival = val:int;
+          tok.rval = tok.ival:real;
+        }
+        when "float" {
+          tok.kind = FUSED_VAL;
+          tok.isReal = true;
+          tok.rval = val:real;
+        }
+        when "op" {
+          if !(val == "+" || val == "-" || val == "*" || val == "/" || val == "//" ||
+               val == "%" || val == "**") {
+            throw new Error("Unsupported operator in fused expression: %s".format(val));
+          }
+          if sp < 1 {
+            throw new Error("Malformed fused expression: too few operands for %s".format(val));
+          }
+          tok.kind = FUSED_OP;
+          tok.op = val;
+          tok.lReal = stack[sp-1];
+          tok.rReal = stack[sp];
+          // int op int stays an int except for true division and
+          // exponentiation, which the client never sends for ints
+          tok.isReal = tok.lReal || tok.rReal || val == "/" || val == "**";
+          sp -= 2;
+        }
+        otherwise {
+          throw new Error("Malformed fused expression token: %s".format(tokStr));
+        }
+      }
+      sp += 1;
+      stack[sp] = tok.isReal;
+      depth = max(depth, sp + 1);
+    }
+    if sp != 0 {
+      throw new Error("Malformed fused expression: %i values left on stack".format(sp + 1));
+    }
+    return (tokens, depth);
+  }
+
+  /*
+  Evaluate a parsed fused expression into `res`, reading the array operands
+  from `intArrs` and `realArrs`. The expression is evaluated one block of
+  `fusedBlockSize` elements at a time, so no temporary arrays the size of
+  the operands are created.
+  */
+  proc fusedEval(ref res: [?D] ?t, const ref tokens: [] FusedToken, depth: int,
+                 intArrs, realArrs) throws {
+    coforall loc in Locales do on loc {
+      const myTokens = tokens;
+      const myIntArrs = intArrs;
+      const myRealArrs = realArrs;
+      const localDom = res.localSubdomain();
+      const nblocks = (localDom.size + fusedBlockSize - 1) / fusedBlockSize;
+      forall b in 0..#nblocks with (var istack: [0..#depth, 0..#fusedBlockSize] int,
+                                    var rstack: [0..#depth, 0..#fusedBlockSize] real) {
+        const lo = localDom.low + b * fusedBlockSize;
+        const block = lo..min(lo + fusedBlockSize - 1, localDom.high);
+        const n = block.size;
+        var sp = -1;
+        for tok in myTokens {
+          select tok.kind {
+            when FUSED_ARR {
+              sp += 1;
+              if tok.isReal {
+                ref src = myRealArrs[tok.idx].a;
+                for (i, x) in zip(block, 0..) do rstack[sp, x] = src[i];
+              } else {
+                ref src = myIntArrs[tok.idx].a;
+                for (i, x) in zip(block, 0..) do istack[sp, x] = src[i];
+              }
+            }
+            when FUSED_VAL {
+              sp += 1;
+              if tok.isReal {
+                for x in 0..#n do rstack[sp, x] = tok.rval;
+              } else {
+                for x in 0..#n do istack[sp, x] = tok.ival;
+              }
+            }
+            otherwise {
+              sp -= 1;
+              if tok.isReal {
+                for x in 0..#n {
+                  const l = if tok.lReal then rstack[sp, x] else istack[sp, x]:real;
+                  const r = if tok.rReal then rstack[sp+1, x] else istack[sp+1, x]:real;
+                  rstack[sp, x] = fusedRealOp(tok.op, l, r);
+                }
+              } else {
+                for x in 0..#n do istack[sp, x] = fusedIntOp(tok.op, istack[sp, x], istack[sp+1, x]);
+              }
+            }
+          }
+        }
+        if t == real {
+          for (i, x) in zip(block, 0..) do res[i] = rstack[0, x];
+        } else {
+          for (i, x) in zip(block, 0..) do res[i] = istack[0, x];
+        }
+      }
+    }
+  }
 }
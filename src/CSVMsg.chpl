@@ -21,10 +21,20 @@ module CSVMsg {
     const CSV_HEADER_OPEN = "**HEADER**";
     const CSV_HEADER_CLOSE = "*/HEADER/*";
     const LINE_DELIM = "\n"; // currently assumed all files are newline delimited. 
+    private const NEWLINE_BYTE = 10: uint(8);
+    private const QUOTE_BYTE = 34: uint(8);
 
     private config const logLevel = ServerConfig.logLevel;
     const csvLogger = new Logger(logLevel);
 
+    // Files are read in chunks of at most CSV_CHUNK_BYTES bytes, and of at
+    // least CSV_MIN_CHUNK_BYTES unless there are fewer than a chunk per task
+    private config const CSV_CHUNK_BYTES = 64 * 1024 * 1024;
+    private config const CSV_MIN_CHUNK_BYTES = 64 * 1024;
+    private config const CSV_BUFFER_BYTES = 1024 * 1024;
+    // The number of rows sampled to infer the dtypes of columns
+    private config const CSV_SAMPLE_ROWS = 1000;
+
     // Future Work (TODO)
     //  - write to single file
     //  - Custom Line Delimiters 
@@ -62,17 +72,21 @@ module CSVMsg {
             return new MsgTuple(errorMsg,MsgType.ERROR);
         } 
 
-        // open file and determine if header exists.
+        // open file and determine if header exists, reading only the header lines.
         var idx = 0;
         var csvFile = open(filename, iomode.r);
         var reader = csvFile.reader();
-        var lines = reader.lines().strip();
+        var lines: list(string);
+        for line in reader.lines() {
+            lines.append(line.strip());
+            if lines[0] != CSV_HEADER_OPEN || lines.size == 4 then break;
+        }
         if lines[0] == CSV_HEADER_OPEN {
             idx = 3; // set to first line after header
         }
 
         var col_delim: string = msgArgs.getValueOf("col_delim");
-        var column_names = lines[idx].split(col_delim);
+        var column_names = [c in lines[idx].split(col_delim)] c.strip().strip("\"");
         reader.close();
         csvFile.close();
         return new MsgTuple("%jt".format(column_names), MsgType.NORMAL);
@@ -261,7 +275,14 @@ module CSVMsg {
         return new MsgTuple("CSV Data written successfully!", MsgType.NORMAL);
     }
 
-    proc get_info(filename: string, datasets: [] string, col_delim: string) throws {
+    /*
+      Read the header lines of a CSV file, without reading its data.
+
+      :returns: whether the file has an Arkouda header, the dtypes of datasets
+                ("str" without a header), the byte offset of the first row of
+                data and the index of the column of each dataset
+    */
+    proc get_info(filename: string, datasets: [?D] string, col_delim: string) throws {
         // Verify that the file exists
         if !exists(filename) {
             throw getErrorWithContext(
@@ -274,7 +295,14 @@ module CSVMsg {
 
         var csvFile = open(filename, iomode.r);
         var reader = csvFile.reader();
-        var lines = reader.lines();
+        var lines: list(string);
+        for line in reader.lines() {
+            lines.append(line);
+            if lines[0] != CSV_HEADER_OPEN + "\n" || lines.size == 4 then break;
+        }
+        reader.close();
+        csvFile.close();
+
         var hasHeader = false;
         var dtype_idx = 0;
         var column_name_idx = 0;
@@ -285,7 +313,7 @@ module CSVMsg {
             column_name_idx = 3;
         }
         
-        var columns = lines[column_name_idx].split(col_delim).strip();
+        var columns = [c in lines[column_name_idx].split(col_delim)] c.strip().strip("\"");
         var file_dtypes: [0..#columns.size] string;
         if dtype_idx > 0 {
             file_dtypes = lines[dtype_idx].split(",").strip();
@@ -293,15 +321,11 @@ module CSVMsg {
         else {
             file_dtypes = "str";
         }
-        var data_start_offset = column_name_idx + 1;
-        // get the row count
-        var row_ct: int = lines.size - data_start_offset;
-
-        reader.close();
-        csvFile.close();
+        var data_start = + reduce [i in 0..column_name_idx] lines[i].numBytes;
 
-        var dtypes: [0..#datasets.size] string;
-        forall (i, dset) in zip(0..#datasets.size, datasets) {
+        var dtypes: [D] string;
+        var col_idx: [D] int;
+        forall (i, dset) in zip(D, datasets) {
             var (col_exists, idx) = columns.find(dset);
             csvLogger.debug(getModuleName(),getRoutineName(),getLineNumber(), "Column: %s, Exists: %jt, IDX: %i".format(dset, col_exists, idx));
             if !col_exists {
@@ -313,142 +337,363 @@ module CSVMsg {
                     errorClass="DatasetNotFoundError");
             }
             dtypes[i] = file_dtypes[idx];
+            col_idx[i] = idx;
         }
 
-        // get datatype of column
-        return (row_ct, hasHeader, new list(dtypes));
+        return (hasHeader, new list(dtypes), data_start, col_idx);
     }
 
-    proc read_files_into_dist_array(A: [?D] ?t, dset: string, filenames: [] string, filedomains: [] domain(1), skips: set(string), hasHeaders: bool, col_delim: string, offsets: [] int) throws {
-
-        coforall loc in A.targetLocales() do on loc {
-            // Create local copies of args
-            var locFiles = filenames;
-            var locFiledoms = filedomains;
-            /* On this locale, find all files containing data that belongs in
-                this locale's chunk of A */
-            for (filedom, filename, file_idx) in zip(locFiledoms, locFiles, 0..) {
-                if (skips.contains(filename)) {
-                    csvLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
-                             "File %s does not contain data for this dataset, skipping".format(filename));
+    /*
+      The bytes of a file from byte start until byte end, read in blocks.
+    */
+    iter fileBytes(filename: string, start: int, end: int = max(int)): uint(8) throws {
+        var f = open(filename, iomode.r);
+        var r = f.reader(kind=ionative, locking=false, start=start, end=end);
+        var buf: bytes;
+        while r.readbytes(buf, CSV_BUFFER_BYTES) {
+            for i in 0..#buf.size do yield buf.byte(i);
+        }
+        r.close();
+        f.close();
+    }
+
+    /*
+      The fields of count rows of a file, starting with the row at byte start,
+      or of the rows up to the end of the file if there are fewer. Fields are
+      separated by col_delim outside of quotes and rows by newlines outside of
+      quotes. A quote opens or closes a quoted part of a field, a doubled
+      quote inside one is a literal quote, and a trailing carriage return is
+      dropped.
+    */
+    iter csvRows(filename: string, start: int, count: int, col_delim: string): list(string) throws {
+        if count > 0 {
+            const delim = col_delim: bytes;
+            var fields: list(string);
+            var field: bytes;
+            var inQuote = false;
+            var closedQuote = false;
+            // the number of bytes at the end of the field that are not quoted
+            var unquoted = 0;
+            var inRow = false;
+            var n = 0;
+            for b in fileBytes(filename, start) {
+                inRow = true;
+                if b == QUOTE_BYTE {
+                    if !inQuote && closedQuote then field.appendByteValues(b);
+                    inQuote = !inQuote;
+                    closedQuote = !inQuote;
+                    unquoted = 0;
                     continue;
+                }
+                closedQuote = false;
+                if inQuote {
+                    field.appendByteValues(b);
+                } else if b == NEWLINE_BYTE {
+                    fields.append(lastField(field));
+                    yield fields;
+                    fields.clear();
+                    field = b"";
+                    unquoted = 0;
+                    inRow = false;
+                    n += 1;
+                    if n == count then break;
                 } else {
-                    var csvFile = open(filename, iomode.r);
-                    var reader = csvFile.reader();
-                    var lines = reader.lines().strip();
-                    var data_offset = 1;
-                    if hasHeaders {
-                        data_offset  = 4;
-                    }
-                    // determine the index of the column.
-                    var column_names = lines[data_offset-1].split(col_delim);
-                    var (colExists, colidx) = column_names.find(dset);
-                    if !colExists{
-                        throw getErrorWithContext(
-                            msg="The dataset %s was not found in %s".format(dset, filename),
-                            lineNumber=getLineNumber(),
-                            routineName=getRoutineName(), 
-                            moduleName=getModuleName(),
-                            errorClass="DatasetNotFoundError");
+                    field.appendByteValues(b);
+                    unquoted += 1;
+                    if unquoted >= delim.size && field.endsWith(delim) {
+                        fields.append(field[0..#(field.size - delim.size)].decode(decodePolicy.replace));
+                        field = b"";
+                        unquoted = 0;
                     }
-                    for locdom in A.localSubdomains() {
-                        const intersection = domain_intersection(locdom, filedom);
-                        if intersection.size > 0 {
-                            forall x in intersection {
-                                var row = lines[x-offsets[file_idx]+data_offset].split(col_delim);
-                                A[x] = row[colidx]: t;
-                            }
-                        }
-                    }
-                    reader.close();
-                    csvFile.close();
                 }
             }
+            // the last row need not end with a newline
+            if inRow && n < count {
+                fields.append(lastField(field));
+                yield fields;
+            }
         }
     }
 
-    proc generate_subdoms(filenames: [?D] string, row_counts: [D] int, validFiles: [D] bool) throws {
-        var skips = new set(string);
-        var offsets = (+ scan row_counts) - row_counts;
-        var subdoms: [D] domain(1);
-        for (i, fname, off, ct, vf) in zip(D, filenames, offsets, row_counts, validFiles) {
-            if (!vf) {
-                skips.add(fname);
-                csvLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
-                        "Adding invalid file to skips, %s".format(fname));
-                continue;
+    private proc lastField(field: bytes): string throws {
+        const f = if field.endsWith(b"\r") then field[0..#(field.size - 1)] else field;
+        return f.decode(decodePolicy.replace);
+    }
+
+    /*
+      The chunks of all files that are processed by the tasks of a locale,
+      which are consecutive so that the rows of a locale's chunks mostly
+      belong in its part of the arrays read.
+    */
+    private proc chunksOf(locId: int, nChunks: int): range {
+        return (locId * nChunks / numLocales)..<((locId + 1) * nChunks / numLocales);
+    }
+
+    /*
+      Split the data of each file into chunks of bytes, at least one per task
+      of each locale for a large file, and find the rows that start in each
+      chunk. A row starts at the first byte of data and after each newline
+      that is not inside a quoted field. Whether a chunk starts inside a
+      quoted field depends on the quotes of the chunks before it, so each
+      chunk is scanned for both cases at once and the right one is chosen by
+      the parity of the quotes before it.
+
+      :returns: for each chunk the index of its file, the byte offset of its
+                first row, its number of rows and the index of its first row
+                among the rows of all files
+    */
+    proc indexCSVChunks(filenames: [?FD] string, dataStarts: [FD] int, validFiles: [FD] bool) throws {
+        var fileSizes, fileChunks: [FD] int;
+        for (fname, ds, size, nc, vf) in zip(filenames, dataStarts, fileSizes, fileChunks, validFiles) {
+            if !vf then continue;
+            size = getFileSize(fname);
+            const dataBytes = size - ds;
+            if dataBytes > 0 {
+                nc = min(divceil(dataBytes, CSV_MIN_CHUNK_BYTES),
+                         max(numLocales * here.maxTaskPar, divceil(dataBytes, CSV_CHUNK_BYTES)));
+            }
+        }
+        const chunkOffsets = (+ scan fileChunks) - fileChunks;
+        const nChunks = + reduce fileChunks;
+        var chunkFile, chunkStart, chunkEnd: [0..#nChunks] int;
+        for (f, off, nc) in zip(FD, chunkOffsets, fileChunks) {
+            const dataBytes = fileSizes[f] - dataStarts[f];
+            for k in 0..#nc {
+                chunkFile[off + k] = f;
+                chunkStart[off + k] = dataStarts[f] + k * dataBytes / nc;
+                chunkEnd[off + k] = dataStarts[f] + (k + 1) * dataBytes / nc;
             }
-            subdoms[i] = {off..#ct};
         }
-        return (subdoms, offsets, skips);
-    }
 
-    proc readTypedCSV(filenames: [] string, datasets: [?D] string, dtypes: list(string), row_counts: [] int, validFiles: [] bool, col_delim: string, st: borrowed SymTab): list((string, string, string)) throws {
-        // assumes the file has header since we were able to access type info
-        var rtnData: list((string, string, string));
-        var record_count = + reduce row_counts;
-        var (subdoms, offsets, skips) = generate_subdoms(filenames, row_counts, validFiles);
-
-        for (i, dset) in zip(D, datasets) {
-            var dtype = str2dtype(dtypes[i]);
-            select dtype {
-                when DType.Int64 {
-                    var a = makeDistArray(record_count, int);
-                    read_files_into_dist_array(a, dset, filenames, subdoms, skips, true, col_delim, offsets);
-                    var entry = new shared SymEntry(a);
-                    var rname = st.nextName();
-                    st.addEntry(rname, entry);
-                    rtnData.append((dset, "pdarray", rname));
+        // the number and first row of the rows of each chunk if it starts
+        // outside of (0) or inside (1) a quoted field
+        var counts, firsts: [0..#nChunks] 2*int;
+        var parities: [0..#nChunks] bool;
+        coforall loc in Locales do on loc {
+            forall c in chunksOf(loc.id, nChunks) {
+                const f = chunkFile[c];
+                const s = chunkStart[c];
+                const e = chunkEnd[c];
+                const atStart = s == dataStarts[f];
+                var inQuote = (false, true);
+                var count = (0, 0);
+                var first = (-1, -1);
+                if atStart {
+                    count = (1, 1);
+                    first = (s, s);
                 }
-                when DType.UInt64 {
-                    var a = makeDistArray(record_count, uint);
-                    read_files_into_dist_array(a, dset, filenames, subdoms, skips, true, col_delim, offsets);
-                    var entry = new shared SymEntry(a);
-                    var rname = st.nextName();
-                    st.addEntry(rname, entry);
-                    rtnData.append((dset, "pdarray", rname));
+                // a newline just before the chunk starts a row in it
+                var p = if atStart then s else s - 1;
+                for b in fileBytes(filenames[f], p, e) {
+                    if b == QUOTE_BYTE {
+                        if p >= s then inQuote = (!inQuote(0), !inQuote(1));
+                    } else if b == NEWLINE_BYTE && p + 1 < e {
+                        for param i in 0..1 {
+                            if !inQuote(i) {
+                                count(i) += 1;
+                                if first(i) < 0 then first(i) = p + 1;
+                            }
+                        }
+                    }
+                    p += 1;
                 }
-                when DType.Float64 {
-                    var a = makeDistArray(record_count, real);
-                    read_files_into_dist_array(a, dset, filenames, subdoms, skips, true, col_delim, offsets);
-                    var entry = new shared SymEntry(a);
-                    var rname = st.nextName();
-                    st.addEntry(rname, entry);
-                    rtnData.append((dset, "pdarray", rname));
+                counts[c] = count;
+                firsts[c] = first;
+                parities[c] = inQuote(0);
+            }
+        }
+
+        var firstRows, rowCounts: [0..#nChunks] int;
+        var inQuote = false;
+        for c in 0..#nChunks {
+            if c == chunkOffsets[chunkFile[c]] then inQuote = false;
+            const i = if inQuote then 1 else 0;
+            rowCounts[c] = counts[c](i);
+            firstRows[c] = firsts[c](i);
+            inQuote = inQuote != parities[c];
+        }
+        const rowStarts = (+ scan rowCounts) - rowCounts;
+        csvLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                        "Split %i files into %i chunks of %i rows".format(FD.size, nChunks, + reduce rowCounts));
+        return (chunkFile, firstRows, rowCounts, rowStarts);
+    }
+
+    /*
+      Infer the dtype of each column col_idx from its values in the first
+      CSV_SAMPLE_ROWS rows of a file: bool if every value is true or false,
+      int64 if every value is an integer, float64 if every value is a number
+      or empty, and str otherwise.
+    */
+    proc inferCSVDtypes(filename: string, dataStart: int, col_idx: [?D] int, col_delim: string): list(string) throws {
+        var isBool, isInt, isReal: [D] bool = true;
+        var sampled = 0;
+        for row in csvRows(filename, dataStart, CSV_SAMPLE_ROWS, col_delim) {
+            for j in D {
+                const v = if col_idx[j] < row.size then row[col_idx[j]].strip() else "";
+                const lower = v.toLower();
+                isBool[j] = isBool[j] && (lower == "true" || lower == "false");
+                if isInt[j] {
+                    try {
+                        const x = v: int;
+                    } catch {
+                        isInt[j] = false;
+                    }
                 }
-                when DType.Bool {
-                    var a = makeDistArray(record_count, bool);
-                    read_files_into_dist_array(a, dset, filenames, subdoms, skips, true, col_delim, offsets);
-                    var entry = new shared SymEntry(a);
-                    var rname = st.nextName();
-                    st.addEntry(rname, entry);
-                    rtnData.append((dset, "pdarray", rname));
+                if isReal[j] && !v.isEmpty() {
+                    try {
+                        const x = v: real;
+                    } catch {
+                        isReal[j] = false;
+                    }
                 }
-                when DType.Strings {
-                    var a = makeDistArray(record_count, string);
-                    read_files_into_dist_array(a, dset, filenames, subdoms, skips, true, col_delim, offsets);
-                    var col_lens = makeDistArray(record_count, int);
-                    forall (i, v) in zip(0..#a.size, a) {
-                        var tmp_str = v + "\x00";
-                        var vbytes = tmp_str.bytes();
-                        col_lens[i] = vbytes.size;
+            }
+            sampled += 1;
+        }
+        var dtypes: list(string);
+        for j in D {
+            if sampled == 0 then dtypes.append("str");
+            else if isBool[j] then dtypes.append("bool");
+            else if isInt[j] then dtypes.append("int64");
+            else if isReal[j] then dtypes.append("float64");
+            else dtypes.append("str");
+        }
+        return dtypes;
+    }
+
+    private proc parseCSVField(field: string, type t, dset: string, row: int): t throws {
+        const v = field.strip();
+        try {
+            if t == bool {
+                const lower = v.toLower();
+                if lower == "true" then return true;
+                if lower == "false" then return false;
+                throw new IllegalArgumentError(v);
+            } else if t == real && v.isEmpty() {
+                return nan;
+            } else {
+                return v: t;
+            }
+        } catch {
+            throw getErrorWithContext(
+                msg="Could not parse %jt in row %i of dataset %s as %s".format(v, row, dset, t:string),
+                lineNumber=getLineNumber(),
+                routineName=getRoutineName(),
+                moduleName=getModuleName(),
+                errorClass="IOError");
+        }
+    }
+
+    /*
+      Parse the columns of the rows of each chunk into entries, which hold
+      the lengths of the values, including a null terminator, for Strings.
+      Each chunk is parsed once for all columns by a task of the locale that
+      its rows mostly belong to, converting the fields of each row as it is
+      read.
+    */
+    proc parseCSVChunks(filenames: [?FD] string, chunks, datasets: [?D] string, types: [D] DType,
+                        entries: [D] borrowed GenSymEntry?, col_idx: [FD] [D] int, col_delim: string) throws {
+        const (chunkFile, firstRows, rowCounts, rowStarts) = chunks;
+        const nChunks = chunkFile.size;
+        coforall loc in Locales do on loc {
+            const locTypes = types;
+            const locEntries = entries;
+            const locDsets = datasets;
+            forall c in chunksOf(loc.id, nChunks) with (var intAgg = newDstAggregator(int),
+                                                        var uintAgg = newDstAggregator(uint),
+                                                        var realAgg = newDstAggregator(real),
+                                                        var boolAgg = newDstAggregator(bool)) {
+                const idx = col_idx[chunkFile[c]];
+                var r = rowStarts[c];
+                for row in csvRows(filenames[chunkFile[c]], firstRows[c], rowCounts[c], col_delim) {
+                    for j in D {
+                        if idx[j] >= row.size {
+                            throw getErrorWithContext(
+                                msg="Row %i of dataset %s has only %i columns".format(r, locDsets[j], row.size),
+                                lineNumber=getLineNumber(),
+                                routineName=getRoutineName(),
+                                moduleName=getModuleName(),
+                                errorClass="IOError");
+                        }
+                        const field = row[idx[j]];
+                        select locTypes[j] {
+                            when DType.Int64 do
+                                intAgg.copy(toSymEntry(locEntries[j]!, int).a[r],
+                                            parseCSVField(field, int, locDsets[j], r));
+                            when DType.UInt64 do
+                                uintAgg.copy(toSymEntry(locEntries[j]!, uint).a[r],
+                                             parseCSVField(field, uint, locDsets[j], r));
+                            when DType.Float64 do
+                                realAgg.copy(toSymEntry(locEntries[j]!, real).a[r],
+                                             parseCSVField(field, real, locDsets[j], r));
+                            when DType.Bool do
+                                boolAgg.copy(toSymEntry(locEntries[j]!, bool).a[r],
+                                             parseCSVField(field, bool, locDsets[j], r));
+                            when DType.Strings do
+                                intAgg.copy(toSymEntry(locEntries[j]!, int).a[r], field.numBytes + 1);
+                        }
                     }
-                    var str_offsets = (+ scan col_lens) - col_lens;
-                    var value_size: int = + reduce col_lens;
-                    var data = makeDistArray(value_size, uint(8));
-                    forall (i, v) in zip(0..#a.size, a) {
-                        var tmp_str = v + "\x00";
-                        var vbytes = tmp_str.bytes();
-                        ref low = str_offsets[i];
-                        data[low..#vbytes.size] = vbytes;
+                    r += 1;
+                }
+            }
+        }
+    }
+
+    /*
+      Copy the values of the Strings columns of the rows of each chunk into
+      values, at the offsets of their rows, in one pass over the chunks.
+      Columns that are not Strings have no offsets or values.
+    */
+    proc readCSVStrings(filenames: [?FD] string, chunks, types: [?D] DType, col_idx: [FD] [D] int,
+                        offsets: [D] shared SymEntry(int)?, values: [D] shared SymEntry(uint(8))?,
+                        col_delim: string) throws {
+        const (chunkFile, firstRows, rowCounts, rowStarts) = chunks;
+        const nChunks = chunkFile.size;
+        coforall loc in Locales do on loc {
+            const locTypes = types;
+            const locOffsets = offsets;
+            const locValues = values;
+            forall c in chunksOf(loc.id, nChunks) with (var agg = newDstAggregator(uint(8))) {
+                if rowCounts[c] > 0 {
+                    const idx = col_idx[chunkFile[c]];
+                    var o: [D] int;
+                    for j in D do
+                        if locTypes[j] == DType.Strings then o[j] = locOffsets[j]!.a[rowStarts[c]];
+                    for row in csvRows(filenames[chunkFile[c]], firstRows[c], rowCounts[c], col_delim) {
+                        for j in D {
+                            if locTypes[j] != DType.Strings then continue;
+                            const v = row[idx[j]];
+                            ref vals = locValues[j]!.a;
+                            for i in 0..#v.numBytes do agg.copy(vals[o[j]+i], v.byte(i));
+                            // values are zeroed, so the null terminator is in place
+                            o[j] += v.numBytes + 1;
+                        }
                     }
-                    var ss = getSegString(str_offsets, data, st);
-                    var rst = (dset, "seg_string", "%s+%t".format(ss.name, ss.nBytes));
-                    rtnData.append(rst);
                 }
+            }
+        }
+    }
+
+    /*
+      Read the datasets, with the given dtypes, from the chunks of the files,
+      in one pass over the chunks for all columns and another for all Strings
+      columns.
+    */
+    proc readCSVColumns(filenames: [?FD] string, chunks, datasets: [?D] string, dtypes: list(string),
+                        col_idx: [FD] [D] int, col_delim: string, st: borrowed SymTab): list((string, string, string)) throws {
+        var rtnData: list((string, string, string));
+        const (chunkFile, firstRows, rowCounts, rowStarts) = chunks;
+        const nrows = + reduce rowCounts;
+
+        var types: [D] DType;
+        var names: [D] string;
+        var entries: [D] borrowed GenSymEntry?;
+        for j in D {
+            types[j] = str2dtype(dtypes[j]);
+            select types[j] {
+                when DType.Int64, DType.UInt64, DType.Float64, DType.Bool, DType.Strings {}
                 otherwise {
                     throw getErrorWithContext(
-                                    msg="Data Type %s cannot be read into Arkouda.".format(dtypes[i]),
+                                    msg="Data Type %s cannot be read into Arkouda.".format(dtypes[j]),
                                     lineNumber=getLineNumber(), 
                                     routineName=getRoutineName(), 
                                     moduleName=getModuleName(), 
@@ -457,36 +702,41 @@ module CSVMsg {
                 }
             }
         }
-        return rtnData;
-    }
+        for j in D {
+            // Strings columns first hold the lengths of their values
+            names[j] = st.nextName();
+            const dtype = if types[j] == DType.Strings then DType.Int64 else types[j];
+            entries[j] = toGenSymEntry(st.addEntry(names[j], nrows, dtype));
+        }
 
-    proc readGenericCSV(filenames: [] string, datasets: [?D] string, row_counts: [] int, validFiles: [] bool, col_delim: string, st: borrowed SymTab): list((string, string, string)) throws {
-        // assumes the file does not have a header since we were not able to access type info
-        var rtnData: list((string, string, string));
-        var record_count = + reduce row_counts;
-        var (subdoms, offsets, skips) = generate_subdoms(filenames, row_counts, validFiles);
-
-        for (i, dset) in zip(D, datasets) {
-            var a = makeDistArray(record_count, string);
-            read_files_into_dist_array(a, dset, filenames, subdoms, skips, false, col_delim, offsets);
-            var col_lens = makeDistArray(record_count, int);
-            forall (i, v) in zip(0..#a.size, a) {
-                var tmp_str = v + "\x00";
-                var vbytes = tmp_str.bytes();
-                col_lens[i] = vbytes.size;
-            }
-            var str_offsets = (+ scan col_lens) - col_lens;
-            var value_size: int = + reduce col_lens;
-            var data = makeDistArray(value_size, uint(8));
-            forall (i, v) in zip(0..#a.size, a) {
-                var tmp_str = v + "\x00";
-                var vbytes = tmp_str.bytes();
-                ref low = str_offsets[i];
-                data[low..#vbytes.size] = vbytes;
-            }
-            var ss = getSegString(str_offsets, data, st);
-            var rst = (dset, "seg_string", "%s+%t".format(ss.name, ss.nBytes));
-            rtnData.append(rst);
+        try {
+            parseCSVChunks(filenames, chunks, datasets, types, entries, col_idx, col_delim);
+            var offsets: [D] shared SymEntry(int)?;
+            var values: [D] shared SymEntry(uint(8))?;
+            for j in D {
+                if types[j] == DType.Strings {
+                    ref lens = toSymEntry(entries[j]!, int).a;
+                    offsets[j] = new shared SymEntry(nrows, int);
+                    offsets[j]!.a = (+ scan lens) - lens;
+                    values[j] = new shared SymEntry(+ reduce lens, uint(8));
+                    st.deleteEntry(names[j]);
+                }
+            }
+            if || reduce (types == DType.Strings) then
+                readCSVStrings(filenames, chunks, types, col_idx, offsets, values, col_delim);
+            for (j, dset) in zip(D, datasets) {
+                if types[j] == DType.Strings {
+                    var ss = assembleSegStringFromParts(offsets[j]!, values[j]!, st);
+                    rtnData.append((dset, "seg_string", "%s+%t".format(ss.name, ss.nBytes)));
+                } else {
+                    rtnData.append((dset, "pdarray", names[j]));
+                }
+            }
+        } catch e {
+            for (j, name) in zip(D, names) {
+                if st.contains(name) then st.deleteEntry(name);
+            }
+            throw e;
         }
         return rtnData;
     }
@@ -552,7 +802,10 @@ module CSVMsg {
             filenames = filelist;
         }
 
-        var row_cts: [filedom] int;
+        var inferDtypes = msgArgs.contains("infer_dtypes") && msgArgs.get("infer_dtypes").getBoolValue();
+
+        var data_starts: [filedom] int;
+        var col_idx: [filedom] [0..#ndsets] int;
         var data_types: list(list(string));
         var headers: [filedom] bool;
         var rtnData: list((string, string, string));
@@ -564,7 +817,7 @@ module CSVMsg {
             var hadError = false;
             try {
                 var dtypes: list(string);
-                (row_cts[i], headers[i], dtypes) = get_info(fname, dsetlist, col_delim);
+                (headers[i], dtypes, data_starts[i], col_idx[i]) = get_info(fname, dsetlist, col_delim);
                 data_types.append(dtypes);
             } catch e: FileNotFoundError {
                 fileErrorMsg = "File %s not found".format(fname);
@@ -603,11 +856,14 @@ module CSVMsg {
             }
         }
 
+        var (_, first) = maxloc reduce zip(validFiles, filedom);
         var dtype = data_types[0];
-        var rows = row_cts[0];
-        var hasHeader = headers[0];
-        for (isValid, fname, dt, rc, hh) in zip(validFiles, filenames, data_types, row_cts, headers) {
+        var hasHeader = headers[first];
+        var dtidx = 0;
+        for (isValid, fname, hh) in zip(validFiles, filenames, headers) {
             if isValid {
+                const dt = data_types[dtidx];
+                dtidx += 1;
                 if (dtype != dt) {
                     var errorMsg = "Inconsistent dtypes in file %s".format(fname);
                     csvLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
@@ -623,15 +879,14 @@ module CSVMsg {
                                         "Verified all dtypes across files for file %s".format(fname));
         }
 
-        var rtnMsg: string;
-        if headers[0] {
-            rtnData = readTypedCSV(filenames, dsetlist, data_types[0], row_cts, validFiles, col_delim, st);
-            rtnMsg = _buildReadAllMsgJson(rtnData, allowErrors, fileErrorCount, fileErrors, st);
-        }
-        else {
-            rtnData = readGenericCSV(filenames, dsetlist, row_cts, validFiles, col_delim, st);
-            rtnMsg = _buildReadAllMsgJson(rtnData, allowErrors, fileErrorCount, fileErrors, st);
+        // without an Arkouda header every column is read as strings, unless
+        // their dtypes are inferred from the first rows of the first file
+        if !hasHeader && inferDtypes {
+            dtype = inferCSVDtypes(filenames[first], data_starts[first], col_idx[first], col_delim);
         }
+        var chunks = indexCSVChunks(filenames, data_starts, validFiles);
+        rtnData = readCSVColumns(filenames, chunks, dsetlist, dtype, col_idx, col_delim, st);
+        var rtnMsg = _buildReadAllMsgJson(rtnData, allowErrors, fileErrorCount, fileErrors, st);
         
         return new MsgTuple(rtnMsg, MsgType.NORMAL);
     } 
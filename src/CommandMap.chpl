@@ -82,7 +82,8 @@ module CommandMap {
   proc executeCommand(cmd: string, msgArgs, st) throws {
     var repTuple: MsgTuple;
     if commandMap.contains(cmd) {
-      usedModules.add(moduleMap[cmd]);
+      if moduleMap.contains(cmd) then
+        usedModules.add(moduleMap[cmd]);
       repTuple = commandMap.getBorrowed(cmd)(cmd, msgArgs, st);
     } else {
       repTuple = new MsgTuple("Unrecognized command: %s".format(cmd), MsgType.ERROR);
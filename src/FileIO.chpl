@@ -4,6 +4,7 @@ module FileIO {
     use IO;
     use GenSymIO;
     use FileSystem;
+    use List;
     use Map;
     use Path;
     use Reflection;
@@ -292,6 +293,110 @@ module FileIO {
       }
     }
 
+    /*
+    List the files in a directory and all its subdirectories, for example the
+    partitions of a dataset, in sorted order.
+
+    :arg reqMsg: request containing (cmd,path)
+    :type reqMsg: string
+
+    :returns: MsgTuple containing the JSON list of the paths of the files
+    */
+    proc listFilesMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+      var path: string = msgArgs.getValueOf("path");
+      if !exists(path) || !isDir(path) {
+        var errorMsg = "Directory %s does not exist in a location accessible to Arkouda".format(path);
+        fioLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+        return new MsgTuple(errorMsg, MsgType.ERROR);
+      }
+      var files = for f in findFiles(path, recursive=true) do f;
+      sort(files);
+      var repMsg = "%jt".format(files);
+      fioLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                      "found %i files in %s".format(files.size, path));
+      return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    /*
+    Create a directory and any missing parents, if it does not exist.
+
+    :arg reqMsg: request containing (cmd,path)
+    :type reqMsg: string
+    */
+    proc makeDirsMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+      var path: string = msgArgs.getValueOf("path");
+      if !exists(path) then mkdir(path, parents=true);
+      if !isDir(path) {
+        var errorMsg = "%s exists and is not a directory".format(path);
+        fioLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+        return new MsgTuple(errorMsg, MsgType.ERROR);
+      }
+      return new MsgTuple("created directory %s".format(path), MsgType.NORMAL);
+    }
+
+    /*
+    Check that every directory of a partitioned dataset is a relative path of
+    key=value directories, so that it lies inside the root of the dataset.
+    */
+    proc checkPartitionDirs(dirs: [] string) throws {
+      for dir in dirs {
+        for part in dir.split("/") {
+          if part.find("="): int < 1 then
+            throw getErrorWithContext(
+                      msg="Partition directory %s is not a relative path of key=value directories".format(dir),
+                      lineNumber=getLineNumber(),
+                      routineName=getRoutineName(),
+                      moduleName=getModuleName(),
+                      errorClass='IllegalArgumentError');
+        }
+      }
+    }
+
+    /*
+    The files of the partition directories dirs of the dataset under root
+    whose names do not start with keepPrefix, "_" or ".", which are the files
+    that truncating the partitions removes. Files in subdirectories are not
+    included.
+    */
+    proc partitionFiles(root: string, dirs: [] string, keepPrefix: string): list(string) throws {
+      checkPartitionDirs(dirs);
+      var files: list(string);
+      for dir in dirs {
+        const path = root + "/" + dir;
+        if !isDir(path) then continue;
+        for f in listDir(path, dirs=false, files=true, listDotfiles=false) {
+          if !f.startsWith("_") && (keepPrefix.isEmpty() || !f.startsWith(keepPrefix)) then
+            files.append(path + "/" + f);
+        }
+      }
+      return files;
+    }
+
+    /*
+    Delete the files of partitions of a dataset, except those whose names
+    start with a prefix, which are the files of the partitions that were just
+    written. Only files directly inside key=value directories under the root
+    of the dataset can be deleted.
+
+    :arg reqMsg: request containing (cmd,path,partition_size,partitions,keep_prefix)
+    :type reqMsg: string
+    */
+    proc removePartitionFilesMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+      const root: string = msgArgs.getValueOf("path");
+      const ndirs = msgArgs.get("partition_size").getIntValue();
+      var dirs = msgArgs.get("partitions").getList(ndirs);
+      const keepPrefix: string = msgArgs.getValueOf("keep_prefix");
+      var files: list(string);
+      try {
+        files = partitionFiles(root, dirs, keepPrefix);
+      } catch e: IllegalArgumentError {
+        fioLogger.error(getModuleName(),getRoutineName(),getLineNumber(),e.message());
+        return new MsgTuple(e.message(), MsgType.ERROR);
+      }
+      for f in files do remove(f);
+      return new MsgTuple("removed %i files".format(files.size), MsgType.NORMAL);
+    }
+
     proc lsAnyMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
       // Retrieve filename from payload
       var filename: string = msgArgs.getValueOf("filename");
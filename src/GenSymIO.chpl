@@ -60,6 +60,43 @@ module GenSymIO {
             return name;
         }
 
+        /*
+         * Chunked uploads send each chunk of an array created beforehand along
+         * with the position of the chunk, so copy the chunk into place
+         */
+        proc bytesIntoSymEntry(size:int, type t, st: borrowed SymTab, ref data:bytes,
+                               name: string, start: int): string throws {
+            var entry = toSymEntry(getGenericTypedArrayEntry(name, st), t);
+            if start < 0 || start + size > entry.size {
+                throw new Error("Chunk %i..#%i out of bounds for array of size %i".format(
+                                                                       start, size, entry.size));
+            }
+            var localA = makeArrayFromPtr(data.c_str():c_void_ptr:c_ptr(t), size:uint);
+            entry.a[start..#size] = localA;
+            return name;
+        }
+
+        if msgArgs.contains("target") {
+            const target = msgArgs.getValueOf("target");
+            const start = msgArgs.get("start").getIntValue();
+            if dtype == DType.Int64 {
+                rname = bytesIntoSymEntry(size, int, st, data, target, start);
+            } else if dtype == DType.UInt64 {
+                rname = bytesIntoSymEntry(size, uint, st, data, target, start);
+            } else if dtype == DType.Float64 {
+                rname = bytesIntoSymEntry(size, real, st, data, target, start);
+            } else if dtype == DType.Bool {
+                rname = bytesIntoSymEntry(size, bool, st, data, target, start);
+            } else {
+                msg = "Unhandled data type %s for chunked transfer".format(msgArgs.getValueOf("dtype"));
+                gsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),msg);
+                return new MsgTuple(msg, MsgType.ERROR);
+            }
+            msg = "set %s[%i..#%i]".format(rname, start, size);
+            gsLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),msg);
+            return new MsgTuple(msg, MsgType.NORMAL);
+        }
+
         if dtype == DType.Int64 {
             rname = bytesToSymEntry(size, int, st, data);
         } else if dtype == DType.UInt64 {
@@ -138,14 +175,28 @@ module GenSymIO {
             return errorMsg.encode(); // return as bytes
         }
         var entry:borrowed GenSymEntry = abstractEntry: borrowed GenSymEntry;
-        
+
+        // chunked transfers only request the elements start..<stop
+        var start = 0, stop = entry.size;
+        if msgArgs.contains("start") {
+            start = msgArgs.get("start").getIntValue();
+            stop = msgArgs.get("stop").getIntValue();
+            if start < 0 || stop > entry.size || start > stop {
+                var errorMsg = "Error: chunk %i..<%i out of bounds for array of size %i".format(
+                                                                     start, stop, entry.size);
+                gsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return errorMsg.encode(); // return as bytes
+            }
+        }
+
         overMemLimit(2 * entry.getSizeEstimate());
 
         proc distArrToBytes(A: [?D] ?eltType) {
-            var ptr = c_malloc(eltType, D.size);
-            var localA = makeArrayFromPtr(ptr, D.size:uint);
-            localA = A;
-            const size = D.size*c_sizeof(eltType):int;
+            const n = stop - start;
+            var ptr = c_malloc(eltType, n);
+            var localA = makeArrayFromPtr(ptr, n:uint);
+            localA = A[start..<stop];
+            const size = n*c_sizeof(eltType):int;
             return createBytesWithOwnedBuffer(ptr:c_ptr(uint(8)), size, size);
         }
 
@@ -168,6 +219,133 @@ module GenSymIO {
        return arrayBytes;
     }
 
+    /*
+     * Each buffer sent by tondarrayMultiMsg starts on a multiple of this many
+     * bytes, the alignment Arrow recommends for its buffers
+     */
+    param arrowAlignment = 64;
+
+    proc arrowAlignedSize(nbytes: int): int {
+        return (nbytes + arrowAlignment - 1) / arrowAlignment * arrowAlignment;
+    }
+
+    /*
+     * Outputs several arrays in one reply, laid out as Arrow buffers, so a
+     * client can rebuild many columns from a single request without copying.
+     * Each component is one of
+     *   "pdarray <name>": the array as is
+     *   "strings <name>": the int64 offsets of the strings with the total
+     *                     length appended, then the bytes of the strings
+     *                     without their null terminators
+     *   "segments <name> <values name>": the segments with the size of the
+     *                     values appended
+     * Every buffer is zero padded to a multiple of arrowAlignment bytes.
+     */
+    proc tondarrayMultiMsg(cmd: string, msgArgs: borrowed MessageArgs, st:
+                                               borrowed SymTab): bytes throws {
+        const n = msgArgs.get("n").getIntValue();
+        const components = msgArgs.get("components").getList(n);
+
+        // Check every component and add up the size of the reply before copying anything
+        var total = 0;
+        for comp in components {
+            const fields = comp.split(" ");
+            select fields[0] {
+                when "pdarray" {
+                    var abstractEntry = st.lookup(fields[1]);
+                    if !abstractEntry.isAssignableTo(SymbolEntryType.TypedArraySymEntry) {
+                        var errorMsg = "Error: Unhandled SymbolEntryType %s".format(abstractEntry.entryType);
+                        gsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                        return errorMsg.encode(); // return as bytes
+                    }
+                    var entry:borrowed GenSymEntry = abstractEntry: borrowed GenSymEntry;
+                    if entry.dtype != DType.Int64 && entry.dtype != DType.UInt64 &&
+                       entry.dtype != DType.Float64 && entry.dtype != DType.Bool {
+                        var errorMsg = "Error: Unhandled dtype %s".format(entry.dtype);
+                        gsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                        return errorMsg.encode(); // return as bytes
+                    }
+                    total += arrowAlignedSize(entry.size * entry.itemsize);
+                }
+                when "strings" {
+                    var entry = getSegString(fields[1], st);
+                    total += arrowAlignedSize((entry.size + 1) * c_sizeof(int):int);
+                    total += arrowAlignedSize(entry.nBytes - entry.size);
+                }
+                when "segments" {
+                    var entry = getGenericTypedArrayEntry(fields[1], st);
+                    total += arrowAlignedSize((entry.size + 1) * c_sizeof(int):int);
+                }
+                otherwise {
+                    var errorMsg = "Error: Unrecognized component %s".format(comp);
+                    gsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                    return errorMsg.encode(); // return as bytes
+                }
+            }
+        }
+
+        if total == 0 then return b"";
+        overMemLimit(2 * total);
+
+        // zeroed, so the padding between buffers is deterministic
+        var ptr = c_calloc(uint(8), total);
+        var pos = 0;
+
+        proc bufferAt(type eltType, size: int) {
+            return makeArrayFromPtr((ptr + pos):c_void_ptr:c_ptr(eltType), size:uint);
+        }
+
+        proc distArrIntoBytes(A: [?D] ?eltType) {
+            var localA = bufferAt(eltType, D.size);
+            localA = A;
+            pos += arrowAlignedSize(D.size * c_sizeof(eltType):int);
+        }
+
+        for comp in components {
+            const fields = comp.split(" ");
+            select fields[0] {
+                when "pdarray" {
+                    var entry = getGenericTypedArrayEntry(fields[1], st);
+                    select entry.dtype {
+                        when DType.Int64 do distArrIntoBytes(toSymEntry(entry, int).a);
+                        when DType.UInt64 do distArrIntoBytes(toSymEntry(entry, uint).a);
+                        when DType.Float64 do distArrIntoBytes(toSymEntry(entry, real).a);
+                        when DType.Bool do distArrIntoBytes(toSymEntry(entry, bool).a);
+                    }
+                }
+                when "strings" {
+                    var entry = getSegString(fields[1], st);
+                    const size = entry.size;
+                    const nchars = entry.nBytes - size;
+                    var offsets = bufferAt(int, size + 1);
+                    offsets[0..<size] = entry.offsets.a;
+                    // drop the null terminators of the strings before each offset
+                    forall i in 0..<size with (ref offsets) do offsets[i] -= i;
+                    offsets[size] = nchars;
+                    pos += arrowAlignedSize((size + 1) * c_sizeof(int):int);
+
+                    var values = bufferAt(uint(8), nchars);
+                    var localValues: [0..<entry.nBytes] uint(8) = entry.values.a;
+                    forall i in 0..<size with (ref values) {
+                        const len = offsets[i+1] - offsets[i];
+                        if len > 0 then values[offsets[i]..#len] = localValues[offsets[i]+i..#len];
+                    }
+                    pos += arrowAlignedSize(nchars);
+                }
+                when "segments" {
+                    var segments = toSymEntry(getGenericTypedArrayEntry(fields[1], st), int);
+                    var valuesEntry = getGenericTypedArrayEntry(fields[2], st);
+                    var offsets = bufferAt(int, segments.size + 1);
+                    offsets[0..<segments.size] = segments.a;
+                    offsets[segments.size] = valuesEntry.size;
+                    pos += arrowAlignedSize((segments.size + 1) * c_sizeof(int):int);
+                }
+            }
+        }
+
+        return createBytesWithOwnedBuffer(ptr, total, total);
+    }
+
     /*
      * Utility proc to test casting a string to a specified type
      * :arg c: String to cast
@@ -221,7 +399,7 @@ module GenSymIO {
      *           "Permission error Operation not permitted (error msg) opening path/to/file"
      *       ]
      *   }
-     *  Uses keys:  dataset_name, arkouda_type->[pdarray|seg_string], created->(legacy creation statement)
+     *  Uses keys:  dataset_name, arkouda_type->[pdarray|seg_string|dictionary], created->(legacy creation statement)
      */
     proc _buildReadAllMsgJson(rnames:list(3*string), allowErrors:bool, fileErrorCount:int, fileErrors:list(string), st: borrowed SymTab): string throws {
         // TODO: Right now we're building the legacy "created ..." string so we'll stuff them in a single array of items
@@ -244,6 +422,10 @@ module GenSymIO {
                     var (segName, nBytes) = id.splitMsgToTuple("+", 2);
                     item += "," + Q + "created" + QCQ + "created " + st.attrib(segName) + "+created bytes.size " + nBytes + Q + "}";
                 }
+                when ("dictionary") {
+                    var (codesName, segName, nBytes) = id.splitMsgToTuple("+", 3);
+                    item += "," + Q + "created" + QCQ + "created " + st.attrib(codesName) + "+created " + st.attrib(segName) + "+created bytes.size " + nBytes + Q + "}";
+                }
                 when ("seg_array") {
                     item += "," + Q + "created" + QCQ + id.replace(Q, ESCAPED_QUOTES) + Q + "}";
                 }
@@ -26,10 +26,10 @@ module GroupBy {
         return new owned GroupBy(name, entry);
     }
 
-    proc getGroupBy(keyCount: int, keys: [] string, keyTypes: [] string, assumeSorted: bool, st: borrowed SymTab): owned GroupBy throws {
+    proc getGroupBy(keyCount: int, keys: [] string, keyTypes: [] string, assumeSorted: bool, st: borrowed SymTab, method = "sort"): owned GroupBy throws {
         var keyNamesEntry = new shared SymEntry(keys);
         var keyTypesEntry = new shared SymEntry(keyTypes);
-        var (permEntry, segmentsEntry) = uniqueAndCount(keyCount, keys, keyTypes, assumeSorted, st);
+        var (permEntry, segmentsEntry) = uniqueAndCount(keyCount, keys, keyTypes, assumeSorted, st, method);
 
         var uniqueKeyInds = new shared SymEntry(segmentsEntry.size, int);
         if (segmentsEntry.size > 0) {
@@ -25,8 +25,10 @@ module GroupByMsg {
         var n = msgArgs.get("nkeys").getIntValue();
         var keynames = msgArgs.get("keynames").getList(n);
         var keytypes = msgArgs.get("keytypes").getList(n); 
+        // "sort", "hash" or "auto", see UniqueMsg.uniqueAndCount
+        const method = if msgArgs.contains("method") then msgArgs.getValueOf("method") else "sort";
 
-        var gb = getGroupBy(n, keynames, keytypes, assumeSorted, st);
+        var gb = getGroupBy(n, keynames, keytypes, assumeSorted, st, method);
 
         // Create message tuple containing the GroupBy obj, segments, permutation, and indexes of unique keys
         var rtnmap: map(string, string) = new map(string, string);
@@ -0,0 +1,237 @@
+module HashIndexMsg
+{
+    use ServerConfig;
+
+    use Reflection;
+    use ServerErrors;
+    use Logging;
+    use Message;
+    use MultiTypeSymbolTable;
+    use MultiTypeSymEntry;
+    use ServerErrorStrings;
+    use CommAggregation;
+    use RadixSortLSD;
+    use UniqueMsg;
+    use SearchSortedMsg;
+
+    private config const logLevel = ServerConfig.logLevel;
+    private config const logChannel = ServerConfig.logChannel;
+    const hiLogger = new Logger(logLevel, logChannel);
+
+    /*
+    Build a hash index of an array or Strings: the 128-bit hashes of its
+    values are bucketed by their leading bits, with at least as many buckets
+    as values, and stored by bucket with the index of each value and the
+    start of each bucket.
+
+    :arg reqMsg: request containing (cmd,name,objtype)
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: MsgTuple containing a JSON list with the replies for the
+              high and low words of the bucketed hashes, the index of each
+              of them and the start of each bucket, followed by the end
+    */
+    proc createHashIndexMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const name = msgArgs.getValueOf("name");
+        const objtype = msgArgs.getValueOf("objtype");
+        hiLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "cmd: %s name: %s objtype: %s".format(cmd,name,objtype));
+
+        const size = if objtype == "str" then getSegString(name.splitMsgToTuple('+', 2)(0), st).size
+                     else getGenericTypedArrayEntry(name, st).size;
+        var hashes = makeDistArray(size, 2*uint(64));
+        if size > 0 then hashes = hashArrays(size, [name], [objtype], st);
+        const bits = bucketBits(size);
+        const buckets = [h in hashes] bucketOf(h, bits);
+
+        // sort the hashes by bucket, keeping equal values in order
+        const rows = radixSortLSD_ranks(buckets);
+        var sortedBuckets = makeDistArray(size, int);
+        var sortedHashes = makeDistArray(size, 2*uint(64));
+        forall (sb, sh, r) in zip(sortedBuckets, sortedHashes, rows) with (var bucketAgg = newSrcAggregator(int),
+                                                                       var hashAgg = newSrcAggregator(2*uint(64))) {
+          bucketAgg.copy(sb, buckets[r]);
+          hashAgg.copy(sh, hashes[r]);
+        }
+        const hashHi = [h in sortedHashes] h(0);
+        const hashLo = [h in sortedHashes] h(1);
+        var bounds = makeDistArray((1 << bits) + 1, int);
+        forall (b, i) in zip(bounds, bounds.domain) do b = i;
+        const starts = searchSorted(sortedBuckets, bounds, false);
+
+        var hiName = st.nextName();
+        st.addEntry(hiName, new shared SymEntry(hashHi));
+        var loName = st.nextName();
+        st.addEntry(loName, new shared SymEntry(hashLo));
+        var rowsName = st.nextName();
+        st.addEntry(rowsName, new shared SymEntry(rows));
+        var startsName = st.nextName();
+        st.addEntry(startsName, new shared SymEntry(starts));
+        var repMsg = "%jt".format(["created " + st.attrib(hiName), "created " + st.attrib(loName),
+                                   "created " + st.attrib(rowsName), "created " + st.attrib(startsName)]);
+        hiLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    /*
+    Find the first index of each query value in a hash index built by
+    createHashIndexMsg, probing only the bucket of the query.
+
+    :arg reqMsg: request containing (cmd,hashhi,hashlo,rows,starts,name,
+                 objtype) where name and objtype are those of the queries
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: MsgTuple containing the created int64 array of the index of
+              each query, or -1 if it is not in the index
+    */
+    proc hashIndexLookupMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const name = msgArgs.getValueOf("name");
+        const objtype = msgArgs.getValueOf("objtype");
+        hiLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "cmd: %s name: %s objtype: %s".format(cmd,name,objtype));
+        var hashHi = toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("hashhi"), st), uint);
+        var hashLo = toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("hashlo"), st), uint);
+        var rows = toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("rows"), st), int);
+        var starts = toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("starts"), st), int);
+
+        const size = if objtype == "str" then getSegString(name.splitMsgToTuple('+', 2)(0), st).size
+                     else getGenericTypedArrayEntry(name, st).size;
+        var hashes = makeDistArray(size, 2*uint(64));
+        if size > 0 then hashes = hashArrays(size, [name], [objtype], st);
+        var found = probeHashIndex(hashes, hashHi.a, hashLo.a, rows.a, starts.a);
+
+        var rname = st.nextName();
+        st.addEntry(rname, new shared SymEntry(found));
+        var repMsg = "created " + st.attrib(rname);
+        hiLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    /*
+    The number of leading hash bits that select the bucket of a value, so
+    that there are at least as many buckets as values.
+    */
+    private proc bucketBits(size: int): int {
+      var bits = 0;
+      while (1 << bits) < size do bits += 1;
+      return bits;
+    }
+
+    /*
+    The bucket of a hash: its leading bits, mixed with the low word so that
+    values whose hash has a constant high word, such as bools, still spread
+    over the buckets.
+    */
+    private inline proc bucketOf(h: 2*uint(64), bits: int): int {
+      return if bits == 0 then 0 else ((h(0) ^ (h(1) * 0x9E3779B97F4A7C15)) >> (64 - bits)): int;
+    }
+
+    /*
+    For each query hash, the row of the first equal hash in its bucket, or -1.
+    The bucket bounds are gathered with aggregation. Each locale then sends
+    its queries, grouped by the locale holding the start of their bucket, in
+    one bulk transfer to that locale, which compares them with its own hashes
+    and sends the rows back in one bulk transfer. Only a bucket that spills
+    over into the next locale's block is read remotely.
+    */
+    proc probeHashIndex(hashes: [?qD] 2*uint(64), hashHi: [?iD] uint, hashLo: [] uint,
+                        rows: [] int, starts: [] int): [qD] int throws {
+      const bits = bucketBits(starts.size - 1);
+      var first, last: [qD] int;
+      forall (f, l, h) in zip(first, last, hashes) with (var agg = newSrcAggregator(int)) {
+        const b = bucketOf(h, bits);
+        agg.copy(f, starts[b]);
+        agg.copy(l, starts[b+1]);
+      }
+      var found: [qD] int = -1;
+      if iD.size == 0 {
+        return found;
+      }
+
+      const (blockLows, blockHighs, blockLocales) = localeBlocks(iD);
+      const nBlocks = blockLows.size;
+      // each locale's copies of its queries and their blocks, order and rows
+      overMemLimit(qD.size * 8 * numBytes(int));
+      coforall loc in Locales {
+        on loc {
+          const locLows = blockLows;
+          const locLocales = blockLocales;
+          const lD = qD.localSubdomain();
+          const n = lD.size;
+
+          // 1 + the block holding the start of each query's bucket, or 0 if the bucket is empty
+          var blocks: [0..#n] int;
+          forall (bl, i) in zip(blocks, lD) {
+            const f = first.localAccess[i];
+            if f < last.localAccess[i] {
+              var lo = 0, hi = nBlocks;
+              while lo < hi {
+                const mid = (lo + hi) / 2;
+                if locLows[mid] <= f then lo = mid + 1; else hi = mid;
+              }
+              bl = lo;
+            }
+          }
+
+          // group the queries by block with a counting sort
+          var counts: [0..nBlocks] int;
+          for bl in blocks {
+            counts[bl] += 1;
+          }
+          const groupStarts = (+ scan counts) - counts;
+          var fill = groupStarts;
+          var order: [0..#n] int;
+          for (bl, j) in zip(blocks, 0..) {
+            order[fill[bl]] = j;
+            fill[bl] += 1;
+          }
+          var grouped: [0..#n] (2*uint(64), int, int);
+          forall (g, j) in zip(grouped, order) {
+            const i = lD.low + j;
+            g = (hashes.localAccess[i], first.localAccess[i], last.localAccess[i]);
+          }
+
+          // compare each block's queries on the block's locale
+          var groupedFound: [0..#n] int = -1;
+          forall bl in 1..nBlocks {
+            const cnt = counts[bl];
+            if cnt > 0 {
+              const start = groupStarts[bl];
+              var blockFound: [0..#cnt] int;
+              on Locales[locLocales[bl-1]] {
+                const qs: [0..#cnt] (2*uint(64), int, int) = grouped[start..#cnt];
+                const sub = iD.localSubdomain();
+                var res: [0..#cnt] int = -1;
+                forall (r, (h, f, l)) in zip(res, qs) {
+                  for j in f..<l {
+                    const match = if sub.contains(j) then hashHi.localAccess[j] == h(0) && hashLo.localAccess[j] == h(1)
+                                                     else hashHi[j] == h(0) && hashLo[j] == h(1);
+                    if match {
+                      r = if sub.contains(j) then rows.localAccess[j] else rows[j];
+                      break;
+                    }
+                  }
+                }
+                blockFound = res;
+              }
+              groupedFound[start..#cnt] = blockFound;
+            }
+          }
+          forall (r, j) in zip(groupedFound, order) {
+            found.localAccess[lD.low + j] = r;
+          }
+        }
+      }
+      return found;
+    }
+
+    use CommandMap;
+    registerFunction("createHashIndex", createHashIndexMsg, getModuleName());
+    registerFunction("hashIndexLookup", hashIndexLookupMsg, getModuleName());
+}
@@ -0,0 +1,307 @@
+module JoinMsg
+{
+    use ServerConfig;
+
+    use Reflection;
+    use ServerErrors;
+    use Logging;
+    use Message;
+    use MultiTypeSymbolTable;
+    use MultiTypeSymEntry;
+    use ServerErrorStrings;
+    use CommAggregation;
+    use AryUtil;
+    use UniqueMsg;
+    use Map;
+
+    private config const logLevel = ServerConfig.logLevel;
+    private config const logChannel = ServerConfig.logChannel;
+    const jmLogger = new Logger(logLevel, logChannel);
+
+    /*
+    Maximum number of rows of the smaller side of a join for which merge
+    with method "auto" replicates that side to every locale instead of
+    grouping the keys of both sides
+    */
+    config const broadcastJoinMaxRows = 2**16;
+
+    /*
+    Maximum number of rows of the smaller side of a join that merge with
+    method "broadcast" replicates to every locale; with more, the keys of
+    both sides are grouped as with method "auto"
+    */
+    config const broadcastJoinLimitRows = 2**24;
+
+    /*
+    Join the rows of the left and right key arrays that have equal keys.
+
+    The keys of both sides are hashed. With method "broadcast", if the
+    smaller side has at most broadcastJoinLimitRows rows, or "auto", if it
+    has at most broadcastJoinMaxRows rows, the smaller side is replicated to
+    every locale and probed there, see broadcastMerge. Otherwise the keys of
+    both sides are grouped together with the same methods as GroupBy: "sort"
+    sorts the keys, "hash" groups them with hash tables and "auto" hashes
+    while there are few distinct keys, see mergeKeys.
+
+    :arg reqMsg: request containing (cmd,nleft,leftnames,lefttypes,nright,
+                 rightnames,righttypes,how,method) where how is "inner",
+                 "left", "right" or "outer" and method is "broadcast",
+                 "hash", "sort" or "auto"
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: MsgTuple containing a JSON list with the replies for the left
+              and the right row of each joined pair, -1 where a row of one
+              side has no match in the other
+    */
+    proc mergeMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        const nleft = msgArgs.get("nleft").getIntValue();
+        const nright = msgArgs.get("nright").getIntValue();
+        const leftnames = msgArgs.get("leftnames").getList(nleft);
+        const lefttypes = msgArgs.get("lefttypes").getList(nleft);
+        const rightnames = msgArgs.get("rightnames").getList(nright);
+        const righttypes = msgArgs.get("righttypes").getList(nright);
+        const how = msgArgs.getValueOf("how");
+        const method = msgArgs.getValueOf("method");
+        jmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "cmd: %s left: %t right: %t how: %s method: %s".format(
+                                       cmd,leftnames,rightnames,how,method));
+
+        if how != "inner" && how != "left" && how != "right" && how != "outer" {
+            var errorMsg = "Error: %s: unrecognized join type %s".format(pn, how);
+            jmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        if nleft != nright || nleft > 128 {
+            var errorMsg = "Error: %s: expected the same number of left and right keys, at most 128".format(pn);
+            jmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+
+        var (lsize, _, lnames, ltypes) = validateArraysSameLength(nleft, leftnames, lefttypes, st);
+        var (rsize, _, rnames, rtypes) = validateArraysSameLength(nright, rightnames, righttypes, st);
+        var leftKeys = makeDistArray(lsize, 2*uint(64));
+        if lsize > 0 then leftKeys = hashArrays(lsize, lnames, ltypes, st);
+        var rightKeys = makeDistArray(rsize, 2*uint(64));
+        if rsize > 0 then rightKeys = hashArrays(rsize, rnames, rtypes, st);
+
+        proc join() throws {
+            const smallSize = min(lsize, rsize);
+            if (method == "broadcast" && smallSize <= broadcastJoinLimitRows) ||
+               (method == "auto" && smallSize <= broadcastJoinMaxRows) {
+                const keepLeft = how == "left" || how == "outer";
+                const keepRight = how == "right" || how == "outer";
+                if rsize <= lsize {
+                    return broadcastMerge(leftKeys, rightKeys, keepLeft, keepRight);
+                }
+                const (rightRows, leftRows) = broadcastMerge(rightKeys, leftKeys, keepRight, keepLeft);
+                return (leftRows, rightRows);
+            }
+            var keys = makeDistArray(lsize + rsize, 2*uint(64));
+            keys[0..#lsize] = leftKeys;
+            keys[lsize..#rsize] = rightKeys;
+            if method == "broadcast" {
+                jmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                               "more than %i rows on both sides, grouping keys instead".format(broadcastJoinLimitRows));
+            }
+            return mergeKeys(keys, lsize, how, if method == "broadcast" then "auto" else method);
+        }
+        var (leftRows, rightRows) = join();
+
+        var lname = st.nextName();
+        st.addEntry(lname, new shared SymEntry(leftRows));
+        var rname = st.nextName();
+        st.addEntry(rname, new shared SymEntry(rightRows));
+        var repMsg = "%jt".format(["created " + st.attrib(lname), "created " + st.attrib(rname)]);
+        jmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    /*
+    Join the first nleft keys, which are the left rows, with the others,
+    which are the right rows. Returns the left and right row of each joined
+    pair, ordered by group.
+    */
+    proc mergeKeys(keys: [?kD] ?t, nleft: int, how: string, method: string) throws {
+      if kD.size == 0 {
+        return (makeDistArray(0, int), makeDistArray(0, int));
+      }
+      var (permutation, segments) = groupKeys(16, t, keys, false, method);
+      ref perm = permutation.a;
+      ref segs = segments.a;
+      const sD = segs.domain;
+
+      // the number of left rows before each position in grouped order
+      const isLeft = [p in perm] (p < nleft): int;
+      const leftBefore = (+ scan isLeft) - isLeft;
+      // the start, number of left rows and number of right rows of each group
+      var groups: [sD] 3*int;
+      forall (g, s, i) in zip(groups, segs, sD) with (var agg = newSrcAggregator(int)) {
+        g(0) = s;
+        agg.copy(g(1), leftBefore[s]);
+        if i < sD.high then agg.copy(g(2), leftBefore[segs[i+1]]);
+      }
+      forall (g, i) in zip(groups, sD) {
+        const (start, before, after) = g;
+        const end = if i < sD.high then segs[i+1] else kD.size;
+        const l = (if i < sD.high then after else nleft) - before;
+        g = (start, l, end - start - l);
+      }
+
+      // the number of pairs each group produces, a row without a match
+      // pairs with -1 if how keeps it
+      const counts = [(_, l, r) in groups] if l > 0 && r > 0 then l * r
+                                           else if l > 0 && (how == "left" || how == "outer") then l
+                                           else if r > 0 && (how == "right" || how == "outer") then r
+                                           else 0;
+      const ends = + scan counts;
+      const total = ends[sD.high];
+      // each pair takes its left and right rows, its group, a copy of the group
+      // for the scan and the group's start, sizes and end
+      overMemLimit(total * 8 * numBytes(int));
+      var leftRows = makeDistArray(total, int);
+      var rightRows = makeDistArray(total, int);
+      if total == 0 {
+        return (leftRows, rightRows);
+      }
+
+      // the group of each pair: mark the first pair of each group and
+      // spread it with a max scan, since the groups are in increasing order
+      var pairGroup = makeDistArray(total, int);
+      forall (c, e, i) in zip(counts, ends, sD) with (var agg = newDstAggregator(int)) {
+        if c > 0 then agg.copy(pairGroup[e - c], i);
+      }
+      pairGroup = max scan pairGroup;
+
+      var pairInfo = makeDistArray(total, (3*int, int));
+      forall (info, g) in zip(pairInfo, pairGroup) with (var groupAgg = newSrcAggregator(3*int),
+                                                         var endAgg = newSrcAggregator(int)) {
+        groupAgg.copy(info(0), groups[g]);
+        endAgg.copy(info(1), ends[g]);
+      }
+      // the positions of the pair's rows in grouped order
+      forall (lr, rr, info, o) in zip(leftRows, rightRows, pairInfo, pairInfo.domain) {
+        const ((start, l, r), end) = info;
+        const k = o - (end - (if l > 0 && r > 0 then l * r else l + r));
+        lr = if l == 0 then -1 else start + (if r == 0 then k else k / r);
+        rr = if r == 0 then -1 else start + l + (if l == 0 then k else k % r);
+      }
+      forall (lr, rr) in zip(leftRows, rightRows) with (var agg = newSrcAggregator(int)) {
+        if lr >= 0 then agg.copy(lr, perm[lr]);
+        if rr >= 0 then agg.copy(rr, perm[rr]);
+      }
+      forall rr in rightRows {
+        if rr >= 0 then rr -= nleft;
+      }
+      return (leftRows, rightRows);
+    }
+
+    /*
+    Join by replicating the keys of the small side to every locale as a hash
+    table and probing it with the keys of the big side, which are read once
+    where they are and never sorted or moved. Returns the big and the small
+    row of each joined pair, in the order of the big rows, followed by the
+    small rows without a match if keepSmall. Big rows without a match are
+    kept if keepBig. Missing rows are -1.
+    */
+    proc broadcastMerge(big: [?bD] ?t, small: [?sD] t, keepBig: bool, keepSmall: bool) throws {
+      // number the distinct small keys and list the small rows of each
+      const nSmall = sD.size;
+      // every locale holds the small keys, their table, and their groups and rows
+      overMemLimit(numLocales * nSmall * 8 * numBytes(int));
+      const smallKeys: [0..#nSmall] t = small;
+      var table = new map(t, int);
+      var smallGroup: [0..#nSmall] int;
+      for (k, g) in zip(smallKeys, smallGroup) {
+        if !table.contains(k) then table.add(k, table.size);
+        g = table[k];
+      }
+      const nGroups = table.size;
+      var groupCounts: [0..#nGroups] int;
+      for g in smallGroup {
+        groupCounts[g] += 1;
+      }
+      const groupStarts = (+ scan groupCounts) - groupCounts;
+      var groupRows: [0..#nSmall] int;
+      var fill = groupStarts;
+      for (g, i) in zip(smallGroup, 0..) {
+        groupRows[fill[g]] = i;
+        fill[g] += 1;
+      }
+
+      // probe with the big keys, counting the pairs of each big row
+      var bigGroup: [bD] int;
+      var bigCounts: [bD] int;
+      var matched: [0..#nGroups] atomic bool;
+      coforall loc in Locales {
+        on loc {
+          const locTable = table;
+          const locCounts = groupCounts;
+          var locMatched: [0..#nGroups] atomic bool;
+          forall i in bD.localSubdomain() {
+            const k = big.localAccess[i];
+            if locTable.contains(k) {
+              const g = locTable[k];
+              bigGroup.localAccess[i] = g;
+              bigCounts.localAccess[i] = locCounts[g];
+              locMatched[g].write(true);
+            } else {
+              bigGroup.localAccess[i] = -1;
+              bigCounts.localAccess[i] = if keepBig then 1 else 0;
+            }
+          }
+          if keepSmall {
+            for g in 0..#nGroups {
+              if locMatched[g].read() then matched[g].write(true);
+            }
+          }
+        }
+      }
+      const ends = + scan bigCounts;
+      const bigTotal = if bD.size == 0 then 0 else ends[bD.high];
+      var unmatched = 0;
+      if keepSmall {
+        unmatched = + reduce [g in 0..#nGroups] if matched[g].read() then 0 else groupCounts[g];
+      }
+
+      overMemLimit((bigTotal + unmatched) * 2 * numBytes(int));
+      var bigRows = makeDistArray(bigTotal + unmatched, int);
+      var smallRows = makeDistArray(bigTotal + unmatched, int);
+      coforall loc in Locales {
+        on loc {
+          const locStarts = groupStarts;
+          const locRows = groupRows;
+          forall i in bD.localSubdomain() with (var bigAgg = newDstAggregator(int),
+                                                var smallAgg = newDstAggregator(int)) {
+            const g = bigGroup.localAccess[i];
+            const n = bigCounts.localAccess[i];
+            const first = ends.localAccess[i] - n;
+            for j in 0..#n {
+              bigAgg.copy(bigRows[first + j], i);
+              smallAgg.copy(smallRows[first + j], if g >= 0 then locRows[locStarts[g] + j] else -1);
+            }
+          }
+        }
+      }
+      if unmatched > 0 {
+        var pos = bigTotal;
+        var bigAgg = newDstAggregator(int);
+        var smallAgg = newDstAggregator(int);
+        for g in 0..#nGroups {
+          if matched[g].read() then continue;
+          for j in groupStarts[g]..#groupCounts[g] {
+            bigAgg.copy(bigRows[pos], -1);
+            smallAgg.copy(smallRows[pos], groupRows[j]);
+            pos += 1;
+          }
+        }
+      }
+      return (bigRows, smallRows);
+    }
+
+    use CommandMap;
+    registerFunction("merge", mergeMsg, getModuleName());
+}
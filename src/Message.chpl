@@ -12,6 +12,12 @@ module Message {
     enum MsgFormat {STRING,BINARY}
     enum ObjectType {PDARRAY, SEGSTRING, LIST, DICT, VALUE, DATETIME, TIMEDELTA}
 
+    /*
+     * Marks message arguments, and LIST values within them, that are in the
+     * compact format instead of JSON. JSON cannot start with it.
+     */
+    const compactArgsMarker = "~";
+
     /*
      * Encapsulates the message string and message type.
      */
@@ -248,6 +254,9 @@ module Message {
                                     getModuleName(),
                                     "TypeError");
             }
+            if isCompact(this.val) {
+                return parseCompactFields(this.val, size);
+            }
             return jsonToPdArray(this.val, size);
         }
 
@@ -392,6 +401,9 @@ module Message {
     Parse arguments formatted as json string into objects
     */
     proc parseMessageArgs(json_str: string, size: int) throws {
+        if isCompact(json_str) {
+            return parseCompactArgs(json_str, size);
+        }
         var pArr = jsonToPdArray(json_str, size);
         var param_list = new list(ParameterObj, parSafe=true);
         forall j_str in pArr with (ref param_list) {
@@ -400,6 +412,55 @@ module Message {
         return new owned MessageArgs(param_list);
     }
 
+    /*
+    Returns true if the message arguments or LIST value are in the compact format
+    */
+    proc isCompact(s: string): bool {
+        return s.startsWith(compactArgsMarker);
+    }
+
+    /*
+    Parse arguments in the compact format into objects. After the marker, each
+    parameter is four fields, key, objType, dtype and val, where a field is its
+    length in bytes, a colon and the field itself. LIST values are the marker
+    followed by one field per element and DICT values are compact arguments, so
+    nothing needs unescaping or a nested JSON parse.
+    */
+    proc parseCompactArgs(args: string, size: int) throws {
+        const fields = parseCompactFields(args, 4*size);
+        var param_list = new list(ParameterObj, parSafe=true);
+        for i in 0..#size {
+            param_list.append(new ParameterObj(key=fields[4*i],
+                                               val=fields[4*i+3],
+                                               objType=fields[4*i+1]:ObjectType,
+                                               dtype=fields[4*i+2]));
+        }
+        return new owned MessageArgs(param_list);
+    }
+
+    /*
+    Split the length-prefixed fields following the compact format marker
+    */
+    proc parseCompactFields(compact: string, size: int) throws {
+        const b = compact.encode();
+        var fields: [0..#size] string;
+        var pos = compactArgsMarker.numBytes;
+        for field in fields {
+            const colon = b.find(b":", pos..<b.size);
+            if colon < 0 {
+                throw new owned ErrorWithContext("Incorrect compact format %s".format(compact),
+                                       getLineNumber(),
+                                       getRoutineName(),
+                                       getModuleName(),
+                                       "ValueError");
+            }
+            const len = b[pos..<colon].decode(): int;
+            field = b[colon+1..#len].decode();
+            pos = colon + 1 + len;
+        }
+        return fields;
+    }
+
     /*
      * Deserializes a JSON-formatted string to a RequestMsg object, where the
      * JSON format is as follows (size is only set for json args. Otherwise, -1):
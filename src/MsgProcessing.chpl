@@ -86,6 +86,27 @@ module MsgProcessing
         return new MsgTuple(repMsg, MsgType.NORMAL);
     }
 
+    /* 
+    Delete many entries from the symbol table in one request, skipping
+    registered entries and names that are not in the table
+
+    :arg reqMsg: request containing (cmd,size,names)
+    :type reqMsg: string 
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab 
+
+    :returns: MsgTuple
+    */
+    proc deleteManyMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const size = msgArgs.get("size").getIntValue();
+        const names = msgArgs.get("names").getList(size);
+        const deleted = st.deleteEntries(names);
+        var repMsg = "deleted %i of %i".format(deleted, size);
+        mpLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
     /* 
     Clear all unregistered symbols and associated data from sym table
     
@@ -230,6 +251,64 @@ module MsgProcessing
         }
     }
 
+    /*
+    Execute a batch of queued requests in the order they were submitted and
+    return all of the replies together. Processing stops at the first request
+    that errors; every subsequent request in the batch is answered with an
+    ERROR reply indicating it was skipped.
+
+    :arg reqMsg: request containing (cmd,size,requests) where requests is a
+                 list of JSON-formatted RequestMsg strings
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: MsgTuple containing a JSON list of serialized ReplyMsg strings
+    */
+    proc batchMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        import CommandMap;
+        const size = msgArgs.get("size").getIntValue();
+        const requests = msgArgs.get("requests").getList(size);
+        var replies: [0..#size] string;
+        var failed = false;
+
+        mpLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                                       "cmd: %s executing %i requests".format(cmd, size));
+
+        // requests must be executed serially because later ones may depend on earlier ones
+        for (request, reply) in zip(requests, replies) {
+            var msg = new RequestMsg();
+            deserialize(msg, request);
+            if failed {
+                reply = serialize(msg="%s skipped due to an earlier error in batch".format(msg.cmd),
+                                  msgType=MsgType.ERROR, msgFormat=MsgFormat.STRING, user=msg.user);
+                continue;
+            }
+            var repTuple: MsgTuple;
+            try {
+                var subArgs: owned MessageArgs;
+                if msg.size > 0 {
+                    subArgs = parseMessageArgs(msg.args, msg.size);
+                } else {
+                    subArgs = new owned MessageArgs();
+                }
+                repTuple = CommandMap.executeCommand(msg.cmd, subArgs, st);
+            } catch (e: ErrorWithMsg) {
+                repTuple = new MsgTuple(e.msg, MsgType.ERROR);
+            } catch (e: Error) {
+                var errorMsg = e.message();
+                repTuple = new MsgTuple(if errorMsg.isEmpty() then "unexpected error" else errorMsg,
+                                        MsgType.ERROR);
+            }
+            failed = repTuple.msgType == MsgType.ERROR;
+            reply = serialize(msg=repTuple.msg, msgType=repTuple.msgType,
+                              msgFormat=MsgFormat.STRING, user=msg.user);
+        }
+
+        return new MsgTuple("%jt".format(replies), MsgType.NORMAL);
+    }
+
     /* 
     Response to __str__ method in python str convert array data to string 
 
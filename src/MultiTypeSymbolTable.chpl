@@ -209,6 +209,29 @@ module MultiTypeSymbolTable
             }  
         }
 
+        /*
+        Deletes the unregistered entries among names. Names that are registered
+        or that are not in the table are skipped, so a client can queue deletes
+        without tracking what was already freed.
+
+        :arg names: names of the entries to delete
+        :type names: [] string
+
+        :returns: number of entries deleted
+        */
+        proc deleteEntries(names: [] string): int throws {
+            var deleted = 0;
+            for name in names {
+                if tab.contains(name) && !registry.contains(name) {
+                    tab.remove(name);
+                    deleted += 1;
+                }
+            }
+            mtLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                                   "Deleted %i of %i entries".format(deleted, names.size));
+            return deleted;
+        }
+
         /*
         Clears all unregistered entries from the symTable
         */
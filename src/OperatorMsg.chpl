@@ -1839,9 +1839,86 @@ module OperatorMsg
     }
 
     use CommandMap;
+    /*
+      Parse and respond to fusedEval message. Evaluates an arithmetic expression
+      over int64 and float64 pdarrays in a single pass, without materializing
+      the intermediate results of each operator.
+
+      :arg reqMsg: request containing (cmd,narrays,arrays,nprog,program) where
+                   program is the expression in reverse polish notation
+      :type reqMsg: string
+
+      :arg st: SymTab to act on
+      :type st: borrowed SymTab
+
+      :returns: (MsgTuple)
+      :throws: `UndefinedSymbolError(name)`
+    */
+    proc fusedEvalMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        const narrays = msgArgs.get("narrays").getIntValue();
+        const names = msgArgs.get("arrays").getList(narrays);
+        const nprog = msgArgs.get("nprog").getIntValue();
+        const program = msgArgs.get("program").getList(nprog);
+
+        use List;
+        var intArrs = new list(borrowed SymEntry(int));
+        var realArrs = new list(borrowed SymEntry(real));
+        var isRealArr: [0..#narrays] bool;
+        var idxMap: [0..#narrays] int;
+        var size = -1;
+        for (name, isReal, idx) in zip(names, isRealArr, idxMap) {
+            var gEnt: borrowed GenSymEntry = getGenericTypedArrayEntry(name, st);
+            if size == -1 {
+                size = gEnt.size;
+            } else if size != gEnt.size {
+                var errorMsg = "size mismatch in fused expression %i %i".format(size, gEnt.size);
+                omLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+            select gEnt.dtype {
+                when DType.Int64 {
+                    idx = intArrs.size;
+                    intArrs.append(toSymEntry(gEnt, int));
+                }
+                when DType.Float64 {
+                    isReal = true;
+                    idx = realArrs.size;
+                    realArrs.append(toSymEntry(gEnt, real));
+                }
+                otherwise {
+                    var errorMsg = notImplementedError(pn, gEnt.dtype);
+                    omLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                    return new MsgTuple(errorMsg, MsgType.ERROR);
+                }
+            }
+        }
+
+        var (tokens, depth) = parseFusedProgram(program, isRealArr);
+        // the evaluator indexes the int and real operand lists directly
+        for tok in tokens do
+            if tok.kind == FUSED_ARR then tok.idx = idxMap[tok.idx];
+
+        omLogger.debug(getModuleName(), getRoutineName(), getLineNumber(),
+             "cmd: %t program: %t arrays: %t".format(cmd, program, names));
+
+        var rname = st.nextName();
+        if tokens[tokens.domain.high].isReal {
+            var e = st.addEntry(rname, size, real);
+            fusedEval(e.a, tokens, depth, intArrs.toArray(), realArrs.toArray());
+        } else {
+            var e = st.addEntry(rname, size, int);
+            fusedEval(e.a, tokens, depth, intArrs.toArray(), realArrs.toArray());
+        }
+        var repMsg = "created %s".format(st.attrib(rname));
+        omLogger.debug(getModuleName(), getRoutineName(), getLineNumber(), repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
     registerFunction("binopvv", binopvvMsg, getModuleName());
     registerFunction("binopvs", binopvsMsg, getModuleName());
     registerFunction("binopsv", binopsvMsg, getModuleName());
     registerFunction("opeqvv", opeqvvMsg, getModuleName());
     registerFunction("opeqvs", opeqvsMsg, getModuleName());
+    registerFunction("fusedEval", fusedEvalMsg, getModuleName());
 }
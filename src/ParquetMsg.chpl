@@ -14,6 +14,7 @@ module ParquetMsg {
   use CommAggregation;
   use AryUtil;
   use Map;
+  use SymArrayDmap;
 
   use SegmentedString;
   use SegmentedArray;
@@ -114,7 +115,11 @@ module ParquetMsg {
     return (subdoms, (+ reduce lengths));
   }
 
-  proc readFilesByName(A: [] ?t, filenames: [] string, sizes: [] int, dsetname: string, ty) throws {
+  /*
+    Read the rows firstRows[i]..#sizes[i] of each file filenames[i] into
+    consecutive parts of A. A file may be listed more than once.
+  */
+  proc readFilesByName(A: [] ?t, filenames: [] string, sizes: [] int, firstRows: [] int, dsetname: string, ty) throws {
     extern proc c_readColumnByName(filename, chpl_arr, colNum, numElems, startIdx, batchSize, errMsg): int;
     var (subdoms, length) = getSubdomains(sizes);
     var fileOffsets = (+ scan sizes) - sizes;
@@ -123,16 +128,17 @@ module ParquetMsg {
       var locFiles = filenames;
       var locFiledoms = subdoms;
       var locOffsets = fileOffsets;
+      var locFirstRows = firstRows;
       
       try {
-        forall (off, filedom, filename) in zip(locOffsets, locFiledoms, locFiles) {
+        forall (off, first, filedom, filename) in zip(locOffsets, locFirstRows, locFiledoms, locFiles) {
           for locdom in A.localSubdomains() {
             const intersection = domain_intersection(locdom, filedom);
             
             if intersection.size > 0 {
               var pqErr = new parquetErrorMsg();
               if c_readColumnByName(filename.localize().c_str(), c_ptrTo(A[intersection.low]),
-                                    dsetname.localize().c_str(), intersection.size, intersection.low - off,
+                                    dsetname.localize().c_str(), intersection.size, intersection.low - off + first,
                                     batchSize,
                                     c_ptrTo(pqErr.errMsg)) == ARROWERROR {
                 pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
@@ -178,6 +184,51 @@ module ParquetMsg {
     }
   }
 
+  /*
+    Read the dictionary-encoded string column dsetname of each file as the
+    codes into the concatenated dictionaries of the row groups of all files,
+    and those dictionaries as null-terminated strings whose lengths are
+    stored in dictSizes. Null values have code -1. Each file is read by the
+    locale holding its first code.
+  */
+  proc readDictFilesByName(codes: [] int, dictSizes: [] int, dictBytes: [] uint(8), filenames: [] string,
+                           sizes: [] int, numEntries: [] int, numBytes: [] int, dsetname: string) throws {
+    extern proc c_readDictionaryColumnByName(filename, colname, chpl_codes, codeBase, chpl_dict_sizes,
+                                             chpl_dict_bytes, batchSize, errMsg): int;
+    var (subdoms, length) = getSubdomains(sizes);
+    var (entrydoms, _) = getSubdomains(numEntries);
+    var (bytedoms, _) = getSubdomains(numBytes);
+
+    coforall loc in codes.targetLocales() do on loc {
+      var locFiles = filenames;
+      var locFiledoms = subdoms;
+      var locEntrydoms = entrydoms;
+      var locBytedoms = bytedoms;
+
+      try {
+        forall (filedom, entrydom, bytedom, filename) in zip(locFiledoms, locEntrydoms, locBytedoms, locFiles) {
+          if filedom.size > 0 && codes.localSubdomain().contains(filedom.low) {
+            var pqErr = new parquetErrorMsg();
+            var col: [filedom] int;
+            var entries: [entrydom] int;
+            var bytes: [bytedom] uint(8);
+
+            if c_readDictionaryColumnByName(filename.localize().c_str(), dsetname.localize().c_str(),
+                                            c_ptrTo(col), entrydom.low, c_ptrTo(entries), c_ptrTo(bytes),
+                                            batchSize, c_ptrTo(pqErr.errMsg)) == ARROWERROR {
+              pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+            }
+            codes[filedom] = col;
+            dictSizes[entrydom] = entries;
+            dictBytes[bytedom] = bytes;
+          }
+        }
+      } catch e {
+        throw e;
+      }
+    }
+  }
+
   proc readListFilesByName(A: [] ?t, filenames: [] string, sizes: [] int, dsetname: string, ty) throws {
     extern proc c_readListColumnByName(filename, chpl_arr, colNum, numElems, startIdx, batchSize, errMsg): int;
     var (subdoms, length) = getSubdomains(sizes);
@@ -323,6 +374,26 @@ module ParquetMsg {
     return listSize;
   }
   
+  /*
+    The number of dictionary entries of the string column dsetname, summed
+    over the row groups of the file, and their number of bytes including
+    null terminators, or (false, 0, 0) if a row group of the column is not
+    fully dictionary encoded.
+  */
+  proc getDictColSize(filename: string, dsetname: string) throws {
+    extern proc c_getDictionaryColumnSize(filename, colname, chpl_sizes, errMsg): int;
+    var pqErr = new parquetErrorMsg();
+    var sizes: [0..1] int;
+
+    var isDict = c_getDictionaryColumnSize(filename.localize().c_str(),
+                                           dsetname.localize().c_str(),
+                                           c_ptrTo(sizes),
+                                           c_ptrTo(pqErr.errMsg));
+    if isDict == ARROWERROR then
+      pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+    return (isDict == 1, sizes[0], sizes[1]);
+  }
+
   proc getArrSize(filename: string) throws {
     extern proc c_getNumRows(chpl_str, errMsg): int;
     var pqErr = new parquetErrorMsg();
@@ -363,6 +434,81 @@ module ParquetMsg {
     return ArrowTypes.notimplemented;
   }
 
+  /*
+    The parts of the files to read under a conjunction of filters, each a
+    column, comparison operator and value: the row groups whose min/max
+    statistics do not rule out a row passing every filter, merged where
+    they are adjacent, or, if not byRowGroup, the whole of every file that
+    has such a row group. Rows of the parts that fail a filter are left for
+    the caller to drop.
+
+    Returns the file, first row and number of rows of each part, and the
+    number of rows read from each file.
+  */
+  proc selectRowGroups(filenames: [?fD] string, sizes: [fD] int, filterCols: [] string,
+                       filterOps: [] string, filterVals: [] string, byRowGroup: bool) throws {
+    extern proc c_getNumRowGroups(filename, errMsg): int;
+    extern proc c_getRowGroupNumRows(filename, chpl_rows, errMsg): c_int;
+    extern proc c_getRowGroupMatches(filename, colname, op, value, chpl_matches, errMsg): c_int;
+
+    var parts: [fD] list((int, int));
+    forall (fileParts, filename, size) in zip(parts, filenames, sizes) {
+      // files that could not be read have no rows
+      if size > 0 {
+        var pqErr = new parquetErrorMsg();
+        const numGroups = c_getNumRowGroups(filename.localize().c_str(), c_ptrTo(pqErr.errMsg));
+        if numGroups == ARROWERROR then
+          pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+        var groupRows: [0..#numGroups] int;
+        var matches: [0..#numGroups] bool = true;
+        if c_getRowGroupNumRows(filename.localize().c_str(), c_ptrTo(groupRows),
+                                c_ptrTo(pqErr.errMsg)) == ARROWERROR then
+          pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+        for (col, op, val) in zip(filterCols, filterOps, filterVals) {
+          if c_getRowGroupMatches(filename.localize().c_str(), col.localize().c_str(),
+                                  op.localize().c_str(), val.localize().c_str(),
+                                  c_ptrTo(matches), c_ptrTo(pqErr.errMsg)) == ARROWERROR then
+            pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+        }
+
+        if !byRowGroup {
+          if || reduce matches then fileParts.append((0, size));
+        } else {
+          var first = 0;
+          for (m, n) in zip(matches, groupRows) {
+            if m {
+              if !fileParts.isEmpty() && fileParts[fileParts.size-1](0) + fileParts[fileParts.size-1](1) == first then
+                fileParts[fileParts.size-1](1) += n;
+              else
+                fileParts.append((first, n));
+            }
+            first += n;
+          }
+        }
+      }
+    }
+
+    // an empty part of the first file is kept if no rows are selected, so
+    // that readers which look at a file for the details of a type have one
+    if fD.size > 0 && && reduce [fileParts in parts] fileParts.isEmpty() then
+      parts[fD.low].append((0, 0));
+    const numParts = + reduce [fileParts in parts] fileParts.size;
+    var partFiles: [0..#numParts] string;
+    var partFirstRows, partSizes: [0..#numParts] int;
+    var fileRows: [fD] int;
+    var j = 0;
+    for (filename, fileParts, rows) in zip(filenames, parts, fileRows) {
+      for (first, n) in fileParts {
+        (partFiles[j], partFirstRows[j], partSizes[j]) = (filename, first, n);
+        rows += n;
+        j += 1;
+      }
+    }
+    pqLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                   "filters select %i of %i rows".format(+ reduce partSizes, + reduce sizes));
+    return (partFiles, partFirstRows, partSizes, fileRows);
+  }
+
   proc getListData(filename: string, dsetname: string) throws {
     extern proc c_getListType(filename, dsetname, errMsg): c_int;
     var pqErr = new parquetErrorMsg();
@@ -412,9 +558,70 @@ module ParquetMsg {
     }
   }
 
-  proc writeDistArrayToParquet(A, filename, dsetname, dtype, rowGroupSize, compression, mode) throws {
+  /*
+    The options of a Parquet write of ncols columns besides the compression:
+    the number of rows of each row group, the size in bytes of each data
+    page (the Arrow default if 0), per column whether to dictionary encode
+    it and whether to write its min/max statistics, and the indices of the
+    numSorted columns the rows are sorted by, in order.
+  */
+  record parquetWriteOptions {
+    var ncols: int;
+    var rowGroupSize: int = ROWGROUPS;
+    var pageSize: int = 0;
+    var dictionary: [0..#ncols] int = 1;
+    var statistics: [0..#ncols] int = 1;
+    var sortedBy: [0..#ncols] int;
+    var numSorted: int = 0;
+  }
+
+  /*
+    Read the options of a Parquet write of the columns colNames from the
+    optional arguments row_group_size, data_page_size, dictionary and
+    statistics (lists of a bool per column) and sorted_by (a list of
+    num_sorted column names) of a request. Missing arguments keep the
+    defaults, so the row groups hold ROWGROUPS rows.
+  */
+  proc getWriteOptions(msgArgs: borrowed MessageArgs, colNames: [] string): parquetWriteOptions throws {
+    const ncols = colNames.size;
+    var opts = new parquetWriteOptions(ncols=ncols);
+    if msgArgs.contains("row_group_size") {
+      const rowGroupSize = msgArgs.get("row_group_size").getIntValue();
+      if rowGroupSize > 0 then opts.rowGroupSize = rowGroupSize;
+    }
+    if msgArgs.contains("data_page_size") then
+      opts.pageSize = max(msgArgs.get("data_page_size").getIntValue(), 0);
+    if msgArgs.contains("dictionary") {
+      const flags = msgArgs.get("dictionary").getList(ncols);
+      for (d, f) in zip(opts.dictionary, flags) do d = f.toLower(): bool: int;
+    }
+    if msgArgs.contains("statistics") {
+      const flags = msgArgs.get("statistics").getList(ncols);
+      for (d, f) in zip(opts.statistics, flags) do d = f.toLower(): bool: int;
+    }
+    if msgArgs.contains("sorted_by") {
+      const numSorted = msgArgs.get("num_sorted").getIntValue();
+      const names = msgArgs.get("sorted_by").getList(numSorted);
+      for name in names {
+        const (found, idx) = colNames.find(name);
+        if !found || opts.numSorted == ncols then
+          throw getErrorWithContext(
+                    msg="Cannot record that the rows are sorted by %s, which is not a column".format(name),
+                    lineNumber=getLineNumber(),
+                    routineName=getRoutineName(),
+                    moduleName=getModuleName(),
+                    errorClass='IllegalArgumentError');
+        opts.sortedBy[opts.numSorted] = idx - colNames.domain.low;
+        opts.numSorted += 1;
+      }
+    }
+    return opts;
+  }
+
+  proc writeDistArrayToParquet(A, filename, dsetname, dtype, opts: parquetWriteOptions, compression, mode) throws {
     extern proc c_writeColumnToParquet(filename, chpl_arr, colnum,
                                        dsetname, numelems, rowGroupSize,
+                                       pageSize, dictionary, statistics, sorted,
                                        dtype, compression, errMsg): int;
     extern proc c_appendColumnToParquet(filename, chpl_arr,
                                         dsetname, numelems,
@@ -462,7 +669,8 @@ module ParquetMsg {
         var locArr = A[locDom];
         if mode == TRUNCATE || !filesExist {
           if c_writeColumnToParquet(myFilename.localize().c_str(), c_ptrTo(locArr), 0,
-                                    dsetname.localize().c_str(), locDom.size, rowGroupSize,
+                                    dsetname.localize().c_str(), locDom.size, opts.rowGroupSize,
+                                    opts.pageSize, opts.dictionary[0], opts.statistics[0], opts.numSorted,
                                     dtypeRep, compression, c_ptrTo(pqErr.errMsg)) == ARROWERROR {
             pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
           }
@@ -491,7 +699,8 @@ module ParquetMsg {
   // TODO: do we want to add offset writing for Parquet string writes?
   //       if we do, then we need to add the load offsets functionality
   //       in the string reading function
-  proc write1DDistStringsAggregators(filename: string, mode: int, dsetName: string, entry: SegStringSymEntry, compression: int) throws {
+  proc write1DDistStringsAggregators(filename: string, mode: int, dsetName: string, entry: SegStringSymEntry, compression: int,
+                                     opts: parquetWriteOptions) throws {
     var segString = new SegString("", entry);
     ref ss = segString;
     var A = ss.offsets.a;
@@ -570,15 +779,16 @@ module ParquetMsg {
           else
             locOffsets[locOffsets.domain.high] = A[locDom.high+1];
           
-          writeStringsComponentToParquet(myFilename, dsetName, localVals, locOffsets, ROWGROUPS, compression, mode, filesExist);
+          writeStringsComponentToParquet(myFilename, dsetName, localVals, locOffsets, opts, compression, mode, filesExist);
         }
       }
     return filesExist && mode == TRUNCATE;
   }
 
-  private proc writeStringsComponentToParquet(filename, dsetname, values: [] uint(8), offsets: [] int, rowGroupSize, compression, mode, filesExist) throws {
+  private proc writeStringsComponentToParquet(filename, dsetname, values: [] uint(8), offsets: [] int, opts: parquetWriteOptions, compression, mode, filesExist) throws {
     extern proc c_writeStrColumnToParquet(filename, chpl_arr, chpl_offsets,
                                           dsetname, numelems, rowGroupSize,
+                                          pageSize, dictionary, statistics, sorted,
                                           dtype, compression, errMsg): int;
     extern proc c_appendColumnToParquet(filename, chpl_arr,
                                         dsetname, numelems,
@@ -588,7 +798,8 @@ module ParquetMsg {
     var dtypeRep = ARROWSTRING;
     if mode == TRUNCATE || !filesExist {
       if c_writeStrColumnToParquet(filename.localize().c_str(), c_ptrTo(values), c_ptrTo(offsets),
-                                   dsetname.localize().c_str(), offsets.size-1, rowGroupSize,
+                                   dsetname.localize().c_str(), offsets.size-1, opts.rowGroupSize,
+                                   opts.pageSize, opts.dictionary[0], opts.statistics[0], opts.numSorted,
                                    dtypeRep, compression, c_ptrTo(pqErr.errMsg)) == ARROWERROR {
         pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
       }
@@ -635,8 +846,9 @@ module ParquetMsg {
     return filesExist;
   }
 
-  proc write1DDistArrayParquet(filename: string, dsetname, dtype, compression, mode, A) throws {
-    return writeDistArrayToParquet(A, filename, dsetname, dtype, ROWGROUPS, compression, mode);
+  proc write1DDistArrayParquet(filename: string, dsetname, dtype, compression, mode, A,
+                               opts: parquetWriteOptions) throws {
+    return writeDistArrayToParquet(A, filename, dsetname, dtype, opts, compression, mode);
   }
 
   proc parseListDataset(filenames: [] string, dsetname: string, len: int, sizes: [] int, st: borrowed SymTab) throws {
@@ -758,7 +970,6 @@ module ParquetMsg {
     var fileErrorMsg:string = "";
     var sizes: [filedom] int;
     var types: [dsetdom] ArrowTypes;
-    var byteSizes: [filedom] int;
 
     var rnames: list((string, string, string)); // tuple (dsetName, item type, id)
     
@@ -785,47 +996,114 @@ module ParquetMsg {
               fileErrorCount += 1;
             }
         }
-        var len = + reduce sizes;
+    }
+
+    // Without filters every file is read whole. With filters, only the
+    // row groups that may hold matching rows are read, or, since strings
+    // and lists are only read by whole file, the files holding any such
+    // row group; the client drops the remaining rows that do not match.
+    var partdom = filedom;
+    var partFiles: [partdom] string = filenames;
+    var partFirstRows: [partdom] int;
+    var partSizes: [partdom] int = sizes;
+    var fileRows: [filedom] int = sizes;
+    var nfilters = if msgArgs.contains("filter_size") then msgArgs.get("filter_size").getIntValue() else 0;
+    const schemaOnly = msgArgs.contains("schema_only") && msgArgs.get("schema_only").getBoolValue();
+    if schemaOnly {
+        // no rows are read, only the types of the datasets, from the first file
+        partdom = {filedom.low..filedom.low};
+        partSizes = 0;
+        fileRows = 0;
+    } else if nfilters > 0 {
+        var filterCols = msgArgs.get("filter_columns").getList(nfilters);
+        var filterOps = msgArgs.get("filter_ops").getList(nfilters);
+        var filterVals = msgArgs.get("filter_values").getList(nfilters);
+        const byRowGroup = && reduce [ty in types] (ty != ArrowTypes.stringArr && ty != ArrowTypes.list);
+        if !byRowGroup then
+          pqLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                         "strings or lists are read, so filters select whole files");
+        var (selFiles, selFirstRows, selSizes, selFileRows) = selectRowGroups(filenames, sizes, filterCols,
+                                                                              filterOps, filterVals, byRowGroup);
+        partdom = selFiles.domain;
+        partFiles = selFiles;
+        partFirstRows = selFirstRows;
+        partSizes = selSizes;
+        fileRows = selFileRows;
+    }
+
+    // string columns to read as their dictionary and codes where possible
+    var dictDsets: list(string);
+    if msgArgs.contains("dictionary_size") {
+        var ndicts = msgArgs.get("dictionary_size").getIntValue();
+        for dname in msgArgs.get("dictionaries").getList(ndicts) do dictDsets.append(dname);
+    }
+
+    for (dsetidx, dsetname) in zip(dsetdom, dsetnames) do {
+        var len = + reduce partSizes;
         var ty = types[dsetidx];
 
         // Only integer is implemented for now, do nothing if the Parquet
         // file has a different type
         if ty == ArrowTypes.int64 || ty == ArrowTypes.int32 {
           var entryVal = new shared SymEntry(len, int);
-          readFilesByName(entryVal.a, filenames, sizes, dsetname, ty);
+          readFilesByName(entryVal.a, partFiles, partSizes, partFirstRows, dsetname, ty);
           var valName = st.nextName();
           st.addEntry(valName, entryVal);
           rnames.append((dsetname, "pdarray", valName));
         } else if ty == ArrowTypes.uint64 || ty == ArrowTypes.uint32 {
           var entryVal = new shared SymEntry(len, uint);
-          readFilesByName(entryVal.a, filenames, sizes, dsetname, ty);
+          readFilesByName(entryVal.a, partFiles, partSizes, partFirstRows, dsetname, ty);
           var valName = st.nextName();
           st.addEntry(valName, entryVal);
           rnames.append((dsetname, "pdarray", valName));
         } else if ty == ArrowTypes.boolean {
           var entryVal = new shared SymEntry(len, bool);
-          readFilesByName(entryVal.a, filenames, sizes, dsetname, ty);
+          readFilesByName(entryVal.a, partFiles, partSizes, partFirstRows, dsetname, ty);
           var valName = st.nextName();
           st.addEntry(valName, entryVal);
           rnames.append((dsetname, "pdarray", valName));
         } else if ty == ArrowTypes.stringArr {
-          var entrySeg = new shared SymEntry(len, int);
-          byteSizes = calcStrSizesAndOffset(entrySeg.a, filenames, sizes, dsetname);
-          entrySeg.a = (+ scan entrySeg.a) - entrySeg.a;
-          
-          var entryVal = new shared SymEntry((+ reduce byteSizes), uint(8));
-          readStrFilesByName(entryVal.a, filenames, byteSizes, dsetname, ty);
-          
-          var stringsEntry = assembleSegStringFromParts(entrySeg, entryVal, st);
-          rnames.append((dsetname, "seg_string", "%s+%t".format(stringsEntry.name, stringsEntry.nBytes)));
+          // a column is read as its dictionary only if every file stores it
+          // fully dictionary encoded, and as Strings otherwise
+          var isDict: [partdom] bool = dictDsets.contains(dsetname);
+          var numEntries, numBytes: [partdom] int;
+          if dictDsets.contains(dsetname) {
+            forall (fname, size, d, n, nb) in zip(partFiles, partSizes, isDict, numEntries, numBytes) {
+              if size > 0 then (d, n, nb) = getDictColSize(fname, dsetname);
+            }
+          }
+
+          if && reduce isDict {
+            var entryCodes = new shared SymEntry(len, int);
+            var entrySeg = new shared SymEntry(+ reduce numEntries, int);
+            var entryVal = new shared SymEntry(+ reduce numBytes, uint(8));
+            readDictFilesByName(entryCodes.a, entrySeg.a, entryVal.a, partFiles, partSizes,
+                                numEntries, numBytes, dsetname);
+            entrySeg.a = (+ scan entrySeg.a) - entrySeg.a;
+
+            var dictEntry = assembleSegStringFromParts(entrySeg, entryVal, st);
+            var codesName = st.nextName();
+            st.addEntry(codesName, entryCodes);
+            rnames.append((dsetname, "dictionary", "%s+%s+%t".format(codesName, dictEntry.name, dictEntry.nBytes)));
+          } else {
+            var entrySeg = new shared SymEntry(len, int);
+            var byteSizes = calcStrSizesAndOffset(entrySeg.a, partFiles, partSizes, dsetname);
+            entrySeg.a = (+ scan entrySeg.a) - entrySeg.a;
+            
+            var entryVal = new shared SymEntry((+ reduce byteSizes), uint(8));
+            readStrFilesByName(entryVal.a, partFiles, byteSizes, dsetname, ty);
+            
+            var stringsEntry = assembleSegStringFromParts(entrySeg, entryVal, st);
+            rnames.append((dsetname, "seg_string", "%s+%t".format(stringsEntry.name, stringsEntry.nBytes)));
+          }
         } else if ty == ArrowTypes.double || ty == ArrowTypes.float {
           var entryVal = new shared SymEntry(len, real);
-          readFilesByName(entryVal.a, filenames, sizes, dsetname, ty);
+          readFilesByName(entryVal.a, partFiles, partSizes, partFirstRows, dsetname, ty);
           var valName = st.nextName();
           st.addEntry(valName, entryVal);
           rnames.append((dsetname, "pdarray", valName));
         } else if ty == ArrowTypes.list {
-          var create_str: string = parseListDataset(filenames, dsetname, len, sizes, st);
+          var create_str: string = parseListDataset(partFiles, dsetname, len, partSizes, st);
           rnames.append((dsetname, "seg_array", create_str));
         } else {
           var errorMsg = "DType %s not supported for Parquet reading".format(ty);
@@ -835,6 +1113,9 @@ module ParquetMsg {
     }
 
     repMsg = _buildReadAllMsgJson(rnames, false, 0, fileErrors, st);
+    // the number of rows read from each file, in order, which tells the
+    // client the file each row came from
+    repMsg = repMsg[0..<repMsg.size-1] + ',"file_rows":%jt}'.format(fileRows);
     pqLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
     return new MsgTuple(repMsg,MsgType.NORMAL);
   }
@@ -879,24 +1160,25 @@ module ParquetMsg {
     var warnFlag: bool;
 
     try {
+      const opts = getWriteOptions(msgArgs, [dsetname]);
       select entryDtype {
           when DType.Int64 {
             var e = toSymEntry(toGenSymEntry(entry), int);
-            warnFlag = write1DDistArrayParquet(filename, dsetname, dataType, compression:int, mode, e.a);
+            warnFlag = write1DDistArrayParquet(filename, dsetname, dataType, compression:int, mode, e.a, opts);
           }
           when DType.UInt64 {
             var e = toSymEntry(toGenSymEntry(entry), uint);
-            warnFlag = write1DDistArrayParquet(filename, dsetname, dataType, compression:int, mode, e.a);
+            warnFlag = write1DDistArrayParquet(filename, dsetname, dataType, compression:int, mode, e.a, opts);
           }
           when DType.Bool {
             var e = toSymEntry(toGenSymEntry(entry), bool);
-            warnFlag = write1DDistArrayParquet(filename, dsetname, dataType, compression:int, mode, e.a);
+            warnFlag = write1DDistArrayParquet(filename, dsetname, dataType, compression:int, mode, e.a, opts);
           } when DType.Float64 {
             var e = toSymEntry(toGenSymEntry(entry), real);
-            warnFlag = write1DDistArrayParquet(filename, dsetname, dataType, compression:int, mode, e.a);
+            warnFlag = write1DDistArrayParquet(filename, dsetname, dataType, compression:int, mode, e.a, opts);
           } when DType.Strings {
             var segString:SegStringSymEntry = toSegStringSymEntry(entry);
-            warnFlag = write1DDistStringsAggregators(filename, mode, dsetname, segString, compression:int);
+            warnFlag = write1DDistStringsAggregators(filename, mode, dsetname, segString, compression:int, opts);
           } otherwise {
             var errorMsg = "Writing Parquet files is only supported for int arrays";
             pqLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
@@ -930,12 +1212,95 @@ module ParquetMsg {
     }
   }
 
+  /*
+    Write the codes of a Categorical as a dictionary-encoded string column,
+    whose dictionary is its categories. Each locale writes its codes with a
+    local copy of the categories, so no strings are built for the values.
+    Codes equal to the code of the N/A category are written as nulls.
+  */
+  proc writeCategoricalParquet(filename: string, dsetname: string, codes: [] int,
+                               categories: SegString, naCode: int, compression: int,
+                               opts: parquetWriteOptions): bool throws {
+    extern proc c_writeDictionaryColumnToParquet(filename, chpl_codes, numelems, chpl_categories,
+                                                 chpl_offsets, numCategories, numBytes, naCode,
+                                                 dsetname, rowGroupSize, pageSize, statistics,
+                                                 sorted, compression, errMsg): int;
+    var (prefix, extension) = getFileMetadata(filename);
+    var filenames = generateFilenames(prefix, extension, codes.targetLocales().size);
+    var matchingFilenames = getMatchingFilenames(prefix, extension);
+    var filesExist = processParquetFilenames(filenames, matchingFilenames, TRUNCATE);
+
+    coforall (loc, idx) in zip(codes.targetLocales(), filenames.domain) do on loc {
+      var pqErr = new parquetErrorMsg();
+      const fname = filenames[idx];
+      const locDom = codes.localSubdomain();
+      var locCodes: [0..#locDom.size] int = codes[locDom];
+      var locOffsets: [0..#categories.size] int = categories.offsets.a;
+      var locValues: [0..#categories.nBytes] uint(8) = categories.values.a;
+
+      if c_writeDictionaryColumnToParquet(fname.localize().c_str(), c_ptrTo(locCodes), locDom.size,
+                                          c_ptrTo(locValues), c_ptrTo(locOffsets), categories.size,
+                                          categories.nBytes, naCode, dsetname.localize().c_str(),
+                                          opts.rowGroupSize, opts.pageSize, opts.statistics[0],
+                                          opts.numSorted, compression, c_ptrTo(pqErr.errMsg)) == ARROWERROR {
+        pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+      }
+    }
+    return filesExist;
+  }
+
+  /*
+    Write a Categorical to Parquet files, one per locale.
+
+    :arg reqMsg: request containing (cmd,codes,categories,nacode,dset,prefix,
+                 compression) where categories is the name of a Strings,
+                 and optionally the options read by getWriteOptions
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: MsgTuple, a warning if existing files were overwritten
+  */
+  proc categoricalToParquetMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+    var filename: string = msgArgs.getValueOf("prefix");
+    var dsetname = msgArgs.getValueOf("dset");
+    var codes = toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("codes"), st), int);
+    var categories = getSegString(msgArgs.getValueOf("categories"), st);
+    var naCode = msgArgs.get("nacode").getIntValue();
+    var compression = msgArgs.getValueOf("compression").toUpper(): CompressionType;
+
+    var warnFlag: bool;
+    try {
+      const opts = getWriteOptions(msgArgs, [dsetname]);
+      warnFlag = writeCategoricalParquet(filename, dsetname, codes.a, categories, naCode, compression:int, opts);
+    } catch e: FileNotFoundError {
+      var errorMsg = "Unable to open %s for writing: %s".format(filename,e.message());
+      pqLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+      return new MsgTuple(errorMsg, MsgType.ERROR);
+    } catch e: Error {
+      var errorMsg = "problem writing to file %s".format(e.message());
+      pqLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+      return new MsgTuple(errorMsg, MsgType.ERROR);
+    }
+    if warnFlag {
+      var warnMsg = "Warning: possibly overwriting existing files matching filename pattern";
+      return new MsgTuple(warnMsg, MsgType.WARNING);
+    } else {
+      var repMsg = "wrote categorical to file";
+      pqLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+      return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+  }
+
   proc writeMultiColParquet(filename: string, col_names: [] string, 
                               ncols: int, sym_names: [] string, targetLocales: [] locale, 
-                              compression: int, st: borrowed SymTab): bool throws {
+                              compression: int, st: borrowed SymTab,
+                              opts: parquetWriteOptions): bool throws {
 
     extern proc c_writeMultiColToParquet(filename, column_names, ptr_arr,
-                                      datatypes, colnum, numelems, rowGroupSize, compression, errMsg): int;
+                                      datatypes, colnum, numelems, rowGroupSize, pageSize,
+                                      dictionary, statistics, sortedBy, numSorted, compression, errMsg): int;
 
     var prefix: string;
     var extension: string;
@@ -1075,7 +1440,13 @@ module ParquetMsg {
               errorClass='WriteModeError'
         );
       }
-      var result: int = c_writeMultiColToParquet(fname.localize().c_str(), c_ptrTo(c_names), c_ptrTo(ptrList), c_ptrTo(datatypes), ncols, numelems, ROWGROUPS, compression, c_ptrTo(pqErr.errMsg));
+      var locOpts = opts;
+      var result: int = c_writeMultiColToParquet(fname.localize().c_str(), c_ptrTo(c_names), c_ptrTo(ptrList), c_ptrTo(datatypes), ncols, numelems,
+                                                 locOpts.rowGroupSize, locOpts.pageSize, c_ptrTo(locOpts.dictionary), c_ptrTo(locOpts.statistics),
+                                                 c_ptrTo(locOpts.sortedBy), locOpts.numSorted, compression, c_ptrTo(pqErr.errMsg));
+      if result == ARROWERROR {
+        pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+      }
     }
     return filesExist;
   }
@@ -1145,7 +1516,8 @@ module ParquetMsg {
 
     var warnFlag: bool;
     try {
-      warnFlag = writeMultiColParquet(filename, col_names, ncols, sym_names, targetLocales, compression:int, st);
+      const opts = getWriteOptions(msgArgs, col_names);
+      warnFlag = writeMultiColParquet(filename, col_names, ncols, sym_names, targetLocales, compression:int, st, opts);
     } catch e: FileNotFoundError {
       var errorMsg = "Unable to open %s for writing: %s".format(filename,e.message());
       pqLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
@@ -1170,6 +1542,182 @@ module ParquetMsg {
     }
   }
 
+  /*
+    Write the rows lo..#n of the columns sym_names to the Parquet file
+    filename from the locale this is called on, after copying them there.
+  */
+  proc writeRowsToParquet(filename: string, col_names: [] string, sym_names: [] string,
+                          lo: int, n: int, st: borrowed SymTab, opts: parquetWriteOptions,
+                          compression: int) throws {
+    extern proc c_writeMultiColToParquet(filename, column_names, ptr_arr,
+                                      datatypes, colnum, numelems, rowGroupSize, pageSize,
+                                      dictionary, statistics, sortedBy, numSorted, compression, errMsg): int;
+
+    const ncols = sym_names.size;
+    var pqErr = new parquetErrorMsg();
+    var my_column_names: [0..#ncols] string = col_names;
+    var my_sym_names: [0..#ncols] string = sym_names;
+    var c_names: [0..#ncols] c_string;
+    var ptrList: [0..#ncols] c_void_ptr;
+    var datatypes: [0..#ncols] int;
+
+    // the bytes of the rows of each Strings column, null terminators included
+    var byteRanges: [0..#ncols] range;
+    var isStr: [0..#ncols] bool;
+    for (r, s, column) in zip(byteRanges, isStr, my_sym_names) {
+      var entry = st.lookup(column);
+      if entry.isAssignableTo(SymbolEntryType.SegStringSymEntry) {
+        var segStr = new SegString("", toSegStringSymEntry(entry));
+        const last = if lo + n < segStr.size then segStr.offsets.a[lo + n] else segStr.values.size;
+        r = segStr.offsets.a[lo]..<last;
+        s = true;
+      }
+    }
+    const byteSizes = [r in byteRanges] r.size;
+    const byteStarts = (+ scan byteSizes) - byteSizes;
+    var strVals: [0..#(+ reduce byteSizes)] uint(8);
+    // the rows of the other columns, 8 bytes per value at most, one row of
+    // numVals for each of them in column order
+    const isNum = [s in isStr] if s then 0 else 1;
+    const numRow = (+ scan isNum) - 1;
+    var numVals: [0..#(+ reduce isNum), 0..#n] int;
+
+    proc copyRows(const ref A: [] ?t, i: int) {
+      const dst = c_ptrTo(numVals[numRow[i], 0]): c_ptr(t);
+      forall j in 0..#n with (var agg = newSrcAggregator(t)) do
+        agg.copy(dst[j], A[lo + j]);
+      ptrList[i] = dst: c_void_ptr;
+    }
+
+    for i in 0..#ncols {
+      c_names[i] = my_column_names[i].localize().c_str();
+      var entry = st.lookup(my_sym_names[i]);
+      if entry.isAssignableTo(SymbolEntryType.SegStringSymEntry) {
+        var segStr = new SegString("", toSegStringSymEntry(entry));
+        strVals[byteStarts[i]..#byteSizes[i]] = segStr.values.a[byteRanges[i]];
+        ptrList[i] = c_ptrTo(strVals[byteStarts[i]]): c_void_ptr;
+        datatypes[i] = ARROWSTRING;
+        continue;
+      }
+      const entryDtype = if entry.isAssignableTo(SymbolEntryType.TypedArraySymEntry)
+                           then (entry: borrowed GenSymEntry).dtype else DType.UNDEF;
+      select entryDtype {
+        when DType.Int64 {
+          copyRows(toSymEntry(toGenSymEntry(entry), int).a, i);
+          datatypes[i] = ARROWINT64;
+        } when DType.UInt64 {
+          copyRows(toSymEntry(toGenSymEntry(entry), uint).a, i);
+          datatypes[i] = ARROWUINT64;
+        } when DType.Bool {
+          copyRows(toSymEntry(toGenSymEntry(entry), bool).a, i);
+          datatypes[i] = ARROWBOOLEAN;
+        } when DType.Float64 {
+          copyRows(toSymEntry(toGenSymEntry(entry), real).a, i);
+          datatypes[i] = ARROWDOUBLE;
+        } otherwise {
+          throw getErrorWithContext(
+                            msg="Writing Parquet files (multi-column) does not support columns of type %s".format(entryDtype),
+                            lineNumber=getLineNumber(),
+                            routineName=getRoutineName(),
+                            moduleName=getModuleName(),
+                            errorClass='DataTypeError'
+          );
+        }
+      }
+    }
+
+    var locOpts = opts;
+    if c_writeMultiColToParquet(filename.localize().c_str(), c_ptrTo(c_names), c_ptrTo(ptrList), c_ptrTo(datatypes), ncols, n,
+                                locOpts.rowGroupSize, locOpts.pageSize, c_ptrTo(locOpts.dictionary), c_ptrTo(locOpts.statistics),
+                                c_ptrTo(locOpts.sortedBy), locOpts.numSorted, compression, c_ptrTo(pqErr.errMsg)) == ARROWERROR {
+      pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+    }
+  }
+
+  /*
+    Write columns to a dataset partitioned into key=value directories. The
+    client groups the rows by partition, so that the rows of partition p are
+    segments[p]..<segments[p+1]. Each locale writes the rows of partition p
+    that it holds to "{path}/{partitions[p]}/{prefix}_LOCALE{id}.parquet", so
+    no partition is gathered onto one locale. The locales write in parallel,
+    each writing its pieces of the partitions one after the other, so that it
+    only holds a copy of one piece at a time.
+
+    In truncate mode, the other files of the partitions written are removed
+    once every partition has been written, so a failed write leaves the old
+    files in place instead of losing the partition.
+  */
+  proc toParquetPartitionedMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+    const root: string = msgArgs.getValueOf("path");
+    const ncols = msgArgs.get("num_cols").getIntValue();
+    var col_names: [0..#ncols] string = msgArgs.get("col_names").getList(ncols);
+    var sym_names: [0..#ncols] string = msgArgs.get("columns").getList(ncols);
+    const nparts = msgArgs.get("num_partitions").getIntValue();
+    var dirs: [0..#nparts] string = msgArgs.get("partitions").getList(nparts);
+    const numRows = msgArgs.get("num_rows").getIntValue();
+    const prefix: string = msgArgs.getValueOf("prefix");
+    const truncate = msgArgs.getValueOf("mode").toLower() == "truncate";
+    var compression = msgArgs.getValueOf("compression").toUpper(): CompressionType;
+    const segEntry = toSymEntry(toGenSymEntry(st.lookup(msgArgs.getValueOf("segments"))), int);
+    const segments: [0..#nparts] int = segEntry.a;
+
+    var oldFiles: list(string);
+    var filePrefixes: [0..#nparts] string;
+    try {
+      const opts = getWriteOptions(msgArgs, col_names);
+      // each locale copies the rows it holds, 8 bytes per value at most
+      var nbytes = 0;
+      for column in sym_names {
+        var entry = st.lookup(column);
+        if entry.isAssignableTo(SymbolEntryType.SegStringSymEntry) {
+          var segStr = new SegString("", toSegStringSymEntry(entry));
+          nbytes += segStr.values.size;
+        } else {
+          nbytes += numRows * 8;
+        }
+      }
+      overMemLimit(nbytes);
+
+      // the files to remove are listed before the new files are written
+      if truncate then oldFiles = partitionFiles(root, dirs, "");
+      else checkPartitionDirs(dirs);
+      for (dir, filePrefix) in zip(dirs, filePrefixes) {
+        const path = root + "/" + dir;
+        if !exists(path) then mkdir(path, parents=true);
+        filePrefix = "%s/%s".format(path, prefix);
+      }
+
+      const rowDom = makeDistDom(numRows);
+      coforall loc in Locales do on loc {
+        const myRows = rowDom.localSubdomain();
+        const mySegments = segments;
+        const myPrefixes = filePrefixes;
+        for p in 0..#nparts {
+          const end = if p < nparts-1 then mySegments[p+1] else numRows;
+          const lo = max(mySegments[p], myRows.low);
+          const hi = min(end, myRows.high + 1);
+          if lo < hi {
+            writeRowsToParquet(generateFilename(myPrefixes[p], ".parquet", here.id), col_names,
+                               sym_names, lo, hi - lo, st, opts, compression:int);
+          }
+        }
+      }
+    } catch e: Error {
+      // the old files are kept, and the new files that were written are removed
+      for filePrefix in filePrefixes do
+        if !filePrefix.isEmpty() then
+          for f in glob(filePrefix + "_LOCALE*.parquet") do remove(f);
+      var errorMsg = "problem writing partitions to %s: %s".format(root, e.message());
+      pqLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+      return new MsgTuple(errorMsg, MsgType.ERROR);
+    }
+
+    for f in oldFiles do remove(f);
+    var repMsg = "wrote %i partitions to %s".format(nparts, root);
+    pqLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+    return new MsgTuple(repMsg, MsgType.NORMAL);
+  }
+
   proc lspqMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
     // reqMsg: "lshdf [<json_filename>]"
     var repMsg: string;
@@ -1340,7 +1888,9 @@ module ParquetMsg {
   use CommandMap;
   registerFunction("readAllParquet", readAllParquetMsg, getModuleName());
   registerFunction("toParquet_multi", toParquetMultiColMsg, getModuleName());
+  registerFunction("toParquetPartitioned", toParquetPartitionedMsg, getModuleName());
   registerFunction("writeParquet", toparquetMsg, getModuleName());
+  registerFunction("writeCategoricalParquet", categoricalToParquetMsg, getModuleName());
   registerFunction("lspq", lspqMsg, getModuleName());
   registerFunction("getnullparquet", nullIndicesMsg, getModuleName());
   ServerConfig.appendToConfigStr("ARROW_VERSION", getVersionInfo());
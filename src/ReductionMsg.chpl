@@ -14,10 +14,13 @@ module ReductionMsg
     use ServerErrors;
     use Logging;
     use Message;
+    use Map;
+    use List;
 
     use AryUtil;
     use PrivateDist;
     use RadixSortLSD;
+    use Sort only;
 
     private config const lBins = 2**25 * numLocales;
 
@@ -595,6 +598,278 @@ module ReductionMsg
        return new MsgTuple(repMsg, MsgType.NORMAL);
     }
 
+
+    /*
+    Compute several segmented reductions, of one or more values arrays, in a
+    single request. Each values array is gathered into grouped order once,
+    however many reductions use it, instead of once per reduction.
+
+    :arg reqMsg: request containing (cmd,nreductions,values,ops,permute,permutation,
+                 segments,skip_nan,ddof) where values and ops hold the values
+                 array and operator of each reduction
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: MsgTuple containing a JSON list with the reply of each reduction,
+              as returned by segmentedReductionMsg
+    */
+    proc multiSegmentedReductionMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const n = msgArgs.get("nreductions").getIntValue();
+        const valueNames = msgArgs.get("values").getList(n);
+        const ops = msgArgs.get("ops").getList(n);
+        const permute = msgArgs.get("permute").getBoolValue();
+        rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "cmd: %s values: %t ops: %t permute: %t".format(cmd,valueNames,ops,permute));
+
+        // name of each values array in grouped order
+        var grouped = new map(string, string);
+        if permute {
+            var perm = toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("permutation"), st), int);
+            try {
+                for name in valueNames {
+                    if !grouped.contains(name) {
+                        grouped.add(name, permuteValues(getGenericTypedArrayEntry(name, st), perm.a, st));
+                    }
+                }
+            } catch e {
+                for name in grouped.values() {
+                    st.deleteEntry(name);
+                }
+                throw e;
+            }
+        } else {
+            for name in valueNames {
+                grouped.addOrSet(name, name);
+            }
+        }
+
+        var replies: [0..#n] string;
+        var error: MsgTuple;
+        var failed = false;
+
+        // remove the gathered copies and, on error, the results of the reductions computed before it
+        proc deleteTemporaries(deleteReplies: bool) throws {
+            if permute {
+                for name in grouped.values() {
+                    if st.contains(name) then st.deleteEntry(name);
+                }
+            }
+            if deleteReplies {
+                for reply in replies {
+                    if !reply.isEmpty() {
+                        const rname = reply.split()[1];
+                        if st.contains(rname) then st.deleteEntry(rname);
+                    }
+                }
+            }
+        }
+
+        try {
+            for (name, op, reply) in zip(valueNames, ops, replies) {
+                var subArgs = new owned MessageArgs(new list([new ParameterObj("values", grouped[name], ObjectType.PDARRAY, ""),
+                                                              msgArgs.get("segments"),
+                                                              new ParameterObj("op", op, ObjectType.VALUE, "str"),
+                                                              msgArgs.get("skip_nan"),
+                                                              msgArgs.get("ddof")]));
+                var repTuple = segmentedReductionMsg(cmd, subArgs, st);
+                if repTuple.msgType == MsgType.ERROR {
+                    error = repTuple;
+                    failed = true;
+                    break;
+                }
+                reply = repTuple.msg;
+            }
+        } catch e {
+            deleteTemporaries(deleteReplies=true);
+            throw e;
+        }
+
+        deleteTemporaries(deleteReplies=failed);
+        if failed then return error;
+        return new MsgTuple("%jt".format(replies), MsgType.NORMAL);
+    }
+
+    /*
+    Gather values into the order given by perm, adding the result to the
+    symbol table, and return the name of the result
+    */
+    proc permuteValues(gVal: borrowed GenSymEntry, perm: [?D] int, st: borrowed SymTab): string throws {
+        param pn = Reflection.getRoutineName();
+        proc gather(values: [] ?t) {
+            var res: [D] t;
+            forall (r, p) in zip(res, perm) with (var agg = newSrcAggregator(t)) {
+                agg.copy(r, values[p]);
+            }
+            return res;
+        }
+
+        var rname = st.nextName();
+        select (gVal.dtype) {
+            when (DType.Int64) {
+                st.addEntry(rname, new shared SymEntry(gather(toSymEntry(gVal, int).a)));
+            }
+            when (DType.UInt64) {
+                st.addEntry(rname, new shared SymEntry(gather(toSymEntry(gVal, uint).a)));
+            }
+            when (DType.Float64) {
+                st.addEntry(rname, new shared SymEntry(gather(toSymEntry(gVal, real).a)));
+            }
+            when (DType.Bool) {
+                st.addEntry(rname, new shared SymEntry(gather(toSymEntry(gVal, bool).a)));
+            }
+            otherwise {
+                throw new owned ErrorWithContext(unrecognizedTypeError(pn, dtype2str(gVal.dtype)),
+                                                 getLineNumber(),
+                                                 getRoutineName(),
+                                                 getModuleName(),
+                                                 "TypeError");
+            }
+        }
+        return rname;
+    }
+
+    /*
+    Compute quantiles of each segment of a values array that is in grouped
+    order. With method "exact" each segment is sorted on its own, so the
+    (segment, value) pairs are never co-sorted. With method "approx" each
+    segment larger than the compression is summarized in one pass by a
+    sketch of at most compression items per level.
+
+    :arg reqMsg: request containing (cmd,values,segments,nquantiles,quantiles,
+                 method,compression,skip_nan)
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: MsgTuple containing a JSON list with the reply for the array of
+              each quantile
+    */
+    proc segmentedQuantileMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        const skipNan = msgArgs.get("skip_nan").getBoolValue();
+        const nq = msgArgs.get("nquantiles").getIntValue();
+        const qs = [q in msgArgs.get("quantiles").getList(nq)] q: real;
+        const method = msgArgs.getValueOf("method");
+        const compression = msgArgs.get("compression").getIntValue();
+        rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "cmd: %s quantiles: %t method: %s compression: %i skipNan: %t".format(
+                                       cmd,qs,method,compression,skipNan));
+
+        if method != "exact" && method != "approx" {
+            var errorMsg = "Error: %s: unrecognized quantile method %s".format(pn, method);
+            rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        if method == "approx" && (compression < 2 || compression % 2 != 0) {
+            var errorMsg = "Error: %s: compression must be a positive even number, got %i".format(pn, compression);
+            rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        if || reduce [q in qs] (q < 0.0 || q > 1.0) {
+            var errorMsg = "Error: %s: quantiles must be between 0 and 1".format(pn);
+            rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+
+        var gVal: borrowed GenSymEntry = getGenericTypedArrayEntry(msgArgs.getValueOf("values"), st);
+        var segments = toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("segments"), st), int);
+        const k = if method == "exact" then 0 else compression;
+        proc quantiles(values: [] ?t) throws {
+            return segQuantile(values, segments.a, qs, k, skipNan);
+        }
+
+        var flat: [makeDistDom(segments.size * nq)] real;
+        select (gVal.dtype) {
+            when (DType.Int64) {
+                flat = quantiles(toSymEntry(gVal, int).a);
+            }
+            when (DType.UInt64) {
+                flat = quantiles(toSymEntry(gVal, uint).a);
+            }
+            when (DType.Float64) {
+                flat = quantiles(toSymEntry(gVal, real).a);
+            }
+            otherwise {
+                var errorMsg = unrecognizedTypeError(pn, dtype2str(gVal.dtype));
+                rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+        }
+
+        // flat holds the quantiles of each segment next to each other
+        var replies: [0..#nq] string;
+        for (j, reply) in zip(0..#nq, replies) {
+            var res = makeDistArray(segments.size, real);
+            forall (r, i) in zip(res, res.domain) with (var agg = newSrcAggregator(real)) {
+                agg.copy(r, flat[i*nq + j]);
+            }
+            var rname = st.nextName();
+            st.addEntry(rname, new shared SymEntry(res));
+            reply = "created " + st.attrib(rname);
+        }
+        var repMsg = "%jt".format(replies);
+        rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    /*
+    Select the k largest or smallest values of each segment of a values array
+    that is in grouped order, without sorting the segments.
+
+    :arg reqMsg: request containing (cmd,values,segments,k,largest)
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: MsgTuple containing a JSON list with the replies for the
+              positions in values of the selected values and for the segment
+              of each selected value
+    */
+    proc segmentedTopKMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        const k = msgArgs.get("k").getIntValue();
+        const largest = msgArgs.get("largest").getBoolValue();
+        rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "cmd: %s k: %i largest: %t".format(cmd,k,largest));
+        if k < 0 {
+            var errorMsg = "Error: %s: k must be non-negative, got %i".format(pn, k);
+            rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+
+        var gVal: borrowed GenSymEntry = getGenericTypedArrayEntry(msgArgs.getValueOf("values"), st);
+        var segments = toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("segments"), st), int);
+        var rowsName = st.nextName();
+        var groupsName = st.nextName();
+        proc addTopK(values: [] ?t) throws {
+            var (rows, groups) = segTopK(values, segments.a, k, largest);
+            st.addEntry(rowsName, new shared SymEntry(rows));
+            st.addEntry(groupsName, new shared SymEntry(groups));
+        }
+        select (gVal.dtype) {
+            when (DType.Int64) {
+                addTopK(toSymEntry(gVal, int).a);
+            }
+            when (DType.UInt64) {
+                addTopK(toSymEntry(gVal, uint).a);
+            }
+            when (DType.Float64) {
+                addTopK(toSymEntry(gVal, real).a);
+            }
+            otherwise {
+                var errorMsg = unrecognizedTypeError(pn, dtype2str(gVal.dtype));
+                rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+        }
+        var repMsg = "%jt".format(["created " + st.attrib(rowsName), "created " + st.attrib(groupsName)]);
+        rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
           
     /* Segmented Reductions of the form: seg<Op>(values:[] t, segments: [] int)
        Use <segments> as the boundary indices to divide <values> into chunks, 
@@ -860,6 +1135,200 @@ module ReductionMsg
       return res;
     }
 
+    /* Compute the quantiles qs of each segment, returning the quantiles of a
+       segment next to each other. Segments are processed in parallel and
+       each one only sorts its own values, or, if compression is positive and
+       the segment has more values than compression, is summarized by
+       sketchQuantiles instead of being sorted. */
+    proc segQuantile(values:[?vD] ?t, segments:[?D] int, qs: [] real, compression: int, skipNan=false) throws {
+      const nq = qs.size;
+      var res = makeDistArray(D.size * nq, real);
+      if (D.size == 0) { return res; }
+      forall i in D with (var agg = newDstAggregator(real)) {
+        const low = segments[i];
+        const high = if i == D.high then vD.high else segments[i+1] - 1;
+        const quants = if compression > 0 && high - low + 1 > compression
+                         then sketchQuantiles(values[low..high], qs, compression, skipNan)
+                         else exactQuantiles(values[low..high], qs, skipNan);
+        for j in 0..#nq {
+          agg.copy(res[(i - D.low) * nq + j], quants[j]);
+        }
+      }
+      return res;
+    }
+
+    /* Quantiles of vals, interpolated linearly between the two nearest
+       values like numpy.quantile. The quantiles are NaN if vals is empty, or
+       if it contains NaN and skipNan is false. */
+    proc exactQuantiles(vals: [?vD] ?t, qs: [?qD] real, skipNan: bool): [qD] real throws {
+      var res: [qD] real = NAN;
+      var sorted: [0..#vD.size] real;
+      var n = 0;
+      for v in vals {
+        if isRealType(t) {
+          if isnan(v) {
+            if skipNan then continue;
+            return res;
+          }
+        }
+        sorted[n] = v: real;
+        n += 1;
+      }
+      if n == 0 { return res; }
+      Sort.sort(sorted[0..#n]);
+      for (r, q) in zip(res, qs) {
+        const pos = q * (n - 1);
+        const lo = pos: int;
+        const hi = min(lo + 1, n - 1);
+        r = sorted[lo] + (sorted[hi] - sorted[lo]) * (pos - lo);
+      }
+      return res;
+    }
+
+    /* Approximate the quantiles of vals in a single pass with a sketch made
+       of levels of k items each, k even, where an item of level l stands for
+       2**l values. When a level fills up it is sorted and every other item
+       is promoted to the next level, alternating between the even and the
+       odd ones so that the rank errors tend to cancel. The rank error of a
+       quantile is O(log(n/k)/k) of the number of values n, while the memory
+       used is O(k log(n/k)). NaNs are treated as in exactQuantiles. */
+    proc sketchQuantiles(vals: [?vD] ?t, qs: [?qD] real, k: int, skipNan: bool): [qD] real throws {
+      var res: [qD] real = NAN;
+      // level l receives at most n/2**l items, so the top level never fills
+      var nlevels = 1;
+      while k * 2**(nlevels-1) <= vD.size {
+        nlevels += 1;
+      }
+      var items: [0..#nlevels*k] real;
+      var fill: [0..#nlevels] int;
+      var offset: [0..#nlevels] int;
+      for v in vals {
+        if isRealType(t) {
+          if isnan(v) {
+            if skipNan then continue;
+            return res;
+          }
+        }
+        items[fill[0]] = v: real;
+        fill[0] += 1;
+        var l = 0;
+        while fill[l] == k {
+          ref level = items[l*k..#k];
+          Sort.sort(level);
+          for j in offset[l]..<k by 2 {
+            items[(l+1)*k + fill[l+1]] = level[j];
+            fill[l+1] += 1;
+          }
+          offset[l] = 1 - offset[l];
+          fill[l] = 0;
+          l += 1;
+        }
+      }
+
+      const nitems = + reduce fill;
+      if nitems == 0 { return res; }
+      var weighted: [0..#nitems] (real, int);
+      var pos = 0;
+      for l in 0..#nlevels {
+        for j in 0..#fill[l] {
+          weighted[pos] = (items[l*k + j], 2**l);
+          pos += 1;
+        }
+      }
+      Sort.sort(weighted);
+      const n = + reduce [w in weighted] w(1);
+      // pick the item at the rank exactQuantiles would interpolate at
+      for (r, q) in zip(res, qs) {
+        const rank = q * (n - 1);
+        var cum = 0;
+        for (v, w) in weighted {
+          cum += w;
+          r = v;
+          if cum > rank then break;
+        }
+      }
+      return res;
+    }
+
+    /* Select the k largest, or smallest, values of each segment, skipping
+       NaNs. Each segment is scanned once keeping its best values in a heap
+       of size k, in O(n log k), so the segments are never sorted. Returns the
+       position in values and the segment of each selected value, ordered by
+       segment and from best to worst within a segment, with ties going to
+       the value that comes first. */
+    proc segTopK(values:[?vD] ?t, segments:[?D] int, k: int, largest: bool) throws {
+      // whether (value, row) a is selected ahead of b
+      proc better(a: (t, int), b: (t, int)): bool {
+        if a(0) != b(0) then return if largest then a(0) > b(0) else a(0) < b(0);
+        return a(1) < b(1);
+      }
+      // restore the order of a heap of n items, with the worst one at the root
+      proc siftDown(ref heap: [] (t, int), in pos: int, n: int) {
+        while true {
+          var worst = pos;
+          for child in 2*pos+1..min(2*pos+2, n-1) {
+            if better(heap[worst], heap[child]) then worst = child;
+          }
+          if worst == pos then return;
+          heap[pos] <=> heap[worst];
+          pos = worst;
+        }
+      }
+
+      var counts: [D] int;
+      forall (c, i) in zip(counts, D) {
+        const low = segments[i];
+        const high = if i == D.high then vD.high else segments[i+1] - 1;
+        var n = high - low + 1;
+        if isRealType(t) {
+          n = + reduce [v in values[low..high]] (!isnan(v)): int;
+        }
+        c = min(n, k);
+      }
+      const ends = + scan counts;
+      const total = if D.size == 0 then 0 else ends[D.high];
+      var rows = makeDistArray(total, int);
+      var groups = makeDistArray(total, int);
+      forall (i, c, end) in zip(D, counts, ends) with (var rowAgg = newDstAggregator(int),
+                                                       var groupAgg = newDstAggregator(int)) {
+        if c > 0 {
+          const low = segments[i];
+          const high = if i == D.high then vD.high else segments[i+1] - 1;
+          var best: [0..#c] (t, int);
+          var nbest = 0;
+          for (v, idx) in zip(values[low..high], low..high) {
+            if isRealType(t) {
+              if isnan(v) then continue;
+            }
+            if nbest < c {
+              // add v to the heap, moving it up past the better values
+              var pos = nbest;
+              best[pos] = (v, idx);
+              while pos > 0 && better(best[(pos-1)/2], best[pos]) {
+                best[pos] <=> best[(pos-1)/2];
+                pos = (pos-1)/2;
+              }
+              nbest += 1;
+            } else if better((v, idx), best[0]) {
+              // v replaces the worst of the best values
+              best[0] = (v, idx);
+              siftDown(best, 0, c);
+            }
+          }
+          // move the worst remaining value to the end, leaving best[0] the best
+          for last in 1..c-1 by -1 {
+            best[0] <=> best[last];
+            siftDown(best, 0, last);
+          }
+          for j in 0..#c {
+            rowAgg.copy(rows[end - c + j], best[j](1));
+            groupAgg.copy(groups[end - c + j], i);
+          }
+        }
+      }
+      return (rows, groups);
+    }
+
     proc segMin(values:[?vD] ?t, segments:[?D] int, skipNan=false): [D] t throws {
       var res: [D] t = max(t);
       if (D.size == 0) { return res; }
@@ -1289,6 +1758,9 @@ module ReductionMsg
 
     use CommandMap;
     registerFunction("segmentedReduction", segmentedReductionMsg, getModuleName());
+    registerFunction("multiSegmentedReduction", multiSegmentedReductionMsg, getModuleName());
+    registerFunction("segmentedQuantile", segmentedQuantileMsg, getModuleName());
+    registerFunction("segmentedTopK", segmentedTopKMsg, getModuleName());
     registerFunction("reduction", reductionMsg, getModuleName());
     registerFunction("countReduction", countReductionMsg, getModuleName());
 }
@@ -0,0 +1,211 @@
+module SearchSortedMsg
+{
+    use ServerConfig;
+
+    use Reflection;
+    use ServerErrors;
+    use Logging;
+    use Message;
+    use MultiTypeSymbolTable;
+    use MultiTypeSymEntry;
+    use ServerErrorStrings;
+
+    private config const logLevel = ServerConfig.logLevel;
+    private config const logChannel = ServerConfig.logChannel;
+    const ssLogger = new Logger(logLevel, logChannel);
+
+    /*
+    Find the positions at which queries would be inserted into a sorted
+    array to keep it sorted, like numpy.searchsorted.
+
+    :arg reqMsg: request containing (cmd,keys,queries,side) where keys is
+                 sorted in ascending order, queries has the same dtype and
+                 side is "left" or "right"
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: MsgTuple containing the reply for the int64 positions
+    */
+    proc searchSortedMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        const side = msgArgs.getValueOf("side");
+        ssLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "cmd: %s keys: %s queries: %s side: %s".format(
+                       cmd,msgArgs.getValueOf("keys"),msgArgs.getValueOf("queries"),side));
+        if side != "left" && side != "right" {
+            var errorMsg = "Error: %s: side must be left or right, got %s".format(pn, side);
+            ssLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+
+        var gKeys: borrowed GenSymEntry = getGenericTypedArrayEntry(msgArgs.getValueOf("keys"), st);
+        var gQueries: borrowed GenSymEntry = getGenericTypedArrayEntry(msgArgs.getValueOf("queries"), st);
+        if gKeys.dtype != gQueries.dtype {
+            var errorMsg = "Error: %s: keys and queries must have the same dtype, got %s and %s".format(
+                                      pn, dtype2str(gKeys.dtype), dtype2str(gQueries.dtype));
+            ssLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        var rname = st.nextName();
+        select (gKeys.dtype) {
+            when (DType.Int64) {
+                var positions = searchSorted(toSymEntry(gKeys, int).a, toSymEntry(gQueries, int).a,
+                                             side == "right");
+                st.addEntry(rname, new shared SymEntry(positions));
+            }
+            when (DType.UInt64) {
+                var positions = searchSorted(toSymEntry(gKeys, uint).a, toSymEntry(gQueries, uint).a,
+                                             side == "right");
+                st.addEntry(rname, new shared SymEntry(positions));
+            }
+            when (DType.Float64) {
+                var positions = searchSorted(toSymEntry(gKeys, real).a, toSymEntry(gQueries, real).a,
+                                             side == "right");
+                st.addEntry(rname, new shared SymEntry(positions));
+            }
+            otherwise {
+                var errorMsg = unrecognizedTypeError(pn, dtype2str(gKeys.dtype));
+                ssLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+        }
+        var repMsg = "created " + st.attrib(rname);
+        ssLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    /*
+    For each query, the number of elements of the sorted array a that are
+    less than it, or not greater than it if right.
+
+    The first element of every locale's block of a is copied to each locale,
+    which finds the block a query falls into without communication. Each
+    locale then sends its queries, grouped by block, in one bulk transfer to
+    the locale owning the block, which binary searches its own elements and
+    sends the positions back in one bulk transfer. No element of a is read
+    from another locale, and a itself is never copied or moved.
+    */
+    proc searchSorted(a: [?aD] ?t, queries: [?qD] t, right: bool): [qD] int throws {
+      var positions: [qD] int;
+      if aD.size == 0 {
+        return positions;
+      }
+
+      // the bounds, locale and first element of each locale's block, in order
+      const (blockLows, blockHighs, blockLocales) = localeBlocks(aD);
+      const nBlocks = blockLows.size;
+      const blockFirsts = [low in blockLows] a[low];
+
+      // each locale's copies of its queries and their blocks, order and positions
+      overMemLimit(qD.size * 5 * numBytes(int));
+      coforall loc in Locales {
+        on loc {
+          const locLows = blockLows;
+          const locHighs = blockHighs;
+          const locFirsts = blockFirsts;
+          const locLocales = blockLocales;
+          const lD = qD.localSubdomain();
+          const n = lD.size;
+
+          // the number of blocks whose first element comes before each query;
+          // a query before every block has position aD.low, otherwise every
+          // element before block blocks[j]-1 comes before it, and so does its first
+          var blocks: [0..#n] int;
+          forall (bl, i) in zip(blocks, lD) {
+            const q = queries.localAccess[i];
+            var lo = 0, hi = nBlocks;
+            while lo < hi {
+              const mid = (lo + hi) / 2;
+              if precedes(locFirsts[mid], q, right) then lo = mid + 1; else hi = mid;
+            }
+            bl = lo;
+          }
+
+          // group the queries by block with a counting sort
+          var counts: [0..nBlocks] int;
+          for bl in blocks {
+            counts[bl] += 1;
+          }
+          const starts = (+ scan counts) - counts;
+          var fill = starts;
+          var order: [0..#n] int;
+          for (bl, j) in zip(blocks, 0..) {
+            order[fill[bl]] = j;
+            fill[bl] += 1;
+          }
+          var grouped: [0..#n] t;
+          forall (g, j) in zip(grouped, order) {
+            g = queries.localAccess[lD.low + j];
+          }
+
+          // search each block's queries on the block's locale
+          var groupedPositions: [0..#n] int;
+          groupedPositions[0..#counts[0]] = aD.low;
+          forall bl in 1..nBlocks {
+            const cnt = counts[bl];
+            if cnt > 0 {
+              const start = starts[bl];
+              const (blockLow, blockHigh) = (locLows[bl-1], locHighs[bl-1]);
+              var found: [0..#cnt] int;
+              on Locales[locLocales[bl-1]] {
+                const qs: [0..#cnt] t = grouped[start..#cnt];
+                var blockFound: [0..#cnt] int;
+                forall (f, q) in zip(blockFound, qs) {
+                  var l = blockLow + 1, h = blockHigh + 1;
+                  while l < h {
+                    const mid = (l + h) / 2;
+                    if precedes(a.localAccess[mid], q, right) then l = mid + 1; else h = mid;
+                  }
+                  f = l;
+                }
+                found = blockFound;
+              }
+              groupedPositions[start..#cnt] = found;
+            }
+          }
+          forall (p, j) in zip(groupedPositions, order) {
+            positions.localAccess[lD.low + j] = p;
+          }
+        }
+      }
+      return positions;
+    }
+
+    /*
+    The lowest and highest index and the locale id of each locale's block of
+    the distributed domain aD, in order of index, leaving out empty blocks.
+    */
+    proc localeBlocks(aD) throws {
+      var nonEmpty: [0..#numLocales] bool;
+      var lows, highs: [0..#numLocales] int;
+      coforall loc in Locales {
+        on loc {
+          const sub = aD.localSubdomain();
+          if sub.size > 0 {
+            nonEmpty[here.id] = true;
+            lows[here.id] = sub.low;
+            highs[here.id] = sub.high;
+          }
+        }
+      }
+      const nBlocks = + reduce nonEmpty: int;
+      var blockLows, blockHighs, blockLocales: [0..#nBlocks] int;
+      var b = 0;
+      for i in 0..#numLocales {
+        if nonEmpty[i] {
+          (blockLows[b], blockHighs[b], blockLocales[b]) = (lows[i], highs[i], i);
+          b += 1;
+        }
+      }
+      return (blockLows, blockHighs, blockLocales);
+    }
+
+    private inline proc precedes(x, q, right: bool): bool {
+      return if right then x <= q else x < q;
+    }
+
+    use CommandMap;
+    registerFunction("searchSorted", searchSortedMsg, getModuleName());
+}
@@ -166,6 +166,7 @@ module ServerConfig
             const byteorder: string;
             const autoShutdown: bool;
             const serverInfoNoSplash: bool;
+            const compactArgs: bool;
         }
 
         var (Zmajor, Zminor, Zmicro) = ZMQ.version;
@@ -191,7 +192,8 @@ module ServerConfig
             regexMaxCaptures = regexMaxCaptures,
             byteorder = try! getByteorder(),
             autoShutdown = autoShutdown,
-            serverInfoNoSplash = serverInfoNoSplash
+            serverInfoNoSplash = serverInfoNoSplash,
+            compactArgs = true
         );
         return try! "%jt".format(cfg);
 
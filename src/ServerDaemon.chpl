@@ -348,8 +348,10 @@ module ServerDaemon {
          */
         proc registerServerCommands() {
             registerBinaryFunction("tondarray", tondarrayMsg);
+            registerBinaryFunction("tondarrayMulti", tondarrayMultiMsg);
             registerFunction("create", createMsg);
             registerFunction("delete", deleteMsg);
+            registerFunction("deleteMany", deleteManyMsg);
             registerFunction("set", setMsg);
             registerFunction("info", infoMsg);
             registerFunction("str", strMsg);
@@ -361,6 +363,10 @@ module ServerDaemon {
             registerFunction("clear", clearMsg);
             registerFunction("lsany", lsAnyMsg);
             registerFunction("getfiletype", getFileTypeMsg);
+            registerFunction("listfiles", listFilesMsg);
+            registerFunction("makedirs", makeDirsMsg);
+            registerFunction("removepartitionfiles", removePartitionFilesMsg);
+            registerFunction("batch", batchMsg);
 
             // For a few specialized cmds we're going to add dummy functions, so they
             // get added to the client listing of available commands. They will be
@@ -29,11 +29,27 @@ module UniqueMsg
     use Unique;
     use SipHash;
     use CommAggregation;
+    use RangeChunk;
+    use Search only;
+    use Sort only;
     
     private config const logLevel = ServerConfig.logLevel;
     private config const logChannel = ServerConfig.logChannel;
     const umLogger = new Logger(logLevel, logChannel);
 
+    /*
+    Maximum number of distinct keys for which grouping with method "auto" uses
+    hash tables instead of sorting the keys
+    */
+    config const hashGroupMaxGroups = 2**12;
+
+    /*
+    Maximum number of distinct keys for which grouping with method "hash" uses
+    hash tables; with more, the keys are sorted instead. The tables and counts
+    grow with the number of distinct keys times the number of tasks.
+    */
+    config const hashGroupHashMaxGroups = 2**16;
+
     proc uniqueMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
         // flag to return segments and permutation for GroupBy
         const returnGroups = msgArgs.get("returnGroupStr").getBoolValue();
@@ -126,7 +142,50 @@ module UniqueMsg
       return repMsg;
     }
 
-    proc uniqueAndCount(n, namesList: [] string, typesList: [] string, assumeSorted: bool, st) throws {
+    /*
+    Group keys, returning the permutation that puts equal keys next to each
+    other and the offset of each group. method is "sort", or "hash" or
+    "auto" to group few distinct keys with hashGroup instead of sorting.
+    itemsize is the size in bytes of a key.
+    */
+    proc groupKeys(itemsize, type t, keys: [?D] t, assumeSorted: bool, method: string) throws {
+      var permutation = new shared SymEntry(keys.size, int);
+      var sortedKeys: [D] t = keys;
+
+      if assumeSorted {
+        // set permutation to 0..#size and go directly to finding segment boundaries.
+        permutation.a = permutation.a.domain;
+      }
+      else {
+        if method != "sort" {
+          // "hash" hashes up to a larger number of distinct keys than "auto"
+          const maxGroups = if method == "hash" then max(hashGroupHashMaxGroups, hashGroupMaxGroups)
+                                                else hashGroupMaxGroups;
+          var (grouped, hashPerm, hashSegments) = hashGroup(keys, maxGroups, itemsize);
+          if grouped {
+            return (hashPerm, hashSegments);
+          }
+          umLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                         "more than %i groups, sorting keys instead".format(maxGroups));
+        }
+        // Sort the keys
+        overMemLimit(radixSortLSD_memEst(keys.size, itemsize));
+        var kr = radixSortLSD(keys);
+        // Unpack the permutation and sorted keys
+        ref perm = permutation.a;
+        forall (sh, p, val) in zip(sortedKeys, perm, kr) {
+          (sh, p) = val;
+        }
+      }
+      // Get the unique keys and the count of each
+      var (uniqueKeys, counts) = uniqueFromSorted(sortedKeys);
+      // Compute offset of each group in sorted array
+      var segments = new shared SymEntry(counts.size, int);
+      segments.a = (+ scan counts) - counts;
+      return (permutation, segments);
+    }
+
+    proc uniqueAndCount(n, namesList: [] string, typesList: [] string, assumeSorted: bool, st, method = "sort") throws {
       if (n > 128) {
         throw new owned ErrorWithContext("Cannot hash more than 128 arrays",
                                          getLineNumber(),
@@ -139,29 +198,7 @@ module UniqueMsg
         return (new shared SymEntry(0, int), new shared SymEntry(0, int));
       }
       proc helper(itemsize, type t, keys: [?D] t) throws {
-        var permutation = new shared SymEntry(keys.size, int);
-        var sortedKeys: [D] t = keys;
-
-        if assumeSorted {
-          // set permutation to 0..#size and go directly to finding segment boundaries.
-          permutation.a = permutation.a.domain;
-        }
-        else {
-          // Sort the keys
-          overMemLimit(radixSortLSD_memEst(keys.size, itemsize));
-          var kr = radixSortLSD(keys);
-          // Unpack the permutation and sorted keys
-          ref perm = permutation.a;
-          forall (sh, p, val) in zip(sortedKeys, perm, kr) {
-            (sh, p) = val;
-          }
-        }
-        // Get the unique keys and the count of each
-        var (uniqueKeys, counts) = uniqueFromSorted(sortedKeys);
-        // Compute offset of each group in sorted array
-        var segments = new shared SymEntry(counts.size, int);
-        segments.a = (+ scan counts) - counts;
-        return (permutation, segments);
+        return groupKeys(itemsize, t, keys, assumeSorted, method);
       }
 
       if hasStr && n == 1 {
@@ -196,6 +233,135 @@ module UniqueMsg
       return helper(16, 2*uint(64), hashArrays(size, names, types, st));
     }
 
+    /*
+    Group keys with hash tables instead of sorting them. Each task collects the
+    distinct keys of its part of the array in a hash table. The distinct keys of
+    all tasks are sorted and numbered, and a counting sort on the key numbers
+    then places the rows with a single pass over the keys, where a radix sort
+    needs one pass per digit. The counting sort is stable, so the permutation
+    and segments are the same as those of sorting the keys.
+
+    Returns (false, _, _) if there are more than maxGroups distinct keys, which
+    each task detects after seeing at most maxGroups+1 of them. Throws if the
+    hash tables of maxGroups keys would exceed the memory limit.
+    */
+    proc hashGroup(keys: [?aD] ?t, maxGroups: int, itemsize) throws {
+      // each task's table and the merged tables hold up to maxGroups keys, at
+      // about twice the key size per slot
+      overMemLimit(numLocales * (numTasks + 2) * maxGroups * 2 * itemsize);
+      var tooMany = false;
+      var distinct: domain(t, parSafe=true);
+      coforall loc in Locales with (|| reduce tooMany) {
+        on loc {
+          var tasksKeys: [Tasks] domain(t, parSafe=false);
+          coforall task in Tasks with (|| reduce tooMany) {
+            ref taskKeys = tasksKeys[task];
+            const lD = aD.localSubdomain();
+            for i in calcBlock(task, lD.low, lD.high) {
+              taskKeys += keys.localAccess[i];
+              if taskKeys.size > maxGroups {
+                tooMany = true;
+                break;
+              }
+            }
+          }
+          if !tooMany {
+            var locKeys: domain(t, parSafe=false);
+            for taskKeys in tasksKeys {
+              for key in taskKeys {
+                locKeys += key;
+              }
+            }
+            for key in locKeys {
+              distinct += key;
+            }
+          }
+        }
+      }
+      if tooMany || distinct.size > maxGroups {
+        return (false, new shared SymEntry(0, int), new shared SymEntry(0, int));
+      }
+
+      // number the distinct keys in sorted order
+      const numGroups = distinct.size;
+      var uniqueKeys: [0..#numGroups] t;
+      for (u, key) in zip(uniqueKeys, distinct.sorted()) {
+        u = key;
+      }
+
+      // the global counts and starts, each task's counts and positions, and the group of each key
+      overMemLimit(numBytes(int) * (4 * numLocales * numTasks * numGroups + keys.size));
+
+      // count the keys of each group in each task, in the transposed order of
+      // RadixSortLSD, so that the scan gives the position of each task's rows
+      var globalCounts: [makeDistDom(numLocales * numTasks * numGroups)] int;
+      // the group of each key, found once and used again to place the rows
+      var groups: [aD] int;
+      coforall loc in Locales {
+        on loc {
+          const locUniqueKeys = uniqueKeys;
+          var tasksCounts: [Tasks] [0..#numGroups] int;
+          coforall task in Tasks {
+            ref taskCounts = tasksCounts[task];
+            const lD = aD.localSubdomain();
+            for i in calcBlock(task, lD.low, lD.high) {
+              const (_, group) = Search.search(locUniqueKeys, keys.localAccess[i], sorted=true);
+              groups.localAccess[i] = group;
+              taskCounts[group] += 1;
+            }
+          }
+          coforall tid in Tasks {
+            var aggregator = newDstAggregator(int);
+            for task in Tasks {
+              for group in chunk(0..#numGroups, numTasks, tid) {
+                aggregator.copy(globalCounts[calcGlobalIndex(group, loc.id, task)],
+                                tasksCounts[task][group]);
+              }
+            }
+            aggregator.flush();
+          }
+        }
+      }
+      var globalStarts = + scan globalCounts;
+      globalStarts -= globalCounts;
+
+      var permutation = new shared SymEntry(keys.size, int);
+      ref perm = permutation.a;
+      coforall loc in Locales {
+        on loc {
+          var tasksPos: [Tasks] [0..#numGroups] int;
+          coforall tid in Tasks {
+            var aggregator = newSrcAggregator(int);
+            for task in Tasks {
+              for group in chunk(0..#numGroups, numTasks, tid) {
+                aggregator.copy(tasksPos[task][group],
+                                globalStarts[calcGlobalIndex(group, loc.id, task)]);
+              }
+            }
+            aggregator.flush();
+          }
+          coforall task in Tasks {
+            ref taskPos = tasksPos[task];
+            var aggregator = newDstAggregator(int);
+            const lD = aD.localSubdomain();
+            for i in calcBlock(task, lD.low, lD.high) {
+              const group = groups.localAccess[i];
+              aggregator.copy(perm[taskPos[group]], i);
+              taskPos[group] += 1;
+            }
+            aggregator.flush();
+          }
+        }
+      }
+
+      // each group starts with the rows of the first task of the first locale
+      var segments = new shared SymEntry(numGroups, int);
+      forall (s, group) in zip(segments.a, segments.a.domain) {
+        s = globalStarts[calcGlobalIndex(group, 0, 0)];
+      }
+      return (true, permutation, segments);
+    }
+
     proc hashArrays(size, names, types, st): [] 2*uint throws {
       overMemLimit(numBytes(uint) * size * 2);
       var dom = makeDistDom(size);
@@ -265,6 +431,211 @@ module UniqueMsg
       return hashes;
     }
 
+    /*
+    Estimate the number of distinct rows of one or more arrays with
+    HyperLogLog sketches, either over all rows or within each segment of
+    the rows in grouped order. Only the rows are hashed and scanned, they
+    are never sorted.
+
+    :arg reqMsg: request containing (cmd,nkeys,keynames,keytypes,permute,
+                 permutation,segments,precision) where permutation, if permute
+                 is true, puts the rows in the grouped order of segments
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: MsgTuple containing the created int64 array of the estimated
+              number of distinct rows in each segment
+    */
+    proc approxNuniqueMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        const n = msgArgs.get("nkeys").getIntValue();
+        const keynames = msgArgs.get("keynames").getList(n);
+        const keytypes = msgArgs.get("keytypes").getList(n);
+        const permute = msgArgs.get("permute").getBoolValue();
+        const precision = msgArgs.get("precision").getIntValue();
+        umLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "cmd: %s keynames: %t permute: %t precision: %i".format(cmd,keynames,permute,precision));
+        if precision < 4 || precision > 16 {
+            var errorMsg = "Error: %s: precision must be between 4 and 16, got %i".format(pn, precision);
+            umLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        if n > 128 {
+            var errorMsg = "Error: %s: cannot hash more than 128 arrays".format(pn);
+            umLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        var segments = toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("segments"), st), int);
+
+        var (size, _, names, types) = validateArraysSameLength(n, keynames, keytypes, st);
+        // mix the two words of the row hashes into one so that a lone bool
+        // array, which hashArrays leaves as the value itself, is hashed too
+        var rowHashes = [h in hashArrays(size, names, types, st)] sipHash64(h(0) ^ h(1));
+        var hashes: [rowHashes.domain] uint;
+        if permute {
+            var perm = toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("permutation"), st), int);
+            forall (h, p) in zip(hashes, perm.a) with (var agg = newSrcAggregator(uint)) {
+                agg.copy(h, rowHashes[p]);
+            }
+        } else {
+            hashes = rowHashes;
+        }
+
+        var rname = st.nextName();
+        st.addEntry(rname, new shared SymEntry(segHyperLogLog(hashes, segments.a, precision)));
+        var repMsg = "created " + st.attrib(rname);
+        umLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    /*
+    Estimate the number of distinct hashes in each segment with a
+    HyperLogLog sketch of 2**p registers, using the small range correction
+    of Flajolet et al. The hashes are scanned once: each task sketches the
+    segments in its block of the hashes, counting the ones smaller than the
+    sketch exactly, and the sketches of the segments that continue into
+    other blocks are merged at the end, or those segments are counted
+    exactly if they are smaller than the sketch.
+    */
+    proc segHyperLogLog(hashes: [?hD] uint, segments: [?D] int, p: int): [D] int throws {
+      const m = 1 << p;
+      var res: [D] int;
+      if D.size == 0 || hD.size == 0 { return res; }
+
+      // the index of the segment containing row i
+      proc segmentOf(i: int): int {
+        var (lo, hi) = (D.low, D.high);
+        while lo < hi {
+          const mid = (lo + hi + 1) / 2;
+          if segments[mid] <= i then lo = mid; else hi = mid - 1;
+        }
+        return lo;
+      }
+
+      // the sketches of the first and last segment of each task's block, if
+      // they continue in the blocks before or after it
+      const nParts = numLocales * numTasks * 2;
+      var partSegs: [0..#nParts] int = -1;
+      var partRegs: [0..#nParts] [0..#m] uint(8);
+      coforall loc in Locales {
+        on loc {
+          coforall task in Tasks {
+            const lD = hD.localSubdomain();
+            const block = calcBlock(task, lD.low, lD.high);
+            if block.size > 0 {
+              const firstSeg = segmentOf(block.low);
+              const lastSeg = segmentOf(block.high);
+              var starts: [firstSeg..lastSeg+1] int;
+              starts[firstSeg..lastSeg] = segments[firstSeg..lastSeg];
+              starts[lastSeg+1] = if lastSeg == D.high then hD.high + 1 else segments[lastSeg+1];
+              var regs: [0..#m] uint(8);
+              var agg = newDstAggregator(int);
+              for s in firstSeg..lastSeg {
+                const rows = max(starts[s], block.low)..min(starts[s+1] - 1, block.high);
+                if rows.size == 0 then continue;
+                const complete = rows.size == starts[s+1] - starts[s];
+                if complete && rows.size <= m {
+                  agg.copy(res[s], countDistinct(hashes, rows));
+                  continue;
+                }
+                regs = 0;
+                for i in rows {
+                  hllAdd(regs, hashes.localAccess[i], p);
+                }
+                if complete {
+                  agg.copy(res[s], hllEstimate(regs));
+                } else {
+                  const part = (loc.id * numTasks + task) * 2 + (if s == firstSeg then 0 else 1);
+                  partSegs[part] = s;
+                  partRegs[part] = regs;
+                }
+              }
+              agg.flush();
+            }
+          }
+        }
+      }
+
+      // the parts are in row order, so the parts of a segment are adjacent
+      var regs: [0..#m] uint(8);
+      var seg = -1;
+      var firstPart: [0..#nParts] bool;
+      for (s, r, first) in zip(partSegs, partRegs, firstPart) {
+        if s < 0 then continue;
+        if s != seg {
+          if seg >= 0 then res[seg] = hllEstimate(regs);
+          seg = s;
+          regs = r;
+          first = true;
+        } else {
+          regs = max(regs, r);
+        }
+      }
+      if seg >= 0 then res[seg] = hllEstimate(regs);
+
+      // like the segments within a block, the segments that continue into
+      // other blocks are counted exactly if they are smaller than the sketch
+      forall (s, first) in zip(partSegs, firstPart) {
+        if first {
+          const end = if s == D.high then hD.high + 1 else segments[s+1];
+          const size = end - segments[s];
+          if size <= m {
+            const segHashes: [0..#size] uint = hashes[segments[s]..#size];
+            res[s] = countDistinct(segHashes, 0..#size);
+          }
+        }
+      }
+      return res;
+    }
+
+    /* Count the distinct hashes in rows, which are local */
+    proc countDistinct(hashes: [] uint, rows: range): int throws {
+      var sorted: [0..#rows.size] uint;
+      for (x, i) in zip(sorted, rows) {
+        x = hashes.localAccess[i];
+      }
+      Sort.sort(sorted);
+      var n = 1;
+      for i in 1..<sorted.size {
+        if sorted[i] != sorted[i-1] then n += 1;
+      }
+      return n;
+    }
+
+    /* Add a hash to a HyperLogLog sketch with 2**p registers */
+    inline proc hllAdd(ref regs: [] uint(8), h: uint, p: int) {
+      use BitOps;
+      const j = (h >> (64 - p)): int;
+      const w = h << p;
+      // the position of the first one bit after the register index
+      const rho = if w == 0 then (64 - p + 1): uint(8) else (clz(w) + 1): uint(8);
+      if rho > regs[j] then regs[j] = rho;
+    }
+
+    /* Estimate the number of distinct hashes added to a HyperLogLog sketch */
+    proc hllEstimate(regs: [] uint(8)): int {
+      const m = regs.size: real;
+      const alpha = if regs.size == 16 then 0.673
+                    else if regs.size == 32 then 0.697
+                    else if regs.size == 64 then 0.709
+                    else 0.7213 / (1.0 + 1.079 / m);
+      var sum = 0.0;
+      var zeros = 0;
+      for r in regs {
+        sum += 2.0 ** (-(r: int));
+        if r == 0 then zeros += 1;
+      }
+      var est = alpha * m * m / sum;
+      if est <= 2.5 * m && zeros > 0 {
+        // linear counting is more accurate while many registers are empty
+        est = m * Math.log(m / zeros);
+      }
+      return (est + 0.5): int;
+    }
+
     use CommandMap;
     registerFunction("unique", uniqueMsg, getModuleName());
+    registerFunction("approxNunique", approxNuniqueMsg, getModuleName());
 }
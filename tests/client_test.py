@@ -1,3 +1,6 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 from base_test import ArkoudaTest
 from context import arkouda as ak
 
@@ -140,9 +143,15 @@ class ClientTest(ArkoudaTest):
         self.assertEqual(50, ak.client.pdarrayIterThresh)
         self.assertEqual(1048576000, ak.client.maxTransferBytes)
         self.assertTrue(ak.client.verbose)
+        ak.client.transferChunkBytes = 1024
+        self.assertEqual(1024, ak.client.transferChunkBytes)
+        ak.client.groupbyCacheBytes = 0
+        self.assertEqual(0, ak.client.groupbyCacheBytes)
         ak.client.set_defaults()
         self.assertEqual(100, ak.client.pdarrayIterThresh)
         self.assertEqual(1073741824, ak.client.maxTransferBytes)
+        self.assertEqual(134217728, ak.client.transferChunkBytes)
+        self.assertEqual(268435456, ak.client.groupbyCacheBytes)
         self.assertFalse(ak.client.verbose)
 
     def test_client_get_server_commands(self):
@@ -153,3 +162,173 @@ class ClientTest(ArkoudaTest):
         cmds = ak.client.get_server_commands()
         for cmd in ["connect", "array", "create", "tondarray", "info", "str"]:
             self.assertTrue(cmd in cmds)
+
+    def test_batch(self):
+        """
+        Tests the ak.client.batch() context manager sends queued commands
+        in order and returns the replies together
+        """
+        a = ak.zeros(10)
+        with ak.client.batch() as b:
+            rep1 = b.generic_msg(cmd="set", args={"array": a, "dtype": "float64", "val": 1.0})
+            rep2 = b.generic_msg(cmd="info", args={"names": a.name})
+            self.assertFalse(rep1.done)
+            self.assertEqual(2, len(b))
+        self.assertTrue(rep1.done)
+        self.assertTrue(rep1.result().startswith(f"set {a.name}"))
+        self.assertIn(a.name, rep2.result())
+        self.assertEqual(10, a.sum())
+
+        # an error stops the rest of the batch from executing
+        with self.assertRaises(RuntimeError):
+            with ak.client.batch() as b:
+                b.generic_msg(cmd="info", args={"names": "not_a_symbol"})
+                rep = b.generic_msg(cmd="set", args={"array": a, "dtype": "float64", "val": 2.0})
+        with self.assertRaises(RuntimeError):
+            rep.result()
+        self.assertEqual(10, a.sum())
+
+        # pdarray operations go through the open batch: in-place updates are
+        # queued and sent together with the next command that needs a reply
+        a = ak.zeros(10, dtype=ak.int64)
+        idx = ak.arange(2, 4)
+        with ak.client.batch() as b:
+            a[0] = 5
+            a += 1
+            a[idx] = 7
+            a[6:8] = 3
+            self.assertEqual(4, len(b))
+        self.assertEqual(0, len(b))
+        self.assertListEqual([6, 1, 7, 7, 1, 1, 3, 3, 1, 1], a.to_list())
+
+        # an index array deleted while the batch is open is only deleted on
+        # the server after the queued update that reads it
+        with ak.client.batch() as b:
+            a[ak.array([0, 9])] = 2
+            a[idx] = 5
+            self.assertEqual(2, len(b))
+        self.assertListEqual([2, 1, 5, 5, 1, 1, 3, 3, 1, 2], a.to_list())
+
+        with self.assertRaises(RuntimeError):
+            with ak.client.batch():
+                with ak.client.batch():
+                    pass
+
+    def test_async_client(self):
+        """
+        Tests that an AsyncClient can have several requests outstanding and
+        matches each reply to its request
+        """
+        a = ak.arange(10)
+        b = ak.array(["a", "b", "a", "c"])
+
+        async def run():
+            async with ak.AsyncClient() as aclient:
+                return await asyncio.gather(
+                    aclient.to_ndarray(a),
+                    aclient.generic_msg(cmd="info", args={"names": a.name}),
+                    aclient.groupby(b),
+                    aclient.to_ndarray(a * 2),
+                )
+
+        nda, info, g, nda2 = asyncio.run(run())
+        self.assertListEqual(list(range(10)), nda.tolist())
+        self.assertIn(a.name, info)
+        self.assertListEqual(["a", "b", "c"], g.unique_keys.to_list())
+        self.assertListEqual([2, 1, 1], g.count()[1].to_list())
+        self.assertListEqual(list(range(0, 20, 2)), nda2.tolist())
+
+        async def fail():
+            async with ak.AsyncClient() as aclient:
+                await aclient.generic_msg(cmd="info", args={"names": "not_a_symbol"})
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(fail())
+
+    def test_session(self):
+        """
+        Tests that the module-level API can be used from several threads and
+        that a Session's context routes commands to that Session
+        """
+        arrays = [ak.arange(i, i + 100) for i in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            sums = list(pool.map(lambda a: (a * 2).sum(), arrays))
+        self.assertListEqual([2 * (100 * i + 4950) for i in range(8)], sums)
+
+        session = ak.Session(server=ArkoudaTest.server, port=ArkoudaTest.port, pool_size=2)
+        with session:
+            a = ak.arange(10)
+            self.assertIs(session, ak.client._current_session())
+        self.assertIsNot(session, ak.client._current_session())
+        name = a.name
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            infos = list(
+                pool.map(lambda _: session.generic_msg(cmd="info", args={"names": name}), range(8))
+            )
+        self.assertTrue(all(name in info for info in infos))
+        self.assertLessEqual(len(session._idle), 2)
+
+        # errors sent back by the server keep the socket in the pool
+        idle = list(session._idle)
+        with self.assertRaises(RuntimeError):
+            session.generic_msg(cmd="info", args={"names": "not_a_symbol"})
+        self.assertCountEqual(idle, session._idle)
+
+        # each thread enters and exits the same Session in its own context
+        def in_session(i):
+            with session:
+                with session:
+                    return ak.client._current_session() is session and (ak.arange(i) + 1).sum()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            sums = list(pool.map(in_session, range(8)))
+        self.assertListEqual([i * (i + 1) // 2 for i in range(8)], sums)
+        self.assertIsNot(session, ak.client._current_session())
+
+        # the array is deleted through the Session that created it, not the current one
+        del a
+        self.assertIn(name, session._deletes)
+        self.assertNotIn(name, ak.client._current_session()._deletes)
+        session.close()
+
+        with self.assertRaises(ValueError):
+            ak.Session(server=ArkoudaTest.server, port=ArkoudaTest.port, pool_size=0)
+
+    def test_deferred_delete(self):
+        """
+        Tests that deleting pdarrays queues their names and that the queued
+        names are deleted on the server with the next request
+        """
+        session = ak.client._current_session()
+        arrays = [ak.arange(10) for _ in range(4)]
+        names = [a.name for a in arrays]
+        del arrays
+        self.assertTrue(set(names).issubset(session._deletes))
+        self.assertTrue(set(names).isdisjoint(ak.list_symbol_table()))
+        self.assertEqual(0, len(session._deletes))
+
+        # deletions queued before a binary request are sent ahead of it
+        a = ak.arange(10)
+        name = a.name
+        del a
+        self.assertListEqual(list(range(5)), ak.arange(5).to_list())
+        self.assertNotIn(name, ak.list_symbol_table())
+
+    def test_compact_args(self):
+        """
+        Tests that the Session negotiates the compact argument format and that
+        commands give the same results with compact and JSON arguments
+        """
+        self.assertTrue(ak.client._current_session().compact_args)
+        size, args = ak.client._compact_args_to_str({"names": ["x", "ü"], "n": 2})
+        self.assertEqual(2, size)
+        self.assertEqual("~5:names4:LIST3:str8:~1:x2:ü1:n5:VALUE3:int1:2", args)
+
+        json_session = ak.Session(server=ArkoudaTest.server, port=ArkoudaTest.port, compact_args=False)
+        self.assertFalse(json_session.compact_args)
+        a, s = ak.arange(5), ak.array(["a", "ü", "c"])
+        with json_session:
+            json_result = (ak.concatenate([a, a]).to_list(), ak.concatenate([s, s]).to_list())
+        json_session.close()
+        compact_result = (ak.concatenate([a, a]).to_list(), ak.concatenate([s, s]).to_list())
+        self.assertTupleEqual(json_result, compact_result)
@@ -363,6 +363,99 @@ class DataFrameTest(ArkoudaTest):
         with self.assertRaises(TypeError):
             ak.DataFrame.concat([df, df_typeerror])
 
+    def test_chunked_dataframe(self):
+        cols = ["userName", "userID", "item", "day", "amount"]
+        expected = build_pd_df_append()[cols]
+        frame = ak.ChunkedDataFrame("chunked_test", build_ak_df()[cols])
+        batch = build_ak_append()[cols]
+        frame.append(batch[list(reversed(cols))])
+        self.assertEqual(8, len(frame))
+        self.assertEqual(2, len(frame.chunks))
+        self.assertTrue(expected.equals(frame.to_dataframe().to_pandas()))
+        # the chunks hold copies, so the appended DataFrame can change
+        batch["userID"][0] = 555
+        self.assertEqual(444, frame.chunks[1]["userID"][0])
+        # reads share the concatenation until the frame changes
+        self.assertIs(frame.to_dataframe()["userID"], frame.to_dataframe()["userID"])
+        self.assertTrue(expected.equals(ak.DataFrame.attach("chunked_test").to_pandas()))
+
+        attached = ak.ChunkedDataFrame.attach("chunked_test")
+        self.assertTrue(attached.is_registered())
+        self.assertListEqual(frame.columns, attached.columns)
+        self.assertTrue(expected.equals(attached.to_dataframe().to_pandas()))
+        self.assertListEqual(
+            ["Alice", "Bob"], attached.to_dataframe(columns=["userName"])["userName"][:2].to_list()
+        )
+
+        with self.assertRaises(KeyError):
+            frame.append(build_ak_keyerror())
+        with self.assertRaises(TypeError):
+            frame.append(build_ak_typeerror()[cols])
+        with self.assertRaises(ak.RegistrationError):
+            ak.ChunkedDataFrame("chunked_test")
+        with self.assertRaises(ak.RegistrationError):
+            ak.ChunkedDataFrame("chunked_test_df", build_ak_df().register("chunked_test_df"))
+        ak.DataFrame.unregister_dataframe_by_name("chunked_test_df")
+
+        # Carol (333) is in both chunks, which are rewritten without her rows,
+        # and the appended row is merged with the one left in the second chunk
+        update = batch[ak.array([1])]
+        update["amount"][0] = 9.9
+        frame.upsert(update, on="userID")
+        self.assertEqual(2, len(frame.chunks))
+        result = frame.to_dataframe().to_pandas()
+        self.assertListEqual([9.9], result[result["userID"] == 333]["amount"].tolist())
+        self.assertEqual(7, len(result))
+        self.assertTrue(frame.is_registered())
+
+        frame.compact()
+        self.assertEqual(1, len(frame.chunks))
+        self.assertTrue(result.equals(frame.to_dataframe().to_pandas()))
+        self.assertEqual(1, len(ak.ChunkedDataFrame.attach("chunked_test").chunks))
+
+        frame.unregister()
+        self.assertFalse(frame.is_registered())
+        with self.assertRaises(ak.RegistrationError):
+            ak.ChunkedDataFrame.attach("chunked_test")
+
+    def test_chunked_dataframe_merge(self):
+        batch = ak.DataFrame({"id": ak.arange(4)})
+        frame = ak.ChunkedDataFrame("chunked_merge_test", batch)
+        for _ in range(15):
+            frame.append(batch)
+        # equal batches merge like a binary counter, 16 batches into one chunk
+        self.assertListEqual([64], [chunk.size for chunk in frame.chunks])
+        frame.append(batch).append(batch[:1])
+        self.assertListEqual([64, 4, 1], [chunk.size for chunk in frame.chunks])
+        self.assertTrue(frame.is_registered())
+        frame.unregister()
+
+        # batches that shrink fast enough are only merged above max_chunks
+        capped = ak.ChunkedDataFrame("chunked_merge_test", max_chunks=2)
+        for size in (64, 16, 4):
+            capped.append(ak.DataFrame({"id": ak.arange(size)}))
+        self.assertListEqual([64, 20], [chunk.size for chunk in capped.chunks])
+        self.assertListEqual(
+            ak.concatenate([ak.arange(64), ak.arange(16), ak.arange(4)]).to_list(),
+            capped.to_dataframe()["id"].to_list(),
+        )
+        capped.unregister()
+
+        # a merge interrupted after registering the merged chunk leaves the
+        # chunks it replaces registered, and attach skips them
+        frame = ak.ChunkedDataFrame("chunked_merge_test", ak.DataFrame({"id": ak.arange(16)}))
+        frame.append(ak.DataFrame({"id": ak.arange(16, 20)}))
+        frame.append(ak.DataFrame({"id": ak.arange(20, 21)}))
+        self.assertListEqual([0, 1, 2], ak.ChunkedDataFrame._chunk_ids("chunked_merge_test"))
+        merged = ak.DataFrame.concat(frame.chunks[1:])
+        merged.register(ak.ChunkedDataFrame._chunk_name("chunked_merge_test", 3, 1))
+        attached = ak.ChunkedDataFrame.attach("chunked_merge_test")
+        self.assertListEqual([0, 3], attached._ids)
+        self.assertListEqual(list(range(21)), attached.to_dataframe()["id"].to_list())
+        attached.unregister()
+        self.assertListEqual([], ak.ChunkedDataFrame._chunk_ids("chunked_merge_test"))
+        self.assertFalse(any("chunked_merge_test" in name for name in ak.list_registry()))
+
     def test_head(self):
         df = build_ak_df()
         ref_df = build_pd_df()
@@ -432,6 +525,16 @@ class DataFrameTest(ArkoudaTest):
         self.assertListEqual(c.index.to_list(), ["Bob", "Alice", "Carol"])
         self.assertListEqual(c.values.to_list(), [2, 3, 1])
 
+    def test_gb_agg(self):
+        df = build_ak_df()
+        gb = df.groupby("userName")
+        res = gb.agg({"amount": ["sum", "max"], "item": "min"})
+        self.assertListEqual(["amount_sum", "amount_max", "item"], res.columns)
+        self.assertListEqual(gb.unique_keys.to_list(), res.index.to_list())
+        self.assertListEqual(gb.sum("amount").values.to_list(), res["amount_sum"].to_list())
+        self.assertListEqual(gb.max("amount").values.to_list(), res["amount_max"].to_list())
+        self.assertListEqual(gb.min("item").values.to_list(), res["item"].to_list())
+
     def test_to_pandas(self):
         df = build_ak_df()
         pd_df = build_pd_df()
@@ -445,6 +548,39 @@ class DataFrameTest(ArkoudaTest):
         pd_df = slice_df.to_pandas()
         self.assertEqual(pd_df.index.tolist(), [0, 1, 2])
 
+    def test_to_arrow(self):
+        df = ak.DataFrame(
+            {
+                "i": ak.arange(6),
+                "f": ak.linspace(0, 1, 6),
+                "b": ak.arange(6) % 2 == 0,
+                "s": ak.array(["Alice", "Bob", "", "Carol", "zürich", "Alice"]),
+                "c": ak.Categorical(ak.array(["a", "b", "a", "c", "b", "a"])),
+                "sa": ak.segarray(ak.array([0, 2, 2, 5, 5, 6]), ak.arange(7)),
+            }
+        )
+        table = df.to_arrow()
+        self.assertListEqual(list(df.columns), table.column_names)
+        self.assertListEqual(list(range(6)), table["i"].to_pylist())
+        self.assertListEqual(["Alice", "Bob", "", "Carol", "zürich", "Alice"], table["s"].to_pylist())
+        self.assertListEqual(["a", "b", "a", "c", "b", "a"], table["c"].to_pylist())
+        self.assertListEqual([[0, 1], [], [2, 3, 4], [], [5], [6]], table["sa"].to_pylist())
+        self.assertListEqual([True, False] * 3, table["b"].to_pylist())
+
+        # to_pandas uses the same transfer and gives the usual column values
+        pd_df = df.to_pandas()
+        self.assertListEqual(["a", "b", "a", "c", "b", "a"], pd_df["c"].tolist())
+        self.assertListEqual([[0, 1], [], [2, 3, 4], [], [5], [6]], pd_df["sa"].tolist())
+        self.assertListEqual(df["s"].to_list(), pd_df["s"].tolist())
+        # numeric columns keep their dtypes, and pandas stores strings as objects
+        for key in ["i", "f", "b"]:
+            self.assertEqual(df[key].to_ndarray().dtype, pd_df[key].to_numpy().dtype)
+        for key in ["s", "c"]:
+            self.assertEqual(object, pd_df[key].to_numpy().dtype)
+
+        with self.assertRaises(TypeError):
+            build_ak_df().to_arrow()
+
     def test_argsort(self):
         df = build_ak_df()
 
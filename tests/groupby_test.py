@@ -529,6 +529,160 @@ class GroupByTest(ArkoudaTest):
         self.assertListEqual(expected_unique_keys, unique_keys.to_list())
         self.assertListEqual(expected_nuniq, nuniq.to_list())
 
+    def test_multi_aggregation(self):
+        keys = ak.randint(0, 10, 100, seed=1)
+        ints = ak.randint(0, 100, 100, seed=2)
+        floats = ak.randint(0, 1, 100, dtype=ak.float64, seed=3)
+        g = ak.GroupBy(keys)
+        values = [ints, floats, floats, ints, ints]
+        ops = ["sum", "mean", "argmax", "nunique", "max"]
+        unique_keys, aggs = g.aggregate(values, ops)
+        self.assertListEqual(g.unique_keys.to_list(), unique_keys.to_list())
+        for v, op, agg in zip(values, ops, aggs):
+            self.assertListEqual(g.aggregate(v, op)[1].to_list(), agg.to_list())
+
+        _, aggs = g.aggregate(ints, ["min", "max"])
+        self.assertListEqual(g.min(ints)[1].to_list(), aggs[0].to_list())
+        self.assertListEqual(g.max(ints)[1].to_list(), aggs[1].to_list())
+        with self.assertRaises(ValueError):
+            g.aggregate([ints, floats], ["sum"])
+
+    def test_hash_grouping(self):
+        low = ak.randint(0, 5, 1000, seed=1)
+        high = ak.randint(0, 2**40, 1000, seed=2)
+        strs = ak.random_strings_uniform(1, 2, 1000, characters="abc", seed=3)
+        # the groupings would otherwise be reused across methods
+        cache_bytes = ak.client.groupbyCacheBytes
+        ak.client.groupbyCacheBytes = 0
+        try:
+            for keys in (low, high, strs, [low, strs], [low, high]):
+                expected = ak.GroupBy(keys, method="sort")
+                for method in ("hash", "auto"):
+                    g = ak.GroupBy(keys, method=method)
+                    self.assertListEqual(expected.permutation.to_list(), g.permutation.to_list())
+                    self.assertListEqual(expected.segments.to_list(), g.segments.to_list())
+        finally:
+            ak.client.groupbyCacheBytes = cache_bytes
+
+        with self.assertRaises(ValueError):
+            ak.GroupBy(low, method="radix")
+
+    def test_quantile(self):
+        keys = ak.randint(0, 10, 10000, seed=1)
+        vals = ak.randint(0, 1000, 10000, seed=2)
+        df = pd.DataFrame({"keys": keys.to_ndarray(), "vals": vals.to_ndarray()})
+        g = ak.GroupBy(keys)
+        qs = [0.0, 0.1, 0.5, 0.99, 1.0]
+        _, exact = g.quantile(vals, qs)
+        _, median = g.median(vals)
+        self.assertTrue(np.allclose(median.to_ndarray(), exact[2].to_ndarray()))
+        for q, res in zip(qs, exact):
+            expected = df.groupby("keys")["vals"].quantile(q).to_numpy()
+            self.assertTrue(np.allclose(expected, res.to_ndarray()))
+            sorted_vals = [np.sort(df["vals"][df["keys"] == k].to_numpy()) for k in range(10)]
+            # the approximate quantiles are within a few percent of the exact ranks
+            _, approx = g.quantile(vals, q, method="approx", compression=50)
+            for sv, a in zip(sorted_vals, approx.to_list()):
+                rank = np.searchsorted(sv, a) / sv.size
+                self.assertLessEqual(abs(rank - q), 0.05)
+
+        fvals = ak.array([1.0, np.nan, 3.0, 2.0])
+        g = ak.GroupBy(ak.array([0, 0, 0, 1]))
+        self.assertListEqual([2.0, 2.0], g.quantile(fvals)[1].to_list())
+        self.assertTrue(np.isnan(g.quantile(fvals, skipna=False)[1].to_ndarray()[0]))
+        # any sequence or array of quantiles gives one result per quantile
+        for multi in ((0.5, 1.0), np.array([0.5, 1.0])):
+            _, res = g.quantile(fvals, multi)
+            self.assertListEqual([[2.0, 2.0], [3.0, 2.0]], [r.to_list() for r in res])
+
+        with self.assertRaises(ValueError):
+            g.quantile(fvals, 1.5)
+        with self.assertRaises(ValueError):
+            g.quantile(fvals, method="tdigest")
+        with self.assertRaises(TypeError):
+            g.quantile(ak.array(["a", "b", "c", "d"]))
+
+    def test_top_k(self):
+        keys = ak.array([1, 0, 1, 0, 1, 2, 1])
+        vals = ak.array([5.0, 2.0, np.nan, 7.0, 9.0, 4.0, 5.0])
+        g = ak.GroupBy(keys)
+        k, largest = g.nlargest(vals, 2)
+        self.assertListEqual([0, 0, 1, 1, 2], k.to_list())
+        self.assertListEqual([7.0, 2.0, 9.0, 5.0, 4.0], largest.to_list())
+        k, smallest = g.nsmallest(vals, 3)
+        self.assertListEqual([0, 0, 1, 1, 1, 2], k.to_list())
+        self.assertListEqual([2.0, 7.0, 5.0, 5.0, 9.0, 4.0], smallest.to_list())
+        self.assertEqual(0, g.nlargest(vals, 0)[1].size)
+
+        strs = ak.array(["b", "a", "b", "a", "b", "c", "b"])
+        k, largest = ak.GroupBy([keys, strs]).nlargest(ak.arange(7), 1)
+        self.assertListEqual([0, 1, 2], k[0].to_list())
+        self.assertListEqual(["a", "b", "c"], k[1].to_list())
+        self.assertListEqual([3, 6, 5], largest.to_list())
+
+        with self.assertRaises(ValueError):
+            g.nlargest(vals, -1)
+
+    def test_approx_nunique(self):
+        keys = ak.randint(0, 3, 100000, seed=1)
+        vals = ak.randint(0, 20000, 100000, seed=2)
+        strs = ak.random_strings_uniform(1, 3, 100000, characters="abc", seed=3)
+        g = ak.GroupBy(keys)
+        for values in (vals, strs, [vals, strs], vals % 2 == 0):
+            exact = g.nunique(values)[1].to_ndarray()
+            approx = g.nunique(values, approx=True)[1].to_ndarray()
+            # small groups are counted exactly, large ones within a few errors
+            self.assertTrue(np.all(np.abs(approx - exact) <= 0.05 * exact))
+            # groups smaller than the sketch are exact, even across task blocks
+            approx = g.nunique(values, approx=True, precision=16)[1].to_ndarray()
+            self.assertListEqual(exact.tolist(), approx.tolist())
+
+        exact = ak.unique(vals).size
+        self.assertLessEqual(abs(ak.approx_unique_count(vals) - exact), 0.05 * exact)
+        self.assertLessEqual(abs(ak.approx_unique_count(vals, precision=8) - exact), 0.3 * exact)
+        self.assertEqual(3, ak.approx_unique_count(ak.array(["a", "b", "a", "c"])))
+        self.assertEqual(0, ak.approx_unique_count(ak.zeros(0, dtype=ak.int64)))
+        with self.assertRaises(ValueError):
+            ak.approx_unique_count(vals, precision=20)
+
+    def test_grouping_reuse(self):
+        cache_bytes = ak.client.groupbyCacheBytes
+        ak.client.groupbyCacheBytes = 2**20
+        try:
+            keys = ak.array([3, 1, 3, 2, 1])
+            strs = ak.array(["b", "a", "b", "c", "a"])
+            g1 = ak.GroupBy([keys, strs])
+            cache_key = ak.groupbyclass._grouping_cache_key([keys, strs], False)
+            self.assertIn(cache_key, ak.groupbyclass._groupings)
+            g2 = ak.GroupBy([keys, strs])
+            # reused groupings are copies, so changing one GroupBy leaves the others intact
+            self.assertIsNot(g1.permutation, g2.permutation)
+            self.assertListEqual(g1.permutation.to_list(), g2.permutation.to_list())
+            perm = g1.permutation.to_list()
+            g2.permutation.fill(0)
+            self.assertListEqual(perm, g1.permutation.to_list())
+            self.assertListEqual(perm, ak.GroupBy([keys, strs]).permutation.to_list())
+
+            # changing a key in place, through any object with its name, invalidates its groupings
+            keys.register("grouping_reuse_keys")
+            ak.attach("grouping_reuse_keys")[0] = 2
+            g3 = ak.GroupBy([keys, strs])
+            unique_keys, counts = g3.count()
+            self.assertDictEqual(
+                {(2, "b"): 1, (1, "a"): 2, (3, "b"): 1, (2, "c"): 1},
+                dict(zip(zip(*(k.to_list() for k in unique_keys)), counts.to_list())),
+            )
+            keys.unregister()
+
+            cache_key = ak.groupbyclass._grouping_cache_key(keys, False)
+            ak.GroupBy(keys)
+            self.assertIn(cache_key, ak.groupbyclass._groupings)
+            del keys, g1, g2, g3
+            ak.GroupBy(strs)
+            self.assertNotIn(cache_key, ak.groupbyclass._groupings)
+        finally:
+            ak.client.groupbyCacheBytes = cache_bytes
+
 
 def to_tuple_dict(labels, values):
     # transforms labels from list of arrays into a list of tuples by index and builds a dictionary
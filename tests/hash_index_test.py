@@ -0,0 +1,68 @@
+import numpy as np
+from base_test import ArkoudaTest
+from context import arkouda as ak
+
+SIZE = 1000
+
+
+class HashIndexTest(ArkoudaTest):
+    def setUp(self):
+        ArkoudaTest.setUp(self)
+        self.ints = ak.randint(0, SIZE // 2, SIZE, seed=1)
+        self.int_queries = ak.randint(-10, SIZE // 2 + 10, SIZE // 2, seed=2)
+        self.strings = ak.random_strings_uniform(1, 3, SIZE, characters="lowercase", seed=1)
+        self.string_queries = ak.random_strings_uniform(1, 4, SIZE // 2, characters="lowercase", seed=2)
+
+    def test_int_index(self):
+        index = ak.HashIndex(self.ints)
+        self.assertEqual(SIZE, len(index))
+        expected = ak.in1d(self.int_queries, self.ints)
+        self.assertListEqual(expected.to_list(), index.contains(self.int_queries).to_list())
+        self.assertListEqual(expected.to_list(), index.in1d(self.int_queries).to_list())
+        self.assertListEqual((~expected).to_list(), index.in1d(self.int_queries, invert=True).to_list())
+
+        # the first index of repeated values, like np.argmax on the matches
+        keys, queries = self.ints.to_ndarray(), self.int_queries.to_ndarray()
+        first = [int(np.argmax(keys == q)) if (keys == q).any() else -1 for q in queries]
+        self.assertListEqual(first, index.get_loc(self.int_queries).to_list())
+
+        with self.assertRaises(TypeError):
+            index.get_loc(ak.cast(self.int_queries, ak.float64))
+        with self.assertRaises(TypeError):
+            index.get_loc(self.string_queries)
+
+    def test_bool_index(self):
+        index = ak.HashIndex(ak.array([False, False, True, False]))
+        self.assertListEqual([2, 0], index.get_loc(ak.array([True, False])).to_list())
+        self.assertListEqual([-1], ak.HashIndex(ak.array([True])).get_loc(ak.array([False])).to_list())
+
+    def test_strings_index(self):
+        index = ak.HashIndex(self.strings)
+        expected = ak.in1d(self.string_queries, self.strings)
+        self.assertListEqual(expected.to_list(), index.contains(self.string_queries).to_list())
+
+        loc = index.get_loc(self.string_queries)
+        found = loc >= 0
+        self.assertListEqual(self.string_queries[found].to_list(), self.strings[loc[found]].to_list())
+        self.assertListEqual(
+            ak.find(self.string_queries, ak.array(["a", "b", "c"])).to_list(),
+            ak.HashIndex(ak.array(["a", "b", "c"])).get_loc(self.string_queries).to_list(),
+        )
+
+        cat = ak.Categorical(self.string_queries)
+        self.assertListEqual(expected.to_list(), index.contains(cat).to_list())
+
+        empty = ak.HashIndex(ak.array(["a"])[ak.arange(0)])
+        self.assertFalse(empty.contains(self.string_queries).any())
+
+    def test_registration(self):
+        index = ak.HashIndex(ak.array(["x", "y", "x"]))
+        index.register("hash_index_test")
+        self.assertTrue(index.is_registered())
+        attached = ak.HashIndex.attach("hash_index_test")
+        self.assertListEqual([1, -1, 0], attached.get_loc(ak.array(["y", "z", "x"])).to_list())
+        self.assertListEqual(["x", "y", "x"], attached.keys.to_list())
+        index.unregister()
+        self.assertFalse(index.is_registered())
+        with self.assertRaises(ak.RegistrationError):
+            ak.HashIndex.attach("hash_index_test")
@@ -804,6 +804,26 @@ class IOTest(ArkoudaTest):
             self.assertListEqual(data["ColB"].to_list(), d["ColB"].to_list())
             self.assertListEqual(data["ColC"].to_list(), d["ColC"].to_list())
 
+    def test_csv_quoted_and_inferred(self):
+        names = ['plain', 'with, comma', 'with "quotes"', 'two\nlines', '']
+        with tempfile.TemporaryDirectory(dir=IOTest.io_test_dir) as tmp_dirname:
+            with open(f"{tmp_dirname}/quoted.csv", "w") as f:
+                f.write('id,"name",score,flag\r\n')
+                for i in range(100):
+                    name = names[i % len(names)]
+                    f.write(f'{i},"{name.replace(chr(34), 2 * chr(34))}",{i / 4},{i % 2 == 0}\r\n')
+
+            data = ak.read_csv(f"{tmp_dirname}/quoted.csv")
+            self.assertListEqual(["id", "name", "score", "flag"], list(data.keys()))
+            self.assertListEqual([str(i) for i in range(100)], data["id"].to_list())
+            self.assertListEqual([names[i % len(names)] for i in range(100)], data["name"].to_list())
+
+            data = ak.read_csv(f"{tmp_dirname}/quoted.csv", infer_dtypes=True)
+            self.assertListEqual(list(range(100)), data["id"].to_list())
+            self.assertIsInstance(data["name"], ak.Strings)
+            self.assertListEqual([i / 4 for i in range(100)], data["score"].to_list())
+            self.assertListEqual([i % 2 == 0 for i in range(100)], data["flag"].to_list())
+
 
     def tearDown(self):
         super(IOTest, self).tearDown()
@@ -111,6 +111,59 @@ class JoinTest(ArkoudaTest):
                 left, right, wherefunc=ak.intersect1d, whereargs=(ak.arange(10), ak.arange(5))
             )
 
+    def test_merge(self):
+        import pandas as pd
+
+        left = ak.DataFrame(
+            {
+                "key": ak.array([1, 2, 3, 3, 5]),
+                "name": ak.array(["a", "b", "c", "c", "e"]),
+                "lval": ak.array([10, 20, 30, 31, 50]),
+            }
+        )
+        right = ak.DataFrame(
+            {
+                "key": ak.array([3, 1, 1, 4]),
+                "name": ak.array(["c", "a", "x", "d"]),
+                "rval": ak.array([1.5, 2.5, 3.5, 4.5]),
+            }
+        )
+
+        def rows(df):
+            pdf = df.to_pandas() if isinstance(df, ak.DataFrame) else df
+            # missing strings are empty in arkouda
+            pdf = pdf.fillna(-1).replace("", -1)
+            return sorted(map(tuple, pdf.astype(str).to_numpy().tolist()))
+
+        for how in ("inner", "left", "right", "outer"):
+            for method in ("sort", "hash", "auto", "broadcast"):
+                for on in ("key", ["key", "name"]):
+                    expected = pd.merge(left.to_pandas(), right.to_pandas(), on=on, how=how)
+                    result = ak.merge(left, right, on=on, how=how, method=method)
+                    self.assertListEqual(list(expected.columns), result.columns)
+                    self.assertListEqual(rows(expected), rows(result))
+                # the smaller DataFrame is broadcast whichever side it is on
+                expected = pd.merge(right.to_pandas(), left.to_pandas(), on="key", how=how)
+                result = ak.merge(right, left, on="key", how=how, method="broadcast")
+                self.assertListEqual(rows(expected), rows(result))
+
+        # Categorical keys with different categories, and differently named keys
+        left["cat"] = ak.Categorical(left["name"])
+        right["rcat"] = ak.Categorical(right["name"])
+        result = left.merge(right, left_on="cat", right_on="rcat")
+        self.assertListEqual(result["cat"].to_list(), result["rcat"].to_list())
+        self.assertListEqual(["a", "c", "c"], sorted(result["cat"].to_list()))
+        self.assertIn("key_x", result.columns)
+
+        with self.assertRaises(KeyError):
+            ak.merge(left, right, on="lval")
+        with self.assertRaises(ValueError):
+            ak.merge(left, right, on="key", how="cross")
+        with self.assertRaises(ValueError):
+            ak.merge(left, right, on="key", method="nested")
+        with self.assertRaises(TypeError):
+            ak.merge(left, right, left_on="key", right_on="rval")
+
     def test_lookup(self):
         keys = ak.arange(5)
         values = 10 * keys
@@ -0,0 +1,86 @@
+import numpy as np
+from base_test import ArkoudaTest
+from context import arkouda as ak
+
+SIZE = 100
+
+
+class LazyExprTest(ArkoudaTest):
+    def setUp(self):
+        ArkoudaTest.setUp(self)
+        self.a = ak.arange(1, SIZE + 1)
+        self.b = ak.arange(SIZE) - SIZE // 2
+        self.c = ak.linspace(1, 2, SIZE)
+
+    def test_lazy_matches_eager(self):
+        a, b, c = self.a, self.b, self.c
+        lazy_a = ak.lazy(a)
+
+        fused = ((lazy_a * 2 + b) / c - 1).evaluate()
+        eager = (a * 2 + b) / c - 1
+        self.assertEqual(ak.float64, fused.dtype)
+        self.assertTrue(np.allclose(eager.to_ndarray(), fused.to_ndarray()))
+
+        # int64 only expressions stay int64 and follow the server int semantics
+        fused = ((lazy_a * 3 - b) // 7 % 5 + b).evaluate()
+        eager = (a * 3 - b) // 7 % 5 + b
+        self.assertEqual(ak.int64, fused.dtype)
+        self.assertListEqual(eager.to_list(), fused.to_list())
+
+        fused = (-(lazy_a // b) + 2.5 ** ak.lazy(c)).evaluate()
+        eager = -(a // b) + 2.5**c
+        self.assertTrue(np.allclose(eager.to_ndarray(), fused.to_ndarray()))
+
+    def test_lazy_builds_expression(self):
+        expr = (ak.lazy(self.a) + self.b) * self.a
+        self.assertIsInstance(expr, ak.LazyExpr)
+        self.assertIsInstance(self.b + ak.lazy(self.a), ak.LazyExpr)
+        self.assertEqual(SIZE, expr.size)
+        self.assertEqual(ak.int64, expr.dtype)
+        self.assertIs(expr.evaluate(), expr.evaluate())
+
+    def test_lazy_fallback(self):
+        a = self.a
+        # int64 ** int64 is not fused, but still matches the eager result
+        res = ak.lazy(a) ** 2
+        self.assertIsInstance(res, ak.pdarray)
+        self.assertListEqual((a**2).to_list(), res.to_list())
+
+        # bool operands are not fused
+        mask = a % 2 == 0
+        res = ak.lazy(a) + mask
+        self.assertListEqual((a + mask).to_list(), res.to_list())
+
+    def test_lazy_compare_bitwise(self):
+        a, b = self.a, self.b
+        lazy_a = ak.lazy(a) * 2
+        eager_a = a * 2
+        # comparison and bitwise operators are evaluated eagerly with any operand order
+        for res, eager in [
+            (lazy_a == b, eager_a == b),
+            (b == lazy_a, b == eager_a),
+            (lazy_a != 4, eager_a != 4),
+            (lazy_a < b, eager_a < b),
+            (b < lazy_a, b < eager_a),
+            (10 < lazy_a, 10 < eager_a),
+            (lazy_a >= 10.5, eager_a >= 10.5),
+            (lazy_a & b, eager_a & b),
+            (b & lazy_a, b & eager_a),
+            (6 | lazy_a, 6 | eager_a),
+            (lazy_a ^ ak.lazy(b), eager_a ^ b),
+            (lazy_a << 2, eager_a << 2),
+            (~lazy_a, ~eager_a),
+        ]:
+            self.assertIsInstance(res, ak.pdarray)
+            self.assertEqual(eager.dtype, res.dtype)
+            self.assertListEqual(eager.to_list(), res.to_list())
+
+    def test_lazy_errors(self):
+        with self.assertRaises(ValueError):
+            ak.lazy(self.a) + ak.arange(SIZE + 1)
+        with self.assertRaises(TypeError):
+            ak.lazy(self.a) + "abc"
+        with self.assertRaises(TypeError):
+            ak.lazy(self.a) == "abc"
+        with self.assertRaises(TypeError):
+            ak.lazy([1, 2, 3])
@@ -208,6 +208,186 @@ class ParquetTest(ArkoudaTest):
             rd_df = ak.DataFrame(ak_data)
             self.assertTrue(pdf.equals(rd_df.to_pandas()))
 
+    def test_filters(self):
+        pdf = pd.DataFrame({
+            "ts": np.arange(SIZE),
+            "proto": np.arange(SIZE) % 3,
+            "rate": np.arange(SIZE) / 2,
+            "host": [f"host{i % 4}" for i in range(SIZE)],
+        })
+        table = pa.Table.from_pandas(pdf, preserve_index=False)
+
+        with tempfile.TemporaryDirectory(dir=ParquetTest.par_test_base_tmp) as tmp_dirname:
+            # several row groups per file, so that most are skipped
+            for i in range(NUMFILES):
+                part = table.slice(i * SIZE // NUMFILES, SIZE // NUMFILES)
+                pq.write_table(part, f"{tmp_dirname}/filter_pq{i:04d}", row_group_size=5)
+            files = f"{tmp_dirname}/filter_pq*"
+
+            filters = [("ts", ">=", 42), ("ts", "<", 57.5), ("proto", "==", 1)]
+            expected = pdf[(pdf.ts >= 42) & (pdf.ts < 57.5) & (pdf.proto == 1)]
+            data = ak.read_parquet(files, ["ts", "rate"], filters=filters)
+            self.assertListEqual(["ts", "rate"], list(data.keys()))
+            self.assertListEqual(expected.ts.tolist(), data["ts"].to_list())
+            self.assertListEqual(expected.rate.tolist(), data["rate"].to_list())
+
+            # whole files are read with strings, but filtered the same
+            data = ak.read_parquet(files, ["ts", "host"], filters=filters)
+            self.assertListEqual(expected.ts.tolist(), data["ts"].to_list())
+            self.assertListEqual(expected.host.tolist(), data["host"].to_list())
+
+            hosts = ak.read_parquet(files, "ts", filters=[("host", "==", "host2"), ("rate", "<=", 10)])
+            self.assertListEqual(
+                pdf.ts[(pdf.host == "host2") & (pdf.rate <= 10)].tolist(), hosts.to_list()
+            )
+            self.assertListEqual([], ak.read_parquet(files, "ts", filters=[("ts", ">", SIZE)]).to_list())
+
+            with self.assertRaises(ValueError):
+                ak.read_parquet(files, "ts", filters=[("ts", "~", 1)])
+            with self.assertRaises(ValueError):
+                ak.read_parquet(files, "ts", filters=[("missing", "==", 1)])
+
+    def test_partitioned(self):
+        day = ak.arange(SIZE) // 25
+        host = ak.array([f"host/{i % 2}" for i in range(SIZE)])
+        value = ak.arange(SIZE) * 10
+        with tempfile.TemporaryDirectory(dir=ParquetTest.par_test_base_tmp) as tmp_dirname:
+            path = f"{tmp_dirname}/partitioned"
+            ak.to_partitioned({"day": day, "host": host, "value": value}, path, ["day", "host"])
+            self.assertEqual(4, len(glob.glob(f"{path}/day=*")))
+            self.assertEqual(2, len(glob.glob(f"{path}/day=0/host=*")))
+            # each locale writes the rows of a partition that it holds to its own file
+            files = glob.glob(f"{path}/day=0/host=host%2F0/*")
+            self.assertLessEqual(1, len(files))
+            self.assertGreaterEqual(ak.get_config()["numLocales"], len(files))
+            self.assertTrue(all("_LOCALE" in f for f in files))
+
+            data = ak.read_partitioned(path)
+            self.assertListEqual(["value", "day", "host"], list(data.keys()))
+            rows = sorted(zip(data["day"].to_list(), data["host"].to_list(), data["value"].to_list()))
+            self.assertListEqual(sorted(zip(day.to_list(), host.to_list(), value.to_list())), rows)
+
+            data = ak.read_partitioned(
+                path, filters=[("day", ">=", 2), ("host", "==", "host/1"), ("value", "<", 900)]
+            )
+            self.assertListEqual(list(range(510, 900, 20)), sorted(data["value"].to_list()))
+            self.assertListEqual([2, 3], ak.unique(data["day"]).to_list())
+            self.assertListEqual(["host/1"], ak.unique(data["host"]).to_list())
+            empty = ak.read_partitioned(path, filters=[("day", ">", 5)])
+            self.assertEqual(0, empty["value"].size)
+            self.assertEqual(ak.int64, empty["value"].dtype)
+
+            # rewriting a partition replaces its files and keeps the others
+            ak.to_partitioned({"day": ak.zeros(3, ak.int64), "value": ak.arange(3)}, f"{path}_2", "day")
+            ak.to_partitioned({"day": ak.ones(2, ak.int64), "value": ak.arange(2)}, f"{path}_2", "day")
+            ak.to_partitioned({"day": ak.zeros(1, ak.int64), "value": ak.arange(1)}, f"{path}_2", "day")
+            self.assertListEqual([0, 1, 1], ak.read_partitioned(f"{path}_2")["day"].to_list())
+            self.assertEqual(1, len(glob.glob(f"{path}_2/day=0/*")))
+            ak.to_partitioned(
+                {"day": ak.zeros(1, ak.int64), "value": ak.arange(1)}, f"{path}_2", "day", mode="append"
+            )
+            self.assertListEqual([0, 0, 1, 1], ak.read_partitioned(f"{path}_2")["day"].to_list())
+
+            with self.assertRaises(ValueError):
+                ak.to_partitioned({"day": day}, path, "day")
+            with self.assertRaises(ValueError):
+                ak.read_partitioned(path, filters=[("day", "~", 1)])
+
+    def test_dictionary(self):
+        hosts = [None if i % 7 == 0 else f"host{i % 4}" for i in range(SIZE)]
+        table = pa.table({"host": hosts, "ts": np.arange(SIZE)})
+        expected = ["N/A" if h is None else h for h in hosts]
+
+        with tempfile.TemporaryDirectory(dir=ParquetTest.par_test_base_tmp) as tmp_dirname:
+            # each row group and file has its own dictionary
+            for i in range(NUMFILES):
+                part = table.slice(i * SIZE // NUMFILES, SIZE // NUMFILES)
+                pq.write_table(part, f"{tmp_dirname}/dict_pq{i:04d}", row_group_size=7)
+            files = f"{tmp_dirname}/dict_pq*"
+
+            cat = ak.read_parquet(files, "host", read_dictionary="host")
+            self.assertIsInstance(cat, ak.Categorical)
+            self.assertListEqual(expected, cat.to_list())
+            self.assertListEqual(
+                ["N/A", "host0", "host1", "host2", "host3"], sorted(cat.categories.to_list())
+            )
+
+            data = ak.read_parquet(files, read_dictionary=["host"], filters=[("ts", ">=", 50)])
+            self.assertIsInstance(data["host"], ak.Categorical)
+            self.assertListEqual(expected[50:], data["host"].to_list())
+
+            # plainly encoded columns are grouped into a Categorical instead
+            pq.write_table(table, f"{tmp_dirname}/plain_pq", use_dictionary=False)
+            cat = ak.read_parquet(f"{tmp_dirname}/plain_pq", "host", read_dictionary="host")
+            self.assertIsInstance(cat, ak.Categorical)
+            self.assertListEqual(expected, cat.to_list())
+
+            # Categorical values are written as codes into their categories
+            cat = ak.Categorical(ak.array(["b", "N/A", "a", "b"] * 10))
+            cat.to_parquet(f"{tmp_dirname}/cat_pq", "cat")
+            column = pq.read_table(glob.glob(f"{tmp_dirname}/cat_pq*")).column("cat")
+            self.assertEqual(10, column.null_count)
+            self.assertListEqual(["a", "b"], sorted(set(column.drop_null().to_pylist())))
+            metadata = pq.ParquetFile(f"{tmp_dirname}/cat_pq_LOCALE0000").metadata
+            self.assertTrue(metadata.row_group(0).column(0).has_dictionary_page)
+            read = ak.read_parquet(f"{tmp_dirname}/cat_pq*", "cat", read_dictionary="cat")
+            self.assertListEqual(cat.to_list(), read.to_list())
+            # without read_dictionary the N/A values are read as empty strings
+            strings = ak.read_parquet(f"{tmp_dirname}/cat_pq*", "cat")
+            self.assertListEqual(["b", "", "a", "b"] * 10, strings.to_list())
+            with self.assertRaises(ValueError):
+                cat.to_parquet(f"{tmp_dirname}/cat_pq", "cat", mode="append")
+
+    def test_write_layout(self):
+        a = ak.arange(SIZE)
+        s = ak.array([f"str{i % 3}" for i in range(SIZE)])
+        f = ak.linspace(0, 1, SIZE)
+
+        with tempfile.TemporaryDirectory(dir=ParquetTest.par_test_base_tmp) as tmp_dirname:
+            ak.to_parquet(
+                {"a": a, "s": s, "f": f},
+                f"{tmp_dirname}/layout",
+                compression="snappy",
+                row_group_size=10,
+                use_dictionary=["s"],
+                write_statistics=["a"],
+                sorted_by=["a"],
+            )
+            for fname in glob.glob(f"{tmp_dirname}/layout*"):
+                metadata = pq.ParquetFile(fname).metadata
+                self.assertEqual(-(-metadata.num_rows // 10), metadata.num_row_groups)
+                self.assertEqual(b"a", metadata.metadata[b"sorted_by"])
+                for i in range(metadata.num_row_groups):
+                    a_col, s_col, f_col = (metadata.row_group(i).column(c) for c in range(3))
+                    self.assertTrue(a_col.is_stats_set)
+                    self.assertFalse(f_col.is_stats_set)
+                    self.assertTrue(s_col.has_dictionary_page)
+                    self.assertFalse(a_col.has_dictionary_page)
+            data = ak.read_parquet(f"{tmp_dirname}/layout*")
+            self.assertListEqual(a.to_list(), data["a"].to_list())
+            self.assertListEqual(s.to_list(), data["s"].to_list())
+            self.assertListEqual(f.to_list(), data["f"].to_list())
+
+            # single columns are written with the same options
+            a.to_parquet(
+                f"{tmp_dirname}/single", "a", row_group_size=7, use_dictionary=False, is_sorted=True
+            )
+            s.to_parquet(f"{tmp_dirname}/single_str", "s", row_group_size=7, data_page_size=64)
+            for fname in glob.glob(f"{tmp_dirname}/single_LOCALE*"):
+                metadata = pq.ParquetFile(fname).metadata
+                self.assertEqual(-(-metadata.num_rows // 7), metadata.num_row_groups)
+                self.assertEqual(b"a", metadata.metadata[b"sorted_by"])
+                self.assertFalse(metadata.row_group(0).column(0).has_dictionary_page)
+            self.assertListEqual(a.to_list(), ak.read_parquet(f"{tmp_dirname}/single_LOCALE*").to_list())
+            self.assertListEqual(s.to_list(), ak.read_parquet(f"{tmp_dirname}/single_str*").to_list())
+
+            with self.assertRaises(ValueError):
+                a.to_parquet(f"{tmp_dirname}/single", "a", row_group_size=0)
+            with self.assertRaises(ValueError):
+                ak.to_parquet({"a": a, "s": s}, f"{tmp_dirname}/layout", sorted_by=["b"])
+            with self.assertRaises(ValueError):
+                ak.to_parquet([a], f"{tmp_dirname}/single", names=["b"], mode="append", row_group_size=7)
+
     def test_segarray_integration(self):
         df = pd.DataFrame({
             "ListCol": [
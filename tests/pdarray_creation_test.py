@@ -872,6 +872,49 @@ class PdarrayCreationTest(ArkoudaTest):
             self.assertTrue(np.all(a == i + 1))
             self.assertTrue(np.all(npa == i + 1))
 
+    def test_chunked_transfer(self):
+        N = 1000
+        ak.client.transferChunkBytes = 800
+        try:
+            for a in (
+                np.random.randint(-N, N, N),
+                np.random.randint(0, N, N).astype(np.uint64),
+                np.random.uniform(size=N),
+                np.random.randint(0, 2, N).astype(bool),
+            ):
+                aka = ak.array(a)
+                npa = aka.to_ndarray()
+                self.assertTrue(np.array_equal(a, npa))
+                # the chunked result is writable
+                npa[0] = npa[1]
+
+                chunks = list(aka.iter_chunks(160))
+                self.assertEqual(int(np.ceil(N * a.itemsize / 160)), len(chunks))
+                self.assertTrue(np.array_equal(a, np.concatenate(chunks)))
+        finally:
+            ak.client.set_defaults()
+
+        aka = ak.arange(10)
+        self.assertListEqual(
+            [[0, 1], [2, 3], [4, 5], [6, 7], [8, 9]], [c.tolist() for c in aka.iter_chunks(16)]
+        )
+        self.assertListEqual(list(range(10)), np.concatenate(list(aka.iter_chunks())).tolist())
+        with self.assertRaises(ValueError):
+            next(aka.iter_chunks(0))
+
+    def test_to_ndarray_writable(self):
+        # large enough to be received directly into the result
+        N = 2**14
+        for a in (np.arange(N), np.random.uniform(size=N)):
+            npa = ak.array(a).to_ndarray()
+            self.assertTrue(np.array_equal(a, npa))
+            self.assertTrue(npa.flags.writeable)
+            npa[0] = npa[1]
+
+        strings = [f"str {i} ü" for i in range(N)]
+        self.assertListEqual(strings, ak.array(strings).to_ndarray().tolist())
+        self.assertListEqual([], ak.array(ak.arange(0)).to_ndarray().tolist())
+
     def test_uint_greediness(self):
         # default to uint when all supportedInt and any value > 2**63
         # to avoid loss of precision see (#1297)
@@ -5,7 +5,8 @@ use TestBase;
 proc testReadWrite(filename: c_string, dsetname: c_string, size: int) {
   extern proc c_readColumnByName(filename, chpl_arr, colNum, numElems, startIdx, batchSize, errMsg): int;
   extern proc c_writeColumnToParquet(filename, chpl_arr, colnum,
-                                     dsetname, numelems, rowGroupSize, compressed,
+                                     dsetname, numelems, rowGroupSize, pageSize,
+                                     dictionary, statistics, sorted, compressed,
                                      dtype, errMsg): int;
   extern proc c_free_string(a);
   extern proc strlen(a): int;
@@ -18,7 +19,7 @@ proc testReadWrite(filename: c_string, dsetname: c_string, size: int) {
   var a: [0..#size] int;
   for i in 0..#size do a[i] = i;
 
-  if c_writeColumnToParquet(filename, c_ptrTo(a), 0, dsetname, size, 10000, false, 1, errMsg) < 0 {
+  if c_writeColumnToParquet(filename, c_ptrTo(a), 0, dsetname, size, 10000, 0, 1, 1, 0, false, 1, errMsg) < 0 {
     var chplMsg;
     try! chplMsg = createStringWithNewBuffer(errMsg, strlen(errMsg));
     writeln(chplMsg);
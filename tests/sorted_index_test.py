@@ -0,0 +1,108 @@
+import numpy as np
+from base_test import ArkoudaTest
+from context import arkouda as ak
+
+SIZE = 1000
+
+
+class SortedIndexTest(ArkoudaTest):
+    def setUp(self):
+        ArkoudaTest.setUp(self)
+        self.keys = ak.randint(0, SIZE // 4, SIZE, seed=1)
+        self.queries = ak.randint(-10, SIZE // 4 + 10, SIZE // 2, seed=2)
+        self.index = ak.SortedIndex(self.keys)
+
+    def test_searchsorted(self):
+        sorted_keys = np.sort(self.keys.to_ndarray())
+        for side in ("left", "right"):
+            self.assertListEqual(
+                np.searchsorted(sorted_keys, self.queries.to_ndarray(), side=side).tolist(),
+                self.index.searchsorted(self.queries, side=side).to_list(),
+            )
+        self.assertEqual(0, self.index.searchsorted(-1))
+        self.assertEqual(SIZE, self.index.searchsorted(SIZE // 4, side="right"))
+
+        floats = ak.SortedIndex(ak.array([2.5, -1.0, 0.5, 0.5]))
+        self.assertListEqual(
+            [0, 1, 3, 4], floats.searchsorted(ak.array([-2.0, 0.5, 1.0, 3.0])).to_list()
+        )
+
+        with self.assertRaises(ValueError):
+            self.index.searchsorted(self.queries, side="middle")
+        with self.assertRaises(TypeError):
+            self.index.searchsorted(ak.cast(self.queries, ak.float64))
+        with self.assertRaises(ValueError):
+            ak.SortedIndex(ak.array([1.0, np.nan]))
+        with self.assertRaises(ValueError):
+            ak.SortedIndex(ak.array([2, 1]), assume_sorted=True)
+
+    def test_find_and_lookup(self):
+        self.assertListEqual(
+            ak.find(self.queries, ak.unique(self.keys)).to_list(),
+            ak.SortedIndex(ak.unique(self.keys)).find(self.queries).to_list(),
+        )
+        # the first of repeated keys is found, like ak.find
+        index = ak.SortedIndex(ak.array([30, 10, 20, 10]))
+        self.assertListEqual([1, 2, -1, 0], index.find(ak.array([10, 20, 25, 30])).to_list())
+
+        values = ak.array([3, 1, 2, 1]) * 100
+        self.assertListEqual(
+            [100, 200, -1, 300], index.lookup(values, ak.array([10, 20, 25, 30])).to_list()
+        )
+        names = ak.Categorical(ak.array(["thirty", "ten", "twenty", "ten"]))
+        self.assertListEqual(
+            ["ten", "N/A", "thirty"], index.lookup(names, ak.array([10, 25, 30])).to_list()
+        )
+        self.assertListEqual(
+            [-1, -1], ak.SortedIndex(ak.zeros(0, ak.int64)).find(ak.arange(2)).to_list()
+        )
+
+    def test_ranges(self):
+        keys = self.keys.to_ndarray()
+        self.assertListEqual(
+            sorted(np.flatnonzero((keys >= 10) & (keys < 20)).tolist()),
+            sorted(self.index.range(10, 20).to_list()),
+        )
+        self.assertListEqual([], self.index.range(20, 10).to_list())
+
+        low = ak.array([0, 50, 30, 300])
+        high = ak.array([5, 50, 40, 400])
+        segments, indices = self.index.ranges(low, high)
+        self.assertEqual(low.size, segments.size)
+        bounds = segments.to_list() + [indices.size]
+        found = indices.to_ndarray()
+        for i, (lo, hi) in enumerate(zip(low.to_list(), high.to_list())):
+            in_range = found[bounds[i] : bounds[i + 1]]
+            self.assertListEqual(
+                sorted(np.flatnonzero((keys >= lo) & (keys < hi)).tolist()), sorted(in_range.tolist())
+            )
+            self.assertTrue((np.diff(keys[in_range]) >= 0).all())
+
+    def test_search_intervals(self):
+        starts = ak.array([10, 0, 20, 40])
+        ends = ak.array([14, 5, 30, 40])
+        vals = ak.array([-1, 0, 5, 6, 12, 30, 31, 40, 41])
+        index = ak.SortedIndex(starts, ends=ends)
+        idx = ak.search_intervals(vals, (index.keys, index.ends))
+        expected = ak.where(idx >= 0, index.permutation[ak.where(idx >= 0, idx, 0)], -1)
+        self.assertListEqual(expected.to_list(), index.search_intervals(vals).to_list())
+        self.assertListEqual([-1, 1, 1, -1, 0, 2, -1, 3, -1], index.search_intervals(vals).to_list())
+
+        with self.assertRaises(ValueError):
+            ak.SortedIndex(starts, ends=ak.array([14, 5, 30, 39]))
+        with self.assertRaises(ValueError):
+            ak.SortedIndex(starts, ends=ak.array([20, 5, 30, 40]))
+        with self.assertRaises(ValueError):
+            self.index.search_intervals(vals)
+
+    def test_registration(self):
+        index = ak.SortedIndex(ak.array([30, 10, 20]), ends=ak.array([35, 15, 25]))
+        index.register("sorted_index_test")
+        self.assertTrue(index.is_registered())
+        attached = ak.SortedIndex.attach("sorted_index_test")
+        self.assertListEqual([1, 2, -1], attached.find(ak.array([10, 20, 25])).to_list())
+        self.assertListEqual([1, 0], attached.search_intervals(ak.array([12, 33])).to_list())
+        index.unregister()
+        self.assertFalse(index.is_registered())
+        with self.assertRaises(ak.RegistrationError):
+            ak.SortedIndex.attach("sorted_index_test")
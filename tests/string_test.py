@@ -680,3 +680,13 @@ class StringTest(ArkoudaTest):
         s1 = ak.array(v1)
         nd1 = s1.to_ndarray()
         self.assertListEqual(nd1.tolist(), v1)
+
+    def test_array_encoding(self):
+        for v in (
+            ["abc", "", "de", ""],
+            ["münchen", "", "zürich", "😀 emoji", "abc"],
+            np.array(["a", "bcd", ""], dtype=">U3"),
+        ):
+            self.assertListEqual(list(v), ak.array(v).to_ndarray().tolist())
+        s = ak.array(np.array(["x" * 5, "y", ""]))
+        self.assertListEqual([5, 1, 0], s.get_lengths().to_ndarray().tolist())